@@ -1,3 +1,8 @@
+from django.apps import apps
+from django.contrib.auth import get_user_model
+from django.db.models.signals import (
+    m2m_changed, post_delete, post_save, pre_delete
+)
 from django.utils.translation import gettext_lazy as _
 
 from mayan.apps.app_manager.apps import MayanAppConfig
@@ -11,6 +16,14 @@ from mayan.apps.navigation.source_columns import SourceColumn
 
 from .classes import ModelPermission
 from .events import event_acl_deleted, event_acl_edited
+from .handlers import (
+    handler_access_check_cache_clear, handler_acl_grants_update_for_acl,
+    handler_acl_grants_update_for_acl_permissions,
+    handler_acl_grants_update_for_group_delete_post,
+    handler_acl_grants_update_for_group_delete_pre,
+    handler_acl_grants_update_for_role_groups,
+    handler_acl_grants_update_for_user_groups
+)
 from .links import (
     link_acl_create, link_acl_delete, link_acl_permissions,
     link_global_acl_list
@@ -32,6 +45,9 @@ class ACLsApp(MayanAppConfig):
         GlobalAccessControlListProxy = self.get_model(
             model_name='GlobalAccessControlListProxy'
         )
+        Group = apps.get_model(app_label='auth', model_name='Group')
+        Role = apps.get_model(app_label='permissions', model_name='Role')
+        User = get_user_model()
 
         EventModelRegistry.register(model=AccessControlList)
 
@@ -88,3 +104,39 @@ class ACLsApp(MayanAppConfig):
         menu_setup.bind_links(
             links=(link_global_acl_list,)
         )
+
+        m2m_changed.connect(
+            dispatch_uid='acls_handler_access_check_cache_clear',
+            receiver=handler_access_check_cache_clear,
+            sender=Role.permissions.through
+        )
+        m2m_changed.connect(
+            dispatch_uid='acls_handler_acl_grants_update_for_acl_permissions',
+            receiver=handler_acl_grants_update_for_acl_permissions,
+            sender=AccessControlList.permissions.through
+        )
+        m2m_changed.connect(
+            dispatch_uid='acls_handler_acl_grants_update_for_role_groups',
+            receiver=handler_acl_grants_update_for_role_groups,
+            sender=Role.groups.through
+        )
+        m2m_changed.connect(
+            dispatch_uid='acls_handler_acl_grants_update_for_user_groups',
+            receiver=handler_acl_grants_update_for_user_groups,
+            sender=User.groups.through
+        )
+        post_delete.connect(
+            dispatch_uid='acls_handler_acl_grants_update_for_group_delete_post',
+            receiver=handler_acl_grants_update_for_group_delete_post,
+            sender=Group
+        )
+        post_save.connect(
+            dispatch_uid='acls_handler_acl_grants_update_for_acl',
+            receiver=handler_acl_grants_update_for_acl,
+            sender=AccessControlList
+        )
+        pre_delete.connect(
+            dispatch_uid='acls_handler_acl_grants_update_for_group_delete_pre',
+            receiver=handler_acl_grants_update_for_group_delete_pre,
+            sender=Group
+        )
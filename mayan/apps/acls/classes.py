@@ -1,5 +1,6 @@
 import itertools
 import logging
+import threading
 
 from django.apps import apps
 from django.core.exceptions import ImproperlyConfigured
@@ -14,6 +15,51 @@ from .links import link_acl_list
 logger = logging.getLogger(name=__name__)
 
 
+class AccessCheckCache:
+    """
+    Request scoped cache of the access check decisions. The cache is only
+    active while a request is being processed and the decisions are
+    discarded when the request finishes.
+    """
+    _local = threading.local()
+
+    @staticmethod
+    def get_key(obj, permission, user):
+        return (user.pk, permission.pk, obj._meta.label, obj.pk)
+
+    @classmethod
+    def activate(cls):
+        cls._local.decisions = {}
+
+    @classmethod
+    def clear(cls):
+        if cls.get_is_active():
+            cls._local.decisions = {}
+
+    @classmethod
+    def deactivate(cls):
+        cls._local.decisions = None
+
+    @classmethod
+    def get(cls, key):
+        """
+        Return the cached decision or None if the decision is not cached.
+        """
+        decisions = getattr(cls._local, 'decisions', None)
+
+        if decisions is not None:
+            return decisions.get(key)
+
+    @classmethod
+    def get_is_active(cls):
+        return getattr(cls._local, 'decisions', None) is not None
+
+    @classmethod
+    def set(cls, key, value):
+        if cls.get_is_active():
+            cls._local.decisions[key] = value
+
+
 class ModelPermission:
     _field_query_functions = {}
     _inheritances = {}
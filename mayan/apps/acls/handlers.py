@@ -0,0 +1,116 @@
+from django.apps import apps
+
+from .classes import AccessCheckCache
+
+
+def handler_access_check_cache_clear(sender, **kwargs):
+    AccessCheckCache.clear()
+
+
+def handler_acl_grants_update_for_acl(sender, instance, created, **kwargs):
+    AccessControlListGrant = apps.get_model(
+        app_label='acls', model_name='AccessControlListGrant'
+    )
+
+    if not created:
+        # The role, or the object of the access control list could have
+        # changed.
+        AccessControlListGrant.objects.rebuild(
+            acls=(instance.pk,)
+        )
+
+
+def handler_acl_grants_update_for_acl_permissions(
+    sender, instance, action, reverse, pk_set, **kwargs
+):
+    AccessControlList = apps.get_model(
+        app_label='acls', model_name='AccessControlList'
+    )
+    AccessControlListGrant = apps.get_model(
+        app_label='acls', model_name='AccessControlListGrant'
+    )
+
+    if action == 'pre_clear' and reverse:
+        instance._acl_grant_acl_id_list = list(
+            AccessControlList.objects.filter(
+                permissions=instance
+            ).values_list('pk', flat=True)
+        )
+    elif action in ('post_add', 'post_clear', 'post_remove'):
+        if reverse:
+            acl_id_list = pk_set or getattr(
+                instance, '_acl_grant_acl_id_list', ()
+            )
+        else:
+            acl_id_list = (instance.pk,)
+
+        AccessControlListGrant.objects.rebuild(acls=acl_id_list)
+
+
+def handler_acl_grants_update_for_group_delete_post(sender, instance, **kwargs):
+    AccessControlListGrant = apps.get_model(
+        app_label='acls', model_name='AccessControlListGrant'
+    )
+
+    AccessControlListGrant.objects.rebuild(
+        users=getattr(instance, '_acl_grant_user_id_list', ())
+    )
+
+
+def handler_acl_grants_update_for_group_delete_pre(sender, instance, **kwargs):
+    instance._acl_grant_user_id_list = list(
+        instance.user_set.values_list('pk', flat=True)
+    )
+
+
+def handler_acl_grants_update_for_role_groups(
+    sender, instance, action, reverse, **kwargs
+):
+    AccessControlList = apps.get_model(
+        app_label='acls', model_name='AccessControlList'
+    )
+    AccessControlListGrant = apps.get_model(
+        app_label='acls', model_name='AccessControlListGrant'
+    )
+
+    if action in ('post_add', 'post_clear', 'post_remove'):
+        if reverse:
+            # Instance is a group, the users of the group are affected.
+            AccessControlListGrant.objects.rebuild(
+                users=list(
+                    instance.user_set.values_list('pk', flat=True)
+                )
+            )
+        else:
+            # Instance is a role, the access control lists of the role
+            # are affected. `Role.acls` are the access control lists of
+            # the role object itself and cannot be used.
+            AccessControlListGrant.objects.rebuild(
+                acls=list(
+                    AccessControlList.objects.filter(
+                        role=instance
+                    ).values_list('pk', flat=True)
+                )
+            )
+
+
+def handler_acl_grants_update_for_user_groups(
+    sender, instance, action, reverse, pk_set, **kwargs
+):
+    AccessControlListGrant = apps.get_model(
+        app_label='acls', model_name='AccessControlListGrant'
+    )
+
+    if action == 'pre_clear' and reverse:
+        instance._acl_grant_user_id_list = list(
+            instance.user_set.values_list('pk', flat=True)
+        )
+    elif action in ('post_add', 'post_clear', 'post_remove'):
+        if reverse:
+            user_id_list = pk_set or getattr(
+                instance, '_acl_grant_user_id_list', ()
+            )
+        else:
+            user_id_list = (instance.pk,)
+
+        AccessControlListGrant.objects.rebuild(users=user_id_list)
@@ -0,0 +1 @@
+ACL_GRANT_REBUILD_BATCH_SIZE = 1000
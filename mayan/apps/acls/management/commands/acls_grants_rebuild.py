@@ -0,0 +1,16 @@
+from django.core import management
+
+from ...models import AccessControlListGrant
+
+
+class Command(management.BaseCommand):
+    help = 'Recalculate the effective access control list grants of all users.'
+
+    def handle(self, **options):
+        self.stdout.write(msg='\nRebuilding access control list grants...')
+
+        AccessControlListGrant.objects.rebuild()
+
+        self.stdout.write(
+            msg='\nAccess control list grants rebuilt.'
+        )
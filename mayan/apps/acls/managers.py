@@ -2,12 +2,13 @@ from functools import reduce
 import logging
 import operator
 
+from django.apps import apps
 from django.contrib.contenttypes.fields import GenericForeignKey
 from django.contrib.contenttypes.models import ContentType
 from django.core.exceptions import PermissionDenied
-from django.db import models
-from django.db.models import CharField, Q, Value
-from django.db.models.functions import Cast, Concat
+from django.db import models, transaction
+from django.db.models import Q
+from django.db.models.functions import Cast
 from django.utils.translation import gettext
 
 from mayan.apps.common.utils import (
@@ -16,12 +17,90 @@ from mayan.apps.common.utils import (
 from mayan.apps.permissions.classes import Permission
 from mayan.apps.permissions.models import StoredPermission
 
-from .classes import ModelPermission
+from .classes import AccessCheckCache, ModelPermission
 from .exceptions import PermissionNotValidForClass
+from .literals import ACL_GRANT_REBUILD_BATCH_SIZE
 
 logger = logging.getLogger(name=__name__)
 
 
+class AccessControlListGrantManager(models.Manager):
+    def get_for(self, stored_permission, user):
+        return self.filter(stored_permission=stored_permission, user=user)
+
+    def rebuild(self, acls=None, users=None):
+        """
+        Recalculate the grants of the access control lists and users
+        provided. `acls` and `users` can be querysets or lists of primary
+        keys. When neither is provided, all the grants are recalculated.
+        """
+        AccessControlList = self.model._meta.get_field(
+            field_name='acl'
+        ).related_model
+        User = self.model._meta.get_field(field_name='user').related_model
+
+        queryset_grants = self.all()
+        acl_filter = {
+            'permissions__isnull': False,
+            'role__groups__user__isnull': False
+        }
+
+        if acls is not None:
+            queryset_grants = queryset_grants.filter(acl__in=acls)
+            acl_filter['pk__in'] = acls
+
+        if users is not None:
+            queryset_grants = queryset_grants.filter(user__in=users)
+            acl_filter['role__groups__user__in'] = users
+
+        # All the conditions are applied in a single filter call so that
+        # the values below reuse the same joins.
+        queryset_values = AccessControlList.objects.filter(
+            **acl_filter
+        ).values_list(
+            'pk', 'content_type_id', 'object_id', 'permissions',
+            'role__groups__user'
+        ).distinct().order_by()
+
+        AccessCheckCache.clear()
+
+        with transaction.atomic():
+            # Lock the users whose grants are rebuilt, in a fixed order, to
+            # serialize the concurrent rebuilds of the same grants.
+            user_id_set = set(
+                queryset_grants.values_list('user_id', flat=True)
+            )
+            user_id_set.update(
+                queryset_values.values_list('role__groups__user', flat=True)
+            )
+
+            list(
+                User.objects.select_for_update().filter(
+                    pk__in=user_id_set
+                ).order_by('pk').values_list('pk', flat=True)
+            )
+
+            queryset_grants.delete()
+
+            batch = []
+            for acl_id, content_type_id, object_id, stored_permission_id, user_id in queryset_values.iterator():
+                batch.append(
+                    self.model(
+                        acl_id=acl_id, content_type_id=content_type_id,
+                        object_id=object_id,
+                        stored_permission_id=stored_permission_id,
+                        user_id=user_id
+                    )
+                )
+
+                if len(batch) >= ACL_GRANT_REBUILD_BATCH_SIZE:
+                    self.bulk_create(ignore_conflicts=True, objs=batch)
+                    batch = []
+
+            if batch:
+                self.bulk_create(ignore_conflicts=True, objs=batch)
+
+
 class AccessControlListManager(models.Manager):
     """
     Implement a 3 tier permission system, involving a permissions, an actor
@@ -35,7 +114,17 @@ class AccessControlListManager(models.Manager):
         This method does the bulk of the work. It generates filters for the
         AccessControlList model to determine if there are ACL entries for the
         members of the queryset's model provided.
+        The filters use the materialized grants of the user instead of
+        joining the access control lists with the roles, groups and users.
         """
+        AccessControlListGrant = apps.get_model(
+            app_label='acls', model_name='AccessControlListGrant'
+        )
+
+        queryset_grants = AccessControlListGrant.objects.get_for(
+            stored_permission=stored_permission, user=user
+        )
+
         # Determine which of the cases we need to address:
         # 1: No related field
         # 2: Related field
@@ -74,46 +163,55 @@ class AccessControlListManager(models.Manager):
                         recursive_related_reference
                     )
 
-                queryset_content_type_object_id = queryset.annotate(
-                    ct_fk_combination=Concat(
-                        '{}{}'.format(
-                            recursive_related_reference,
-                            related_field.ct_field
-                        ), Value('-'),
-                        '{}{}'.format(
-                            recursive_related_reference,
-                            related_field.fk_field
-                        ), output_field=CharField()
-                    )
-                ).only('ct_fk_combination').values('ct_fk_combination')
+                # Filter each content type separately instead of comparing
+                # a concatenation of the content type and object ID to
+                # allow the use of indexes.
+                content_type_id_list = queryset_grants.values_list(
+                    'content_type_id', flat=True
+                ).distinct().order_by()
 
-                queryset_acl_filter = self.annotate(
-                    ct_fk_combination=Concat(
-                        'content_type', Value('-'), 'object_id',
-                        output_field=CharField()
-                    )
-                ).filter(
-                    permissions=stored_permission, role__groups__user=user,
-                    ct_fk_combination__in=queryset_content_type_object_id
+                content_type_lookup = '{}{}'.format(
+                    recursive_related_reference, related_field.ct_field
                 )
-
-                if fk_field_cast:
-                    clean_acl_filter = queryset_acl_filter.annotate(
-                        clean_object_id=Cast(
-                            'object_id', output_field=fk_field_cast()
-                        )
-                    ).values_list('clean_object_id')
-                else:
-                    clean_acl_filter = queryset_acl_filter.values('object_id')
-
                 field_lookup = '{}{}__in'.format(
                     recursive_related_reference, related_field.fk_field
                 )
-                result.append(
-                    Q(
-                        **{field_lookup: clean_acl_filter}
+
+                content_type_queries = []
+                for content_type_id in content_type_id_list:
+                    queryset_acl_filter = queryset_grants.filter(
+                        content_type_id=content_type_id
+                    )
+
+                    if fk_field_cast:
+                        clean_acl_filter = queryset_acl_filter.annotate(
+                            clean_object_id=Cast(
+                                'object_id', output_field=fk_field_cast()
+                            )
+                        ).values_list('clean_object_id')
+                    else:
+                        clean_acl_filter = queryset_acl_filter.values(
+                            'object_id'
+                        )
+
+                    content_type_queries.append(
+                        Q(
+                            **{
+                                content_type_lookup: content_type_id,
+                                field_lookup: clean_acl_filter
+                            }
+                        )
+                    )
+
+                if content_type_queries:
+                    result.append(
+                        reduce(operator.or_, content_type_queries)
+                    )
+                else:
+                    # No grants, add a filter that matches nothing.
+                    result.append(
+                        Q(pk__in=())
                     )
-                )
             else:
                 # Case 2: Related field of a single type, single ContentType,
                 # multiple object id.
@@ -121,9 +219,8 @@ class AccessControlListManager(models.Manager):
                     model=related_field.related_model
                 )
                 field_lookup = '{}_id__in'.format(related_field_name)
-                queryset_acl_filter = self.filter(
-                    content_type=content_type, permissions=stored_permission,
-                    role__groups__user=user
+                queryset_acl_filter = queryset_grants.filter(
+                    content_type=content_type
                 ).values('object_id')
                 # Don't add empty filters otherwise the default AND operator
                 # of the Q object will return an empty queryset when reduced
@@ -176,9 +273,8 @@ class AccessControlListManager(models.Manager):
                 model=queryset.model
             )
             field_lookup = 'id__in'
-            queryset_acl_filter = self.filter(
-                content_type=content_type, permissions=stored_permission,
-                role__groups__user=user
+            queryset_acl_filter = queryset_grants.filter(
+                content_type=content_type
             ).values('object_id')
             result.append(
                 Q(
@@ -234,9 +330,8 @@ class AccessControlListManager(models.Manager):
                 content_type = ContentType.objects.get_for_model(
                     model=queryset.model
                 )
-                queryset_acl_filter = self.filter(
-                    content_type=content_type, permissions=stored_permission,
-                    role__groups__user=user
+                queryset_acl_filter = queryset_grants.filter(
+                    content_type=content_type
                 ).values('object_id')
 
                 # Obtain a queryset of filtered, authorized model instances.
@@ -278,21 +373,74 @@ class AccessControlListManager(models.Manager):
                 ) % str(obj)
             )
             return True
-        else:
+
+        key = AccessCheckCache.get_key(
+            obj=obj, permission=permission, user=user
+        )
+        decision = AccessCheckCache.get(key=key)
+
+        if decision is None:
             manager = ModelPermission.get_manager(model=obj._meta.model)
             queryset_source = manager.all()
 
-        queryset_restricted = self.restrict_queryset(
-            permission=permission, queryset=queryset_source, user=user
-        )
+            queryset_restricted = self.restrict_queryset(
+                permission=permission, queryset=queryset_source, user=user
+            )
 
-        if queryset_restricted.filter(pk=obj.pk).exists():
+            decision = queryset_restricted.filter(pk=obj.pk).exists()
+            AccessCheckCache.set(key=key, value=decision)
+
+        if decision:
             return True
         else:
             raise PermissionDenied(
                 gettext(message='Insufficient access for: %s') % str(obj)
             )
 
+    def check_access_many(self, obj_list, permission, user):
+        """
+        Return the list of objects to which the user has access with a
+        single query per model. The decisions are stored in the access
+        check cache for subsequent calls to `check_access`.
+        """
+        model_object_lists = {}
+        result = []
+
+        for obj in obj_list:
+            meta = getattr(obj, '_meta', None)
+
+            if meta:
+                model_object_lists.setdefault(meta.model, []).append(obj)
+            else:
+                result.append(obj)
+
+        for model, object_list in model_object_lists.items():
+            manager = ModelPermission.get_manager(model=model)
+
+            queryset_restricted = self.restrict_queryset(
+                permission=permission, queryset=manager.all(), user=user
+            )
+
+            allowed_pk_set = set(
+                queryset_restricted.filter(
+                    pk__in=[obj.pk for obj in object_list]
+                ).values_list('pk', flat=True)
+            )
+
+            for obj in object_list:
+                decision = obj.pk in allowed_pk_set
+
+                AccessCheckCache.set(
+                    key=AccessCheckCache.get_key(
+                        obj=obj, permission=permission, user=user
+                    ), value=decision
+                )
+
+                if decision:
+                    result.append(obj)
+
+        return result
+
     def restrict_queryset(self, permission, queryset, user):
         if not user.is_authenticated:
             return queryset.none()
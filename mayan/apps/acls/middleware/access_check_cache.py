@@ -0,0 +1,16 @@
+from django.utils.deprecation import MiddlewareMixin
+
+from ..classes import AccessCheckCache
+
+
+class AccessCheckCacheMiddleware(MiddlewareMixin):
+    """
+    Enable the access check decision cache for the duration of each
+    request.
+    """
+    def process_request(self, request):
+        AccessCheckCache.activate()
+
+    def process_response(self, request, response):
+        AccessCheckCache.deactivate()
+        return response
@@ -0,0 +1,117 @@
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+ACL_GRANT_REBUILD_BATCH_SIZE = 1000
+
+
+def code_acl_grants_populate(apps, schema_editor):
+    AccessControlList = apps.get_model(
+        app_label='acls', model_name='AccessControlList'
+    )
+    AccessControlListGrant = apps.get_model(
+        app_label='acls', model_name='AccessControlListGrant'
+    )
+
+    queryset_values = AccessControlList.objects.using(
+        alias=schema_editor.connection.alias
+    ).filter(
+        permissions__isnull=False, role__groups__user__isnull=False
+    ).values_list(
+        'pk', 'content_type_id', 'object_id', 'permissions',
+        'role__groups__user'
+    ).distinct().order_by()
+
+    batch = []
+    for acl_id, content_type_id, object_id, stored_permission_id, user_id in queryset_values.iterator():
+        batch.append(
+            AccessControlListGrant(
+                acl_id=acl_id, content_type_id=content_type_id,
+                object_id=object_id,
+                stored_permission_id=stored_permission_id, user_id=user_id
+            )
+        )
+
+        if len(batch) >= ACL_GRANT_REBUILD_BATCH_SIZE:
+            AccessControlListGrant.objects.using(
+                alias=schema_editor.connection.alias
+            ).bulk_create(objs=batch)
+            batch = []
+
+    if batch:
+        AccessControlListGrant.objects.using(
+            alias=schema_editor.connection.alias
+        ).bulk_create(objs=batch)
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ('contenttypes', '0002_remove_content_type_name'),
+        ('permissions', '0004_auto_20191213_0044'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('acls', '0005_auto_20230116_0640')
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='AccessControlListGrant',
+            fields=[
+                (
+                    'id', models.AutoField(
+                        auto_created=True, primary_key=True,
+                        serialize=False, verbose_name='ID'
+                    )
+                ),
+                (
+                    'object_id', models.PositiveIntegerField(
+                        verbose_name='Object ID'
+                    )
+                ),
+                (
+                    'acl', models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name='grants', to='acls.accesscontrollist',
+                        verbose_name='Access entry'
+                    )
+                ),
+                (
+                    'content_type', models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name='+', to='contenttypes.contenttype',
+                        verbose_name='Content type'
+                    )
+                ),
+                (
+                    'stored_permission', models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name='+', to='permissions.storedpermission',
+                        verbose_name='Permission'
+                    )
+                ),
+                (
+                    'user', models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name='+', to=settings.AUTH_USER_MODEL,
+                        verbose_name='User'
+                    )
+                )
+            ],
+            options={
+                'verbose_name': 'Access entry grant',
+                'verbose_name_plural': 'Access entry grants',
+                'indexes': [
+                    models.Index(
+                        fields=[
+                            'user', 'stored_permission', 'content_type',
+                            'object_id'
+                        ], name='acls_grant_lookup_idx'
+                    )
+                ],
+                'unique_together': {('acl', 'stored_permission', 'user')}
+            }
+        ),
+        migrations.RunPython(
+            code=code_acl_grants_populate,
+            reverse_code=migrations.RunPython.noop
+        )
+    ]
@@ -1,5 +1,6 @@
 import logging
 
+from django.conf import settings
 from django.contrib.contenttypes.fields import GenericForeignKey
 from django.contrib.contenttypes.models import ContentType
 from django.db import models
@@ -14,7 +15,9 @@ from mayan.apps.events.event_managers import (
 from mayan.apps.permissions.models import Role, StoredPermission
 
 from .events import event_acl_created, event_acl_deleted
-from .managers import AccessControlListManager
+from .managers import (
+    AccessControlListGrantManager, AccessControlListManager
+)
 from .model_mixins import AccessControlListBusinessLogicMixin
 
 logger = logging.getLogger(name=__name__)
@@ -99,6 +102,56 @@ class AccessControlList(
         return super().save(*args, **kwargs)
 
 
+class AccessControlListGrant(models.Model):
+    """
+    Denormalized effective permission granted to a user for an object by
+    an access control list. Maintained automatically when the access
+    control lists, roles, groups or users change. Used to restrict
+    querysets without joining the access control lists with the roles,
+    groups and users.
+    """
+    acl = models.ForeignKey(
+        on_delete=models.CASCADE, related_name='grants',
+        to=AccessControlList, verbose_name=_(message='Access entry')
+    )
+    content_type = models.ForeignKey(
+        on_delete=models.CASCADE, related_name='+', to=ContentType,
+        verbose_name=_(message='Content type')
+    )
+    object_id = models.PositiveIntegerField(
+        verbose_name=_(message='Object ID')
+    )
+    stored_permission = models.ForeignKey(
+        on_delete=models.CASCADE, related_name='+', to=StoredPermission,
+        verbose_name=_(message='Permission')
+    )
+    user = models.ForeignKey(
+        on_delete=models.CASCADE, related_name='+',
+        to=settings.AUTH_USER_MODEL, verbose_name=_(message='User')
+    )
+
+    objects = AccessControlListGrantManager()
+
+    class Meta:
+        indexes = (
+            models.Index(
+                fields=(
+                    'user', 'stored_permission', 'content_type',
+                    'object_id'
+                ), name='acls_grant_lookup_idx'
+            ),
+        )
+        unique_together = ('acl', 'stored_permission', 'user')
+        verbose_name = _(message='Access entry grant')
+        verbose_name_plural = _(message='Access entry grants')
+
+    def __str__(self):
+        return '{}: {} ({}-{})'.format(
+            self.user_id, self.stored_permission_id, self.content_type_id,
+            self.object_id
+        )
+
+
 class GlobalAccessControlListProxy(AccessControlList):
     class Meta:
         proxy = True
@@ -1,3 +1,5 @@
+from unittest import mock
+
 from django.contrib.contenttypes.fields import GenericForeignKey
 from django.contrib.contenttypes.models import ContentType
 from django.core.exceptions import PermissionDenied
@@ -6,12 +8,137 @@ from django.db import models
 from mayan.apps.events.classes import EventModelRegistry
 from mayan.apps.testing.tests.base import BaseTestCase
 
-from ..classes import ModelPermission
-from ..models import AccessControlList
+from ..classes import AccessCheckCache, ModelPermission
+from ..managers import AccessControlListGrantManager
+from ..models import AccessControlList, AccessControlListGrant
 
 from .mixins import ACLTestMixin
 
 
+class AccessControlListGrantTestCase(ACLTestMixin, BaseTestCase):
+    auto_create_acl_test_object = True
+
+    def _get_test_grant_queryset(self):
+        return AccessControlListGrant.objects.filter(
+            content_type=self._test_object_content_type,
+            object_id=self._test_object.pk,
+            stored_permission=self._test_permission.stored_permission,
+            user=self._test_case_user
+        )
+
+    def test_grant_create_on_acl_permission_add(self):
+        self.grant_access(
+            obj=self._test_object, permission=self._test_permission
+        )
+
+        self.assertEqual(
+            self._get_test_grant_queryset().count(), 1
+        )
+
+    def test_grant_delete_on_acl_permission_remove(self):
+        self.grant_access(
+            obj=self._test_object, permission=self._test_permission
+        )
+        self.revoke_access(
+            obj=self._test_object, permission=self._test_permission
+        )
+
+        self.assertEqual(
+            self._get_test_grant_queryset().count(), 0
+        )
+
+    def test_grant_delete_on_group_delete(self):
+        self.grant_access(
+            obj=self._test_object, permission=self._test_permission
+        )
+        self._test_case_group.delete()
+
+        self.assertEqual(
+            self._get_test_grant_queryset().count(), 0
+        )
+
+    def test_grant_delete_on_group_user_clear(self):
+        self.grant_access(
+            obj=self._test_object, permission=self._test_permission
+        )
+        self._test_case_group.user_set.clear()
+
+        self.assertEqual(
+            self._get_test_grant_queryset().count(), 0
+        )
+
+    def test_grant_delete_on_role_group_remove(self):
+        self.grant_access(
+            obj=self._test_object, permission=self._test_permission
+        )
+        self._test_case_role.groups.remove(self._test_case_group)
+
+        self.assertEqual(
+            self._get_test_grant_queryset().count(), 0
+        )
+
+    def test_grant_update_on_user_group_add(self):
+        self.grant_access(
+            obj=self._test_object, permission=self._test_permission
+        )
+        self._test_case_user.groups.remove(self._test_case_group)
+
+        self.assertEqual(
+            self._get_test_grant_queryset().count(), 0
+        )
+
+        self._test_case_user.groups.add(self._test_case_group)
+
+        self.assertEqual(
+            self._get_test_grant_queryset().count(), 1
+        )
+
+    def test_method_rebuild(self):
+        self.grant_access(
+            obj=self._test_object, permission=self._test_permission
+        )
+        AccessControlListGrant.objects.all().delete()
+
+        AccessControlListGrant.objects.rebuild()
+
+        self.assertEqual(
+            self._get_test_grant_queryset().count(), 1
+        )
+
+    def test_method_rebuild_concurrent(self):
+        self.grant_access(
+            obj=self._test_object, permission=self._test_permission
+        )
+
+        acl_id_list = list(
+            AccessControlList.objects.values_list('pk', flat=True)
+        )
+
+        bulk_create = AccessControlListGrantManager.bulk_create
+        call_list = []
+
+        def bulk_create_interleaved(manager, *args, **kwargs):
+            # Another rebuild of the same grants commits between the
+            # delete and the insert of this rebuild.
+            if not call_list:
+                call_list.append(True)
+                AccessControlListGrant.objects.rebuild(acls=acl_id_list)
+
+            return bulk_create(manager, *args, **kwargs)
+
+        with mock.patch.object(
+            AccessControlListGrantManager, 'bulk_create',
+            autospec=True, side_effect=bulk_create_interleaved
+        ):
+            AccessControlListGrant.objects.rebuild(
+                users=(self._test_case_user.pk,)
+            )
+
+        self.assertEqual(
+            self._get_test_grant_queryset().count(), 1
+        )
+
+
 class PermissionTestCase(ACLTestMixin, BaseTestCase):
     auto_create_acl_test_object = False
 
@@ -68,6 +195,69 @@ class PermissionTestCase(ACLTestMixin, BaseTestCase):
             )
         )
 
+    def test_check_access_cache(self):
+        self._create_acl_test_object()
+
+        self.grant_access(
+            obj=self._test_object, permission=self._test_permission
+        )
+
+        AccessCheckCache.activate()
+        self.addCleanup(AccessCheckCache.deactivate)
+
+        AccessControlList.objects.check_access(
+            obj=self._test_object, permission=self._test_permission,
+            user=self._test_case_user
+        )
+
+        with self.assertNumQueries(num=0):
+            AccessControlList.objects.check_access(
+                obj=self._test_object, permission=self._test_permission,
+                user=self._test_case_user
+            )
+
+        self.revoke_access(
+            obj=self._test_object, permission=self._test_permission
+        )
+
+        with self.assertRaises(expected_exception=PermissionDenied):
+            AccessControlList.objects.check_access(
+                obj=self._test_object, permission=self._test_permission,
+                user=self._test_case_user
+            )
+
+    def test_check_access_many(self):
+        self._create_acl_test_object()
+        test_object_0 = self._test_object
+        self._create_test_object()
+        test_object_1 = self._test_object
+
+        self.grant_access(
+            obj=test_object_1, permission=self._test_permission
+        )
+
+        AccessCheckCache.activate()
+        self.addCleanup(AccessCheckCache.deactivate)
+
+        self.assertEqual(
+            AccessControlList.objects.check_access_many(
+                obj_list=(test_object_0, test_object_1),
+                permission=self._test_permission, user=self._test_case_user
+            ), [test_object_1]
+        )
+
+        with self.assertNumQueries(num=0):
+            with self.assertRaises(expected_exception=PermissionDenied):
+                AccessControlList.objects.check_access(
+                    obj=test_object_0, permission=self._test_permission,
+                    user=self._test_case_user
+                )
+
+            AccessControlList.objects.check_access(
+                obj=test_object_1, permission=self._test_permission,
+                user=self._test_case_user
+            )
+
     def _setup_child_parent_test_objects(self):
         self._create_test_permission()
         self._create_test_model(model_name='TestModelParent')
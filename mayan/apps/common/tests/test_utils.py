@@ -1,10 +1,13 @@
+from unittest import mock
+
 from django.db import models
 
 from mayan.apps.testing.tests.base import BaseTestCase
 
 from ..utils import (
-    ResolverPipelineModelAttribute, flatten_list, flatten_map, flatten_object,
-    group_iterator, parse_range
+    ProcessInstanceCache, ResolverPipelineModelAttribute, flatten_list,
+    flatten_map, flatten_object, group_iterator, parse_range,
+    parse_range_boundaries
 )
 
 
@@ -238,6 +241,98 @@ class ParseRangeTestCase(BaseTestCase):
         )
 
 
+class ParseRangeBoundariesTestCase(BaseTestCase):
+    def test_parse_range_boundaries(self):
+        self.assertEqual(
+            list(
+                parse_range_boundaries(range_string='2,4,6-8')
+            ), [(2, 2), (4, 4), (6, 8)]
+        )
+
+    def test_empty_range(self):
+        self.assertEqual(
+            list(
+                parse_range_boundaries(range_string='')
+            ), []
+        )
+
+    def test_reverse(self):
+        self.assertEqual(
+            list(
+                parse_range_boundaries(range_string='9-5')
+            ), [(9, 5)]
+        )
+
+
+class ProcessInstanceCacheTestCase(BaseTestCase):
+    def setUp(self):
+        super().setUp()
+        self._test_discarded_list = []
+        self._test_instance_cache = ProcessInstanceCache(
+            on_discard=self._test_discarded_list.append
+        )
+
+    def test_get_reuse(self):
+        instance = self._test_instance_cache.get(
+            arguments=1, factory=object
+        )
+
+        self.assertTrue(
+            self._test_instance_cache.get(
+                arguments=1, factory=object
+            ) is instance
+        )
+        self.assertEqual(self._test_discarded_list, [])
+
+    def test_get_arguments_change(self):
+        instance = self._test_instance_cache.get(
+            arguments=1, factory=object
+        )
+        instance_new = self._test_instance_cache.get(
+            arguments=2, factory=object
+        )
+
+        self.assertFalse(instance_new is instance)
+        self.assertEqual(self._test_discarded_list, [instance])
+        self.assertEqual(
+            len(self._test_instance_cache._entries), 1
+        )
+
+    def test_get_key(self):
+        instance_1 = self._test_instance_cache.get(
+            factory=object, key=1
+        )
+        instance_2 = self._test_instance_cache.get(
+            factory=object, key=2
+        )
+
+        self.assertFalse(instance_1 is instance_2)
+        self.assertTrue(
+            self._test_instance_cache.get(
+                factory=object, key=1
+            ) is instance_1
+        )
+
+    def test_get_fork(self):
+        instance = self._test_instance_cache.get(factory=object)
+
+        with mock.patch('mayan.apps.common.utils.os.getpid', return_value=-1):
+            instance_child = self._test_instance_cache.get(factory=object)
+
+        self.assertFalse(instance_child is instance)
+        self.assertEqual(self._test_discarded_list, [])
+
+    def test_clear(self):
+        instance = self._test_instance_cache.get(factory=object)
+
+        self._test_instance_cache.clear()
+
+        self.assertEqual(self._test_discarded_list, [instance])
+        self.assertFalse(
+            self._test_instance_cache.get(factory=object) is instance
+        )
+
+
 class ResolverRelatedManagerTestCase(BaseTestCase):
     def setUp(self):
         super().setUp()
@@ -2,7 +2,9 @@ from distutils import util
 from functools import reduce
 import itertools
 import logging
+import os
 import shlex
+import threading
 import types
 
 from django.core.exceptions import FieldDoesNotExist
@@ -46,6 +48,52 @@ class ProgressBar:
             print()
 
 
+class ProcessInstanceCache:
+    """
+    Per process, thread safe cache of long lived instances. Each key holds
+    a single instance, created by calling `factory` and created again when
+    the `arguments` used to create it change. The previous instance is
+    passed to `on_discard`. Entries inherited from a parent process are
+    dropped after a fork without being discarded, to avoid sharing or
+    closing the resources of the parent process.
+    """
+    def __init__(self, on_discard=None):
+        self._entries = {}
+        self._lock = threading.Lock()
+        self._on_discard = on_discard
+        self._pid = None
+
+    def _discard(self, instance):
+        if self._on_discard:
+            self._on_discard(instance)
+
+    def clear(self):
+        with self._lock:
+            if self._pid == os.getpid():
+                for arguments, instance in self._entries.values():
+                    self._discard(instance=instance)
+
+            self._entries.clear()
+
+    def get(self, factory, arguments=None, key=None):
+        with self._lock:
+            pid = os.getpid()
+            if self._pid != pid:
+                self._entries.clear()
+                self._pid = pid
+
+            entry = self._entries.get(key)
+
+            if entry is None or entry[0] != arguments:
+                if entry is not None:
+                    self._discard(instance=entry[1])
+
+                entry = (arguments, factory())
+                self._entries[key] = entry
+
+            return entry[1]
+
+
 class Resolver:
     exceptions = ()
 
@@ -358,6 +406,20 @@ def group_iterator(iterable, group_size=None):
 
 
 def parse_range(range_string):
+    for start, stop in parse_range_boundaries(range_string=range_string):
+        if stop > start:
+            step = 1
+        else:
+            step = -1
+
+        yield from range(start, stop + step, step)
+
+
+def parse_range_boundaries(range_string):
+    """
+    Generator of the (start, stop) boundaries of each part of a range
+    string without expanding the ranges.
+    """
     for part in range_string.split(','):
         part = part.strip()
 
@@ -370,19 +432,14 @@ def parse_range(range_string):
                 part_range[1].strip()
             )
 
-            if stop > start:
-                step = 1
-            else:
-                step = -1
-
-            yield from range(start, stop + step, step)
+            yield (start, stop)
         else:
             try:
                 value = int(part)
             except ValueError:
                 return
             else:
-                yield value
+                yield (value, value)
 
 
 def resolve_attribute(attribute, obj, kwargs=None):
@@ -1,5 +1,6 @@
 import io
 import logging
+import os
 import shutil
 import struct
 
@@ -9,7 +10,7 @@ import sh
 
 from django.utils.translation import gettext_lazy as _
 
-from mayan.apps.storage.utils import NamedTemporaryFile
+from mayan.apps.storage.utils import NamedTemporaryFile, TemporaryDirectory
 
 from ..classes import ConverterBase
 from ..exceptions import PageCountError
@@ -82,6 +83,50 @@ class Python(ConverterBase):
                 image_buffer.seek(0)
                 return Image.open(fp=image_buffer)
 
+    def convert_range(self, page_number_first, page_number_last):
+        """
+        Render the entire page range with a single `pdftoppm` execution
+        from a single temporary copy of the source file.
+        """
+        if self.mime_type == 'application/pdf' and command_pdftoppm:
+            with NamedTemporaryFile() as new_file_object:
+                self.file_object.seek(0)
+                shutil.copyfileobj(
+                    fsrc=self.file_object, fdst=new_file_object
+                )
+                self.file_object.seek(0)
+                new_file_object.flush()
+
+                with TemporaryDirectory() as output_directory:
+                    command_pdftoppm(
+                        new_file_object.name,
+                        os.path.join(output_directory, 'page'),
+                        f=page_number_first + 1, l=page_number_last + 1
+                    )
+
+                    # `pdftoppm` names the output files
+                    # "<prefix>-<page number>.<extension>" and zero pads
+                    # the page number based on the total page count.
+                    output_pages = []
+                    for filename in os.listdir(output_directory):
+                        name, extension = os.path.splitext(filename)
+                        page_number = int(
+                            name.rsplit('-', 1)[-1]
+                        ) - 1
+                        output_pages.append((page_number, filename))
+
+                    for page_number, filename in sorted(output_pages):
+                        image = Image.open(
+                            fp=os.path.join(output_directory, filename)
+                        )
+                        image.load()
+                        yield page_number, image
+        else:
+            yield from super().convert_range(
+                page_number_first=page_number_first,
+                page_number_last=page_number_last
+            )
+
     def get_page_count(self):
         super().get_page_count()
 
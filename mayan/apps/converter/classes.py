@@ -1,8 +1,12 @@
+import atexit
+from contextlib import contextmanager
 import copy
 from io import BytesIO
 import logging
 import os
+import queue
 import shutil
+import threading
 
 import PIL
 from PIL import Image, ImageFile
@@ -22,16 +26,16 @@ from mayan.apps.navigation.links import Link
 from mayan.apps.storage.compressed_files import MsgArchive
 from mayan.apps.storage.literals import MSG_MIME_TYPES
 from mayan.apps.storage.settings import setting_temporary_directory
-from mayan.apps.storage.utils import (
-    NamedTemporaryFile, TemporaryDirectory, fs_cleanup
-)
+from mayan.apps.storage.utils import NamedTemporaryFile, fs_cleanup, mkdtemp
 
 from .exceptions import (
     AppImageError, InvalidOfficeFormat, LayerError, OfficeConversionError
 )
 from .literals import (
     CONVERTER_OFFICE_FILE_MIMETYPES, DEFAULT_LIBREOFFICE_PATH,
-    DEFAULT_PAGE_NUMBER, DEFAULT_PILLOW_FORMAT, MAP_PILLOW_FORMAT_TO_MIME_TYPE
+    DEFAULT_LIBREOFFICE_POOL_SIZE, DEFAULT_LIBREOFFICE_TIMEOUT,
+    DEFAULT_PAGE_NUMBER, DEFAULT_PILLOW_FORMAT,
+    LIBREOFFICE_PROFILE_DIRECTORY_PREFIX, MAP_PILLOW_FORMAT_TO_MIME_TYPE
 )
 from .literals import IMAGE_ERROR_BROKEN_FILE
 from .settings import (
@@ -45,6 +49,12 @@ logger = logging.getLogger(name=__name__)
 libreoffice_path = setting_graphics_backend_arguments.value.get(
     'libreoffice_path', DEFAULT_LIBREOFFICE_PATH
 )
+libreoffice_pool_size = setting_graphics_backend_arguments.value.get(
+    'libreoffice_pool_size', DEFAULT_LIBREOFFICE_POOL_SIZE
+)
+libreoffice_timeout = setting_graphics_backend_arguments.value.get(
+    'libreoffice_timeout', DEFAULT_LIBREOFFICE_TIMEOUT
+)
 
 logger = logging.getLogger(name=__name__)
 
@@ -80,6 +90,101 @@ class AppImageErrorImage:
         return self.template.render(context=context)
 
 
+class LibreOfficeProfile:
+    """
+    Persistent LibreOffice user installation. Most of the LibreOffice
+    startup time is spent initializing a new user profile, reusing the
+    profile keeps the following conversions warm.
+    """
+    def __init__(self):
+        self.path = mkdtemp(prefix=LIBREOFFICE_PROFILE_DIRECTORY_PREFIX)
+
+    def __repr__(self):
+        return '<LibreOfficeProfile ({})>'.format(self.path)
+
+    def get_user_installation(self):
+        return 'file://{}'.format(
+            os.path.join(self.path, 'LibreOffice_Conversion')
+        )
+
+    def remove(self):
+        fs_cleanup(filename=self.path)
+
+
+class LibreOfficeProfilePool:
+    """
+    Per process pool of LibreOffice profiles. The size of the pool limits
+    the number of concurrent conversions of the process as LibreOffice
+    does not allow sharing a profile between instances.
+    """
+    _lock = threading.Lock()
+    _pid = None
+    _queue = None
+
+    @classmethod
+    @contextmanager
+    def acquire(cls):
+        """
+        Yield a profile, blocking until one is available. The profile of
+        a failed or timed out conversion is discarded and replaced by a
+        new one as LibreOffice might have left it in an invalid state.
+        Profiles released after the pool was purged are removed instead
+        of being returned to the discarded queue.
+        """
+        queue_profiles = cls.get_queue()
+        profile = queue_profiles.get()
+
+        try:
+            yield profile
+        except Exception:
+            logger.debug('Recycling LibreOffice profile: %s', profile)
+            profile.remove()
+            profile = LibreOfficeProfile()
+            raise
+        finally:
+            with cls._lock:
+                if queue_profiles is cls._queue:
+                    queue_profiles.put(profile)
+                else:
+                    profile.remove()
+
+    @classmethod
+    def get_queue(cls):
+        with cls._lock:
+            # Profiles must not be shared with forked child processes.
+            if cls._queue is None or cls._pid != os.getpid():
+                cls._pid = os.getpid()
+                cls._queue = queue.Queue()
+
+                for index in range(libreoffice_pool_size):
+                    cls._queue.put(
+                        LibreOfficeProfile()
+                    )
+
+            return cls._queue
+
+    @classmethod
+    def purge(cls):
+        """
+        Remove the idle profiles of the pool of this process. Profiles in
+        use are removed when they are released.
+        """
+        with cls._lock:
+            if cls._queue is not None and cls._pid == os.getpid():
+                while True:
+                    try:
+                        profile = cls._queue.get_nowait()
+                    except queue.Empty:
+                        break
+                    else:
+                        profile.remove()
+
+            cls._queue = None
+
+
+atexit.register(LibreOfficeProfilePool.purge)
+
+
 class ConverterBase:
     @staticmethod
     def get_converter_class():
@@ -116,6 +221,15 @@ class ConverterBase:
     def convert(self, page_number=DEFAULT_PAGE_NUMBER):
         self.page_number = page_number
 
+    def convert_range(self, page_number_first, page_number_last):
+        """
+        Generator that yields a tuple with the page number and the image
+        of each page in the range. Backends able to render several pages
+        in a single pass should override this method.
+        """
+        for page_number in range(page_number_first, page_number_last + 1):
+            yield page_number, self.convert(page_number=page_number)
+
     def get_page(self, output_format=None):
         output_format = output_format or setting_graphics_backend_arguments.value.get(
             'pillow_format', DEFAULT_PILLOW_FORMAT
@@ -146,6 +260,42 @@ class ConverterBase:
         except InvalidOfficeFormat as exception:
             logger.debug('Is not an office format document; %s', exception)
 
+    def get_pages(
+        self, page_number_first, page_number_last, output_format=None
+    ):
+        """
+        Generator that yields a tuple with the page number and the encoded
+        image buffer of each page in the range. Page numbers start at 0.
+        Paged image formats are seeked one page at a time, other formats
+        are rendered in a single pass by `convert_range`.
+        """
+        self.file_object.seek(0)
+
+        try:
+            Image.open(fp=self.file_object)
+        except IOError:
+            is_image = False
+        except Exception:
+            # Let `seek_page` raise the proper error for the page.
+            is_image = True
+        else:
+            is_image = True
+        finally:
+            self.file_object.seek(0)
+
+        if is_image:
+            for page_number in range(page_number_first, page_number_last + 1):
+                self.seek_page(page_number=page_number)
+                yield page_number, self.get_page(output_format=output_format)
+        else:
+            iterator = self.convert_range(
+                page_number_first=page_number_first,
+                page_number_last=page_number_last
+            )
+            for page_number, image in iterator:
+                self.image = image
+                yield page_number, self.get_page(output_format=output_format)
+
     def seek_page(self, page_number):
         """
         Seek the specified page number from the source file object.
@@ -212,19 +362,17 @@ class ConverterBase:
             self.file_object.seek(0)
             temporary_file_object.seek(0)
 
-            with TemporaryDirectory() as libreoffice_home_directory:
+            with LibreOfficeProfilePool.acquire() as libreoffice_profile:
                 args = (
                     temporary_file_object.name, '--outdir', setting_temporary_directory.value,
-                    '-env:UserInstallation=file://{}'.format(
-                        os.path.join(
-                            libreoffice_home_directory,
-                            'LibreOffice_Conversion'
-                        )
+                    '-env:UserInstallation={}'.format(
+                        libreoffice_profile.get_user_installation()
                     ),
                 )
 
                 kwargs = {
-                    '_env': {'HOME': libreoffice_home_directory}
+                    '_env': {'HOME': libreoffice_profile.path},
+                    '_timeout': libreoffice_timeout
                 }
 
                 if self.mime_type == 'text/plain':
@@ -237,6 +385,12 @@ class ConverterBase:
                 except sh.ErrorReturnCode as exception:
                     temporary_file_object.close()
                     raise OfficeConversionError(exception)
+                except sh.TimeoutException as exception:
+                    temporary_file_object.close()
+                    raise OfficeConversionError(
+                        'LibreOffice conversion timed out after {} '
+                        'seconds; {}'.format(libreoffice_timeout, exception)
+                    )
                 except Exception as exception:
                     temporary_file_object.close()
                     logger.error(
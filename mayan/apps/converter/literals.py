@@ -75,6 +75,9 @@ DEFAULT_CONVERTER_IMAGE_GENERATION_TIMEOUT = 120  # seconds
 
 DEFAULT_CONVERTER_LOAD_TRUNCATED_IMAGES = False
 
+DEFAULT_LIBREOFFICE_POOL_SIZE = 2
+DEFAULT_LIBREOFFICE_TIMEOUT = 300  # seconds
+
 DEFAULT_PAGE_NUMBER = 1
 DEFAULT_PDFTOPPM_DPI = 300
 DEFAULT_PDFTOPPM_FORMAT = 'jpeg'  # Possible values jpeg, png, tiff
@@ -85,6 +88,8 @@ DEFAULT_ZOOM_LEVEL = 100
 
 DEFAULT_CONVERTER_GRAPHICS_BACKEND_ARGUMENTS = {
     'libreoffice_path': DEFAULT_LIBREOFFICE_PATH,
+    'libreoffice_pool_size': DEFAULT_LIBREOFFICE_POOL_SIZE,
+    'libreoffice_timeout': DEFAULT_LIBREOFFICE_TIMEOUT,
     'pdftoppm_dpi': DEFAULT_PDFTOPPM_DPI,
     'pdftoppm_format': DEFAULT_PDFTOPPM_FORMAT,
     'pdftoppm_path': DEFAULT_PDFTOPPM_PATH,
@@ -95,6 +100,8 @@ DEFAULT_CONVERTER_GRAPHICS_BACKEND_ARGUMENTS = {
 
 IMAGE_ERROR_BROKEN_FILE = 'converter_image_error_broken_file'
 
+LIBREOFFICE_PROFILE_DIRECTORY_PREFIX = 'mayan-libreoffice-'
+
 MAP_PILLOW_FORMAT_TO_MIME_TYPE = {
     'JPEG': 'image/jpeg'
 }
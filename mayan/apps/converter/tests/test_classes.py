@@ -0,0 +1,83 @@
+from pathlib import Path
+
+from mayan.apps.testing.tests.base import BaseTestCase
+
+from ..classes import LibreOfficeProfilePool
+from ..exceptions import OfficeConversionError
+
+
+class LibreOfficeProfilePoolTestCase(BaseTestCase):
+    def setUp(self):
+        super().setUp()
+        LibreOfficeProfilePool.purge()
+
+    def tearDown(self):
+        LibreOfficeProfilePool.purge()
+        super().tearDown()
+
+    def test_profile_reuse(self):
+        with LibreOfficeProfilePool.acquire() as profile:
+            test_profile_path = profile.path
+
+        queue_profiles = LibreOfficeProfilePool.get_queue()
+
+        test_profile_paths = [
+            profile.path for profile in list(queue_profiles.queue)
+        ]
+
+        self.assertTrue(test_profile_path in test_profile_paths)
+        self.assertTrue(
+            Path(test_profile_path).exists()
+        )
+
+    def test_profile_recycle_on_error(self):
+        with self.assertRaises(expected_exception=OfficeConversionError):
+            with LibreOfficeProfilePool.acquire() as profile:
+                test_profile_path = profile.path
+                raise OfficeConversionError
+
+        queue_profiles = LibreOfficeProfilePool.get_queue()
+
+        test_profile_paths = [
+            profile.path for profile in list(queue_profiles.queue)
+        ]
+
+        self.assertFalse(test_profile_path in test_profile_paths)
+        self.assertFalse(
+            Path(test_profile_path).exists()
+        )
+
+    def test_purge(self):
+        queue_profiles = LibreOfficeProfilePool.get_queue()
+
+        test_profile_paths = [
+            profile.path for profile in list(queue_profiles.queue)
+        ]
+
+        LibreOfficeProfilePool.purge()
+
+        for test_profile_path in test_profile_paths:
+            self.assertFalse(
+                Path(test_profile_path).exists()
+            )
+
+    def test_purge_with_profile_in_use(self):
+        with LibreOfficeProfilePool.acquire() as profile:
+            test_profile_path = profile.path
+            LibreOfficeProfilePool.purge()
+
+            self.assertTrue(
+                Path(test_profile_path).exists()
+            )
+
+        self.assertFalse(
+            Path(test_profile_path).exists()
+        )
+
+        queue_profiles = LibreOfficeProfilePool.get_queue()
+
+        test_profile_paths = [
+            profile.path for profile in list(queue_profiles.queue)
+        ]
+
+        self.assertFalse(test_profile_path in test_profile_paths)
@@ -0,0 +1,139 @@
+import logging
+import threading
+
+from django.apps import apps
+from django.utils.translation import gettext_lazy as _
+
+from mayan.apps.templating.template_backends import Template
+
+logger = logging.getLogger(name=__name__)
+
+
+class IndexTemplatePlan:
+    """
+    Compiled representation of the enabled nodes of an index template.
+    The template of each node is parsed once and the plan is reused for
+    every document until the nodes of the index template change.
+    """
+    _cache = {}
+    _cache_lock = threading.Lock()
+
+    @classmethod
+    def cache_clear(cls):
+        with cls._cache_lock:
+            cls._cache.clear()
+
+    @classmethod
+    def get_for(cls, index_template):
+        """
+        Return the plan of the index template. The node values are
+        compared with those of the cached plan to detect changes made by
+        any process.
+        """
+        IndexTemplateNode = apps.get_model(
+            app_label='document_indexing', model_name='IndexTemplateNode'
+        )
+
+        node_values = tuple(
+            IndexTemplateNode.objects.filter(
+                index_id=index_template.pk
+            ).order_by('tree_id', 'lft').values_list(
+                'pk', 'parent_id', 'enabled', 'expression', 'link_documents'
+            )
+        )
+
+        with cls._cache_lock:
+            plan = cls._cache.get(index_template.pk)
+
+            if plan is None or plan.node_values != node_values:
+                plan = cls(node_values=node_values)
+                cls._cache[index_template.pk] = plan
+
+            return plan
+
+    def __init__(self, node_values):
+        self.children = {}
+        self.node_values = node_values
+        self.root_node_id = None
+
+        enabled_node_id_set = set()
+
+        # The nodes are sorted in tree order, parents are always found
+        # before their children. The children of disabled nodes are not
+        # evaluated.
+        for pk, parent_id, enabled, expression, link_documents in node_values:
+            if parent_id is None:
+                self.root_node_id = pk
+                enabled_node_id_set.add(pk)
+            elif enabled and parent_id in enabled_node_id_set:
+                enabled_node_id_set.add(pk)
+                self.children.setdefault(parent_id, []).append(
+                    IndexTemplatePlanNode(
+                        expression=expression,
+                        link_documents=link_documents, pk=pk
+                    )
+                )
+
+    def _evaluate(self, document, parent_id):
+        result = []
+
+        for plan_node in self.children.get(parent_id, ()):
+            try:
+                value = plan_node.render(document=document)
+            except Exception as exception:
+                logger.debug('Evaluating error: %s', exception)
+                error_message = _(
+                    message='Error indexing document: %(document)s; expression: '
+                    '%(expression)s; %(exception)s'
+                ) % {
+                    'document': document,
+                    'exception': exception,
+                    'expression': plan_node.expression
+                }
+                logger.debug(msg=error_message)
+            else:
+                logger.debug('Evaluation result: %s', value)
+
+                if value:
+                    result.append(
+                        (
+                            plan_node, value, self._evaluate(
+                                document=document, parent_id=plan_node.pk
+                            )
+                        )
+                    )
+
+        return result
+
+    def evaluate(self, document):
+        """
+        Evaluate all the nodes for the document. Returns a list of plan
+        node, value, and children result tuples, the children results
+        having the same format.
+        """
+        return self._evaluate(
+            document=document, parent_id=self.root_node_id
+        )
+
+
+class IndexTemplatePlanNode:
+    def __init__(self, expression, link_documents, pk):
+        self.expression = expression
+        self.link_documents = link_documents
+        self.pk = pk
+
+        try:
+            self.template = Template(template_string=expression)
+        except Exception as exception:
+            # Raise the error when rendering to report it for each
+            # document like any other evaluation error.
+            self.template = None
+            self.template_exception = exception
+
+    def render(self, document):
+        if self.template is None:
+            raise self.template_exception
+
+        return self.template.render(
+            context={'document': document}
+        )
@@ -1,5 +1,7 @@
 from django.utils.translation import gettext_lazy as _
 
+INDEX_TEMPLATE_REBUILD_GROUP_SIZE = 500
+
 RELATIONSHIP_NO = 'no'
 RELATIONSHIP_YES = 'yes'
 RELATIONSHIP_CHOICES = (
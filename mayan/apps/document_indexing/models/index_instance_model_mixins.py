@@ -8,7 +8,9 @@ from mayan.apps.documents.models.document_models import Document
 from mayan.apps.documents.permissions import permission_document_view
 from mayan.apps.lock_manager.backends.base import LockingBackend
 from mayan.apps.lock_manager.exceptions import LockError
-from mayan.apps.templating.template_backends import Template
+from mayan.apps.lock_manager.settings import setting_default_lock_timeout
+
+from ..classes import IndexTemplatePlan
 
 logger = logging.getLogger(name=__name__)
 
@@ -19,42 +21,110 @@ class IndexInstanceBusinessLogicMixin:
             children=None, documents=None
         ).delete()
 
-    def _document_add(self, document, index_instance_node_parent):
-        for index_template_node in index_instance_node_parent.index_template_node.get_children().filter(enabled=True):
-            try:
-                template = Template(
-                    template_string=index_template_node.expression
-                )
-                result = template.render(
-                    context={'document': document}
-                )
-            except Exception as exception:
-                logger.debug('Evaluating error: %s', exception)
-                error_message = _(
-                    message='Error indexing document: %(document)s; expression: '
-                    '%(expression)s; %(exception)s'
-                ) % {
-                    'document': document,
-                    'exception': exception,
-                    'expression': index_template_node.expression
-                }
-                logger.debug(msg=error_message)
-            else:
-                logger.debug('Evaluation result: %s', result)
+    def _documents_add(self, document_results):
+        """
+        Apply the index template plan evaluation results of a list of
+        documents one level at a time. `document_results` is a list of
+        document and evaluation results tuples. The existing instance
+        nodes of each level are fetched with a single query and the
+        documents are linked to their nodes at the end.
+        """
+        IndexInstanceNode = apps.get_model(
+            app_label='document_indexing', model_name='IndexInstanceNode'
+        )
 
-                if result:
-                    index_instance_node, created = index_template_node.index_instance_nodes.get_or_create(
-                        parent=index_instance_node_parent,
-                        value=result
-                    )
+        index_instance_node_link_list = []
 
-                    if index_template_node.link_documents:
-                        index_instance_node.documents.add(document)
+        index_instance_root_node = self.index_instance_root_node
 
-                    self._document_add(
-                        document=document,
-                        index_instance_node_parent=index_instance_node
-                    )
+        level_entries = [
+            (index_instance_root_node, document, results)
+            for document, results in document_results
+        ]
+
+        while level_entries:
+            key_list = [
+                (index_instance_node_parent.pk, plan_node.pk, value)
+                for index_instance_node_parent, document, results in level_entries
+                for plan_node, value, children in results
+            ]
+
+            if not key_list:
+                break
+
+            parent_id_set, index_template_node_id_set, value_set = (
+                set(values) for values in zip(*key_list)
+            )
+
+            queryset_index_instance_nodes = IndexInstanceNode.objects.filter(
+                index_template_node_id__in=index_template_node_id_set,
+                parent_id__in=parent_id_set, value__in=value_set
+            )
+
+            index_instance_node_dictionary = {
+                (
+                    index_instance_node.parent_id,
+                    index_instance_node.index_template_node_id,
+                    index_instance_node.value
+                ): index_instance_node
+                for index_instance_node in queryset_index_instance_nodes
+            }
+
+            level_entries_next = []
+
+            for index_instance_node_parent, document, results in level_entries:
+                for plan_node, value, children in results:
+                    key = (index_instance_node_parent.pk, plan_node.pk, value)
+
+                    try:
+                        index_instance_node = index_instance_node_dictionary[key]
+                    except KeyError:
+                        index_instance_node, created = IndexInstanceNode.objects.get_or_create(
+                            index_template_node_id=plan_node.pk,
+                            parent=index_instance_node_parent, value=value
+                        )
+                        index_instance_node_dictionary[key] = index_instance_node
+
+                    if plan_node.link_documents:
+                        index_instance_node_link_list.append(
+                            (index_instance_node, document)
+                        )
+
+                    if children:
+                        level_entries_next.append(
+                            (index_instance_node, document, children)
+                        )
+
+            level_entries = level_entries_next
+
+        self._documents_link(
+            index_instance_node_link_list=index_instance_node_link_list
+        )
+
+    def _documents_link(self, index_instance_node_link_list):
+        """
+        Add the documents to their nodes using the side of the relationship
+        that requires the fewest M2M additions. The M2M additions send the
+        `m2m_changed` signal to keep the receivers, like the search
+        indexing, updated.
+        """
+        document_dictionary = {}
+        index_instance_node_dictionary = {}
+
+        for index_instance_node, document in index_instance_node_link_list:
+            document_dictionary.setdefault(
+                document, set()
+            ).add(index_instance_node)
+            index_instance_node_dictionary.setdefault(
+                index_instance_node, set()
+            ).add(document)
+
+        if len(document_dictionary) <= len(index_instance_node_dictionary):
+            for document, index_instance_nodes in document_dictionary.items():
+                document.index_instance_nodes.add(*index_instance_nodes)
+        else:
+            for index_instance_node, documents in index_instance_node_dictionary.items():
+                index_instance_node.documents.add(*documents)
 
     def document_nodes_delete(self, document):
         IndexInstanceNode = apps.get_model(
@@ -102,9 +172,18 @@ class IndexInstanceBusinessLogicMixin:
 
                         self.document_nodes_delete(document=document)
 
-                        self._document_add(
-                            document=document,
-                            index_instance_node_parent=self.index_instance_root_node
+                        index_template_plan = IndexTemplatePlan.get_for(
+                            index_template=self
+                        )
+
+                        self._documents_add(
+                            document_results=(
+                                (
+                                    document, index_template_plan.evaluate(
+                                        document=document
+                                    )
+                                ),
+                            )
                         )
 
                         self._delete_empty_nodes()
@@ -139,6 +218,83 @@ class IndexInstanceBusinessLogicMixin:
                 finally:
                     lock_index_instance.release()
 
+    def documents_add(self, document_id_list):
+        """
+        Add a group of documents to the index. Used to rebuild the index in
+        parallel. The lock of each document is held from the index template
+        plan evaluation until the results are applied, to keep a concurrent
+        `document_add` or `document_remove` from interleaving. The documents
+        are read after their locks are acquired. The index lock is acquired
+        after the evaluation and held only while the existing nodes of the
+        documents are removed and the results are applied. The locks
+        timeout is sized to the number of documents of the group.
+        """
+        if self.enabled:
+            locking_backend = LockingBackend.get_backend()
+
+            queryset_documents = Document.valid.filter(
+                document_type__in=self.document_types.all(),
+                pk__in=document_id_list
+            )
+
+            document_lock_list = list(queryset_documents.only('pk'))
+
+            if not document_lock_list:
+                return
+
+            lock_timeout = setting_default_lock_timeout.value * len(
+                document_lock_list
+            )
+            lock_document_list = []
+
+            try:
+                for document in document_lock_list:
+                    lock_document_list.append(
+                        locking_backend.acquire_lock(
+                            name=self.get_document_lock_string(
+                                document=document
+                            ), timeout=lock_timeout
+                        )
+                    )
+
+                # Read the documents again, now that they cannot change.
+                document_list = list(
+                    queryset_documents.filter(
+                        pk__in=[document.pk for document in document_lock_list]
+                    )
+                )
+
+                index_template_plan = IndexTemplatePlan.get_for(
+                    index_template=self
+                )
+
+                document_results = [
+                    (
+                        document, index_template_plan.evaluate(
+                            document=document
+                        )
+                    ) for document in document_list
+                ]
+
+                lock_index_instance = locking_backend.acquire_lock(
+                    name=self.get_lock_string(), timeout=lock_timeout
+                )
+
+                try:
+                    self.initialize_index_instance_root_node_node()
+
+                    for document, results in document_results:
+                        self.document_nodes_delete(document=document)
+
+                    self._documents_add(document_results=document_results)
+
+                    self._delete_empty_nodes()
+                finally:
+                    lock_index_instance.release()
+            finally:
+                for lock_document in lock_document_list:
+                    lock_document.release()
+
     def get_children(self):
         return self.index_instance_root_node.get_children()
 
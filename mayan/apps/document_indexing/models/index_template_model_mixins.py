@@ -1,9 +1,11 @@
 from django.apps import apps
 
+from mayan.apps.common.utils import group_iterator
 from mayan.apps.documents.models.document_models import Document
 from mayan.apps.events.classes import ModelEventType
 
 from ..events import event_index_template_edited
+from ..literals import INDEX_TEMPLATE_REBUILD_GROUP_SIZE
 
 
 class IndexTemplateBusinessLogicMixin:
@@ -69,6 +71,22 @@ class IndexTemplateBusinessLogicMixin:
         """
         return self.index_template_nodes.get(parent=None)
 
+    def get_rebuild_document_id_groups(self, group_size=None):
+        """
+        Return the IDs of the documents of the index template in groups
+        to allow rebuilding the index in parallel.
+        """
+        queryset_documents = Document.valid.filter(
+            document_type__in=self.document_types.all()
+        ).order_by('pk')
+
+        return group_iterator(
+            iterable=queryset_documents.values_list(
+                'pk', flat=True
+            ).iterator(),
+            group_size=group_size or INDEX_TEMPLATE_REBUILD_GROUP_SIZE
+        )
+
     def rebuild(self):
         """
         Delete and reconstruct the index by deleting of all its instance nodes
@@ -80,21 +98,16 @@ class IndexTemplateBusinessLogicMixin:
         )
 
         if self.enabled:
-            self.delete_index_instance_nodes()
-
-            # Create the new root index instance node.
-            self.index_template_root_node.index_instance_nodes.create()
+            self.reset()
 
             index_instance = IndexInstance.objects.get(pk=self.pk)
-            index_instance.index_instance_root_node
-            # Re-index each document with a type associated with this index.
-            queryset = Document.objects.filter(
-                document_type__in=self.document_types.all()
-            )
-            for document in queryset:
-                # Evaluate each index template node for each document
-                # associated with this index.
-                index_instance.document_add(document=document)
+
+            # Re-index each document with a type associated with this
+            # index one group at a time.
+            for document_id_list in self.get_rebuild_document_id_groups():
+                index_instance.documents_add(
+                    document_id_list=document_id_list
+                )
 
     def reset(self):
         self.delete_index_instance_nodes()
@@ -19,6 +19,10 @@ queue_indexing.add_task_type(
     dotted_path='mayan.apps.document_indexing.tasks.task_index_instance_document_add'
 )
 
+queue_indexing_slow.add_task_type(
+    label=_(message='Index documents'),
+    dotted_path='mayan.apps.document_indexing.tasks.task_index_instance_documents_add'
+)
 queue_indexing_slow.add_task_type(
     label=_(message='Rebuild index'),
     dotted_path='mayan.apps.document_indexing.tasks.task_index_template_rebuild'
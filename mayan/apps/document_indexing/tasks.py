@@ -3,6 +3,7 @@ import logging
 from django.apps import apps
 from django.db import OperationalError
 
+from mayan.apps.lock_manager.backends.base import LockingBackend
 from mayan.apps.lock_manager.exceptions import LockError
 from mayan.celery import app
 
@@ -82,17 +83,67 @@ def task_index_instance_document_remove(self, document_id):
             raise self.retry(exc=exception)
 
 
+@app.task(
+    bind=True, ignore_result=True, max_retries=None, retry_backoff=True,
+    retry_backoff_max=60
+)
+def task_index_instance_documents_add(
+    self, document_id_list, index_instance_id
+):
+    IndexInstance = apps.get_model(
+        app_label='document_indexing', model_name='IndexInstance'
+    )
+
+    index_instance = IndexInstance.objects.get(pk=index_instance_id)
+
+    try:
+        index_instance.documents_add(document_id_list=document_id_list)
+    except OperationalError as exception:
+        logger.warning(
+            'Operational error while trying to index documents of index: '
+            '%s; %s', index_instance, exception
+        )
+        raise self.retry(exc=exception)
+    except LockError as exception:
+        logger.warning(
+            'Unable to acquire lock for index %s; %s ',
+            index_instance, exception
+        )
+        raise self.retry(exc=exception)
+
+
 # Index template
 
 @app.task(bind=True, ignore_result=True, retry_backoff=True)
 def task_index_template_rebuild(self, index_id):
-    IndexTemplate = apps.get_model(
-        app_label='document_indexing', model_name='IndexTemplate'
+    """
+    Reset the index and queue the documents to be added in groups, to
+    allow several workers to rebuild the index in parallel.
+    """
+    IndexInstance = apps.get_model(
+        app_label='document_indexing', model_name='IndexInstance'
     )
 
-    try:
-        index = IndexTemplate.objects.get(pk=index_id)
-        index.rebuild()
-    except LockError as exception:
-        # This index is being rebuilt by another task, retry later
-        raise self.retry(exc=exception)
+    index = IndexInstance.objects.get(pk=index_id)
+
+    if index.enabled:
+        try:
+            lock_index_instance = LockingBackend.get_backend().acquire_lock(
+                name=index.get_lock_string()
+            )
+        except LockError as exception:
+            # This index is being rebuilt by another task, retry later
+            raise self.retry(exc=exception)
+        else:
+            try:
+                index.reset()
+            finally:
+                lock_index_instance.release()
+
+        for document_id_list in index.get_rebuild_document_id_groups():
+            task_index_instance_documents_add.apply_async(
+                kwargs={
+                    'document_id_list': document_id_list,
+                    'index_instance_id': index.pk
+                }
+            )
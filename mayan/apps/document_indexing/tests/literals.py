@@ -8,3 +8,4 @@ TEST_INDEX_TEMPLATE_SLUG = 'test_slug'
 
 TEST_INDEX_TEMPLATE_NODE_EXPRESSION = '{{ document.pk }}'
 TEST_INDEX_TEMPLATE_NODE_EXPRESSION_EDITED = '{{ document.description }}'
+TEST_INDEX_TEMPLATE_NODE_EXPRESSION_INVALID = '{% invalid_tag %}'
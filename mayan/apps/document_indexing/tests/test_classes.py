@@ -0,0 +1,91 @@
+from mayan.apps.documents.tests.base import GenericDocumentTestCase
+
+from ..classes import IndexTemplatePlan
+
+from .literals import (
+    TEST_INDEX_TEMPLATE_NODE_EXPRESSION_EDITED,
+    TEST_INDEX_TEMPLATE_NODE_EXPRESSION_INVALID
+)
+from .mixins.index_template_mixins import IndexTemplateTestMixin
+
+
+class IndexTemplatePlanTestCase(
+    IndexTemplateTestMixin, GenericDocumentTestCase
+):
+    def setUp(self):
+        super().setUp()
+        IndexTemplatePlan.cache_clear()
+
+    def tearDown(self):
+        IndexTemplatePlan.cache_clear()
+        super().tearDown()
+
+    def test_evaluate(self):
+        index_template_plan = IndexTemplatePlan.get_for(
+            index_template=self._test_index_template
+        )
+
+        result = index_template_plan.evaluate(document=self._test_document)
+
+        self.assertEqual(len(result), 1)
+        self.assertEqual(
+            result[0][0].pk, self._test_index_template_node.pk
+        )
+        self.assertEqual(
+            result[0][1], str(self._test_document.pk)
+        )
+        self.assertEqual(result[0][2], [])
+
+    def test_evaluate_disabled_node(self):
+        self._test_index_template_node.enabled = False
+        self._test_index_template_node.save()
+
+        index_template_plan = IndexTemplatePlan.get_for(
+            index_template=self._test_index_template
+        )
+
+        self.assertEqual(
+            index_template_plan.evaluate(document=self._test_document), []
+        )
+
+    def test_evaluate_invalid_expression(self):
+        self._test_index_template_node.expression = TEST_INDEX_TEMPLATE_NODE_EXPRESSION_INVALID
+        self._test_index_template_node.save()
+
+        index_template_plan = IndexTemplatePlan.get_for(
+            index_template=self._test_index_template
+        )
+
+        self.assertEqual(
+            index_template_plan.evaluate(document=self._test_document), []
+        )
+
+    def test_get_for_reuse(self):
+        index_template_plan = IndexTemplatePlan.get_for(
+            index_template=self._test_index_template
+        )
+
+        self.assertTrue(
+            IndexTemplatePlan.get_for(
+                index_template=self._test_index_template
+            ) is index_template_plan
+        )
+
+    def test_get_for_template_node_edit(self):
+        index_template_plan = IndexTemplatePlan.get_for(
+            index_template=self._test_index_template
+        )
+
+        self._test_index_template_node.expression = TEST_INDEX_TEMPLATE_NODE_EXPRESSION_EDITED
+        self._test_index_template_node.save()
+
+        index_template_plan_new = IndexTemplatePlan.get_for(
+            index_template=self._test_index_template
+        )
+
+        self.assertFalse(index_template_plan_new is index_template_plan)
+        self.assertEqual(
+            index_template_plan_new.children[
+                self._test_index_template_root_node.pk
+            ][0].expression, TEST_INDEX_TEMPLATE_NODE_EXPRESSION_EDITED
+        )
@@ -1,5 +1,8 @@
+from unittest import mock
+
 from django.db.utils import IntegrityError
 
+from mayan.apps.documents.models.document_models import Document
 from mayan.apps.documents.models.trashed_document_models import (
     TrashedDocument
 )
@@ -10,6 +13,9 @@ from mayan.apps.documents.tests.literals import (
     TEST_DOCUMENT_DESCRIPTION, TEST_DOCUMENT_DESCRIPTION_EDITED,
     TEST_DOCUMENT_LABEL_EDITED
 )
+from mayan.apps.lock_manager.backends.base import LockingBackend
+from mayan.apps.lock_manager.exceptions import LockError
+from mayan.apps.lock_manager.settings import setting_default_lock_timeout
 from mayan.apps.metadata.models.document_type_metadata_type_models import (
     DocumentTypeMetadataType
 )
@@ -307,6 +313,84 @@ class IndexInstanceTestCase(IndexTemplateTestMixin, GenericDocumentTestCase):
             self._test_document_type_list[1].label
         )
 
+    def test_method_documents_add_existing_nodes(self):
+        self._create_test_index_template_node(
+            expression=TEST_INDEX_TEMPLATE_DOCUMENT_LABEL_EXPRESSION
+        )
+
+        self._test_index_template.rebuild()
+
+        # Change the label without triggering the indexing.
+        Document.objects.filter(pk=self._test_document.pk).update(
+            label=TEST_DOCUMENT_LABEL_EDITED
+        )
+
+        test_index_instance = IndexInstance.objects.get(
+            pk=self._test_index_template.pk
+        )
+        test_index_instance.documents_add(
+            document_id_list=(self._test_document.pk,)
+        )
+
+        self.assertQuerySetEqual(
+            qs=self._test_document.index_instance_nodes.values_list(
+                'value', flat=True
+            ), values=(TEST_DOCUMENT_LABEL_EDITED,)
+        )
+        self.assertEqual(IndexInstanceNode.objects.count(), 2)
+
+    def test_method_documents_add_lock_timeout(self):
+        self._create_test_index_template_node(
+            expression=TEST_INDEX_TEMPLATE_DOCUMENT_LABEL_EXPRESSION
+        )
+        self._create_test_document_stub()
+
+        test_index_instance = IndexInstance.objects.get(
+            pk=self._test_index_template.pk
+        )
+
+        locking_backend = LockingBackend.get_backend()
+
+        with mock.patch.object(
+            locking_backend, 'acquire_lock',
+            wraps=locking_backend.acquire_lock
+        ) as mock_acquire_lock:
+            test_index_instance.documents_add(
+                document_id_list=self._test_document_id_list
+            )
+
+        # Two document locks and the index lock.
+        self.assertEqual(mock_acquire_lock.call_count, 3)
+
+        for call in mock_acquire_lock.call_args_list:
+            self.assertEqual(
+                call.kwargs['timeout'],
+                setting_default_lock_timeout.value * 2
+            )
+
+    def test_method_documents_add_document_locked(self):
+        self._create_test_index_template_node(
+            expression=TEST_INDEX_TEMPLATE_DOCUMENT_LABEL_EXPRESSION
+        )
+
+        test_index_instance = IndexInstance.objects.get(
+            pk=self._test_index_template.pk
+        )
+
+        lock_document = LockingBackend.get_backend().acquire_lock(
+            name=test_index_instance.get_document_lock_string(
+                document=self._test_document
+            )
+        )
+
+        try:
+            with self.assertRaises(expected_exception=LockError):
+                test_index_instance.documents_add(
+                    document_id_list=(self._test_document.pk,)
+                )
+        finally:
+            lock_document.release()
+
     def test_method_get_absolute_url(self):
         test_index_instance = IndexInstance.objects.first()
         self.assertTrue(
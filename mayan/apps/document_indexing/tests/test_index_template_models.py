@@ -1,5 +1,10 @@
+from unittest import mock
+
 from mayan.apps.documents.tests.base import GenericDocumentTestCase
 
+from ..models import IndexInstanceNode
+from ..tasks import task_index_template_rebuild
+
 from .mixins.index_template_mixins import IndexTemplateTestMixin
 
 
@@ -17,3 +22,48 @@ class IndexTemplateTestCase(IndexTemplateTestMixin, GenericDocumentTestCase):
 
         events = self._get_test_events()
         self.assertEqual(events.count(), 0)
+
+
+class IndexTemplateRebuildTestCase(
+    IndexTemplateTestMixin, GenericDocumentTestCase
+):
+    auto_upload_test_document = False
+
+    def setUp(self):
+        super().setUp()
+
+        for index in range(3):
+            self._create_test_document_stub()
+
+    def test_method_get_rebuild_document_id_groups(self):
+        document_id_list = sorted(
+            document.pk for document in self._test_document_list
+        )
+
+        self.assertEqual(
+            list(
+                self._test_index_template.get_rebuild_document_id_groups(
+                    group_size=2
+                )
+            ), [
+                tuple(document_id_list[:2]), tuple(document_id_list[2:])
+            ]
+        )
+
+    @mock.patch(
+        'mayan.apps.document_indexing.models.index_template_model_mixins.INDEX_TEMPLATE_REBUILD_GROUP_SIZE',
+        2
+    )
+    def test_task_index_template_rebuild(self):
+        IndexInstanceNode.objects.filter(parent__isnull=False).delete()
+
+        task_index_template_rebuild.apply_async(
+            kwargs={'index_id': self._test_index_template.pk}
+        )
+
+        for document in self._test_document_list:
+            self.assertQuerySetEqual(
+                qs=IndexInstanceNode.objects.get(
+                    value=str(document.pk)
+                ).documents.all(), values=(document,)
+            )
@@ -8,3 +8,7 @@ else:
 DEFAULT_DOCUMENT_PARSING_AUTO_PARSING = True
 
 ERROR_LOG_DOMAIN_NAME = 'document_parsing'
+
+DOCUMENT_FILE_PAGE_CONTENT_SAVE_BATCH_SIZE = 500
+
+PDFTOTEXT_PAGE_SEPARATOR = b'\x0c'
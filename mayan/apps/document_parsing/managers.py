@@ -5,12 +5,15 @@ import traceback
 from django.apps import apps
 from django.conf import settings
 from django.db import models, transaction
+from django.db.models.signals import post_save
 
 from .events import (
     event_parsing_document_file_content_deleted,
     event_parsing_document_file_finished
 )
-from .literals import ERROR_LOG_DOMAIN_NAME
+from .literals import (
+    DOCUMENT_FILE_PAGE_CONTENT_SAVE_BATCH_SIZE, ERROR_LOG_DOMAIN_NAME
+)
 from .parsers import Parser
 
 logger = logging.getLogger(name=__name__)
@@ -27,6 +30,62 @@ class DocumentFilePageContentManager(models.Manager):
             target=document_file
         )
 
+    def content_save_many(self, entries):
+        """
+        Create or update the content of several document file pages using
+        bulk queries. `entries` is an iterable of document file page and
+        content tuples. The `post_save` signal is sent for each saved
+        instance to keep the receivers, like the search indexing, updated.
+        """
+        entry_list = list(entries)
+
+        queryset = self.filter(
+            document_file_page__in=[
+                document_file_page for document_file_page, content in entry_list
+            ]
+        )
+        instance_dictionary = {
+            instance.document_file_page_id: instance for instance in queryset
+        }
+
+        instance_created_list = []
+        instance_updated_list = []
+
+        for document_file_page, content in entry_list:
+            try:
+                instance = instance_dictionary[document_file_page.pk]
+            except KeyError:
+                instance_created_list.append(
+                    self.model(
+                        content=content, document_file_page=document_file_page
+                    )
+                )
+            else:
+                instance.content = content
+                instance_updated_list.append(instance)
+
+        with transaction.atomic():
+            self.bulk_create(
+                batch_size=DOCUMENT_FILE_PAGE_CONTENT_SAVE_BATCH_SIZE,
+                objs=instance_created_list
+            )
+            self.bulk_update(
+                batch_size=DOCUMENT_FILE_PAGE_CONTENT_SAVE_BATCH_SIZE,
+                fields=('content',), objs=instance_updated_list
+            )
+
+        for instance in instance_created_list:
+            post_save.send(
+                created=True, instance=instance, raw=False,
+                sender=self.model, update_fields=None, using=self.db
+            )
+
+        for instance in instance_updated_list:
+            post_save.send(
+                created=False, instance=instance, raw=False,
+                sender=self.model, update_fields=None, using=self.db
+            )
+
     def process_document_file(self, document_file, user=None):
         logger.info(
             'Starting parsing for document file: %s', document_file
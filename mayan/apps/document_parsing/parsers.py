@@ -12,6 +12,7 @@ from mayan.apps.converter.literals import CONVERTER_OFFICE_FILE_MIMETYPES
 from mayan.apps.storage.utils import NamedTemporaryFile
 
 from .exceptions import ParserError
+from .literals import PDFTOTEXT_PAGE_SEPARATOR
 from .settings import setting_pdftotext_path
 
 logger = logging.getLogger(name=__name__)
@@ -67,16 +68,64 @@ class Parser:
                     mimetype, []
                 ).append(parser_class)
 
+    def execute_many(self, file_object, page_number_list):
+        """
+        Return a dictionary with the content of each page number. Parsers
+        able to extract the content of all the pages in a single pass
+        should override this method.
+        """
+        result = {}
+
+        for page_number in page_number_list:
+            file_object.seek(0)
+            result[page_number] = self.execute(
+                file_object=file_object, page_number=page_number
+            )
+
+        return result
+
     def process_document_file(self, document_file):
+        DocumentFilePageContent = apps.get_model(
+            app_label='document_parsing',
+            model_name='DocumentFilePageContent'
+        )
+
         logger.info(
             'Starting parsing for document file: %s', document_file
         )
         logger.debug('document file: %d', document_file.pk)
 
-        for document_file_page in document_file.pages.all():
-            self.process_document_file_page(
-                document_file_page=document_file_page
-            )
+        document_file_pages = list(
+            document_file.pages.all()
+        )
+
+        with document_file.open() as file_object:
+            try:
+                content_dictionary = self.execute_many(
+                    file_object=file_object, page_number_list=[
+                        document_file_page.page_number
+                        for document_file_page in document_file_pages
+                    ]
+                )
+            except Exception as exception:
+                error_message = _(
+                    message='Exception parsing document file; %s'
+                ) % exception
+                logger.error(error_message, exc_info=True)
+                raise ParserError(error_message)
+
+        DocumentFilePageContent.objects.content_save_many(
+            entries=[
+                (
+                    document_file_page,
+                    content_dictionary[document_file_page.page_number]
+                ) for document_file_page in document_file_pages
+            ]
+        )
+
+        logger.info(
+            'Finished parsing document file: %s', document_file
+        )
 
     def process_document_file_page(self, document_file_page):
         DocumentFilePageContent = apps.get_model(
@@ -136,9 +185,9 @@ class PopplerParser(Parser):
 
         logger.debug('self.pdftotext_path: %s', self.pdftotext_path)
 
-    def execute(self, file_object, page_number):
-        logger.debug('Parsing PDF page: %d', page_number)
-
+    def _execute_pdftotext(
+        self, file_object, page_number_first, page_number_last
+    ):
         with NamedTemporaryFile() as temporary_file_object:
             copyfileobj(fsrc=file_object, fdst=temporary_file_object)
             temporary_file_object.seek(0)
@@ -147,11 +196,11 @@ class PopplerParser(Parser):
             command.append(self.pdftotext_path)
             command.append('-f')
             command.append(
-                str(page_number)
+                str(page_number_first)
             )
             command.append('-l')
             command.append(
-                str(page_number)
+                str(page_number_last)
             )
             command.append(temporary_file_object.name)
             command.append('-')
@@ -160,36 +209,81 @@ class PopplerParser(Parser):
                 command, close_fds=True, stderr=subprocess.PIPE,
                 stdout=subprocess.PIPE
             )
-            return_code = proc.wait()
-            if return_code != 0:
+            # Read the output while waiting for the process to avoid
+            # blocking when the output is larger than the pipe buffer.
+            output, error_output = proc.communicate()
+
+            if proc.returncode != 0:
                 logger.error(
-                    proc.stderr.readline()
+                    force_str(s=error_output)
                 )
 
                 raise ParserError
 
-            output = proc.stdout.read()
+            return output
 
-            if output == b'\x0c':
-                logger.debug('Parser didn\'t return any output')
-                return ''
+    def execute(self, file_object, page_number):
+        return self.execute_many(
+            file_object=file_object, page_number_list=(page_number,)
+        )[page_number]
+
+    def execute_many(self, file_object, page_number_list):
+        """
+        Execute pdftotext once for the range of pages. pdftotext terminates
+        the text of each page with a form feed which is used to split the
+        output.
+        """
+        if not page_number_list:
+            return {}
+
+        page_number_first = min(page_number_list)
+        page_number_last = max(page_number_list)
+
+        logger.debug(
+            'Parsing PDF pages: %d to %d', page_number_first,
+            page_number_last
+        )
 
-            if output[-3:] == b'\x0a\x0a\x0c':
-                return force_str(
-                    s=output[:-3]
+        output = self._execute_pdftotext(
+            file_object=file_object, page_number_first=page_number_first,
+            page_number_last=page_number_last
+        )
+
+        page_output_list = output.split(PDFTOTEXT_PAGE_SEPARATOR)
+
+        result = {}
+
+        for page_number in page_number_list:
+            try:
+                page_output = page_output_list[
+                    page_number - page_number_first
+                ]
+            except IndexError:
+                page_output = b''
+
+            if not page_output:
+                logger.debug(
+                    'Parser didn\'t return any output for page: %d',
+                    page_number
                 )
 
-            return force_str(s=output)
+            if page_output[-2:] == b'\x0a\x0a':
+                page_output = page_output[:-2]
+
+            result[page_number] = force_str(s=page_output)
+
+        return result
 
 
 class OfficePopplerParser(PopplerParser):
-    def execute(self, file_object, page_number):
+    def execute_many(self, file_object, page_number_list):
         converter = ConverterBase.get_converter_class()(
             file_object=file_object
         )
         with converter.to_pdf() as pdf_file_object:
-            return super().execute(
-                file_object=pdf_file_object, page_number=page_number
+            return super().execute_many(
+                file_object=pdf_file_object,
+                page_number_list=page_number_list
             )
 
 
@@ -1 +1,6 @@
 TEST_DOCUMENT_FILE_CONTENT_INDEX_NODE_TEMPLATE = '{{ document.content|join:" " }}'
+
+TEST_DOCUMENT_FILE_PAGE_CONTENT = 'test content'
+TEST_DOCUMENT_FILE_PAGE_CONTENT_UPDATED = 'updated content'
+
+TEST_PDFTOTEXT_OUTPUT = b'page 1\n\n\x0c\x0cpage 3\n\n\x0c'
@@ -2,7 +2,14 @@ from django.test import override_settings
 
 from mayan.apps.documents.tests.base import GenericDocumentTestCase
 from mayan.apps.documents.tests.literals import (
-    TEST_FILE_HYBRID_PDF_CONTENT, TEST_FILE_HYBRID_PDF_FILENAME
+    TEST_FILE_HYBRID_PDF_CONTENT, TEST_FILE_HYBRID_PDF_FILENAME,
+    TEST_FILE_MULTI_PAGE_TIFF_FILENAME
+)
+
+from ..models import DocumentFilePageContent
+
+from .literals import (
+    TEST_DOCUMENT_FILE_PAGE_CONTENT, TEST_DOCUMENT_FILE_PAGE_CONTENT_UPDATED
 )
 
 
@@ -27,3 +34,39 @@ class DocumentAutoParsingTestCase(GenericDocumentTestCase):
                 self._test_document_file.content()
             )
         )
+
+
+class DocumentFilePageContentManagerTestCase(GenericDocumentTestCase):
+    _test_document_filename = TEST_FILE_MULTI_PAGE_TIFF_FILENAME
+
+    def test_content_save_many(self):
+        document_file_pages = list(
+            self._test_document_file.pages.all()
+        )
+
+        DocumentFilePageContent.objects.create(
+            content=TEST_DOCUMENT_FILE_PAGE_CONTENT,
+            document_file_page=document_file_pages[0]
+        )
+
+        DocumentFilePageContent.objects.content_save_many(
+            entries=[
+                (
+                    document_file_page,
+                    TEST_DOCUMENT_FILE_PAGE_CONTENT_UPDATED
+                ) for document_file_page in document_file_pages
+            ]
+        )
+
+        queryset = DocumentFilePageContent.objects.filter(
+            document_file_page__document_file=self._test_document_file
+        )
+
+        self.assertEqual(
+            queryset.count(), len(document_file_pages)
+        )
+        self.assertEqual(
+            set(
+                queryset.values_list('content', flat=True)
+            ), {TEST_DOCUMENT_FILE_PAGE_CONTENT_UPDATED}
+        )
@@ -1,3 +1,6 @@
+import io
+from unittest import mock
+
 from mayan.apps.documents.tests.base import GenericDocumentTestCase
 from mayan.apps.documents.tests.literals import (
     TEST_FILE_HYBRID_PDF_CONTENT, TEST_FILE_HYBRID_PDF_PATH,
@@ -7,6 +10,8 @@ from mayan.apps.documents.tests.literals import (
 
 from ..parsers import OfficePopplerParser, PopplerParser
 
+from .literals import TEST_PDFTOTEXT_OUTPUT
+
 
 class ParserTestCase(GenericDocumentTestCase):
     auto_upload_test_document = False
@@ -46,3 +51,24 @@ class ParserTestCase(GenericDocumentTestCase):
         self.assertTrue(
             TEST_FILE_HYBRID_PDF_CONTENT in self._test_document_file.pages.first().content.content
         )
+
+    @mock.patch('mayan.apps.document_parsing.parsers.os.path.exists')
+    @mock.patch(
+        'mayan.apps.document_parsing.parsers.PopplerParser._execute_pdftotext'
+    )
+    def test_poppler_parser_execute_many(
+        self, mock_execute_pdftotext, mock_path_exists
+    ):
+        mock_execute_pdftotext.return_value = TEST_PDFTOTEXT_OUTPUT
+        mock_path_exists.return_value = True
+
+        parser = PopplerParser()
+
+        result = parser.execute_many(
+            file_object=io.BytesIO(), page_number_list=(1, 2, 3, 4)
+        )
+
+        self.assertEqual(mock_execute_pdftotext.call_count, 1)
+        self.assertEqual(
+            result, {1: 'page 1', 2: '', 3: 'page 3', 4: ''}
+        )
@@ -83,7 +83,8 @@ from .handlers import (
     handler_create_default_document_type,
     handler_create_document_file_page_image_cache,
     handler_create_document_version_page_image_cache,
-    handler_document_event_on_save
+    handler_document_event_on_save,
+    handler_document_file_page_image_pregenerate
 )
 from .links.document_file_links import (
     link_document_file_delete_multiple, link_document_file_delete_single,
@@ -208,6 +209,7 @@ from .permissions import (
 from .permissions import (
     permission_trashed_document_delete, permission_trashed_document_restore
 )
+from .signals import signal_post_document_file_upload
 
 
 class DocumentsApp(MayanAppConfig):
@@ -444,6 +446,10 @@ class DocumentsApp(MayanAppConfig):
             dispatch_uid='documents_handler_create_document_file_page_image_cache',
             receiver=handler_create_document_file_page_image_cache
         )
+        signal_post_document_file_upload.connect(
+            dispatch_uid='documents_handler_document_file_page_image_pregenerate',
+            receiver=handler_document_file_page_image_pregenerate
+        )
 
     def ready_document_recently_accessed(self):
         RecentlyAccessedDocument = self.get_model(
@@ -2,14 +2,20 @@ from django.apps import apps
 
 from .events import event_document_created, event_document_edited
 from .literals import (
-    DEFAULT_DOCUMENT_TYPE_LABEL, STORAGE_NAME_DOCUMENT_FILE_PAGE_IMAGE_CACHE,
+    DEFAULT_DOCUMENT_TYPE_LABEL,
+    DOCUMENT_FILE_PAGE_IMAGE_PREGENERATE_RANGE_SIZE,
+    STORAGE_NAME_DOCUMENT_FILE_PAGE_IMAGE_CACHE,
     STORAGE_NAME_DOCUMENT_VERSION_PAGE_IMAGE_CACHE
 )
 from .settings import (
     setting_document_file_page_image_cache_maximum_size,
+    setting_document_file_page_image_pregenerate,
     setting_document_version_page_image_cache_maximum_size
 )
 from .signals import signal_post_initial_document_type
+from .tasks.document_file_tasks import (
+    task_document_file_pages_base_image_generate
+)
 
 
 def handler_create_default_document_type(sender, **kwargs):
@@ -45,6 +51,26 @@ def handler_create_document_version_page_image_cache(sender, **kwargs):
     )
 
 
+def handler_document_file_page_image_pregenerate(
+    sender, instance, **kwargs
+):
+    if setting_document_file_page_image_pregenerate.value:
+        page_count = instance.file_pages.count()
+        range_size = DOCUMENT_FILE_PAGE_IMAGE_PREGENERATE_RANGE_SIZE
+
+        # Each task renders a range of pages with a single conversion.
+        for page_number_first in range(1, page_count + 1, range_size):
+            task_document_file_pages_base_image_generate.apply_async(
+                kwargs={
+                    'document_file_id': instance.pk,
+                    'page_number_first': page_number_first,
+                    'page_number_last': min(
+                        page_number_first + range_size - 1, page_count
+                    )
+                }
+            )
+
+
 def handler_document_event_on_save(sender, instance, created, **kwargs):
     _event_ignore = getattr(instance, '_event_ignore', False)
     if not _event_ignore:
@@ -25,6 +25,7 @@ DEFAULT_DOCUMENTS_DISPLAY_HEIGHT = ''
 DEFAULT_DOCUMENTS_DISPLAY_WIDTH = '3600'
 DEFAULT_DOCUMENTS_FAVORITE_COUNT = 400
 DEFAULT_DOCUMENTS_FILE_PAGE_IMAGE_CACHE_MAXIMUM_SIZE = 500 * 2 ** 20  # 500 Megabytes
+DEFAULT_DOCUMENTS_FILE_PAGE_IMAGE_PREGENERATE = False
 DEFAULT_DOCUMENTS_FILE_STORAGE_BACKEND = 'django.core.files.storage.FileSystemStorage'
 DEFAULT_DOCUMENTS_FILE_STORAGE_BACKEND_ARGUMENTS = {
     'location': os.path.join(settings.MEDIA_ROOT, 'document_file_storage')
@@ -76,7 +77,9 @@ DEFAULT_LANGUAGE_CODES = (
 )
 DEFAULT_DOCUMENT_STUB_EXPIRATION_INTERVAL = 60 * 60 * 24  # 24 hours
 
+DOCUMENT_FILE_PAGE_BASE_IMAGE_CACHE_FILENAME = 'base_image'
 DOCUMENT_FILE_PAGE_CREATE_BATCH_SIZE = 100
+DOCUMENT_FILE_PAGE_IMAGE_PREGENERATE_RANGE_SIZE = 20
 DOCUMENT_VERSION_PAGE_CREATE_BATCH_SIZE = 100
 
 ERROR_LOG_DOMAIN_NAME = 'documents'
@@ -20,10 +20,12 @@ from mayan.apps.events.event_managers import EventManagerMethodAfter
 from mayan.apps.file_caching.models import CachePartitionFile
 from mayan.apps.mime_types.classes import MIMETypeBackend
 from mayan.apps.storage.model_mixins import ModelMixinFileFieldOpen
+from mayan.apps.storage.utils import TemporaryFile
 
 from ..classes import DocumentFileAction
 from ..events import event_document_file_created, event_document_file_edited
 from ..literals import (
+    DOCUMENT_FILE_PAGE_BASE_IMAGE_CACHE_FILENAME,
     DOCUMENT_FILE_PAGE_CREATE_BATCH_SIZE, ERROR_LOG_DOMAIN_NAME,
     IMAGE_ERROR_DOCUMENT_FILE_HAS_NO_PAGES,
     STORAGE_NAME_DOCUMENT_FILE_PAGE_IMAGE_CACHE
@@ -125,26 +127,72 @@ class DocumentFileBusinessLogicMixin(ModelMixinFileFieldOpen):
         else:
             return result
 
+    def _execute_pre_open_hooks(self, file_object):
+        DocumentFile = apps.get_model(
+            app_label='documents', model_name='DocumentFile'
+        )
+
+        result = DocumentFile._execute_hooks(
+            hook_list=DocumentFile._pre_open_hooks,
+            instance=self, file_object=file_object
+        )
+
+        if result:
+            return result['file_object']
+        else:
+            return file_object
+
+    def _get_detected_page_count(self, file_object):
+        converter_class = ConverterBase.get_converter_class()
+        converter = converter_class(
+            file_object=file_object, mime_type=self.mimetype
+        )
+        return converter.get_page_count()
+
+    def _get_hash_block_size(self):
+        block_size = setting_hash_block_size.value
+        if block_size == 0:
+            # If the setting value is 0 that means disable read limit.
+            # To disable the read limit passing None won't work, we pass
+            # -1 instead as per the Python documentation.
+            # https://docs.python.org/2/tutorial/inputoutput.html#methods-of-file-objects
+            block_size = -1
+
+        return block_size
+
     def _introspect(self):
         actor = getattr(self, '_event_actor', None)
 
         try:
-            self.checksum_update(save=False)
-            super().save(
-                update_fields=('checksum',)
-            )
-
-            self.mimetype_update(save=False)
-            super().save(
-                update_fields=('encoding', 'mimetype',)
-            )
-
-            self.size_update(save=False)
-            super().save(
-                update_fields=('size',)
-            )
+            if self.exists():
+                # Read the stored file only once. The checksum is
+                # calculated while the file is copied to a local temporary
+                # file from which the MIME type and the page count are
+                # obtained. The size is still obtained from the storage
+                # layer as the number of bytes read differs from the
+                # stored size for storages that compress or encrypt.
+                with TemporaryFile() as spool_file_object:
+                    self.checksum = self._spool(
+                        file_object_destination=spool_file_object
+                    )
+                    self.size_update(save=False)
+
+                    with self._execute_pre_open_hooks(file_object=spool_file_object) as file_object:
+                        self.mimetype_update(
+                            file_object=file_object, save=False
+                        )
+                        super().save(
+                            update_fields=(
+                                'checksum', 'encoding', 'mimetype', 'size'
+                            )
+                        )
 
-            self.page_count_update(save=False)
+                        file_object.seek(0)
+                        self.page_count_update(
+                            file_object=file_object, save=False
+                        )
+            else:
+                self.page_count_update(save=False)
         except Exception as exception:
             logger.error(
                 'Error introspecting new document file for document '
@@ -158,29 +206,29 @@ class DocumentFileBusinessLogicMixin(ModelMixinFileFieldOpen):
 
             self.upload_complete()
 
+    def _mimetype_update(self, file_object):
+        try:
+            mimetype_backend = MIMETypeBackend.get_backend_instance()
+            self.mimetype, self.encoding = mimetype_backend.get_mime_type(
+                file_object=file_object
+            )
+        except Exception:
+            self.encoding = ''
+            self.mimetype = ''
+        finally:
+            file_object.seek(0)
+
     def _open(self, raw=False, **kwargs):
         """
         Return a file descriptor to a document file's file irrespective of
         the storage backend.
         """
-        DocumentFile = apps.get_model(
-            app_label='documents', model_name='DocumentFile'
-        )
-
         if raw:
             return self.file.storage.open(**kwargs)
         else:
             file_object = self.file.storage.open(**kwargs)
 
-            result = DocumentFile._execute_hooks(
-                hook_list=DocumentFile._pre_open_hooks,
-                instance=self, file_object=file_object
-            )
-
-            if result:
-                return result['file_object']
-            else:
-                return file_object
+            return self._execute_pre_open_hooks(file_object=file_object)
 
     @method_event(
         action_object='document',
@@ -217,6 +265,33 @@ class DocumentFileBusinessLogicMixin(ModelMixinFileFieldOpen):
         else:
             return result
 
+    def _spool(self, file_object_destination):
+        """
+        Copy the raw stored file to a local file object in a single read
+        while calculating the checksum. Returns the checksum.
+        """
+        DocumentFile = apps.get_model(
+            app_label='documents', model_name='DocumentFile'
+        )
+
+        block_size = self._get_hash_block_size()
+        hash_object = DocumentFile.hash_function()
+
+        with self.open(raw=True) as file_object:
+            while (True):
+                data = file_object.read(block_size)
+                if not data:
+                    break
+
+                hash_object.update(data)
+                file_object_destination.write(data)
+
+        file_object_destination.seek(0)
+
+        return str(
+            hash_object.hexdigest()
+        )
+
     @cached_property
     def cache(self):
         Cache = apps.get_model(app_label='file_caching', model_name='Cache')
@@ -240,13 +315,7 @@ class DocumentFileBusinessLogicMixin(ModelMixinFileFieldOpen):
             app_label='documents', model_name='DocumentFile'
         )
 
-        block_size = setting_hash_block_size.value
-        if block_size == 0:
-            # If the setting value is 0 that means disable read limit.
-            # To disable the read limit passing None won't work, we pass
-            # -1 instead as per the Python documentation.
-            # https://docs.python.org/2/tutorial/inputoutput.html#methods-of-file-objects
-            block_size = -1
+        block_size = self._get_hash_block_size()
 
         if self.exists():
             hash_object = DocumentFile.hash_function()
@@ -386,35 +455,40 @@ class DocumentFileBusinessLogicMixin(ModelMixinFileFieldOpen):
     def is_in_trash(self):
         return self.document.is_in_trash
 
-    def mimetype_update(self, save=True):
+    def mimetype_update(self, file_object=None, save=True):
         """
         Read a document version's file and determine the mime type by using
-        the MIME type backend.
+        the MIME type backend. An already opened file object can be
+        provided to avoid reading the file from the storage again.
         """
-        if self.exists():
+        if file_object:
+            self._mimetype_update(file_object=file_object)
+        elif self.exists():
             try:
                 with self.open() as file_object:
-                    mimetype_backend = MIMETypeBackend.get_backend_instance()
-                    self.mimetype, self.encoding = mimetype_backend.get_mime_type(
-                        file_object=file_object
-                    )
+                    self._mimetype_update(file_object=file_object)
             except Exception:
                 self.encoding = ''
                 self.mimetype = ''
-            finally:
-                if save:
-                    self.save(
-                        update_fields=('encoding', 'mimetype')
-                    )
+        else:
+            return
 
-    def page_count_update(self, save=True, user=None):
+        if save:
+            self.save(
+                update_fields=('encoding', 'mimetype')
+            )
+
+    def page_count_update(self, file_object=None, save=True, user=None):
         try:
-            with self.open() as file_object:
-                converter_class = ConverterBase.get_converter_class()
-                converter = converter_class(
-                    file_object=file_object, mime_type=self.mimetype
+            if file_object:
+                detected_pages = self._get_detected_page_count(
+                    file_object=file_object
                 )
-                detected_pages = converter.get_page_count()
+            else:
+                with self.open() as file_object:
+                    detected_pages = self._get_detected_page_count(
+                        file_object=file_object
+                    )
         except PageCountError as exception:
             """Converter backend doesn't understand the format."""
             self.error_log.create(
@@ -463,6 +537,82 @@ class DocumentFileBusinessLogicMixin(ModelMixinFileFieldOpen):
 
             return detected_pages
 
+    def pages_base_image_generate(
+        self, page_number_first=None, page_number_last=None
+    ):
+        """
+        Render the base image of a range of pages in a single converter
+        pass and store each one in the cache partition of its page.
+        Pages that already have a cached base image are skipped.
+        Returns the number of base images generated.
+        """
+        queryset_pages = self.file_pages.all()
+
+        if page_number_first is not None:
+            queryset_pages = queryset_pages.filter(
+                page_number__gte=page_number_first
+            )
+
+        if page_number_last is not None:
+            queryset_pages = queryset_pages.filter(
+                page_number__lte=page_number_last
+            )
+
+        document_file_page_list = list(queryset_pages)
+
+        # The cache partition of each page is named after its UUID. Find
+        # the pages with a base image with a single query.
+        partition_name_set = set(
+            self.cache.partitions.filter(
+                files__filename=DOCUMENT_FILE_PAGE_BASE_IMAGE_CACHE_FILENAME,
+                name__in=[
+                    document_file_page.uuid for document_file_page in document_file_page_list
+                ]
+            ).values_list('name', flat=True)
+        )
+
+        pages_missing = {}
+        for document_file_page in document_file_page_list:
+            if document_file_page.uuid not in partition_name_set:
+                # Converter page numbers start at 0.
+                pages_missing[
+                    document_file_page.page_number - 1
+                ] = document_file_page
+
+        if not pages_missing:
+            return 0
+
+        generated_count = 0
+
+        with self.get_intermediate_file() as file_object:
+            converter_class = ConverterBase.get_converter_class()
+            converter_instance = converter_class(file_object=file_object)
+
+            iterator = converter_instance.get_pages(
+                page_number_first=min(pages_missing),
+                page_number_last=max(pages_missing)
+            )
+
+            for page_number, page_image in iterator:
+                document_file_page = pages_missing.get(page_number)
+
+                if document_file_page:
+                    cache_partition = document_file_page.cache_partition
+                    queryset_cache_files = cache_partition.files.filter(
+                        filename=DOCUMENT_FILE_PAGE_BASE_IMAGE_CACHE_FILENAME
+                    )
+
+                    # Another process might have generated the image
+                    # while the range was being rendered.
+                    if not queryset_cache_files.exists():
+                        with cache_partition.create_file(filename=DOCUMENT_FILE_PAGE_BASE_IMAGE_CACHE_FILENAME) as cache_file_object:
+                            cache_file_object.write(
+                                page_image.getvalue()
+                            )
+                        generated_count += 1
+
+        return generated_count
+
     @property
     def pages(self):
         DocumentFilePage = apps.get_model(
@@ -15,7 +15,8 @@ from mayan.apps.file_caching.models import CachePartitionFile
 from mayan.apps.lock_manager.backends.base import LockingBackend
 
 from ..literals import (
-    ERROR_LOG_DOMAIN_NAME, IMAGE_ERROR_DOCUMENT_FILE_PAGE_TRANSFORMATION_ERROR
+    DOCUMENT_FILE_PAGE_BASE_IMAGE_CACHE_FILENAME, ERROR_LOG_DOMAIN_NAME,
+    IMAGE_ERROR_DOCUMENT_FILE_PAGE_TRANSFORMATION_ERROR
 )
 
 logger = logging.getLogger(name=__name__)
@@ -173,7 +174,7 @@ class DocumentFilePageBusinessLogicMixin:
         return result
 
     def get_image(self, transformation_instance_list=None):
-        cache_filename = 'base_image'
+        cache_filename = DOCUMENT_FILE_PAGE_BASE_IMAGE_CACHE_FILENAME
         logger.debug('Page cache filename: %s', cache_filename)
 
         try:
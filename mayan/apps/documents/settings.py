@@ -8,6 +8,7 @@ from .literals import (
     DEFAULT_DOCUMENTS_FILE_PAGE_IMAGE_CACHE_MAXIMUM_SIZE,
     DEFAULT_DOCUMENTS_FILE_PAGE_IMAGE_CACHE_STORAGE_BACKEND,
     DEFAULT_DOCUMENTS_FILE_PAGE_IMAGE_CACHE_STORAGE_BACKEND_ARGUMENTS,
+    DEFAULT_DOCUMENTS_FILE_PAGE_IMAGE_PREGENERATE,
     DEFAULT_DOCUMENTS_FILE_STORAGE_BACKEND,
     DEFAULT_DOCUMENTS_FILE_STORAGE_BACKEND_ARGUMENTS,
     DEFAULT_DOCUMENTS_HASH_BLOCK_SIZE, DEFAULT_DOCUMENTS_LIST_THUMBNAIL_WIDTH,
@@ -54,6 +55,17 @@ setting_document_file_page_image_cache_maximum_size = setting_namespace.do_setti
         'the size in bytes.'
     ), post_edit_function=callback_update_document_file_page_image_cache_size
 )
+setting_document_file_page_image_pregenerate = setting_namespace.do_setting_add(
+    choices=('false', 'true'),
+    default=DEFAULT_DOCUMENTS_FILE_PAGE_IMAGE_PREGENERATE,
+    global_name='DOCUMENTS_FILE_PAGE_IMAGE_PREGENERATE', help_text=_(
+        message='Render the images of the pages of new document files in '
+        'the background after they are uploaded. Consecutive pages are '
+        'rendered together to convert the file once per group of pages. '
+        'When disabled, page images are rendered the first time they are '
+        'displayed.'
+    )
+)
 setting_document_file_storage_backend = setting_namespace.do_setting_add(
     default=DEFAULT_DOCUMENTS_FILE_STORAGE_BACKEND,
     global_name='DOCUMENTS_FILE_STORAGE_BACKEND', help_text=_(
@@ -3,13 +3,15 @@ from pathlib import Path
 
 from django.apps import apps
 from django.contrib.auth import get_user_model
-from django.core.files import File
 from django.db import OperationalError
 
+from mayan.apps.storage.classes import DefinedStorage
 from mayan.apps.storage.tasks import task_shared_upload_delete
 from mayan.celery import app
 
-from ..literals import DEFAULT_DOCUMENT_FILE_ACTION_NAME
+from ..literals import (
+    DEFAULT_DOCUMENT_FILE_ACTION_NAME, STORAGE_NAME_DOCUMENT_FILES
+)
 
 from .utils import execute_callback
 
@@ -103,11 +105,17 @@ def task_document_file_create(
         str(shared_uploaded_file)
     ).name
 
-    with shared_uploaded_file.open() as file_object:
+    storage = DefinedStorage.get(
+        name=STORAGE_NAME_DOCUMENT_FILES
+    ).get_storage_instance()
+
+    # The shared file is linked instead of copied when both storages are
+    # in the same filesystem. The shared file is kept for the retries.
+    with shared_uploaded_file.open_for_storage(storage=storage) as file_object:
         try:
             document_file = DocumentFile(
-                comment=comment, document=document,
-                file=File(file=file_object), filename=filename
+                comment=comment, document=document, file=file_object,
+                filename=filename
             )
             document_file._event_actor = user
             document_file.save(skip_introspection=True)
@@ -275,6 +283,39 @@ def task_document_file_page_count_update(
             )
 
 
+@app.task(bind=True, ignore_result=True, retry_backoff=True)
+def task_document_file_pages_base_image_generate(
+    self, document_file_id, page_number_first=None, page_number_last=None
+):
+    DocumentFile = apps.get_model(
+        app_label='documents', model_name='DocumentFile'
+    )
+
+    try:
+        document_file = DocumentFile.objects.get(pk=document_file_id)
+    except OperationalError as exception:
+        raise self.retry(exc=exception)
+
+    try:
+        document_file.pages_base_image_generate(
+            page_number_first=page_number_first,
+            page_number_last=page_number_last
+        )
+    except OperationalError as exception:
+        logger.warning(
+            'Operational error during attempt to generate the page base '
+            'images of document file: %s; %s. Retrying.', document_file,
+            exception
+        )
+        raise self.retry(exc=exception)
+    except Exception as exception:
+        logger.critical(
+            'Unexpected exception generating the page base images of '
+            'document file: %s; %s.', document_file, exception
+        )
+        raise
+
+
 @app.task(bind=True, ignore_result=True, retry_backoff=True)
 def task_document_file_size_update(
     self, document_file_id, action_name=None, callback_dict=None,
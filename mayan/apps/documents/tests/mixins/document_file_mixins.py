@@ -2,8 +2,12 @@ from django.db.models import Q
 
 from mayan.apps.converter.layers import layer_saved_transformations
 
-from ...literals import DEFAULT_DOCUMENT_FILE_ACTION_NAME, PAGE_RANGE_ALL
+from ...literals import (
+    DEFAULT_DOCUMENT_FILE_ACTION_NAME,
+    DOCUMENT_FILE_PAGE_BASE_IMAGE_CACHE_FILENAME, PAGE_RANGE_ALL
+)
 from ...models.document_file_models import DocumentFile
+from ...settings import setting_document_file_page_image_pregenerate
 
 from ..literals import (
     TEST_DOCUMENT_FILE_COMMENT, TEST_DOCUMENT_FILE_COMMENT_EDITED,
@@ -73,6 +77,26 @@ class DocumentFileLinkTestMixin:
 
 
 class DocumentFileTestMixin:
+    def _get_test_document_file_page_base_image_count(self):
+        count = 0
+        for document_file_page in self._test_document_file.file_pages.all():
+            count += document_file_page.cache_partition.files.filter(
+                filename=DOCUMENT_FILE_PAGE_BASE_IMAGE_CACHE_FILENAME
+            ).count()
+
+        return count
+
+    def _set_test_document_file_page_image_pregenerate(self):
+        self._set_environment_variable(
+            name='MAYAN_{}'.format(
+                setting_document_file_page_image_pregenerate.global_name
+            ), value='true'
+        )
+        setting_document_file_page_image_pregenerate.do_cache_invalidate()
+        self.addCleanup(
+            setting_document_file_page_image_pregenerate.do_cache_invalidate
+        )
+
     def _upload_test_document_file(self, action_name=None, user=None):
         self._calculate_test_document_file_path()
 
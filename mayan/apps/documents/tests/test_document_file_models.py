@@ -1,4 +1,7 @@
 from pathlib import Path
+from unittest import mock
+
+from PIL import Image
 
 from mayan.apps.file_metadata.events import (
     event_file_metadata_document_file_finished,
@@ -12,8 +15,13 @@ from ..events import (
     event_document_version_page_deleted
 )
 
+from ..models.document_file_models import DocumentFile
+
 from .base import GenericDocumentTestCase
-from .literals import TEST_DOCUMENT_SMALL_CHECKSUM
+from .literals import (
+    TEST_DOCUMENT_SMALL_CHECKSUM, TEST_FILE_HYBRID_PDF_FILENAME,
+    TEST_FILE_MULTI_PAGE_TIFF_FILENAME
+)
 from .mixins.document_file_mixins import DocumentFileTestMixin
 
 
@@ -126,6 +134,56 @@ class DocumentFileTestCase(DocumentFileTestMixin, GenericDocumentTestCase):
             self._test_document_file.filename, self._test_document.label
         )
 
+    def test_file_create_introspection_single_read(self):
+        original_open = DocumentFile._open
+
+        with mock.patch.object(target=DocumentFile, attribute='_open', autospec=True, side_effect=original_open) as mocked_open:
+            self._upload_test_document_file(user=self._test_case_user)
+
+        raw_open_calls = [
+            call for call in mocked_open.call_args_list if call.kwargs.get(
+                'raw'
+            )
+        ]
+        self.assertEqual(len(raw_open_calls), 1)
+
+        self.assertEqual(
+            self._test_document_file.checksum, TEST_DOCUMENT_SMALL_CHECKSUM
+        )
+        self.assertEqual(
+            self._test_document_file.size,
+            self._test_document_file.file.size
+        )
+        self.assertTrue(self._test_document_file.mimetype)
+        self.assertEqual(self._test_document_file.pages.count(), 1)
+
+    def test_file_introspection_missing_file(self):
+        test_document_file_checksum = self._test_document_file.checksum
+
+        with mock.patch.object(target=DocumentFile, attribute='exists', autospec=True, return_value=False):
+            with mock.patch.object(target=DocumentFile, attribute='_spool', autospec=True) as mocked_spool:
+                with mock.patch.object(target=DocumentFile, attribute='page_count_update', autospec=True) as mocked_page_count_update:
+                    self._test_document_file._introspect()
+
+        self.assertFalse(mocked_spool.called)
+        self.assertTrue(mocked_page_count_update.called)
+
+        self._test_document_file.refresh_from_db()
+        self.assertEqual(
+            self._test_document_file.checksum, test_document_file_checksum
+        )
+
+    def test_file_introspection_storage_size(self):
+        storage = self._test_document_file.file.storage
+
+        with mock.patch.object(target=storage, attribute='size', return_value=1) as mocked_size:
+            self._test_document_file._introspect()
+
+        self.assertTrue(mocked_size.called)
+
+        self._test_document_file.refresh_from_db()
+        self.assertEqual(self._test_document_file.size, 1)
+
     def test_method_get_absolute_url(self):
         self._clear_events()
 
@@ -135,3 +193,151 @@ class DocumentFileTestCase(DocumentFileTestMixin, GenericDocumentTestCase):
 
         events = self._get_test_events()
         self.assertEqual(events.count(), 0)
+
+
+class DocumentFilePageBaseImageTestCase(
+    DocumentFileTestMixin, GenericDocumentTestCase
+):
+    _test_document_filename = TEST_FILE_MULTI_PAGE_TIFF_FILENAME
+
+    def test_method_pages_base_image_generate(self):
+        page_count = self._test_document_file.file_pages.count()
+
+        self._clear_events()
+
+        result = self._test_document_file.pages_base_image_generate()
+
+        self.assertEqual(result, page_count)
+        self.assertEqual(
+            self._get_test_document_file_page_base_image_count(),
+            page_count
+        )
+
+        events = self._get_test_events()
+        self.assertEqual(events.count(), 0)
+
+    def test_method_pages_base_image_generate_existing(self):
+        page_count = self._test_document_file.file_pages.count()
+
+        self._test_document_file_page.get_image()
+
+        self._clear_events()
+
+        result = self._test_document_file.pages_base_image_generate()
+
+        self.assertEqual(result, page_count - 1)
+        self.assertEqual(
+            self._get_test_document_file_page_base_image_count(),
+            page_count
+        )
+
+        events = self._get_test_events()
+        self.assertEqual(events.count(), 0)
+
+    def test_method_pages_base_image_generate_existing_query_count(self):
+        self._test_document_file.pages_base_image_generate()
+
+        self.assertTrue(self._test_document_file.file_pages.count() > 1)
+
+        # The pages and their base images are found with a query each,
+        # independently of the page count.
+        with self.assertNumQueries(num=2):
+            result = self._test_document_file.pages_base_image_generate()
+
+        self.assertEqual(result, 0)
+
+    def test_method_pages_base_image_generate_range(self):
+        self._clear_events()
+
+        result = self._test_document_file.pages_base_image_generate(
+            page_number_first=2, page_number_last=2
+        )
+
+        self.assertEqual(result, 1)
+        self.assertEqual(
+            self._get_test_document_file_page_base_image_count(), 1
+        )
+
+        events = self._get_test_events()
+        self.assertEqual(events.count(), 0)
+
+    def test_pages_base_image_pregenerate_on_upload(self):
+        self._set_test_document_file_page_image_pregenerate()
+        self._upload_test_document()
+
+        self.assertEqual(
+            self._get_test_document_file_page_base_image_count(),
+            self._test_document_file.file_pages.count()
+        )
+
+
+class DocumentFilePagePDFBaseImageTestCase(
+    DocumentFileTestMixin, GenericDocumentTestCase
+):
+    _test_document_filename = TEST_FILE_HYBRID_PDF_FILENAME
+    auto_upload_test_document = False
+
+    def _pdftoppm_side_effect(
+        self, input_filename, output_prefix=None, _out=None, **kwargs
+    ):
+        if _out:
+            # Single page conversion to a stream.
+            Image.new(mode='RGB', size=(10, 10)).save(_out, format='PNG')
+        else:
+            # The `f` and `l` arguments are the first and last pages.
+            for page_number in range(kwargs['f'], kwargs['l'] + 1):
+                Image.new(mode='RGB', size=(10, 10)).save(
+                    '{}-{}.png'.format(output_prefix, page_number)
+                )
+
+    def setUp(self):
+        super().setUp()
+        patcher = mock.patch(
+            'mayan.apps.converter.backends.python.command_pdftoppm'
+        )
+        self._mock_command_pdftoppm = patcher.start()
+        self._mock_command_pdftoppm.side_effect = self._pdftoppm_side_effect
+        self.addCleanup(patcher.stop)
+
+    def test_method_pages_base_image_generate(self):
+        self._upload_test_document()
+        self._mock_command_pdftoppm.reset_mock()
+
+        page_count = self._test_document_file.file_pages.count()
+
+        result = self._test_document_file.pages_base_image_generate()
+
+        self.assertEqual(result, page_count)
+        self.assertEqual(
+            self._get_test_document_file_page_base_image_count(),
+            page_count
+        )
+        self.assertEqual(self._mock_command_pdftoppm.call_count, 1)
+        self.assertEqual(
+            self._mock_command_pdftoppm.call_args.kwargs,
+            {'f': 1, 'l': page_count}
+        )
+
+    def test_pages_base_image_pregenerate_on_upload(self):
+        self._set_test_document_file_page_image_pregenerate()
+
+        with mock.patch(
+            'mayan.apps.documents.handlers.DOCUMENT_FILE_PAGE_IMAGE_PREGENERATE_RANGE_SIZE',
+            new=1
+        ):
+            self._upload_test_document()
+
+        page_count = self._test_document_file.file_pages.count()
+
+        self.assertEqual(
+            self._get_test_document_file_page_base_image_count(),
+            page_count
+        )
+        # One conversion per range of one page.
+        self.assertEqual(
+            [
+                call.kwargs for call in self._mock_command_pdftoppm.call_args_list if '_out' not in call.kwargs
+            ], [
+                {'f': page_number, 'l': page_number} for page_number in range(1, page_count + 1)
+            ]
+        )
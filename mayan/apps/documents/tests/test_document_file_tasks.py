@@ -1,3 +1,4 @@
+import os
 from unittest import mock
 
 from django.core.files import File
@@ -16,7 +17,9 @@ from ..events import (
 )
 from ..models.document_file_models import DocumentFile
 from ..models.document_models import Document
-from ..tasks.document_file_tasks import task_document_file_upload
+from ..tasks.document_file_tasks import (
+    task_document_file_create, task_document_file_upload
+)
 
 from .literals import (
     TEST_DOCUMENT_SMALL_CHECKSUM, TEST_FILE_SMALL_FILENAME,
@@ -40,6 +43,44 @@ class DocumentFileTaskTestCase(DocumentTestMixin, BaseTestCase):
     ):
         return test_argument
 
+    def test_task_document_file_create_shared_file_link(self):
+        self._create_test_document_stub()
+
+        self._calculate_test_document_path()
+
+        with open(file=self._test_document_path, mode='rb') as file_object:
+            test_shared_uploaded_file = SharedUploadedFile.objects.create(
+                file=File(file=file_object)
+            )
+
+        test_shared_uploaded_file_inode = os.stat(
+            path=test_shared_uploaded_file.get_local_path()
+        ).st_ino
+
+        task_document_file_create.apply_async(
+            kwargs={
+                'document_id': self._test_document.pk,
+                'shared_uploaded_file_id': test_shared_uploaded_file.pk
+            }
+        )
+
+        self._test_document.refresh_from_db()
+        test_document_file = self._test_document.file_latest
+
+        self.assertEqual(
+            os.stat(path=test_document_file.file.path).st_ino,
+            test_shared_uploaded_file_inode
+        )
+        self.assertEqual(
+            test_document_file.checksum_update(save=False),
+            TEST_DOCUMENT_SMALL_CHECKSUM
+        )
+        self.assertFalse(
+            SharedUploadedFile.objects.filter(
+                pk=test_shared_uploaded_file.pk
+            ).exists()
+        )
+
     @mock.patch(target='mayan.apps.documents.tests.test_document_file_tasks.DocumentFileTaskTestCase._test_post_document_file_create_callback')
     def test_task_post_document_file_create_callback(self, mocked_callback):
         self._create_test_document_stub()
@@ -1,6 +1,8 @@
 from django.contrib import admin
 
-from .models import DuplicateBackendEntry, StoredDuplicateBackend
+from .models import (
+    DuplicateBackendEntry, DuplicateImageHash, StoredDuplicateBackend
+)
 
 
 @admin.register(DuplicateBackendEntry)
@@ -8,6 +10,11 @@ class DuplicateBackendEntryAdmin(admin.ModelAdmin):
     list_display = ('document',)
 
 
+@admin.register(DuplicateImageHash)
+class DuplicateImageHashAdmin(admin.ModelAdmin):
+    list_display = ('document', 'document_file', 'value')
+
+
 @admin.register(StoredDuplicateBackend)
 class StoredDuplicateBackendAdmin(admin.ModelAdmin):
     list_display = (
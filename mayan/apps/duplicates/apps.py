@@ -11,7 +11,8 @@ from mayan.apps.navigation.source_columns import SourceColumn
 
 from .classes import DuplicateBackend
 from .handlers import (
-    handler_remove_empty_duplicates_lists, handler_scan_duplicates_for
+    handler_remove_empty_duplicates_lists, handler_scan_duplicates_for,
+    handler_scan_duplicates_for_document_file_delete
 )
 from .links import (
     link_document_duplicates_list, link_duplicated_document_list,
@@ -33,6 +34,9 @@ class DuplicatesApp(MayanAppConfig):
         Document = apps.get_model(
             app_label='documents', model_name='Document'
         )
+        DocumentFile = apps.get_model(
+            app_label='documents', model_name='DocumentFile'
+        )
 
         DuplicateBackendEntry = self.get_model(
             model_name='DuplicateBackendEntry'
@@ -77,6 +81,11 @@ class DuplicatesApp(MayanAppConfig):
             receiver=handler_remove_empty_duplicates_lists,
             sender=Document
         )
+        post_delete.connect(
+            dispatch_uid='duplicates_handler_scan_duplicates_for_document_file_delete',
+            receiver=handler_scan_duplicates_for_document_file_delete,
+            sender=DocumentFile
+        )
         signal_post_document_file_upload.connect(
             dispatch_uid='duplicates_handler_scan_duplicates_for',
             receiver=handler_scan_duplicates_for
@@ -1,11 +1,12 @@
 import logging
 
 from django.apps import apps
+from django.db.models import Count
 from django.utils.translation import gettext_lazy as _
 
 from mayan.apps.common.class_mixins import AppsModuleLoaderMixin
 
-__all__ = ('DuplicateBackend',)
+__all__ = ('DuplicateBackend', 'DuplicateBackendDocumentField')
 logger = logging.getLogger(name=__name__)
 
 
@@ -37,6 +38,12 @@ class DuplicateBackend(
     def get_all(cls):
         return cls._registry.items()
 
+    @classmethod
+    def get_all_enabled(cls):
+        return [
+            (path, klass) for path, klass in cls.get_all() if klass.is_enabled()
+        ]
+
     @classmethod
     def get_choices(cls):
         return sorted(
@@ -49,10 +56,18 @@ class DuplicateBackend(
 
     @classmethod
     def get_class_path(cls):
-        for path, klass in cls.get_all().items():
+        for path, klass in cls.get_all():
             if klass is cls:
                 return path
 
+    @classmethod
+    def is_enabled(cls):
+        """
+        Disabled backends are not used to scan for duplicates. Backends
+        that are expensive to run should be enabled by a setting.
+        """
+        return True
+
     @classmethod
     def verify(cls, document):
         """
@@ -65,6 +80,14 @@ class DuplicateBackend(
         self.model_instance_id = model_instance_id
         self.kwargs = kwargs
 
+    def get_duplicate_groups(self):
+        """
+        Backends able to find all the duplicates at once return an
+        iterable of lists of duplicated document IDs. Return None to scan
+        each document individually.
+        """
+        return None
+
     def get_model_instance(self):
         StoredDuplicateBackend = apps.get_model(
             app_label='duplicated', model_name='StoredDuplicateBackend'
@@ -85,5 +108,81 @@ class DuplicateBackend(
         )
 
 
+class DuplicateBackendDocumentField(DuplicateBackend):
+    """
+    Documents are duplicates when they have the same value of a document
+    field. The field must be indexed so that finding the duplicates of a
+    document is a single index lookup. Related fields are supported using
+    the double underscore notation.
+    """
+    field_name = None
+
+    def _get_document_value(self, document):
+        value = document
+
+        for part in self.field_name.split('__'):
+            value = getattr(value, part)
+
+            if value is None:
+                break
+
+        return value
+
+    def _process(self, document):
+        Document = apps.get_model(
+            app_label='documents', model_name='Document'
+        )
+
+        value = self._get_document_value(document=document)
+
+        if value is None:
+            return Document.objects.none()
+
+        return Document.objects.filter(
+            **{self.field_name: value}
+        ).exclude(pk=document.pk)
+
+    def get_duplicate_groups(self):
+        """
+        Find the groups of documents with the same field value using a
+        single grouped query instead of a query per document.
+        """
+        Document = apps.get_model(
+            app_label='documents', model_name='Document'
+        )
+
+        queryset_values = Document.objects.filter(
+            **{
+                '{}__isnull'.format(self.field_name): False
+            }
+        ).values(self.field_name).annotate(
+            document_count=Count('pk')
+        ).filter(document_count__gt=1).values(self.field_name)
+
+        queryset = Document.objects.filter(
+            **{
+                '{}__in'.format(self.field_name): queryset_values
+            }
+        ).order_by(self.field_name, 'pk').values_list(self.field_name, 'pk')
+
+        group_value = None
+        group_id_list = []
+
+        # Database collations can group values that compare as different
+        # in Python, groups with a single document are skipped.
+        for value, pk in queryset.iterator():
+            if value != group_value:
+                if len(group_id_list) > 1:
+                    yield group_id_list
+
+                group_id_list = []
+
+            group_value = value
+            group_id_list.append(pk)
+
+        if len(group_id_list) > 1:
+            yield group_id_list
+
+
 class NullBackend(DuplicateBackend):
     label = _(message='Null backend')
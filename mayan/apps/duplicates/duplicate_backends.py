@@ -1,40 +1,58 @@
 from django.apps import apps
-from django.db.models import F, Max
 from django.utils.translation import gettext_lazy as _
 
-from .classes import DuplicateBackend
+from .classes import DuplicateBackend, DuplicateBackendDocumentField
+from .settings import setting_image_hash_backend_enable
 
 
-class DuplicateBackendFileChecksum(DuplicateBackend):
+class DuplicateBackendFileChecksum(DuplicateBackendDocumentField):
+    # Documents whose latest file has the same checksum. The latest file
+    # of each document is kept updated when files are uploaded or
+    # deleted.
+    field_name = 'file_latest__checksum'
     label = _(message='Exact document file checksum')
 
     @classmethod
     def verify(cls, document):
-        return document.file_latest
+        return document.file_latest and document.file_latest.checksum
 
-    def process(self, document):
-        Document = apps.get_model(
-            app_label='documents', model_name='Document'
-        )
 
-        # Get the documents whose latest file matches the checksum
-        # of the current document and exclude the current document
+class DuplicateBackendLabel(DuplicateBackendDocumentField):
+    field_name = 'label'
+    label = _(message='Exact document label')
 
-        return Document.objects.annotate(
-            max_timestamp=Max('files__timestamp')
-        ).filter(
-            files__timestamp=F('max_timestamp'),
-            files__checksum=document.file_latest.checksum
-        ).exclude(pk=document.pk)
 
+class DuplicateBackendImageHash(DuplicateBackend):
+    # Documents whose first page images look alike. The candidates are
+    # found using the index of the image hash bands instead of comparing
+    # each document with all the others.
+    label = _(message='Similar first page image')
 
-class DuplicateBackendLabel(DuplicateBackend):
-    label = _(message='Exact document label')
+    @classmethod
+    def is_enabled(cls):
+        return setting_image_hash_backend_enable.value
 
-    def process(self, document):
+    @classmethod
+    def verify(cls, document):
+        return document.file_latest_id is not None
+
+    def _process(self, document):
         Document = apps.get_model(
             app_label='documents', model_name='Document'
         )
+        DuplicateImageHash = apps.get_model(
+            app_label='duplicates', model_name='DuplicateImageHash'
+        )
+
+        image_hash = DuplicateImageHash.objects.update_for(
+            document=document
+        )
+
+        if image_hash is None:
+            return Document.objects.none()
+
         return Document.objects.filter(
-            label=document.label
-        ).exclude(pk=document.pk)
+            pk__in=DuplicateImageHash.objects.get_similar_document_ids(
+                image_hash=image_hash
+            )
+        )
@@ -1,3 +1,7 @@
+from functools import partial
+
+from django.db import transaction
+
 from .tasks import task_duplicates_clean_empty_lists, task_duplicates_scan_for
 
 
@@ -7,5 +11,18 @@ def handler_scan_duplicates_for(sender, instance, **kwargs):
     )
 
 
+def handler_scan_duplicates_for_document_file_delete(
+    sender, instance, **kwargs
+):
+    # The latest file of the document is updated after the file is
+    # deleted, scan once the deletion is committed.
+    transaction.on_commit(
+        partial(
+            task_duplicates_scan_for.apply_async,
+            kwargs={'document_id': instance.document_id}
+        )
+    )
+
+
 def handler_remove_empty_duplicates_lists(sender, **kwargs):
     task_duplicates_clean_empty_lists.apply_async()
@@ -1 +1,23 @@
 BULK_CREATE_BATCH_SIZE = 100
+
+COMMAND_NAME_DUPLICATES_IMAGE_HASH_BACKFILL = 'duplicates_image_hash_backfill'
+COMMAND_NAME_DUPLICATES_SCAN = 'duplicates_scan'
+
+DEFAULT_DUPLICATES_IMAGE_HASH_BACKEND_ENABLE = False
+
+# Number of documents scanned by each task of a bulk scan.
+DOCUMENT_SCAN_CHUNK_SIZE = 100
+
+# The image hash has IMAGE_HASH_SIZE * IMAGE_HASH_SIZE bits (256) split in
+# IMAGE_HASH_BAND_COUNT bands of 16 bits. Two hashes differing in fewer
+# bits than the number of bands always share at least one band, so the
+# distance maximum is kept below the band count. Copies differing in more
+# bits are only found when they happen to share a band.
+IMAGE_HASH_BAND_COUNT = 16
+IMAGE_HASH_DISTANCE_MAXIMUM = 15
+IMAGE_HASH_SIZE = 16
+
+# Bands shared by more hashes than this, like those of blank pages, are not
+# used to find candidates. Documents matching only through those bands are
+# not detected.
+IMAGE_HASH_BAND_HASH_MAXIMUM = 1000
@@ -0,0 +1,24 @@
+from django.core import management
+
+from ...duplicate_backends import DuplicateBackendImageHash
+from ...tasks import task_duplicates_image_hash_backfill
+
+
+class Command(management.BaseCommand):
+    help = (
+        'Queue the computation of the first page image hash of the '
+        'documents that do not have one. The documents are processed in '
+        'groups by the workers and their duplicates are updated.'
+    )
+
+    def handle(self, **options):
+        if not DuplicateBackendImageHash.is_enabled():
+            self.stderr.write(
+                msg='\nThe image hash duplicate backend is disabled. Enable '
+                'it with the DUPLICATES_IMAGE_HASH_BACKEND_ENABLE setting.'
+            )
+            return
+
+        task_duplicates_image_hash_backfill.apply_async()
+
+        self.stdout.write(msg='\nImage hash computation queued.')
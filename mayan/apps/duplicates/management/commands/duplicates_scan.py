@@ -0,0 +1,19 @@
+from django.core import management
+
+from ...tasks import task_duplicates_scan_all
+
+
+class Command(management.BaseCommand):
+    help = (
+        'Find the duplicates of all the documents. Backends able to find all '
+        'the duplicates at once are processed immediately, the others are '
+        'queued to scan each document in the background.'
+    )
+
+    def handle(self, **options):
+        self.stdout.write(msg='\nScanning for duplicated documents...')
+
+        # Execute the task in this process instead of queuing it.
+        task_duplicates_scan_all()
+
+        self.stdout.write(msg='\nDuplicated documents scan finished.')
@@ -2,23 +2,128 @@ from itertools import islice
 import logging
 
 from django.apps import apps
-from django.db import models
-from django.db.models import Q, Value
+from django.db import models, transaction
+from django.db.models import Count, F, Q, Value
 
 from mayan.apps.acls.models import AccessControlList
 from mayan.apps.lock_manager.backends.base import LockingBackend
 from mayan.apps.lock_manager.exceptions import LockError
 
 from .classes import DuplicateBackend
-from .literals import BULK_CREATE_BATCH_SIZE
+from .literals import (
+    BULK_CREATE_BATCH_SIZE, IMAGE_HASH_BAND_COUNT,
+    IMAGE_HASH_BAND_HASH_MAXIMUM, IMAGE_HASH_DISTANCE_MAXIMUM,
+    IMAGE_HASH_SIZE
+)
+from .utils import (
+    get_hamming_distance, get_hash_bands, get_image_difference_hash
+)
 
 logger = logging.getLogger(name=__name__)
 
 
 class StoredDuplicateBackendManager(models.Manager):
-    def scan_document(self, document):
+    def _duplicate_groups_save(self, stored_backend, duplicate_groups):
+        """
+        Replace the entries of the backend with those of the duplicate
+        groups. Groups are saved in batches to avoid queries per group.
+        """
+        DuplicateBackendEntry = apps.get_model(
+            app_label='duplicates', model_name='DuplicateBackendEntry'
+        )
+
+        duplicate_groups = iter(duplicate_groups)
+
+        with transaction.atomic():
+            stored_backend.duplicate_entries.all().delete()
+
+            while True:
+                group_list = []
+                group_document_count = 0
+
+                for group_id_list in duplicate_groups:
+                    group_list.append(group_id_list)
+                    group_document_count += len(group_id_list)
+
+                    if group_document_count >= BULK_CREATE_BATCH_SIZE:
+                        break
+
+                if not group_list:
+                    break
+
+                document_id_list = [
+                    document_id for group_id_list in group_list for document_id in group_id_list
+                ]
+
+                DuplicateBackendEntry.objects.bulk_create(
+                    batch_size=BULK_CREATE_BATCH_SIZE, ignore_conflicts=True,
+                    objs=(
+                        DuplicateBackendEntry(
+                            document_id=document_id,
+                            stored_backend=stored_backend
+                        ) for document_id in document_id_list
+                    )
+                )
+
+                entry_ids = dict(
+                    stored_backend.duplicate_entries.filter(
+                        document_id__in=document_id_list
+                    ).values_list('document_id', 'pk')
+                )
+
+                bulk_create_list = (
+                    DuplicateBackendEntry.documents.through(
+                        duplicatebackendentry_id=entry_ids[document_id],
+                        document_id=duplicate_id
+                    ) for group_id_list in group_list for document_id in group_id_list for duplicate_id in group_id_list if duplicate_id != document_id
+                )
+
+                while True:
+                    batch = list(
+                        islice(bulk_create_list, BULK_CREATE_BATCH_SIZE)
+                    )
+
+                    if not batch:
+                        break
+
+                    DuplicateBackendEntry.documents.through.objects.bulk_create(
+                        batch_size=BULK_CREATE_BATCH_SIZE,
+                        ignore_conflicts=True, objs=batch
+                    )
+
+    def scan_all(self):
+        """
+        Find the duplicates of all the documents. Backends able to find
+        all the duplicates at once rebuild their entries using grouped
+        queries. Returns the paths of the backends that must scan each
+        document individually.
+        """
+        backend_path_list = []
+
+        for backend_path, backend_class in DuplicateBackend.get_all_enabled():
+            stored_backend, created = self.get_or_create(
+                backend_path=backend_path
+            )
+
+            duplicate_groups = stored_backend.get_backend_instance().get_duplicate_groups()
+
+            if duplicate_groups is None:
+                backend_path_list.append(backend_path)
+            else:
+                logger.debug(
+                    'Rebuilding the duplicates of backend: %s', backend_path
+                )
+                self._duplicate_groups_save(
+                    duplicate_groups=duplicate_groups,
+                    stored_backend=stored_backend
+                )
+
+        return backend_path_list
+
+    def scan_document(self, document, backend_path_list=None):
         """
         Find duplicates of document based on each registered backend's logic.
+        Use `backend_path_list` to scan with only some of the backends.
         """
         lock_name = 'duplicates__scan_document-{}'.format(document.pk)
         try:
@@ -30,12 +135,27 @@ class StoredDuplicateBackendManager(models.Manager):
                     app_label='duplicates', model_name='DuplicateBackendEntry'
                 )
 
-                for backend_path, backend_class in DuplicateBackend.get_all():
+                for backend_path, backend_class in DuplicateBackend.get_all_enabled():
+                    if backend_path_list is not None and backend_path not in backend_path_list:
+                        continue
+
+                    stored_backend, created = self.get_or_create(
+                        backend_path=backend_path
+                    )
+
                     if backend_class.verify(document=document):
+                        # Remove the previous results of the document for
+                        # the backend, as a source and as a target, before
+                        # adding the current ones.
+                        stored_backend.duplicate_entries.filter(
+                            document=document
+                        ).delete()
+
+                        DuplicateBackendEntry.documents.through.objects.filter(
+                            document=document,
+                            duplicatebackendentry__stored_backend=stored_backend
+                        ).delete()
 
-                        stored_backend, created = self.get_or_create(
-                            backend_path=backend_path
-                        )
                         duplicates = stored_backend.get_backend_instance().process(
                             document=document
                         )
@@ -125,19 +245,6 @@ class StoredDuplicateBackendManager(models.Manager):
                                     batch_size=BULK_CREATE_BATCH_SIZE,
                                     ignore_conflicts=True, objs=batch
                                 )
-                        else:
-                            # Document has no duplicates for this backend.
-                            # Delete any existing entry for where this
-                            # document is the source for the backend.
-                            stored_backend.duplicate_entries.filter(
-                                document=document
-                            ).delete()
-
-                            # Delete any existing entry for where this
-                            # document is a duplicate for the backend.
-                            document.as_duplicate.filter(
-                                stored_backend=stored_backend
-                            ).delete()
                     else:
                         # Document cannot be scanned for duplicates for this
                         # backend. Delete any existing entries for the
@@ -219,3 +326,125 @@ class DuplicateBackendEntryManager(models.Manager):
             )
 
         return queryset
+
+
+class DuplicateImageHashManager(models.Manager):
+    def get_similar_document_ids(self, image_hash):
+        """
+        Return the IDs of the documents with a first page image similar to
+        the one of the image hash. Only the hashes sharing a band with the
+        image hash are compared. Bands shared by too many hashes are
+        skipped to keep the number of candidates bounded.
+        """
+        DuplicateImageHashBand = apps.get_model(
+            app_label='duplicates', model_name='DuplicateImageHashBand'
+        )
+
+        value = image_hash.get_value_integer()
+
+        query_bands = Q()
+
+        for band, band_value in enumerate(
+            get_hash_bands(
+                band_count=IMAGE_HASH_BAND_COUNT,
+                bit_count=IMAGE_HASH_SIZE * IMAGE_HASH_SIZE, value=value
+            )
+        ):
+            query_bands |= Q(band=band, value=band_value)
+
+        queryset_bands = DuplicateImageHashBand.objects.filter(
+            query_bands
+        ).values('band', 'value').annotate(
+            hash_count=Count('pk')
+        ).filter(
+            hash_count__lte=IMAGE_HASH_BAND_HASH_MAXIMUM
+        ).values_list('band', 'value').order_by()
+
+        query = Q()
+
+        for band, band_value in queryset_bands:
+            query |= Q(bands__band=band, bands__value=band_value)
+
+        if not query:
+            return []
+
+        # Skip the hashes of documents whose latest file changed and are
+        # waiting to be scanned again.
+        queryset = self.filter(query).filter(
+            document__file_latest=F('document_file')
+        ).exclude(pk=image_hash.pk).values_list(
+            'document_id', 'value'
+        ).distinct()
+
+        return [
+            document_id for document_id, candidate_value in queryset.iterator() if get_hamming_distance(
+                value_a=value, value_b=int(candidate_value, 16)
+            ) <= IMAGE_HASH_DISTANCE_MAXIMUM
+        ]
+
+    def update_for(self, document):
+        """
+        Return the image hash of the latest file of the document, computing
+        it if the file changed. Returns None if the document has no first
+        page image.
+        """
+        DuplicateImageHashBand = apps.get_model(
+            app_label='duplicates', model_name='DuplicateImageHashBand'
+        )
+
+        document_file = document.file_latest
+
+        if document_file:
+            try:
+                return self.get(
+                    document=document, document_file=document_file
+                )
+            except self.model.DoesNotExist:
+                document_file_page = document_file.pages.first()
+        else:
+            document_file_page = None
+
+        if not document_file_page:
+            self.filter(document=document).delete()
+            return None
+
+        try:
+            with document_file_page.get_image() as file_object:
+                value = get_image_difference_hash(
+                    file_object=file_object, hash_size=IMAGE_HASH_SIZE
+                )
+        except Exception as exception:
+            logger.warning(
+                'Unable to compute the image hash of document: %s; %s',
+                document, exception
+            )
+            self.filter(document=document).delete()
+            return None
+
+        with transaction.atomic():
+            image_hash, created = self.update_or_create(
+                document=document, defaults={
+                    'document_file': document_file,
+                    'value': '{:0{}x}'.format(
+                        value, IMAGE_HASH_SIZE * IMAGE_HASH_SIZE // 4
+                    )
+                }
+            )
+
+            image_hash.bands.all().delete()
+
+            DuplicateImageHashBand.objects.bulk_create(
+                objs=[
+                    DuplicateImageHashBand(
+                        band=band, image_hash=image_hash, value=band_value
+                    ) for band, band_value in enumerate(
+                        get_hash_bands(
+                            band_count=IMAGE_HASH_BAND_COUNT,
+                            bit_count=IMAGE_HASH_SIZE * IMAGE_HASH_SIZE,
+                            value=value
+                        )
+                    )
+                ]
+            )
+
+        return image_hash
@@ -0,0 +1,88 @@
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ('documents', '0091_fix_documenttype_verbose_name'),
+        ('duplicates', '0010_auto_20210419_0709')
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DuplicateImageHash',
+            fields=[
+                (
+                    'id', models.AutoField(
+                        auto_created=True, primary_key=True, serialize=False,
+                        verbose_name='ID'
+                    )
+                ),
+                (
+                    'value', models.CharField(
+                        max_length=16, verbose_name='Value'
+                    )
+                ),
+                (
+                    'document', models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name='duplicate_image_hash',
+                        to='documents.document', verbose_name='Document'
+                    )
+                ),
+                (
+                    'document_file', models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name='+', to='documents.documentfile',
+                        verbose_name='Document file'
+                    )
+                )
+            ],
+            options={
+                'verbose_name': 'Duplicate image hash',
+                'verbose_name_plural': 'Duplicate image hashes'
+            }
+        ),
+        migrations.CreateModel(
+            name='DuplicateImageHashBand',
+            fields=[
+                (
+                    'id', models.AutoField(
+                        auto_created=True, primary_key=True, serialize=False,
+                        verbose_name='ID'
+                    )
+                ),
+                (
+                    'band', models.PositiveSmallIntegerField(
+                        verbose_name='Band'
+                    )
+                ),
+                (
+                    'value', models.PositiveIntegerField(
+                        verbose_name='Value'
+                    )
+                ),
+                (
+                    'image_hash', models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name='bands',
+                        to='duplicates.duplicateimagehash',
+                        verbose_name='Image hash'
+                    )
+                )
+            ],
+            options={
+                'verbose_name': 'Duplicate image hash band',
+                'verbose_name_plural': 'Duplicate image hash bands',
+                'indexes': [
+                    models.Index(
+                        fields=['band', 'value'],
+                        name='duplicates_hash_band_idx'
+                    )
+                ],
+                'unique_together': {
+                    ('image_hash', 'band')
+                }
+            }
+        )
+    ]
@@ -0,0 +1,31 @@
+from django.db import migrations, models
+
+
+def code_duplicate_image_hash_delete(apps, schema_editor):
+    # The hashes use a different size, they are computed again by the
+    # duplicates_image_hash_backfill command or the next document scan.
+    DuplicateImageHash = apps.get_model(
+        app_label='duplicates', model_name='DuplicateImageHash'
+    )
+
+    DuplicateImageHash.objects.using(
+        alias=schema_editor.connection.alias
+    ).all().delete()
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ('duplicates', '0011_duplicateimagehash_duplicateimagehashband')
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='duplicateimagehash',
+            name='value',
+            field=models.CharField(max_length=64, verbose_name='Value'),
+        ),
+        migrations.RunPython(
+            code=code_duplicate_image_hash_delete,
+            reverse_code=code_duplicate_image_hash_delete
+        )
+    ]
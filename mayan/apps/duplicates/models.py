@@ -2,11 +2,13 @@ from django.db import models
 from django.utils.translation import gettext_lazy as _
 
 from mayan.apps.backends.model_mixins import BackendModelMixin
+from mayan.apps.documents.models.document_file_models import DocumentFile
 from mayan.apps.documents.models.document_models import Document
 
 from .classes import NullBackend
 from .managers import (
-    DuplicateBackendEntryManager, StoredDuplicateBackendManager
+    DuplicateBackendEntryManager, DuplicateImageHashManager,
+    StoredDuplicateBackendManager
 )
 
 
@@ -48,6 +50,61 @@ class DuplicateBackendEntry(models.Model):
         verbose_name_plural = _(message='Duplicated backend entries')
 
 
+class DuplicateImageHash(models.Model):
+    """
+    Perceptual hash of the first page image of the latest file of a
+    document.
+    """
+    document = models.OneToOneField(
+        on_delete=models.CASCADE, related_name='duplicate_image_hash',
+        to=Document, verbose_name=_(message='Document')
+    )
+    document_file = models.ForeignKey(
+        on_delete=models.CASCADE, related_name='+', to=DocumentFile,
+        verbose_name=_(message='Document file')
+    )
+    value = models.CharField(
+        max_length=64, verbose_name=_(message='Value')
+    )
+
+    objects = DuplicateImageHashManager()
+
+    class Meta:
+        verbose_name = _(message='Duplicate image hash')
+        verbose_name_plural = _(message='Duplicate image hashes')
+
+    def __str__(self):
+        return self.value
+
+    def get_value_integer(self):
+        return int(self.value, 16)
+
+
+class DuplicateImageHashBand(models.Model):
+    """
+    Band of an image hash. Image hashes sharing a band are candidate
+    duplicates.
+    """
+    image_hash = models.ForeignKey(
+        on_delete=models.CASCADE, related_name='bands',
+        to=DuplicateImageHash, verbose_name=_(message='Image hash')
+    )
+    band = models.PositiveSmallIntegerField(
+        verbose_name=_(message='Band')
+    )
+    value = models.PositiveIntegerField(verbose_name=_(message='Value'))
+
+    class Meta:
+        indexes = (
+            models.Index(
+                fields=('band', 'value'), name='duplicates_hash_band_idx'
+            ),
+        )
+        unique_together = ('image_hash', 'band')
+        verbose_name = _(message='Duplicate image hash band')
+        verbose_name_plural = _(message='Duplicate image hash bands')
+
+
 class DuplicateSourceDocument(Document):
     class Meta:
         proxy = True
@@ -19,7 +19,15 @@ queue_duplicates.add_task_type(
     label=_(message='Scan document duplicates')
 )
 
+queue_duplicates_slow.add_task_type(
+    dotted_path='mayan.apps.duplicates.tasks.task_duplicates_image_hash_backfill',
+    label=_(message='Compute the missing duplicate image hashes')
+)
 queue_duplicates_slow.add_task_type(
     dotted_path='mayan.apps.duplicates.tasks.task_duplicates_scan_all',
     label=_(message='Duplicated document scan')
 )
+queue_duplicates_slow.add_task_type(
+    dotted_path='mayan.apps.duplicates.tasks.task_duplicates_scan_chunk',
+    label=_(message='Scan the duplicates of a group of documents')
+)
@@ -0,0 +1,20 @@
+from django.utils.translation import gettext_lazy as _
+
+from mayan.apps.smart_settings.settings import setting_cluster
+
+from .literals import DEFAULT_DUPLICATES_IMAGE_HASH_BACKEND_ENABLE
+
+setting_namespace = setting_cluster.do_namespace_add(
+    label=_(message='Duplicates'), name='duplicates'
+)
+
+setting_image_hash_backend_enable = setting_namespace.do_setting_add(
+    choices=('false', 'true'),
+    default=DEFAULT_DUPLICATES_IMAGE_HASH_BACKEND_ENABLE,
+    global_name='DUPLICATES_IMAGE_HASH_BACKEND_ENABLE', help_text=_(
+        message='Find documents with similar first page images. The image '
+        'of the first page of each new document file is rendered to '
+        'compute its hash. Use the duplicates_image_hash_backfill command '
+        'to hash the existing documents after enabling it.'
+    )
+)
@@ -1,8 +1,34 @@
+from itertools import islice
+import logging
+
 from django.apps import apps
+from django.db.models import F
 
 from mayan.apps.lock_manager.exceptions import LockError
 from mayan.celery import app
 
+from .duplicate_backends import DuplicateBackendImageHash
+from .literals import DOCUMENT_SCAN_CHUNK_SIZE
+
+logger = logging.getLogger(name=__name__)
+
+
+def _scan_chunks_queue(document_id_iterator, backend_path_list=None):
+    while True:
+        document_id_list = list(
+            islice(document_id_iterator, DOCUMENT_SCAN_CHUNK_SIZE)
+        )
+
+        if not document_id_list:
+            break
+
+        task_duplicates_scan_chunk.apply_async(
+            kwargs={
+                'backend_path_list': backend_path_list,
+                'document_id_list': document_id_list
+            }
+        )
+
 
 @app.task(ignore_result=True)
 def task_duplicates_clean_empty_lists():
@@ -12,22 +38,80 @@ def task_duplicates_clean_empty_lists():
     DuplicateBackendEntry.objects.clean_empty_duplicate_lists()
 
 
+@app.task(ignore_result=True)
+def task_duplicates_image_hash_backfill():
+    Document = apps.get_model(
+        app_label='documents', model_name='Document'
+    )
+    DuplicateImageHash = apps.get_model(
+        app_label='duplicates', model_name='DuplicateImageHash'
+    )
+
+    if not DuplicateBackendImageHash.is_enabled():
+        logger.info(
+            'The image hash duplicate backend is disabled, skipping the '
+            'image hash backfill.'
+        )
+        return
+
+    queryset = Document.valid.filter(file_latest__isnull=False).exclude(
+        pk__in=DuplicateImageHash.objects.filter(
+            document_file=F('document__file_latest')
+        ).values('document_id')
+    )
+
+    _scan_chunks_queue(
+        backend_path_list=[
+            DuplicateBackendImageHash.get_class_path()
+        ], document_id_iterator=queryset.values_list(
+            'pk', flat=True
+        ).iterator()
+    )
+
+
 @app.task(ignore_result=True)
 def task_duplicates_scan_all():
     Document = apps.get_model(
         app_label='documents', model_name='Document'
     )
+    StoredDuplicateBackend = apps.get_model(
+        app_label='duplicates', model_name='StoredDuplicateBackend'
+    )
 
-    for document in Document.valid.all():
-        task_duplicates_scan_for.apply_async(
-            kwargs={
-                'document_id': document.pk
-            }
+    backend_path_list = StoredDuplicateBackend.objects.scan_all()
+
+    if backend_path_list:
+        _scan_chunks_queue(
+            backend_path_list=backend_path_list,
+            document_id_iterator=Document.valid.values_list(
+                'pk', flat=True
+            ).iterator()
         )
 
 
 @app.task(bind=True, ignore_result=True)
-def task_duplicates_scan_for(self, document_id):
+def task_duplicates_scan_chunk(
+    self, document_id_list, backend_path_list=None
+):
+    Document = apps.get_model(
+        app_label='documents', model_name='Document'
+    )
+    StoredDuplicateBackend = apps.get_model(
+        app_label='duplicates', model_name='StoredDuplicateBackend'
+    )
+
+    # Documents deleted after the scan was queued are skipped.
+    for document in Document.objects.filter(pk__in=document_id_list):
+        try:
+            StoredDuplicateBackend.objects.scan_document(
+                backend_path_list=backend_path_list, document=document
+            )
+        except LockError as exception:
+            raise self.retry(exc=exception)
+
+
+@app.task(bind=True, ignore_result=True)
+def task_duplicates_scan_for(self, document_id, backend_path_list=None):
     Document = apps.get_model(
         app_label='documents', model_name='Document'
     )
@@ -35,11 +119,15 @@ def task_duplicates_scan_for(self, document_id):
         app_label='duplicates', model_name='StoredDuplicateBackend'
     )
 
-    document = Document.objects.get(pk=document_id)
+    try:
+        document = Document.objects.get(pk=document_id)
+    except Document.DoesNotExist:
+        # The document was deleted after the scan was queued.
+        return
 
     try:
         StoredDuplicateBackend.objects.scan_document(
-            document=document
+            backend_path_list=backend_path_list, document=document
         )
     except LockError as exception:
         raise self.retry(exc=exception)
@@ -1,4 +1,12 @@
-from ..tasks import task_duplicates_scan_all, task_duplicates_scan_for
+from io import BytesIO
+
+from PIL import Image
+
+from ..settings import setting_image_hash_backend_enable
+from ..tasks import (
+    task_duplicates_image_hash_backfill, task_duplicates_scan_all,
+    task_duplicates_scan_for
+)
 
 
 class DuplicatedDocumentAPIViewTestMixin:
@@ -14,6 +22,9 @@ class DuplicatedDocumentAPIViewTestMixin:
 
 
 class DuplicatedDocumentTaskTestMixin:
+    def _execute_task_duplicates_image_hash_backfill(self):
+        task_duplicates_image_hash_backfill.apply_async().get()
+
     def _execute_task_duplicates_scan_all(self):
         task_duplicates_scan_all.apply_async().get()
 
@@ -29,6 +40,46 @@ class DuplicatedDocumentTestMixin:
     def _upload_duplicate_document(self):
         self._upload_test_document(label='duplicated document label')
 
+    def _upload_similar_document(self):
+        """
+        Upload a resized and recompressed copy of the test document image.
+        """
+        self._calculate_test_document_path()
+
+        with Image.open(fp=self._test_document_path) as image:
+            image = image.convert(mode='RGB').resize(
+                size=(image.width // 2, image.height // 2)
+            )
+
+        file_object = BytesIO()
+        file_object.name = 'similar_document.jpg'
+        image.save(file_object, format='JPEG', quality=70)
+        file_object.seek(0)
+
+        self._test_document = self._test_document_type.documents_upload(
+            file_object=file_object, label='similar document label'
+        )
+        self._test_document_list.append(self._test_document)
+
+
+class DuplicateImageHashTestMixin:
+    """
+    Enable the image hash backend before uploading the test document.
+    """
+    auto_upload_test_document = False
+
+    def setUp(self):
+        super().setUp()
+        self._set_environment_variable(
+            name='MAYAN_{}'.format(
+                setting_image_hash_backend_enable.global_name
+            ), value='true'
+        )
+        setting_image_hash_backend_enable.do_cache_invalidate()
+        self.addCleanup(setting_image_hash_backend_enable.do_cache_invalidate)
+
+        self._upload_test_document()
+
 
 class DuplicatedDocumentToolViewTestMixin:
     def _request_duplicated_document_scan_view(self):
@@ -0,0 +1,56 @@
+from mayan.apps.common.tests.mixins import ManagementCommandTestMixin
+from mayan.apps.documents.tests.base import GenericDocumentTestCase
+
+from ..literals import (
+    COMMAND_NAME_DUPLICATES_IMAGE_HASH_BACKFILL, COMMAND_NAME_DUPLICATES_SCAN
+)
+from ..models import DuplicateBackendEntry, DuplicateImageHash
+
+from .mixins import DuplicatedDocumentTestMixin, DuplicateImageHashTestMixin
+
+
+class DuplicatesImageHashBackfillManagementCommandTestCase(
+    DuplicateImageHashTestMixin, DuplicatedDocumentTestMixin,
+    ManagementCommandTestMixin, GenericDocumentTestCase
+):
+    _test_management_command_name = COMMAND_NAME_DUPLICATES_IMAGE_HASH_BACKFILL
+
+    def setUp(self):
+        super().setUp()
+        self._upload_similar_document()
+        DuplicateBackendEntry.objects.all().delete()
+        DuplicateImageHash.objects.all().delete()
+
+    def test_duplicates_image_hash_backfill_command(self):
+        self._call_test_management_command()
+
+        self.assertEqual(DuplicateImageHash.objects.count(), 2)
+        self.assertTrue(
+            self._test_document_list[1] in DuplicateBackendEntry.objects.get_duplicates_of(
+                document=self._test_document_list[0]
+            )
+        )
+
+
+class DuplicatesScanManagementCommandTestCase(
+    ManagementCommandTestMixin, GenericDocumentTestCase
+):
+    _test_management_command_name = COMMAND_NAME_DUPLICATES_SCAN
+    auto_upload_test_document = False
+
+    def setUp(self):
+        super().setUp()
+        self._upload_test_document()
+        self._upload_test_document()
+        DuplicateBackendEntry.objects.all().delete()
+
+    def test_duplicates_scan_command(self):
+        self._call_test_management_command()
+
+        self.assertEqual(
+            list(
+                DuplicateBackendEntry.objects.get_duplicates_of(
+                    document=self._test_document_list[0]
+                )
+            ), [self._test_document_list[1]]
+        )
@@ -1,8 +1,13 @@
+from unittest import mock
+
 from mayan.apps.documents.tests.base import GenericDocumentTestCase
+from mayan.apps.documents.tests.literals import TEST_FILE_MULTI_PAGE_TIFF_PATH
 
-from ..models import DuplicateBackendEntry, StoredDuplicateBackend
+from ..models import (
+    DuplicateBackendEntry, DuplicateImageHash, StoredDuplicateBackend
+)
 
-from .mixins import DuplicatedDocumentTestMixin
+from .mixins import DuplicatedDocumentTestMixin, DuplicateImageHashTestMixin
 
 
 class DuplicatedDocumentModelTestCase(
@@ -50,3 +55,162 @@ class DuplicatedDocumentModelTestCase(
         StoredDuplicateBackend.objects.scan_document(
             document=self._test_document_list[0]
         )
+
+    def test_duplicates_after_file_delete(self):
+        self._upload_test_document(label='test document label')
+
+        with open(file=TEST_FILE_MULTI_PAGE_TIFF_PATH, mode='rb') as file_object:
+            self._test_document.files_upload(file_object=file_object)
+
+        self.assertEqual(
+            DuplicateBackendEntry.objects.get_duplicates_of(
+                document=self._test_document_list[0]
+            ).count(), 0
+        )
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self._test_document.file_latest.delete()
+
+        self.assertTrue(
+            self._test_document_list[1] in DuplicateBackendEntry.objects.get_duplicates_of(
+                document=self._test_document_list[0]
+            )
+        )
+
+    def test_duplicates_after_file_change(self):
+        test_document_path = self._test_document_path
+        self._test_document_path = TEST_FILE_MULTI_PAGE_TIFF_PATH
+        self._upload_test_document(label='test multi page label')
+        self._test_document_path = test_document_path
+
+        self._upload_test_document(label='test document changed label')
+
+        self.assertTrue(
+            self._test_document_list[0] in DuplicateBackendEntry.objects.get_duplicates_of(
+                document=self._test_document_list[2]
+            )
+        )
+
+        with open(file=TEST_FILE_MULTI_PAGE_TIFF_PATH, mode='rb') as file_object:
+            self._test_document.files_upload(file_object=file_object)
+
+        self.assertEqual(
+            list(
+                DuplicateBackendEntry.objects.get_duplicates_of(
+                    document=self._test_document_list[2]
+                )
+            ), [self._test_document_list[1]]
+        )
+        self.assertFalse(
+            self._test_document_list[2] in DuplicateBackendEntry.objects.get_duplicates_of(
+                document=self._test_document_list[0]
+            )
+        )
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self._test_document.file_latest.delete()
+
+        self.assertEqual(
+            list(
+                DuplicateBackendEntry.objects.get_duplicates_of(
+                    document=self._test_document_list[2]
+                )
+            ), [self._test_document_list[0]]
+        )
+        self.assertFalse(
+            self._test_document_list[2] in DuplicateBackendEntry.objects.get_duplicates_of(
+                document=self._test_document_list[1]
+            )
+        )
+
+    def test_image_hash_backend_disabled(self):
+        self._upload_similar_document()
+
+        self.assertEqual(DuplicateImageHash.objects.count(), 0)
+        self.assertFalse(
+            self._test_document_list[1] in DuplicateBackendEntry.objects.get_duplicates_of(
+                document=self._test_document_list[0]
+            )
+        )
+
+    def test_scan_all(self):
+        self._upload_test_document()
+        DuplicateBackendEntry.objects.all().delete()
+
+        backend_path_list = StoredDuplicateBackend.objects.scan_all()
+
+        self.assertEqual(backend_path_list, [])
+        self.assertEqual(
+            list(
+                DuplicateBackendEntry.objects.get_duplicates_of(
+                    document=self._test_document_list[0]
+                )
+            ), [self._test_document_list[1]]
+        )
+        self.assertEqual(
+            list(
+                DuplicateBackendEntry.objects.get_duplicates_of(
+                    document=self._test_document_list[1]
+                )
+            ), [self._test_document_list[0]]
+        )
+
+
+class DuplicateImageHashModelTestCase(
+    DuplicateImageHashTestMixin, DuplicatedDocumentTestMixin,
+    GenericDocumentTestCase
+):
+    def test_different_document(self):
+        self._test_document_path = TEST_FILE_MULTI_PAGE_TIFF_PATH
+        self._upload_test_document(label='test document label')
+
+        self.assertFalse(
+            self._test_document_list[1] in DuplicateBackendEntry.objects.get_duplicates_of(
+                document=self._test_document_list[0]
+            )
+        )
+
+    def test_image_hash_update_after_file_upload(self):
+        image_hash = self._test_document.duplicate_image_hash
+
+        with open(file=TEST_FILE_MULTI_PAGE_TIFF_PATH, mode='rb') as file_object:
+            self._test_document.files_upload(file_object=file_object)
+
+        self._test_document.refresh_from_db()
+
+        self.assertEqual(
+            self._test_document.duplicate_image_hash.document_file,
+            self._test_document.file_latest
+        )
+        self.assertNotEqual(
+            self._test_document.duplicate_image_hash.value, image_hash.value
+        )
+
+    def test_similar_document(self):
+        self._upload_similar_document()
+
+        self.assertEqual(DuplicateImageHash.objects.count(), 2)
+        self.assertTrue(
+            self._test_document_list[1] in DuplicateBackendEntry.objects.get_duplicates_of(
+                document=self._test_document_list[0]
+            )
+        )
+        self.assertTrue(
+            self._test_document_list[0] in DuplicateBackendEntry.objects.get_duplicates_of(
+                document=self._test_document_list[1]
+            )
+        )
+
+    def test_similar_document_band_hash_maximum(self):
+        with mock.patch(
+            'mayan.apps.duplicates.managers.IMAGE_HASH_BAND_HASH_MAXIMUM', 1
+        ):
+            self._upload_similar_document()
+
+        # The bands shared by both hashes are skipped.
+        self.assertEqual(DuplicateImageHash.objects.count(), 2)
+        self.assertFalse(
+            self._test_document_list[0] in DuplicateBackendEntry.objects.get_duplicates_of(
+                document=self._test_document_list[1]
+            )
+        )
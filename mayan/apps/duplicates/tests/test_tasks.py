@@ -1,8 +1,11 @@
 from mayan.apps.documents.tests.base import GenericDocumentTestCase
 
-from ..models import DuplicateBackendEntry
+from ..models import DuplicateBackendEntry, DuplicateImageHash
 
-from .mixins import DuplicatedDocumentTaskTestMixin
+from .mixins import (
+    DuplicatedDocumentTaskTestMixin, DuplicatedDocumentTestMixin,
+    DuplicateImageHashTestMixin
+)
 
 
 class DuplicatedDocumentTaskTestCase(
@@ -61,3 +64,31 @@ class DuplicatedDocumentTaskTestCase(
 
         events = self._get_test_events()
         self.assertEqual(events.count(), 0)
+
+
+class DuplicateImageHashTaskTestCase(
+    DuplicateImageHashTestMixin, DuplicatedDocumentTaskTestMixin,
+    DuplicatedDocumentTestMixin, GenericDocumentTestCase
+):
+    def setUp(self):
+        super().setUp()
+        self._upload_similar_document()
+        DuplicateBackendEntry.objects.all().delete()
+        DuplicateImageHash.objects.all().delete()
+
+    def test_task_duplicates_image_hash_backfill(self):
+        self._clear_events()
+
+        self._execute_task_duplicates_image_hash_backfill()
+
+        self.assertEqual(DuplicateImageHash.objects.count(), 2)
+        self.assertEqual(
+            list(
+                DuplicateBackendEntry.objects.get_duplicates_of(
+                    document=self._test_document_list[0]
+                )
+            ), [self._test_document_list[1]]
+        )
+
+        events = self._get_test_events()
+        self.assertEqual(events.count(), 0)
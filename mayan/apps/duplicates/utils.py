@@ -0,0 +1,40 @@
+from PIL import Image
+
+
+def get_image_difference_hash(file_object, hash_size):
+    """
+    Return the difference hash of an image as an integer. Each bit
+    compares the brightness of two horizontally adjacent pixels of the
+    image reduced to a small grayscale thumbnail. Rescanned, resized or
+    recompressed copies of an image produce hashes that differ in only
+    a few bits.
+    """
+    image = Image.open(fp=file_object).convert(mode='L').resize(
+        resample=Image.Resampling.LANCZOS, size=(hash_size + 1, hash_size)
+    )
+    pixels = image.getdata()
+    value = 0
+
+    for row in range(hash_size):
+        for column in range(hash_size):
+            offset = row * (hash_size + 1) + column
+            value = (value << 1) | (pixels[offset] < pixels[offset + 1])
+
+    return value
+
+
+def get_hamming_distance(value_a, value_b):
+    return bin(value_a ^ value_b).count('1')
+
+
+def get_hash_bands(value, band_count, bit_count):
+    """
+    Split a hash in bands of consecutive bits. Returns the list of the
+    integer value of each band.
+    """
+    band_size = bit_count // band_count
+    mask = (1 << band_size) - 1
+
+    return [
+        (value >> (band * band_size)) & mask for band in range(band_count)
+    ]
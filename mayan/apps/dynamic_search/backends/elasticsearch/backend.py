@@ -1,10 +1,13 @@
 from collections import deque
 import functools
+import json
 
 import elasticsearch
 from elasticsearch import Elasticsearch, helpers
 from elasticsearch_dsl import Search
 
+from mayan.apps.common.utils import ProcessInstanceCache
+
 from ...exceptions import (
     DynamicSearchBackendException, DynamicSearchValueTransformationError
 )
@@ -13,6 +16,9 @@ from ...search_fields import SearchFieldVirtualAllFields
 from ...search_models import SearchModel
 
 from .literals import (
+    DEFAULT_ELASTICSEARCH_BULK_CHUNK_SIZE,
+    DEFAULT_ELASTICSEARCH_BULK_MAX_CHUNK_BYTES,
+    DEFAULT_ELASTICSEARCH_BULK_THREAD_COUNT,
     DEFAULT_ELASTICSEARCH_CLIENT_MAXSIZE,
     DEFAULT_ELASTICSEARCH_CLIENT_SNIFF_ON_CONNECTION_FAIL,
     DEFAULT_ELASTICSEARCH_CLIENT_SNIFF_ON_START,
@@ -20,16 +26,21 @@ from .literals import (
     DEFAULT_ELASTICSEARCH_CLIENT_VERIFY_CERTS,
     DEFAULT_ELASTICSEARCH_INDICES_NAMESPACE,
     DEFAULT_ELASTICSEARCH_SEARCH_PAGE_SIZE,
-    DJANGO_TO_ELASTICSEARCH_FIELD_MAP, MAXIMUM_API_ATTEMPT_COUNT
+    DJANGO_TO_ELASTICSEARCH_FIELD_MAP,
+    ELASTICSEARCH_BULK_INDEXING_INDEX_SETTINGS, MAXIMUM_API_ATTEMPT_COUNT
 )
 
 
 class ElasticSearchBackend(SearchBackend):
+    _client_cache = ProcessInstanceCache()
     feature_reindex = True
     field_type_mapping = DJANGO_TO_ELASTICSEARCH_FIELD_MAP
 
     def __init__(
-        self, client_http_auth=None, client_host=DEFAULT_ELASTICSEARCH_HOST,
+        self, bulk_chunk_size=DEFAULT_ELASTICSEARCH_BULK_CHUNK_SIZE,
+        bulk_max_chunk_bytes=DEFAULT_ELASTICSEARCH_BULK_MAX_CHUNK_BYTES,
+        bulk_thread_count=DEFAULT_ELASTICSEARCH_BULK_THREAD_COUNT,
+        client_http_auth=None, client_host=DEFAULT_ELASTICSEARCH_HOST,
         client_hosts=None,
         client_maxsize=DEFAULT_ELASTICSEARCH_CLIENT_MAXSIZE,
         client_port=None, client_scheme=None,
@@ -42,6 +53,11 @@ class ElasticSearchBackend(SearchBackend):
     ):
         super().__init__(**kwargs)
 
+        self.bulk_kwargs = {
+            'chunk_size': int(bulk_chunk_size),
+            'max_chunk_bytes': int(bulk_max_chunk_bytes)
+        }
+        self.bulk_thread_count = int(bulk_thread_count)
         self.indices_namespace = indices_namespace
 
         self.client_kwargs = {
@@ -103,7 +119,16 @@ class ElasticSearchBackend(SearchBackend):
             ) from exception
 
     def _get_client(self):
-        return Elasticsearch(**self.client_kwargs)
+        """
+        Return a client shared by all the backend instances of the process
+        that use the same client arguments. Reusing the client reuses its
+        connection pool.
+        """
+        return self.__class__._client_cache.get(
+            arguments=json.dumps(
+                default=str, obj=self.client_kwargs, sort_keys=True
+            ), factory=functools.partial(Elasticsearch, **self.client_kwargs)
+        )
 
     def _get_index_name(self, search_model):
         return '{}-{}'.format(
@@ -217,6 +242,18 @@ class ElasticSearchBackend(SearchBackend):
                         index_name=index_name, search=search
                     )
 
+    def _update_index_settings(self, index_settings):
+        client = self._get_client()
+
+        for search_model in SearchModel.all():
+            try:
+                client.indices.put_settings(
+                    body={'index': index_settings},
+                    index=self._get_index_name(search_model=search_model)
+                )
+            except elasticsearch.exceptions.NotFoundError:
+                """Ignore non existent indexes."""
+
     def _update_mappings(self, search_model=None):
         client = self._get_client()
 
@@ -265,6 +302,71 @@ class ElasticSearchBackend(SearchBackend):
                     old indices.
                     """
 
+    def bulk_indexing_end(self, index_settings=None):
+        """
+        Restore the index settings saved by `bulk_indexing_start`. Settings
+        that were not saved are reset to their defaults.
+        """
+        index_settings = index_settings or {}
+        client = self._get_client()
+
+        for search_model in SearchModel.all():
+            index_name = self._get_index_name(search_model=search_model)
+
+            saved_index_settings = {
+                key: None for key in ELASTICSEARCH_BULK_INDEXING_INDEX_SETTINGS
+            }
+            saved_index_settings.update(
+                index_settings.get(index_name, {})
+            )
+
+            try:
+                client.indices.put_settings(
+                    body={'index': saved_index_settings}, index=index_name
+                )
+            except elasticsearch.exceptions.NotFoundError:
+                """Ignore non existent indexes."""
+
+        self.refresh()
+
+    def bulk_indexing_start(self):
+        """
+        Return the current values of the index settings changed for the
+        bulk indexing, to be restored by `bulk_indexing_end`. Values that
+        are not set explicitly or that are already the bulk indexing
+        values, like after an interrupted reindex, are not returned.
+        """
+        client = self._get_client()
+        result = {}
+
+        for search_model in SearchModel.all():
+            index_name = self._get_index_name(search_model=search_model)
+
+            try:
+                response = client.indices.get_settings(index=index_name)
+            except elasticsearch.exceptions.NotFoundError:
+                """Ignore non existent indexes."""
+            else:
+                current_index_settings = response.get(index_name, {}).get(
+                    'settings', {}
+                ).get('index', {})
+
+                saved_index_settings = {}
+                for key, value in ELASTICSEARCH_BULK_INDEXING_INDEX_SETTINGS.items():
+                    current_value = current_index_settings.get(key)
+
+                    if current_value is not None and str(current_value) != str(value):
+                        saved_index_settings[key] = current_value
+
+                if saved_index_settings:
+                    result[index_name] = saved_index_settings
+
+        self._update_index_settings(
+            index_settings=ELASTICSEARCH_BULK_INDEXING_INDEX_SETTINGS
+        )
+
+        return result
+
     def deindex_instance(self, instance):
         search_model = SearchModel.get_for_model(instance=instance)
         client = self._get_client()
@@ -296,18 +398,23 @@ class ElasticSearchBackend(SearchBackend):
 
             queryset = queryset.filter(pk__in=id_list)
 
-            for instance in queryset:
-                kwargs = search_model.populate(
-                    search_backend=self, instance=instance
-                )
+            for instance, kwargs in search_model.populate_many(
+                queryset=queryset, search_backend=self
+            ):
                 kwargs['_id'] = kwargs['id']
 
                 yield kwargs
 
-        bulk_indexing_generator = helpers.streaming_bulk(
-            actions=generate_actions(), client=client, index=index_name,
-            yield_ok=False
-        )
+        if self.bulk_thread_count > 1:
+            bulk_indexing_generator = helpers.parallel_bulk(
+                actions=generate_actions(), client=client, index=index_name,
+                thread_count=self.bulk_thread_count, **self.bulk_kwargs
+            )
+        else:
+            bulk_indexing_generator = helpers.streaming_bulk(
+                actions=generate_actions(), client=client, index=index_name,
+                yield_ok=False, **self.bulk_kwargs
+            )
 
         deque(iterable=bulk_indexing_generator, maxlen=0)
 
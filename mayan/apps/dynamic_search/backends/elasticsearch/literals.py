@@ -17,6 +17,9 @@ from ...value_transformations import (
     ValueTransformationToString
 )
 
+DEFAULT_ELASTICSEARCH_BULK_CHUNK_SIZE = 500
+DEFAULT_ELASTICSEARCH_BULK_MAX_CHUNK_BYTES = 100 * 1024 * 1024  # 100 MB
+DEFAULT_ELASTICSEARCH_BULK_THREAD_COUNT = 1
 DEFAULT_ELASTICSEARCH_CLIENT_MAXSIZE = 10
 DEFAULT_ELASTICSEARCH_CLIENT_SNIFF_ON_START = False
 DEFAULT_ELASTICSEARCH_CLIENT_SNIFF_ON_CONNECTION_FAIL = False
@@ -214,4 +217,11 @@ DJANGO_TO_ELASTICSEARCH_FIELD_MAP = {
     }
 }
 
+# Index settings applied while bulk indexing. Refreshing and replication
+# are disabled and restored to their previous values once bulk indexing
+# ends.
+ELASTICSEARCH_BULK_INDEXING_INDEX_SETTINGS = {
+    'number_of_replicas': 0, 'refresh_interval': '-1'
+}
+
 MAXIMUM_API_ATTEMPT_COUNT = 10
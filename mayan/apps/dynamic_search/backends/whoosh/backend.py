@@ -10,7 +10,10 @@ from whoosh.qparser import MultifieldParser, OrGroup
 from whoosh.query import Every
 from whoosh.writing import BufferedWriter
 
+from django.apps import apps
 from django.conf import settings
+from django.db.models import Count, Min
+from django.utils.timezone import now
 
 from mayan.apps.common.utils import any_to_bool
 from mayan.apps.lock_manager.backends.base import LockingBackend
@@ -39,11 +42,20 @@ class WhooshSearchBackend(SearchBackend):
     field_type_mapping = DJANGO_TO_WHOOSH_FIELD_MAP
 
     def __init__(
-        self, index_path=None, writer_limitmb=128, writer_multisegment=False,
-        writer_procs=1, **kwargs
+        self, batch_interval=5, batch_size=0, index_path=None,
+        writer_limitmb=128, writer_multisegment=False, writer_procs=1,
+        **kwargs
     ):
         super().__init__(**kwargs)
 
+        # When the batch size is not zero, the instances to index are
+        # stored in the database and written using a single writer and a
+        # single commit per search model when the batch is full or when
+        # its oldest entry is older than the batch interval. Entries left
+        # pending are written by the periodic batch flush task.
+        self.batch_interval = float(batch_interval)
+        self.batch_size = int(batch_size or 0)
+
         if self._test_mode:
             if not self.__class__._local_attribute_backend_temporary_directory:
                 self.__class__._local_attribute_backend_temporary_directory = TemporaryDirectory()
@@ -69,6 +81,89 @@ class WhooshSearchBackend(SearchBackend):
             'procs': writer_procs
         }
 
+    def _batch_add(
+        self, instance, search_model, exclude_model=None,
+        exclude_kwargs=None
+    ):
+        IndexBatchEntry = apps.get_model(
+            app_label='dynamic_search', model_name='IndexBatchEntry'
+        )
+
+        IndexBatchEntry.objects.entry_add(
+            exclude_kwargs=exclude_kwargs, exclude_model=exclude_model,
+            object_id=instance.pk, search_model=search_model
+        )
+
+        batch_status = IndexBatchEntry.objects.aggregate(
+            count=Count('pk'), datetime_oldest=Min('datetime')
+        )
+
+        if batch_status['count']:
+            # Another process might have written the entries already.
+            is_flush_required = (
+                batch_status['count'] >= self.batch_size
+            ) or (
+                (now() - batch_status['datetime_oldest']).total_seconds() >= self.batch_interval
+            )
+        else:
+            is_flush_required = False
+
+        if is_flush_required:
+            try:
+                self.batch_flush()
+            except (DynamicSearchRetry, LockError) as exception:
+                # The entries are kept and written by the next flush.
+                logger.debug(
+                    'Unable to flush the search index batch; %s', exception
+                )
+
+    def _batch_write(self, entries, search_model):
+        exclusions = {}
+
+        for entry in entries:
+            # Keep the exclusion of a previous request for the same
+            # instance. The related instance being deleted must not be
+            # indexed.
+            exclusions[entry.object_id] = entry.get_exclude() or exclusions.get(
+                entry.object_id
+            )
+
+        queryset = search_model.model._meta.default_manager.filter(
+            pk__in=exclusions.keys()
+        )
+        instances = {instance.pk: instance for instance in queryset}
+
+        with self._get_writer(search_model=search_model) as writer:
+            for object_id, exclude in exclusions.items():
+                instance = instances.get(object_id)
+
+                if instance is None:
+                    # Object was deleted before it could be indexed.
+                    writer.delete_by_term(
+                        'id', str(object_id)
+                    )
+                    continue
+
+                exclude_model, exclude_kwargs = exclude or (None, None)
+
+                try:
+                    kwargs = search_model.populate(
+                        search_backend=self, instance=instance,
+                        exclude_model=exclude_model,
+                        exclude_kwargs=exclude_kwargs
+                    )
+                    writer.update_document(**kwargs)
+                except whoosh.index.LockError:
+                    raise
+                except Exception as exception:
+                    # Skip the instance to avoid blocking the rest of the
+                    # batch.
+                    logger.error(
+                        'Unexpected exception while indexing search object '
+                        'id: %s, search model: %s; %s', instance.pk,
+                        search_model.full_name, exception, exc_info=True
+                    )
+
     def _clear_search_model_index(self, search_model):
         schema = self._get_search_model_schema(search_model=search_model)
 
@@ -231,7 +326,77 @@ class WhooshSearchBackend(SearchBackend):
             for search_model in search_models:
                 self._get_or_create_index(search_model=search_model)
 
+    def batch_flush(self):
+        """
+        Write the pending batched instances to the search indexes. The
+        entries of a search model are deleted only after its index
+        changes are committed. Entries added during the flush are written
+        by the next one.
+        """
+        IndexBatchEntry = apps.get_model(
+            app_label='dynamic_search', model_name='IndexBatchEntry'
+        )
+
+        if not IndexBatchEntry.objects.exists():
+            return
+
+        try:
+            lock = LockingBackend.get_backend().acquire_lock(
+                name=TEXT_LOCK_INSTANCE_INDEX
+            )
+        except LockError:
+            raise
+        else:
+            try:
+                search_model_entries = {}
+                for entry in IndexBatchEntry.objects.all():
+                    search_model_entries.setdefault(
+                        entry.search_model_name, []
+                    ).append(entry)
+
+                for search_model_full_name, entries in search_model_entries.items():
+                    logger.debug(
+                        'Flushing %d batched search instances of search '
+                        'model: %s.', len(entries), search_model_full_name
+                    )
+
+                    try:
+                        search_model = SearchModel.get(
+                            name=search_model_full_name
+                        )
+                    except KeyError as exception:
+                        logger.warning(
+                            'Discarding the batched instances of search '
+                            'model `%s`; %s', search_model_full_name,
+                            exception
+                        )
+                    else:
+                        if not settings.COMMON_DISABLE_LOCAL_STORAGE:
+                            try:
+                                self._batch_write(
+                                    entries=entries, search_model=search_model
+                                )
+                            except whoosh.index.LockError as exception:
+                                raise DynamicSearchRetry from exception
+
+                    IndexBatchEntry.objects.filter(
+                        pk__in=[entry.pk for entry in entries]
+                    ).delete()
+            finally:
+                lock.release()
+
     def deindex_instance(self, instance):
+        search_model = SearchModel.get_for_model(instance=instance)
+
+        if self.batch_size:
+            IndexBatchEntry = apps.get_model(
+                app_label='dynamic_search', model_name='IndexBatchEntry'
+            )
+            IndexBatchEntry.objects.filter(
+                object_id=instance.pk,
+                search_model_name=search_model.full_name
+            ).delete()
+
         try:
             lock = LockingBackend.get_backend().acquire_lock(
                 name=TEXT_LOCK_INSTANCE_DEINDEX
@@ -240,7 +405,6 @@ class WhooshSearchBackend(SearchBackend):
             raise
         else:
             try:
-                search_model = SearchModel.get_for_model(instance=instance)
                 index = self._get_or_create_index(search_model=search_model)
 
                 if not settings.COMMON_DISABLE_LOCAL_STORAGE:
@@ -258,6 +422,14 @@ class WhooshSearchBackend(SearchBackend):
             return value
 
     def index_instance(self, instance, exclude_model=None, exclude_kwargs=None):
+        if self.batch_size:
+            self._batch_add(
+                exclude_kwargs=exclude_kwargs, exclude_model=exclude_model,
+                instance=instance,
+                search_model=SearchModel.get_for_model(instance=instance)
+            )
+            return
+
         try:
             lock = LockingBackend.get_backend().acquire_lock(
                 name=TEXT_LOCK_INSTANCE_INDEX
@@ -352,11 +524,9 @@ class WhooshSearchBackend(SearchBackend):
                     index = self._get_or_create_index(search_model=search_model)
 
                     writer = BufferedWriter(index=index)
-                    for instance in queryset:
-                        kwargs = search_model.populate(
-                            search_backend=self, instance=instance
-                        )
-
+                    for instance, kwargs in search_model.populate_many(
+                        queryset=queryset, search_backend=self
+                    ):
                         try:
                             writer.update_document(**kwargs)
                         except Exception as exception:
@@ -389,6 +559,9 @@ class WhooshSearchBackend(SearchBackend):
             finally:
                 lock.release()
 
+    def refresh(self):
+        self.batch_flush()
+
     def reset(self, search_model=None):
         self.tear_down(search_model=search_model)
         self._update_mappings(search_model=search_model)
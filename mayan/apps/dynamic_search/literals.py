@@ -1,5 +1,8 @@
 from django.utils.translation import gettext_lazy as _
 
+from mayan.apps.rest_api.literals import DEFAULT_PAGE_SIZE_QUERY_PARAMETER
+from mayan.apps.views.literals import TEXT_SORT_FIELD_PARAMETER
+
 COMMAND_NAME_SEARCH_INDEX_OBJECTS = 'search_index_objects'
 COMMAND_NAME_SEARCH_REINDEX = 'search_reindex'
 COMMAND_NAME_SEARCH_STATUS = 'search_status'
@@ -10,6 +13,7 @@ DEFAULT_SEARCH_DISABLE_SIMPLE_SEARCH = False
 DEFAULT_SEARCH_INDEXING_CHUNK_SIZE = 25
 DEFAULT_SEARCH_MATCH_ALL_DEFAULT_VALUE = 'False'
 DEFAULT_SEARCH_QUERY_RESULTS_LIMIT = 100000
+DEFAULT_SEARCH_RESULTS_CACHE_TIME_TO_LIVE = 10 * 60  # 10 minutes.
 DEFAULT_SEARCH_RESULTS_LIMIT = 1000
 DEFAULT_SEARCH_SAVED_RESULTSET_RESULTS_LIMIT = 1000
 DEFAULT_SEARCH_SAVED_RESULTSETS_PER_USER_LIMIT = 10
@@ -81,10 +85,22 @@ DEFAULT_SEARCH_DEFAULT_OPERATOR = SCOPE_OPERATOR_AND
 DEFAULT_SEARCH_MODEL_FIELD_DISABLE = {}
 
 SEARCH_MODEL_NAME_KWARG = 'search_model_pk'
+SEARCH_MODEL_POPULATE_MANY_GROUP_SIZE = 500
+
+# Query parameters of page size changes and sorting of an existing search
+# result. Requests with these parameters, or with a paging parameter, reuse
+# the cached search results.
+SEARCH_RESULTS_CACHE_QUERY_PARAMETERS = (
+    DEFAULT_PAGE_SIZE_QUERY_PARAMETER, TEXT_SORT_FIELD_PARAMETER
+)
+
+TASK_CACHED_RESULTSET_EXPIRED_DELETE_INTERVAL = 5 * 60  # 5 minutes.
 
 TASK_DEINDEX_INSTANCE_MAX_RETRIES = 40
 TASK_DEINDEX_INSTANCE_RETRY_BACKOFF_MAX = 60
 
+TASK_INDEX_BATCH_FLUSH_INTERVAL = 60  # 60 seconds.
+
 TASK_INDEX_INSTANCE_MAX_RETRIES = 40
 TASK_INDEX_INSTANCE_RETRY_BACKOFF_MAX = 60
 
@@ -94,6 +110,9 @@ TASK_INDEX_INSTANCES_RETRY_BACKOFF_MAX = 60
 TASK_INDEX_RELATED_INSTANCE_M2M_MAX_RETRIES = 40
 TASK_INDEX_RELATED_INSTANCE_M2M_RETRY_BACKOFF_MAX = 60
 
+# Number of ID groups indexed by each chord of a backend reindex.
+TASK_REINDEX_BACKEND_CHUNK_SIZE = 100
+
 TASK_SAVED_RESULTSET_EXPIRED_DELETE_INTERVAL = 5 * 60  # 5 minutes.
 
 TERM_OPERATOR_AND = 'AND'
@@ -1,6 +1,6 @@
 from django.core.management.base import BaseCommand
 
-from mayan.apps.common.utils import parse_range
+from mayan.apps.common.utils import parse_range_boundaries
 
 from ...search_models import SearchModel
 from ...tasks import task_index_instances
@@ -30,7 +30,9 @@ class Command(BaseCommand):
             exit(1)
 
         try:
-            id_range = parse_range(range_string=id_range_string)
+            list(
+                parse_range_boundaries(range_string=id_range_string)
+            )
         except Exception as exception:
             self.stderr.write(
                 msg='Unknown or invalid range format `{}`; {}'.format(
@@ -39,7 +41,11 @@ class Command(BaseCommand):
             )
             exit(1)
 
+        instance_count = 0
+
         for id_list in search_model.get_id_groups(range_string=id_range_string):
+            instance_count += len(id_list)
+
             task_index_instances.apply_async(
                 kwargs={
                     'id_list': id_list,
@@ -49,8 +55,6 @@ class Command(BaseCommand):
 
         self.stdout.write(
             msg='\nInstances queued for indexing: {}'.format(
-                len(
-                    list(id_range)
-                )
+                instance_count
             )
         )
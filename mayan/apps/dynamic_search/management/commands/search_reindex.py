@@ -6,5 +6,16 @@ from ...tasks import task_reindex_backend
 class Command(BaseCommand):
     help = 'Erases and populates the search backend internal indexes.'
 
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--resume', action='store_true', default=False, dest='resume',
+            help='Continue a previous reindex that did not finish instead '
+            'of starting a new one.'
+        )
+
     def handle(self, *args, **options):
-        task_reindex_backend.apply_async()
+        task_reindex_backend.apply_async(
+            kwargs={
+                'resume': options['resume']
+            }
+        )
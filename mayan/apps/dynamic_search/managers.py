@@ -1,20 +1,106 @@
+from datetime import timedelta
+import hashlib
 import json
 
 from django.apps import apps
 from django.contrib.contenttypes.models import ContentType
-from django.db import models
+from django.db import IntegrityError, models, transaction
 from django.db.models import F, Value
 from django.utils.timezone import now
 
 from mayan.apps.databases.manager_mixins import ManagerMinixCreateBulk
 
+from .search_models import SearchModel
 from .settings import (
+    setting_results_cache_time_to_live,
     setting_saved_resultset_results_limit,
     setting_saved_resultset_time_to_live,
     setting_saved_resultsets_per_user_limit
 )
 
 
+class CachedResultsetManager(models.Manager):
+    @staticmethod
+    def get_query_hash(query):
+        return hashlib.sha256(
+            json.dumps(obj=query, sort_keys=True).encode()
+        ).hexdigest()
+
+    def expired_delete(self):
+        self.filter(datetime_expire__lt=now()).delete()
+
+    def get_id_list(self, query, search_model, user):
+        """
+        Return the cached result IDs of the query or None if the query is
+        not cached or the cache entry expired.
+        """
+        try:
+            cached_resultset = self.get(
+                datetime_expire__gte=now(),
+                query_hash=self.get_query_hash(query=query),
+                search_model_name=search_model.full_name, user=user
+            )
+        except self.model.DoesNotExist:
+            return None
+        else:
+            return cached_resultset.get_id_list()
+
+    def id_list_save(self, id_list, query, search_model, user):
+        cached_resultset = self.model(
+            datetime_expire=now() + timedelta(
+                seconds=setting_results_cache_time_to_live.value
+            ), query_hash=self.get_query_hash(query=query),
+            search_model_name=search_model.full_name, user=user
+        )
+        cached_resultset.set_id_list(id_list=id_list)
+
+        self.filter(
+            query_hash=cached_resultset.query_hash,
+            search_model_name=search_model.full_name, user=user
+        ).delete()
+
+        try:
+            with transaction.atomic():
+                cached_resultset.save()
+        except IntegrityError:
+            """
+            Another request cached the same query at the same time.
+            """
+
+
+class IndexBatchEntryManager(models.Manager):
+    def entry_add(
+        self, object_id, search_model, exclude_model=None,
+        exclude_kwargs=None
+    ):
+        if exclude_model is None:
+            exclude_data = ''
+        else:
+            exclude_data = json.dumps(
+                obj={
+                    'app_label': exclude_model._meta.app_label,
+                    'kwargs': exclude_kwargs or {},
+                    'model_name': exclude_model._meta.model_name
+                }
+            )
+
+        return self.create(
+            exclude_data=exclude_data, object_id=object_id,
+            search_model_name=search_model.full_name
+        )
+
+
+class ReindexCheckpointManager(models.Manager):
+    def checkpoints_create(self):
+        """
+        Start a new reindex by creating a checkpoint for each search model.
+        """
+        self.all().delete()
+
+        for search_model in SearchModel.all():
+            self.create(search_model_name=search_model.full_name)
+
+
 class SavedResultsetEntryManager(ManagerMinixCreateBulk, models.Manager):
     """
     Nothing additional required, this is just to add the create bulk mixing
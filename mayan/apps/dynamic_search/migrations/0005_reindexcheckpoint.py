@@ -0,0 +1,50 @@
+from django.db import migrations, models
+
+import mayan.apps.dynamic_search.model_mixins
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ('dynamic_search', '0004_create_saved_resultsets')
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ReindexCheckpoint',
+            fields=[
+                (
+                    'id', models.AutoField(
+                        auto_created=True, primary_key=True, serialize=False,
+                        verbose_name='ID'
+                    )
+                ),
+                (
+                    'search_model_name', models.CharField(
+                        max_length=128, unique=True,
+                        verbose_name='Search model name'
+                    )
+                ),
+                (
+                    'last_object_id', models.PositiveBigIntegerField(
+                        blank=True, help_text='ID of the last instance '
+                        'queued for indexing.', null=True,
+                        verbose_name='Last object ID'
+                    )
+                ),
+                (
+                    'datetime', models.DateTimeField(
+                        auto_now=True, verbose_name='Date and time'
+                    )
+                )
+            ],
+            options={
+                'verbose_name': 'Reindex checkpoint',
+                'verbose_name_plural': 'Reindex checkpoints',
+                'ordering': ('search_model_name',)
+            },
+            bases=(
+                mayan.apps.dynamic_search.model_mixins.ReindexCheckpointBusinessLogicModelMixin,
+                models.Model
+            )
+        )
+    ]
@@ -0,0 +1,70 @@
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+import mayan.apps.dynamic_search.model_mixins
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('dynamic_search', '0005_reindexcheckpoint')
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CachedResultset',
+            fields=[
+                (
+                    'id', models.AutoField(
+                        auto_created=True, primary_key=True, serialize=False,
+                        verbose_name='ID'
+                    )
+                ),
+                (
+                    'search_model_name', models.CharField(
+                        max_length=128, verbose_name='Search model name'
+                    )
+                ),
+                (
+                    'query_hash', models.CharField(
+                        max_length=64, verbose_name='Query hash'
+                    )
+                ),
+                (
+                    'datetime_expire', models.DateTimeField(
+                        db_index=True,
+                        verbose_name='Expiration date and time'
+                    )
+                ),
+                (
+                    'result_count', models.PositiveIntegerField(
+                        default=0, verbose_name='Result count'
+                    )
+                ),
+                (
+                    'id_list_data', models.BinaryField(
+                        verbose_name='ID list data'
+                    )
+                ),
+                (
+                    'user', models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name='cached_resultsets',
+                        to=settings.AUTH_USER_MODEL, verbose_name='User'
+                    )
+                )
+            ],
+            options={
+                'verbose_name': 'Cached resultset',
+                'verbose_name_plural': 'Cached resultsets',
+                'unique_together': {
+                    ('user', 'search_model_name', 'query_hash')
+                }
+            },
+            bases=(
+                mayan.apps.dynamic_search.model_mixins.CachedResultsetBusinessLogicModelMixin,
+                models.Model
+            )
+        )
+    ]
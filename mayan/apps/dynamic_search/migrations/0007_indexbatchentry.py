@@ -0,0 +1,55 @@
+from django.db import migrations, models
+
+import mayan.apps.dynamic_search.model_mixins
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ('dynamic_search', '0006_cachedresultset')
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='IndexBatchEntry',
+            fields=[
+                (
+                    'id', models.AutoField(
+                        auto_created=True, primary_key=True, serialize=False,
+                        verbose_name='ID'
+                    )
+                ),
+                (
+                    'search_model_name', models.CharField(
+                        max_length=128, verbose_name='Search model name'
+                    )
+                ),
+                (
+                    'object_id', models.PositiveBigIntegerField(
+                        verbose_name='Object ID'
+                    )
+                ),
+                (
+                    'exclude_data', models.TextField(
+                        blank=True, help_text='Related instance to exclude '
+                        'when indexing the instance.',
+                        verbose_name='Exclude data'
+                    )
+                ),
+                (
+                    'datetime', models.DateTimeField(
+                        auto_now_add=True, db_index=True,
+                        verbose_name='Date and time'
+                    )
+                )
+            ],
+            options={
+                'verbose_name': 'Index batch entry',
+                'verbose_name_plural': 'Index batch entries',
+                'ordering': ('id',)
+            },
+            bases=(
+                mayan.apps.dynamic_search.model_mixins.IndexBatchEntryBusinessLogicModelMixin,
+                models.Model
+            )
+        )
+    ]
@@ -1,4 +1,7 @@
+from array import array
+import itertools
 import json
+import zlib
 
 from django.apps import apps
 from django.contrib.contenttypes.models import ContentType
@@ -8,6 +11,122 @@ from .search_models import SearchModel
 from .settings import setting_saved_resultset_time_to_live_increment
 
 
+class CachedResultsetBusinessLogicModelMixin:
+    def get_id_list(self):
+        deltas = array('Q')
+        deltas.frombytes(
+            zlib.decompress(
+                bytes(self.id_list_data)
+            )
+        )
+
+        return list(
+            itertools.accumulate(deltas)
+        )
+
+    def set_id_list(self, id_list):
+        """
+        Store the IDs sorted and delta encoded to allow the compression
+        to reduce them to a few bytes per ID.
+        """
+        id_list = sorted(
+            set(
+                int(pk) for pk in id_list
+            )
+        )
+
+        deltas = array(
+            'Q', (
+                current - previous for previous, current in zip(
+                    [0] + id_list, id_list
+                )
+            )
+        )
+
+        self.id_list_data = zlib.compress(
+            deltas.tobytes()
+        )
+        self.result_count = len(id_list)
+
+
+class IndexBatchEntryBusinessLogicModelMixin:
+    def get_exclude(self):
+        """
+        Return a tuple with the model and the lookup keyword arguments of
+        the related instance to exclude or None.
+        """
+        if self.exclude_data:
+            exclude = json.loads(s=self.exclude_data)
+
+            ExcludeModel = apps.get_model(
+                app_label=exclude['app_label'],
+                model_name=exclude['model_name']
+            )
+
+            return (ExcludeModel, exclude['kwargs'])
+
+
+class ReindexCheckpointBusinessLogicModelMixin:
+    def do_index_instances_queue(self):
+        """
+        Queue the indexing of the search model instances after the last
+        queued ID. The checkpoint is updated after each ID group and
+        deleted once all the instances are queued.
+        """
+        # Hidden import.
+        from .tasks import task_index_instances
+
+        search_model = self.get_search_model()
+
+        for id_list in search_model.get_id_groups(id_last=self.last_object_id):
+            task_index_instances.apply_async(
+                kwargs={
+                    'id_list': id_list,
+                    'search_model_full_name': search_model.full_name
+                }
+            )
+
+            self.last_object_id = id_list[-1]
+            self.save(
+                update_fields=('datetime', 'last_object_id')
+            )
+
+        self.delete()
+
+    def get_index_instances_signatures(self, limit):
+        """
+        Return the signatures of the indexing tasks of up to `limit` ID
+        groups after the last queued ID without queuing them, and the last
+        ID of those groups. The checkpoint is not updated.
+        """
+        # Hidden import.
+        from .tasks import task_index_instances
+
+        search_model = self.get_search_model()
+
+        id_groups = list(
+            itertools.islice(
+                search_model.get_id_groups(id_last=self.last_object_id),
+                limit
+            )
+        )
+
+        signatures = [
+            task_index_instances.si(
+                id_list=id_list,
+                search_model_full_name=search_model.full_name
+            ) for id_list in id_groups
+        ]
+
+        if id_groups:
+            return signatures, id_groups[-1][-1]
+        else:
+            return signatures, None
+
+    def get_search_model(self):
+        return SearchModel.get(name=self.search_model_name)
+
+
 class SavedResultsetBusinessLogicModelMixin:
     def get_content_type(self):
         content_type = ContentType.objects.get(
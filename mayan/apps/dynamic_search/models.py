@@ -9,8 +9,121 @@ from mayan.apps.events.event_managers import EventManagerSave
 from mayan.apps.templating.template_backends import Template
 
 from .events import event_saved_resultset_created
-from .managers import SavedResultsetEntryManager, SavedResultsetManager
-from .model_mixins import SavedResultsetBusinessLogicModelMixin
+from .managers import (
+    CachedResultsetManager, IndexBatchEntryManager, ReindexCheckpointManager,
+    SavedResultsetEntryManager, SavedResultsetManager
+)
+from .model_mixins import (
+    CachedResultsetBusinessLogicModelMixin,
+    IndexBatchEntryBusinessLogicModelMixin,
+    ReindexCheckpointBusinessLogicModelMixin,
+    SavedResultsetBusinessLogicModelMixin
+)
+
+
+class CachedResultset(CachedResultsetBusinessLogicModelMixin, models.Model):
+    """
+    Compact copy of the IDs resolved by the search backend for a search
+    query. Used to paginate and sort the results of a search without
+    executing the query again.
+    """
+    user = models.ForeignKey(
+        on_delete=models.CASCADE, related_name='cached_resultsets',
+        to=settings.AUTH_USER_MODEL, verbose_name=_(message='User')
+    )
+    search_model_name = models.CharField(
+        max_length=128, verbose_name=_(message='Search model name')
+    )
+    query_hash = models.CharField(
+        max_length=64, verbose_name=_(message='Query hash')
+    )
+    datetime_expire = models.DateTimeField(
+        db_index=True, verbose_name=_(message='Expiration date and time')
+    )
+    result_count = models.PositiveIntegerField(
+        default=0, verbose_name=_(message='Result count')
+    )
+    id_list_data = models.BinaryField(
+        verbose_name=_(message='ID list data')
+    )
+
+    class Meta:
+        unique_together = ('user', 'search_model_name', 'query_hash')
+        verbose_name = _(message='Cached resultset')
+        verbose_name_plural = _(message='Cached resultsets')
+
+    objects = CachedResultsetManager()
+
+    def __str__(self):
+        return '{} - {}'.format(self.search_model_name, self.query_hash)
+
+
+class IndexBatchEntry(IndexBatchEntryBusinessLogicModelMixin, models.Model):
+    """
+    Instance pending to be written to the search index by a backend that
+    indexes in batches. Entries are stored in the database to survive the
+    end of the process that received them and are deleted only once
+    written.
+    """
+    search_model_name = models.CharField(
+        max_length=128, verbose_name=_(message='Search model name')
+    )
+    object_id = models.PositiveBigIntegerField(
+        verbose_name=_(message='Object ID')
+    )
+    exclude_data = models.TextField(
+        blank=True, help_text=_(
+            message='Related instance to exclude when indexing the '
+            'instance.'
+        ), verbose_name=_(message='Exclude data')
+    )
+    datetime = models.DateTimeField(
+        auto_now_add=True, db_index=True,
+        verbose_name=_(message='Date and time')
+    )
+
+    class Meta:
+        ordering = ('id',)
+        verbose_name = _(message='Index batch entry')
+        verbose_name_plural = _(message='Index batch entries')
+
+    objects = IndexBatchEntryManager()
+
+    def __str__(self):
+        return '{} - {}'.format(self.search_model_name, self.object_id)
+
+
+class ReindexCheckpoint(
+    ReindexCheckpointBusinessLogicModelMixin, models.Model
+):
+    """
+    Keeps track of the instances of a search model already queued for
+    indexing by a backend reindex. Allows resuming a reindex that stopped
+    before queuing all the instances.
+    """
+    search_model_name = models.CharField(
+        max_length=128, unique=True, verbose_name=_(
+            message='Search model name'
+        )
+    )
+    last_object_id = models.PositiveBigIntegerField(
+        blank=True, help_text=_(
+            message='ID of the last instance queued for indexing.'
+        ), null=True, verbose_name=_(message='Last object ID')
+    )
+    datetime = models.DateTimeField(
+        auto_now=True, verbose_name=_(message='Date and time')
+    )
+
+    class Meta:
+        ordering = ('search_model_name',)
+        verbose_name = _(message='Reindex checkpoint')
+        verbose_name_plural = _(message='Reindex checkpoints')
+
+    objects = ReindexCheckpointManager()
+
+    def __str__(self):
+        return self.search_model_name
 
 
 class SavedResultset(
@@ -5,7 +5,11 @@ from django.utils.translation import gettext_lazy as _
 from mayan.apps.task_manager.classes import CeleryQueue
 from mayan.apps.task_manager.workers import worker_e
 
-from .literals import TASK_SAVED_RESULTSET_EXPIRED_DELETE_INTERVAL
+from .literals import (
+    TASK_CACHED_RESULTSET_EXPIRED_DELETE_INTERVAL,
+    TASK_INDEX_BATCH_FLUSH_INTERVAL,
+    TASK_SAVED_RESULTSET_EXPIRED_DELETE_INTERVAL
+)
 
 queue_search = CeleryQueue(
     label=_(message='Search'), name='search', worker=worker_e
@@ -14,11 +18,30 @@ queue_search_slow = CeleryQueue(
     label=_(message='Search slow'), name='search_slow', worker=worker_e
 )
 
+queue_search.add_task_type(
+    dotted_path='mayan.apps.dynamic_search.tasks.task_bulk_indexing_end',
+    label=_(
+        message='Restore the search engine after a bulk indexing.'
+    ), name='task_bulk_indexing_end'
+)
+queue_search.add_task_type(
+    dotted_path='mayan.apps.dynamic_search.tasks.task_cached_resultset_expired_delete',
+    label=_(message='Delete expired cached resultsets'),
+    name='task_cached_resultset_expired_delete',
+    schedule=timedelta(seconds=TASK_CACHED_RESULTSET_EXPIRED_DELETE_INTERVAL)
+)
 queue_search.add_task_type(
     dotted_path='mayan.apps.dynamic_search.tasks.task_deindex_instance',
     label=_(message='Remove a model instance from the search engine.'),
     name='task_deindex_instance'
 )
+queue_search.add_task_type(
+    dotted_path='mayan.apps.dynamic_search.tasks.task_index_batch_flush',
+    label=_(
+        message='Write the instances pending in the search engine batch.'
+    ), name='task_index_batch_flush',
+    schedule=timedelta(seconds=TASK_INDEX_BATCH_FLUSH_INTERVAL)
+)
 queue_search.add_task_type(
     dotted_path='mayan.apps.dynamic_search.tasks.task_index_instance',
     label=_(message='Index a model instance to the search engine.'),
@@ -45,6 +68,13 @@ queue_search_slow.add_task_type(
         'again.'
     ), name='task_reindex_backend'
 )
+queue_search_slow.add_task_type(
+    dotted_path='mayan.apps.dynamic_search.tasks.task_reindex_backend_chunk',
+    label=_(
+        message='Index the next group of instances of a search backend '
+        'reindex.'
+    ), name='task_reindex_backend_chunk'
+)
 
 queue_search.add_task_type(
     dotted_path='mayan.apps.dynamic_search.tasks.task_saved_resultset_expired_delete',
@@ -14,7 +14,8 @@ from .literals import MESSAGE_FEATURE_NO_STATUS
 from .search_interpreters import SearchInterpreter
 from .search_models import SearchModel
 from .settings import (
-    setting_backend, setting_backend_arguments, setting_results_limit
+    setting_backend, setting_backend_arguments,
+    setting_results_cache_time_to_live, setting_results_limit
 )
 
 logger = logging.getLogger(name=__name__)
@@ -234,6 +235,26 @@ class SearchBackend:
     def _search(self, limit, query, search_model, user):
         raise NotImplementedError
 
+    def batch_flush(self):
+        """
+        Optional method to write the instances pending to be indexed by
+        backends that index in batches.
+        """
+
+    def bulk_indexing_end(self, index_settings=None):
+        """
+        Optional method to restore the search backend after a bulk
+        indexing like a reindex. Receives the value returned by
+        `bulk_indexing_start`.
+        """
+
+    def bulk_indexing_start(self):
+        """
+        Optional method to tune the search backend before a bulk indexing
+        like a reindex. May return a serializable value with the previous
+        configuration to be passed to `bulk_indexing_end`.
+        """
+
     def deindex_instance(self, instance):
         """
         Optional method to remove an model instance from the search index.
@@ -330,11 +351,20 @@ class SearchBackend:
         """
 
     def search(
-        self, query, search_model, user, store_resultset=False, queryset=None
+        self, query, search_model, user, store_resultset=False, queryset=None,
+        use_cached_results=False
     ):
+        """
+        `use_cached_results` allows reusing the result IDs of a previous
+        execution of the same query by the same user, for example when
+        changing the page or the sorting of the results.
+        """
         AccessControlList = apps.get_model(
             app_label='acls', model_name='AccessControlList'
         )
+        CachedResultset = apps.get_model(
+            app_label='dynamic_search', model_name='CachedResultset'
+        )
         SavedResultset = apps.get_model(
             app_label='dynamic_search', model_name='SavedResultset'
         )
@@ -343,7 +373,25 @@ class SearchBackend:
             query=query, search_model=search_model
         )
 
-        id_list = search_interpreter.do_resolve(search_backend=self)
+        is_cache_enabled = setting_results_cache_time_to_live.value and user.is_authenticated
+
+        id_list = None
+
+        if is_cache_enabled and use_cached_results:
+            id_list = CachedResultset.objects.get_id_list(
+                query=query, search_model=search_model, user=user
+            )
+
+        if id_list is None:
+            id_list = search_interpreter.do_resolve(search_backend=self)
+
+            if is_cache_enabled:
+                id_list = list(id_list)
+
+                CachedResultset.objects.id_list_save(
+                    id_list=id_list, query=query, search_model=search_model,
+                    user=user
+                )
 
         queryset = queryset or search_model.get_queryset()
 
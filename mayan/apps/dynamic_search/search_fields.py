@@ -163,6 +163,29 @@ class SearchField:
     def get_help_text(self):
         return self.help_text or getattr(self.model_field, 'help_text', '')
 
+    def get_instance_values(
+        self, instance_list, search_backend, exclude_kwargs=None,
+        exclude_model=None, instance_field_data=None
+    ):
+        """
+        Return the values of the search field for a list of instances
+        as a dictionary keyed by the instance primary key.
+        `instance_field_data` is a dictionary with the field data already
+        populated for each instance, keyed by the instance primary key.
+        """
+        instance_field_data = instance_field_data or {}
+        result = {}
+
+        for instance in instance_list:
+            result[instance.pk] = self.get_instance_value(
+                exclude_kwargs=exclude_kwargs, exclude_model=exclude_model,
+                instance=instance, instance_field_data=instance_field_data.get(
+                    instance.pk, {}
+                ), search_backend=search_backend
+            )
+
+        return result
+
     def get_label(self):
         return self.label or self.field_name
 
@@ -308,6 +331,52 @@ class SearchFieldRelated(SearchFieldConcrete):
 
         return search_backend.do_native_type_conversion(value=result)
 
+    def get_instance_values(
+        self, instance_list, search_backend, exclude_kwargs=None,
+        exclude_model=None, instance_field_data=None
+    ):
+        """
+        Fetch the related values of all the instances with a single
+        query instead of one query per instance.
+        """
+        last_field = self.field_name.split(LOOKUP_SEP)[-1]
+
+        values = {instance.pk: [] for instance in instance_list}
+
+        sub_queryset = self.related_model._meta.default_manager.filter(
+            **{
+                '{reverse_path}{lookup_separator}in'.format(
+                    lookup_separator=LOOKUP_SEP,
+                    reverse_path=self.reverse_path
+                ): list(values)
+            }
+        ).values_list(self.reverse_path, last_field)
+
+        sub_queryset = sub_queryset.filter(
+            **{
+                '{field_name}{lookup_separator}isnull'.format(
+                    field_name=last_field, lookup_separator=LOOKUP_SEP
+                ): False
+            }
+        )
+
+        if exclude_model and self.related_model == exclude_model:
+            sub_queryset = sub_queryset.exclude(**exclude_kwargs)
+
+        sub_queryset = sub_queryset.distinct()
+
+        for pk, item in sub_queryset:
+            item_value = self.do_value_index_transform(
+                search_backend=search_backend, value=item
+            )
+            if item_value:
+                values[pk].append(item_value)
+
+        return {
+            pk: search_backend.do_native_type_conversion(value=value)
+            for pk, value in values.items()
+        }
+
 
 class SearchFieldVirtual(SearchField):
     """
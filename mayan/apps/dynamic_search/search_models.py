@@ -3,18 +3,19 @@ import logging
 
 from django.apps import apps
 from django.contrib.admin.utils import reverse_field_path
-from django.db.models.aggregates import Max, Min
 from django.utils.functional import cached_property
 from django.utils.module_loading import import_string
 from django.utils.translation import gettext_lazy as _
 
 from mayan.apps.common.class_mixins import AppsModuleLoaderMixin
-from mayan.apps.common.utils import group_iterator, parse_range
+from mayan.apps.common.utils import group_iterator, parse_range_boundaries
 from mayan.apps.databases.literals import DATABASE_MINIMUM_ID
 from mayan.apps.views.literals import LIST_MODE_CHOICE_LIST
 
 from .exceptions import DynamicSearchException
-from .literals import QUERY_PARAMETER_ANY_FIELD
+from .literals import (
+    QUERY_PARAMETER_ANY_FIELD, SEARCH_MODEL_POPULATE_MANY_GROUP_SIZE
+)
 from .search_fields import SearchField
 from .settings import (
     setting_indexing_chunk_size, setting_search_model_field_disable
@@ -161,6 +162,29 @@ class SearchModel(AppsModuleLoaderMixin):
     def __str__(self):
         return str(self.label)
 
+    def _get_id_groups_keyset(self, queryset, id_last=None, id_maximum=None):
+        queryset = queryset.order_by('pk').values_list('pk', flat=True)
+
+        if id_maximum is not None:
+            queryset = queryset.filter(pk__lte=id_maximum)
+
+        while True:
+            if id_last is None:
+                queryset_group = queryset
+            else:
+                queryset_group = queryset.filter(pk__gt=id_last)
+
+            id_list = tuple(
+                queryset_group[:setting_indexing_chunk_size.value]
+            )
+
+            if not id_list:
+                break
+
+            yield id_list
+
+            id_last = id_list[-1]
+
     def add_model_field(self, **kwargs):
         """
         Add a search field that directly belongs to the parent SearchModel.
@@ -198,43 +222,37 @@ class SearchModel(AppsModuleLoaderMixin):
 
     full_name.short_description = _(message='Full name')
 
-    def get_id_groups(self, range_string=None):
+    def get_id_groups(self, id_last=None, range_string=None):
         """
         Generate ID groups when doing bulk indexing. ID groups avoid having
         to create a single task call for each object to be indexed.
+        IDs are fetched using keyset pagination, ordered by ID, which makes
+        the generation time proportional to the number of existing rows
+        instead of the span of the IDs. `id_last` allows resuming after a
+        previously generated ID.
         """
         queryset = self.model._meta.managers_map[self.manager_name].all()
 
-        # Part 1 - Split the user requested range into blind groups.
         if not range_string:
-            # If range is not specified it will be the minimum and maximum
-            # IDs of the queryset.
-            queryset_id_values = queryset.aggregate(
-                min_id=Min('id'), max_id=Max('id')
+            return self._get_id_groups_keyset(
+                id_last=id_last, queryset=queryset
             )
-            range_string = '{}-{}'.format(
-                queryset_id_values['min_id'] or DATABASE_MINIMUM_ID,
-                queryset_id_values['max_id'] or DATABASE_MINIMUM_ID
-            )
-
-        # Part 2 - Validate the blind groups by querying them and retrieve
-        # the valid ID values.
-        id_list_groups = group_iterator(
-            iterable=parse_range(range_string=range_string),
-            group_size=setting_indexing_chunk_size.value
-        )
 
-        generator_valid_id_groups = (
-            queryset.filter(
-                pk__in=id_list
-            ).values_list('id', flat=True) for id_list in id_list_groups
+        generator_id_groups = (
+            self._get_id_groups_keyset(
+                id_last=max(
+                    min(start, stop) - 1, id_last or DATABASE_MINIMUM_ID - 1
+                ), id_maximum=max(start, stop), queryset=queryset
+            ) for start, stop in parse_range_boundaries(
+                range_string=range_string
+            )
         )
 
-        # Part 3 - Chain the valid ID groups into a single sequence and
-        # split them again into groups.
+        # Chain the ID groups of each part of the range into a single
+        # sequence and split them again into groups.
         return group_iterator(
             iterable=itertools.chain.from_iterable(
-                generator_valid_id_groups
+                itertools.chain.from_iterable(generator_id_groups)
             ), group_size=setting_indexing_chunk_size.value
         )
 
@@ -316,6 +334,46 @@ class SearchModel(AppsModuleLoaderMixin):
 
         return instance_field_data
 
+    def populate_many(
+        self, queryset, search_backend, exclude_kwargs=None,
+        exclude_model=None
+    ):
+        """
+        Generator of (instance, instance field data) tuples. Bulk version
+        of `populate`. Each search field is resolved for a group of
+        instances at a time, avoiding one query per related field and
+        instance.
+        """
+        iterator = queryset.iterator(
+            chunk_size=SEARCH_MODEL_POPULATE_MANY_GROUP_SIZE
+        )
+
+        for instance_list in group_iterator(
+            iterable=iterator, group_size=SEARCH_MODEL_POPULATE_MANY_GROUP_SIZE
+        ):
+            instance_field_data = {
+                instance.pk: {} for instance in instance_list
+            }
+
+            # Process the search fields by order of priority. This makes
+            # sure that virtual fields are processed last.
+            for search_field in self.search_fields_priority_sorted:
+                field_values = search_field.get_instance_values(
+                    exclude_kwargs=exclude_kwargs,
+                    exclude_model=exclude_model, instance_list=instance_list,
+                    instance_field_data=instance_field_data,
+                    search_backend=search_backend
+                )
+
+                for pk, field_value in field_values.items():
+                    if field_value is not None:
+                        instance_field_data[pk][
+                            search_field.field_name
+                        ] = field_value
+
+            for instance in instance_list:
+                yield (instance, instance_field_data[instance.pk])
+
     @property
     def proxies(self):
         result = []
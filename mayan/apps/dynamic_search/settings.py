@@ -8,7 +8,8 @@ from .literals import (
     DEFAULT_SEARCH_INDEXING_CHUNK_SIZE,
     DEFAULT_SEARCH_MATCH_ALL_DEFAULT_VALUE,
     DEFAULT_SEARCH_MODEL_FIELD_DISABLE,
-    DEFAULT_SEARCH_QUERY_RESULTS_LIMIT, DEFAULT_SEARCH_RESULTS_LIMIT,
+    DEFAULT_SEARCH_QUERY_RESULTS_LIMIT,
+    DEFAULT_SEARCH_RESULTS_CACHE_TIME_TO_LIVE, DEFAULT_SEARCH_RESULTS_LIMIT,
     DEFAULT_SEARCH_SAVED_RESULTSET_RESULTS_LIMIT,
     DEFAULT_SEARCH_SAVED_RESULTSETS_PER_USER_LIMIT,
     DEFAULT_SEARCH_SAVED_RESULTSET_TIME_TO_LIVE,
@@ -66,6 +67,15 @@ setting_query_results_limit = setting_namespace.do_setting_add(
         'search query unit.'
     )
 )
+setting_results_cache_time_to_live = setting_namespace.do_setting_add(
+    default=DEFAULT_SEARCH_RESULTS_CACHE_TIME_TO_LIVE,
+    global_name='SEARCH_RESULTS_CACHE_TIME_TO_LIVE', help_text=_(
+        message='Time in seconds to keep the result IDs of a search query. '
+        'The cached result IDs are used when changing the page or the '
+        'sorting of the results instead of executing the query again. '
+        'Use 0 to disable.'
+    )
+)
 setting_results_limit = setting_namespace.do_setting_add(
     default=DEFAULT_SEARCH_RESULTS_LIMIT, global_name='SEARCH_RESULTS_LIMIT',
     help_text=_(
@@ -1,5 +1,7 @@
 import logging
 
+from celery import chord
+
 from django.apps import apps
 from django.core.exceptions import ObjectDoesNotExist
 
@@ -13,7 +15,8 @@ from .literals import (
     TASK_INDEX_INSTANCE_RETRY_BACKOFF_MAX, TASK_INDEX_INSTANCES_MAX_RETRIES,
     TASK_INDEX_INSTANCES_RETRY_BACKOFF_MAX,
     TASK_INDEX_RELATED_INSTANCE_M2M_MAX_RETRIES,
-    TASK_INDEX_RELATED_INSTANCE_M2M_RETRY_BACKOFF_MAX
+    TASK_INDEX_RELATED_INSTANCE_M2M_RETRY_BACKOFF_MAX,
+    TASK_REINDEX_BACKEND_CHUNK_SIZE
 )
 from .search_backends import SearchBackend
 from .search_models import SearchModel
@@ -21,6 +24,21 @@ from .search_models import SearchModel
 logger = logging.getLogger(name=__name__)
 
 
+@app.task(ignore_result=True)
+def task_bulk_indexing_end(index_settings=None):
+    search_backend = SearchBackend.get_instance()
+    search_backend.bulk_indexing_end(index_settings=index_settings)
+
+
+@app.task(ignore_result=True)
+def task_cached_resultset_expired_delete():
+    CachedResultset = apps.get_model(
+        app_label='dynamic_search', model_name='CachedResultset'
+    )
+
+    CachedResultset.objects.expired_delete()
+
+
 @app.task(
     bind=True, ignore_result=True,
     max_retries=TASK_DEINDEX_INSTANCE_MAX_RETRIES, retry_backoff=True,
@@ -46,6 +64,18 @@ def task_deindex_instance(self, app_label, model_name, object_id):
     logger.info('Finished')
 
 
+@app.task(ignore_result=True)
+def task_index_batch_flush():
+    try:
+        search_backend = SearchBackend.get_instance()
+        search_backend.batch_flush()
+    except (DynamicSearchRetry, LockError) as exception:
+        # The entries are kept and written by the next execution.
+        logger.info(
+            'Unable to write the search engine batch; %s', exception
+        )
+
+
 @app.task(
     bind=True, ignore_result=True,
     max_retries=TASK_INDEX_INSTANCE_MAX_RETRIES, retry_backoff=True,
@@ -168,19 +198,109 @@ def task_index_related_instance_m2m(
 
 
 @app.task(ignore_result=True)
-def task_reindex_backend():
+def task_reindex_backend(resume=False):
+    ReindexCheckpoint = apps.get_model(
+        app_label='dynamic_search', model_name='ReindexCheckpoint'
+    )
+
+    if resume and not ReindexCheckpoint.objects.exists():
+        logger.info(
+            'No interrupted reindex to resume; the search backend was '
+            'not modified.'
+        )
+        return
+
     search_backend = SearchBackend.get_instance()
-    search_backend.reset()
-
-    for search_model in SearchModel.all():
-        for id_list in search_model.get_id_groups():
-            task_index_instances.apply_async(
-                kwargs={
-                    'id_list': id_list,
-                    'search_model_full_name': search_model.full_name
-                }
+
+    if not resume:
+        search_backend.reset()
+
+        ReindexCheckpoint.objects.checkpoints_create()
+
+    index_settings = search_backend.bulk_indexing_start()
+
+    if app.conf.result_backend:
+        task_reindex_backend_chunk.apply_async(
+            kwargs={'index_settings': index_settings}
+        )
+    else:
+        for reindex_checkpoint in ReindexCheckpoint.objects.all():
+            try:
+                reindex_checkpoint.do_index_instances_queue()
+            except KeyError as exception:
+                # The search model is no longer available.
+                logger.warning(
+                    'Unable to resume the reindex of search model `%s`; %s',
+                    reindex_checkpoint.search_model_name, exception
+                )
+                reindex_checkpoint.delete()
+
+        # Without a result backend the completion of the indexing tasks
+        # cannot be tracked. Queued after the indexing tasks in the same
+        # queue to restore the backend once the queued indexing tasks are
+        # being processed.
+        task_bulk_indexing_end.apply_async(
+            kwargs={'index_settings': index_settings}
+        )
+
+
+@app.task(ignore_result=True)
+def task_reindex_backend_chunk(index_settings=None):
+    """
+    Queue the indexing tasks of the next chunk of ID groups of a backend
+    reindex as a chord whose body queues the following chunk. The
+    checkpoint advances after each chunk is queued. The backend is restored
+    once the last chunk has finished.
+    """
+    ReindexCheckpoint = apps.get_model(
+        app_label='dynamic_search', model_name='ReindexCheckpoint'
+    )
+
+    for reindex_checkpoint in ReindexCheckpoint.objects.all():
+        try:
+            signatures, last_object_id = reindex_checkpoint.get_index_instances_signatures(
+                limit=TASK_REINDEX_BACKEND_CHUNK_SIZE
+            )
+        except KeyError as exception:
+            # The search model is no longer available.
+            logger.warning(
+                'Unable to resume the reindex of search model `%s`; %s',
+                reindex_checkpoint.search_model_name, exception
+            )
+            reindex_checkpoint.delete()
+        else:
+            if not signatures:
+                reindex_checkpoint.delete()
+                continue
+
+            signature_next = task_reindex_backend_chunk.si(
+                index_settings=index_settings
+            )
+            # Continue with the next chunk even if some of the indexing
+            # tasks failed.
+            signature_next.link_error(
+                task_reindex_backend_chunk.si(index_settings=index_settings)
             )
 
+            # The chord tracks the completion of the header tasks using
+            # their results.
+            chord(
+                body=signature_next, header=[
+                    signature.set(ignore_result=False) for signature in signatures
+                ]
+            ).apply_async()
+
+            reindex_checkpoint.last_object_id = last_object_id
+            reindex_checkpoint.save(
+                update_fields=('datetime', 'last_object_id')
+            )
+
+            return
+
+    task_bulk_indexing_end.apply_async(
+        kwargs={'index_settings': index_settings}
+    )
+
 
 @app.task(ignore_result=True)
 def task_saved_resultset_expired_delete():
@@ -1,11 +1,20 @@
-from ...tasks import task_index_instances, task_reindex_backend
+from ...tasks import (
+    task_index_instances, task_reindex_backend, task_reindex_backend_chunk
+)
 
 from .base import SearchTestMixin
 
 
 class SearchTaskTestMixin(SearchTestMixin):
-    def _execute_task_reindex_backend(self):
-        task_reindex_backend.apply_async().get()
+    def _execute_task_reindex_backend(self, resume=False):
+        task_reindex_backend.apply_async(
+            kwargs={'resume': resume}
+        ).get()
+
+    def _execute_task_reindex_backend_chunk(self, index_settings=None):
+        task_reindex_backend_chunk.apply_async(
+            kwargs={'index_settings': index_settings}
+        ).get()
 
     def _execute_task_index_instances(self):
         task_index_instances.apply_async(
@@ -1,6 +1,13 @@
+from unittest import mock
+
 from mayan.apps.testing.tests.base import BaseTestCase
 
+from ..backends.elasticsearch import ElasticSearchBackend
+from ..backends.elasticsearch.literals import (
+    ELASTICSEARCH_BULK_INDEXING_INDEX_SETTINGS
+)
 from ..exceptions import DynamicSearchBackendException
+from ..search_models import SearchModel
 from ..search_query_types import QueryTypeExact
 
 from .mixins.backend_mixins import (
@@ -24,6 +31,104 @@ class ElasticSearchSearchBackendLimitTestCase(
     """
 
 
+class ElasticSearchBackendClientTestCase(BaseTestCase):
+    def test_bulk_indexing_end(self):
+        search_backend = ElasticSearchBackend(_test_mode=True)
+
+        with mock.patch.object(search_backend, '_get_client') as mock_client:
+            search_backend.bulk_indexing_end()
+
+        index_settings = mock_client.return_value.indices.put_settings.call_args.kwargs['body']['index']
+
+        self.assertEqual(
+            set(index_settings), set(
+                ELASTICSEARCH_BULK_INDEXING_INDEX_SETTINGS
+            )
+        )
+        self.assertEqual(
+            set(
+                index_settings.values()
+            ), {None}
+        )
+        self.assertTrue(mock_client.return_value.indices.refresh.called)
+
+    def test_bulk_indexing_end_saved_settings(self):
+        search_backend = ElasticSearchBackend(_test_mode=True)
+        test_index_name = search_backend._get_index_name(
+            search_model=SearchModel.all()[0]
+        )
+
+        with mock.patch.object(search_backend, '_get_client') as mock_client:
+            search_backend.bulk_indexing_end(
+                index_settings={
+                    test_index_name: {'number_of_replicas': '2'}
+                }
+            )
+
+        mock_client.return_value.indices.put_settings.assert_any_call(
+            body={
+                'index': {
+                    'number_of_replicas': '2', 'refresh_interval': None
+                }
+            }, index=test_index_name
+        )
+
+    def test_bulk_indexing_start(self):
+        search_backend = ElasticSearchBackend(_test_mode=True)
+
+        with mock.patch.object(search_backend, '_get_client') as mock_client:
+            mock_client.return_value.indices.get_settings.side_effect = lambda index: {
+                index: {
+                    'settings': {
+                        'index': {
+                            'number_of_replicas': '2',
+                            'refresh_interval': '-1'
+                        }
+                    }
+                }
+            }
+
+            result = search_backend.bulk_indexing_start()
+
+        mock_client.return_value.indices.put_settings.assert_called_with(
+            body={'index': ELASTICSEARCH_BULK_INDEXING_INDEX_SETTINGS},
+            index=mock.ANY
+        )
+
+        # Values equal to the bulk indexing values are not saved.
+        self.assertTrue(result)
+        for index_settings in result.values():
+            self.assertEqual(
+                index_settings, {'number_of_replicas': '2'}
+            )
+
+    def test_client_reuse(self):
+        search_backend_1 = ElasticSearchBackend(_test_mode=True)
+        search_backend_2 = ElasticSearchBackend(_test_mode=True)
+
+        self.assertEqual(
+            id(
+                search_backend_1._get_client()
+            ), id(
+                search_backend_2._get_client()
+            )
+        )
+
+    def test_client_reuse_different_arguments(self):
+        search_backend_1 = ElasticSearchBackend(_test_mode=True)
+        search_backend_2 = ElasticSearchBackend(
+            _test_mode=True, client_maxsize=20
+        )
+
+        client_1 = search_backend_1._get_client()
+        client_2 = search_backend_2._get_client()
+
+        self.assertFalse(client_1 is client_2)
+        self.assertTrue(
+            search_backend_2._get_client() is client_2
+        )
+
+
 class ElasticSearchBackendIndexingTestCase(
     BackendSearchTestMixin, ElasticSearchBackendTestMixin,
     TestSearchObjectSimpleTestMixin, BaseTestCase
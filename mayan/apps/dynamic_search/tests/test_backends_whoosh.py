@@ -1,6 +1,14 @@
+from unittest import mock
+
+import whoosh
+
 from mayan.apps.testing.tests.base import BaseTestCase
 
+from ..backends.whoosh import WhooshSearchBackend
+from ..exceptions import DynamicSearchRetry
+from ..models import IndexBatchEntry
 from ..search_query_types import QueryTypeExact
+from ..tasks import task_index_batch_flush
 
 from .mixins.backend_mixins import (
     BackendSearchTestMixin, SearchBackendLimitTestMixin,
@@ -13,6 +21,157 @@ from .mixins.backend_search_field_mixins import (
     BackendSearchFieldTestCaseMixin
 )
 from .mixins.base import TestSearchObjectSimpleTestMixin
+from .literals import TEST_OBJECT_CHAR_VALUE
+
+
+class WhooshSearchBackendBatchTestCase(
+    BackendSearchTestMixin, TestSearchObjectSimpleTestMixin,
+    WhooshSearchBackendTestMixin, BaseTestCase
+):
+    def setUp(self):
+        super().setUp()
+        self._test_search_backend_batch = WhooshSearchBackend(
+            _test_mode=True, batch_interval=60, batch_size=10
+        )
+        self._deindex_instance(instance=self._test_object)
+
+    def tearDown(self):
+        self._test_search_backend_batch.batch_flush()
+        super().tearDown()
+
+    def _get_test_object_id_list(self, _skip_refresh=True):
+        return tuple(
+            self._do_backend_search(
+                field_name='char', query_type=QueryTypeExact,
+                value=TEST_OBJECT_CHAR_VALUE, _skip_refresh=_skip_refresh
+            )
+        )
+
+    def test_batch_index_instance(self):
+        self._test_search_backend_batch.index_instance(
+            instance=self._test_object
+        )
+
+        self.assertEqual(
+            self._get_test_object_id_list(), ()
+        )
+
+        self._test_search_backend_batch.batch_flush()
+
+        self.assertEqual(
+            self._get_test_object_id_list(), (self._test_object.pk,)
+        )
+
+    def test_batch_index_instance_batch_interval(self):
+        self._test_search_backend_batch.batch_interval = 0
+
+        self._test_search_backend_batch.index_instance(
+            instance=self._test_object
+        )
+
+        self.assertEqual(
+            self._get_test_object_id_list(), (self._test_object.pk,)
+        )
+        self.assertEqual(
+            IndexBatchEntry.objects.count(), 0
+        )
+
+    def test_batch_index_instance_batch_size(self):
+        self._test_search_backend_batch.batch_size = 1
+
+        self._test_search_backend_batch.index_instance(
+            instance=self._test_object
+        )
+
+        self.assertEqual(
+            self._get_test_object_id_list(), (self._test_object.pk,)
+        )
+
+    def test_batch_index_instance_deindex(self):
+        self._test_search_backend_batch.index_instance(
+            instance=self._test_object
+        )
+        self._test_search_backend_batch.deindex_instance(
+            instance=self._test_object
+        )
+        self._test_search_backend_batch.batch_flush()
+
+        self.assertEqual(
+            self._get_test_object_id_list(), ()
+        )
+
+    def test_batch_index_instance_lock_error(self):
+        self._test_search_backend_batch.index_instance(
+            instance=self._test_object
+        )
+
+        with mock.patch.object(
+            self._test_search_backend_batch, '_get_writer',
+            side_effect=whoosh.index.LockError
+        ):
+            with self.assertRaises(expected_exception=DynamicSearchRetry):
+                self._test_search_backend_batch.batch_flush()
+
+        self.assertEqual(
+            self._get_test_object_id_list(), ()
+        )
+        self.assertEqual(
+            IndexBatchEntry.objects.count(), 1
+        )
+
+        self._test_search_backend_batch.batch_flush()
+
+        self.assertEqual(
+            self._get_test_object_id_list(), (self._test_object.pk,)
+        )
+
+    def test_batch_index_instance_pending_entry(self):
+        self._test_search_backend_batch.index_instance(
+            instance=self._test_object
+        )
+
+        # The pending instance is stored in the database to survive the
+        # end of the process.
+        self.assertEqual(
+            list(
+                IndexBatchEntry.objects.values_list(
+                    'search_model_name', 'object_id'
+                )
+            ), [
+                (
+                    self._test_object._meta.label.lower(),
+                    self._test_object.pk
+                )
+            ]
+        )
+
+    def test_batch_index_instance_refresh(self):
+        self._test_search_backend_batch.index_instance(
+            instance=self._test_object
+        )
+
+        self.assertEqual(
+            self._get_test_object_id_list(_skip_refresh=False),
+            (self._test_object.pk,)
+        )
+
+    def test_task_index_batch_flush(self):
+        self._test_search_backend_batch.index_instance(
+            instance=self._test_object
+        )
+
+        with mock.patch(
+            'mayan.apps.dynamic_search.tasks.SearchBackend.get_instance',
+            return_value=self._test_search_backend_batch
+        ):
+            task_index_batch_flush.apply_async().get()
+
+        self.assertEqual(
+            self._get_test_object_id_list(), (self._test_object.pk,)
+        )
+        self.assertEqual(
+            IndexBatchEntry.objects.count(), 0
+        )
 
 
 class WhooshSearchBackendLimitTestCase(
@@ -0,0 +1,100 @@
+from datetime import timedelta
+
+from django.utils.timezone import now
+
+from mayan.apps.testing.tests.base import BaseTestCase
+
+from ..models import CachedResultset
+
+from .mixins.base import TestSearchObjectSimpleTestMixin
+
+
+class CachedResultsetTestCase(TestSearchObjectSimpleTestMixin, BaseTestCase):
+    auto_test_search_objects_create = False
+
+    def setUp(self):
+        super().setUp()
+        self._test_query = {'char': 'test'}
+
+    def _id_list_save(self, id_list):
+        CachedResultset.objects.id_list_save(
+            id_list=id_list, query=self._test_query,
+            search_model=self._test_search_model, user=self._test_case_user
+        )
+
+    def test_expired_delete(self):
+        self._id_list_save(id_list=(1,))
+
+        CachedResultset.objects.update(
+            datetime_expire=now() - timedelta(seconds=1)
+        )
+
+        self.assertEqual(
+            CachedResultset.objects.get_id_list(
+                query=self._test_query, search_model=self._test_search_model,
+                user=self._test_case_user
+            ), None
+        )
+
+        CachedResultset.objects.expired_delete()
+
+        self.assertEqual(
+            CachedResultset.objects.count(), 0
+        )
+
+    def test_id_list_save(self):
+        test_id_list = ['9', 5, 1000000, 3, 5]
+
+        self._id_list_save(id_list=test_id_list)
+
+        self.assertEqual(
+            CachedResultset.objects.get_id_list(
+                query=self._test_query, search_model=self._test_search_model,
+                user=self._test_case_user
+            ), [3, 5, 9, 1000000]
+        )
+        self.assertEqual(
+            CachedResultset.objects.get().result_count, 4
+        )
+
+    def test_id_list_save_empty(self):
+        self._id_list_save(id_list=())
+
+        self.assertEqual(
+            CachedResultset.objects.get_id_list(
+                query=self._test_query, search_model=self._test_search_model,
+                user=self._test_case_user
+            ), []
+        )
+
+    def test_id_list_save_replace(self):
+        self._id_list_save(id_list=(1, 2))
+        self._id_list_save(id_list=(3,))
+
+        self.assertEqual(
+            CachedResultset.objects.count(), 1
+        )
+        self.assertEqual(
+            CachedResultset.objects.get_id_list(
+                query=self._test_query, search_model=self._test_search_model,
+                user=self._test_case_user
+            ), [3]
+        )
+
+    def test_query_key_order(self):
+        self._id_list_save(id_list=(1,))
+
+        self.assertEqual(
+            CachedResultset.objects.get_id_list(
+                query={'char': 'test', '_match_all': 'True'},
+                search_model=self._test_search_model,
+                user=self._test_case_user
+            ), None
+        )
+        self.assertEqual(
+            CachedResultset.objects.get_id_list(
+                query=dict(reversed(self._test_query.items())),
+                search_model=self._test_search_model,
+                user=self._test_case_user
+            ), [1]
+        )
@@ -3,10 +3,12 @@ from django.db import models
 from mayan.apps.testing.tests.base import BaseTestCase
 
 from ..search_models import SearchModel
-from ..settings import setting_search_model_field_disable
+from ..settings import (
+    setting_indexing_chunk_size, setting_search_model_field_disable
+)
 
 from .literals import TEST_SEARCH_MODEL_FIELD_NAME
-from .mixins.base import SearchTestMixin
+from .mixins.base import SearchTestMixin, TestSearchObjectHierarchyTestMixin
 
 
 class SearchModelTestCase(SearchTestMixin, BaseTestCase):
@@ -30,6 +32,79 @@ class SearchModelTestCase(SearchTestMixin, BaseTestCase):
             field=TEST_SEARCH_MODEL_FIELD_NAME
         )
 
+    def _create_test_search_model_instances(self):
+        self._set_environment_variable(
+            name='MAYAN_{}'.format(setting_indexing_chunk_size.global_name),
+            value='2'
+        )
+
+        test_model = self._test_model_dict['_TestModel_0']
+
+        self._test_instance_list = [
+            test_model.objects.create(
+                **{TEST_SEARCH_MODEL_FIELD_NAME: str(index)}
+            ) for index in range(5)
+        ]
+
+        # Create a gap in the IDs.
+        self._test_instance_list.pop(2).delete()
+        self._test_instance_id_list = sorted(
+            instance.pk for instance in self._test_instance_list
+        )
+
+    def test_get_id_groups(self):
+        self._create_test_search_model_instances()
+
+        self.assertEqual(
+            list(
+                self._test_search_model.get_id_groups()
+            ), [
+                tuple(self._test_instance_id_list[0:2]),
+                tuple(self._test_instance_id_list[2:4])
+            ]
+        )
+
+    def test_get_id_groups_id_last(self):
+        self._create_test_search_model_instances()
+
+        self.assertEqual(
+            list(
+                self._test_search_model.get_id_groups(
+                    id_last=self._test_instance_id_list[0]
+                )
+            ), [
+                tuple(self._test_instance_id_list[1:3]),
+                tuple(self._test_instance_id_list[3:4])
+            ]
+        )
+
+    def test_get_id_groups_range_string(self):
+        self._create_test_search_model_instances()
+
+        self.assertEqual(
+            list(
+                self._test_search_model.get_id_groups(
+                    range_string='{}-{},{}'.format(
+                        self._test_instance_id_list[2],
+                        self._test_instance_id_list[0],
+                        self._test_instance_id_list[3]
+                    )
+                )
+            ), [
+                tuple(self._test_instance_id_list[0:2]),
+                tuple(self._test_instance_id_list[2:4])
+            ]
+        )
+
+    def test_get_id_groups_query_count(self):
+        self._create_test_search_model_instances()
+
+        # One query per group and a final empty query.
+        with self.assertNumQueries(num=3):
+            list(
+                self._test_search_model.get_id_groups()
+            )
+
     def test_search_field_removal(self):
         test_search_fields = self._test_search_model.search_fields
 
@@ -75,3 +150,82 @@ class SearchModelTestCase(SearchTestMixin, BaseTestCase):
         self.assertTrue(
             test_search_field not in self._test_search_model.search_fields
         )
+
+
+class SearchModelPopulateTestCase(
+    TestSearchObjectHierarchyTestMixin, BaseTestCase
+):
+    def _test_search_model_populate_many(self, search_model):
+        queryset = search_model.get_queryset()
+
+        result = {
+            instance.pk: instance_field_data
+            for instance, instance_field_data in search_model.populate_many(
+                queryset=queryset, search_backend=self._test_search_backend
+            )
+        }
+
+        self.assertEqual(
+            set(result), set(
+                queryset.values_list('pk', flat=True)
+            )
+        )
+
+        for instance in queryset:
+            self.assertEqual(
+                result[instance.pk], search_model.populate(
+                    instance=instance,
+                    search_backend=self._test_search_backend
+                )
+            )
+
+    def test_populate_many_attribute(self):
+        self._test_search_model_populate_many(
+            search_model=self._test_search_attribute
+        )
+
+    def test_populate_many_exclude(self):
+        test_model_attribute = self._test_model_dict['TestModelAttribute']
+
+        result = dict(
+            self._test_search_grandchild.populate_many(
+                exclude_kwargs={'id': self._test_object_attribute.pk},
+                exclude_model=test_model_attribute,
+                queryset=self._test_search_grandchild.get_queryset(),
+                search_backend=self._test_search_backend
+            )
+        )
+
+        for instance_field_data in result.values():
+            self.assertEqual(
+                instance_field_data['attributes__label'], []
+            )
+
+    def test_populate_many_grandchild(self):
+        self._test_search_model_populate_many(
+            search_model=self._test_search_grandchild
+        )
+
+    def test_populate_many_grandparent(self):
+        self._test_search_model_populate_many(
+            search_model=self._test_search_grandparent
+        )
+
+    def test_populate_many_query_count(self):
+        queryset = self._test_search_grandparent.get_queryset()
+
+        related_field_count = len(
+            [
+                search_field for search_field in self._test_search_grandparent.search_fields
+                if search_field.collection
+            ]
+        )
+
+        # One query for the instances and one query per related field.
+        with self.assertNumQueries(num=related_field_count + 1):
+            tuple(
+                self._test_search_grandparent.populate_many(
+                    queryset=queryset,
+                    search_backend=self._test_search_backend
+                )
+            )
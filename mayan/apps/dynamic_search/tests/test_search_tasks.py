@@ -1,11 +1,13 @@
-from unittest import skip
+from unittest import mock, skip
 
 from django.db import models
 
 from mayan.apps.testing.tests.base import BaseTestCase
 
+from ..models import ReindexCheckpoint
 from ..search_backends import SearchBackend
 from ..search_models import SearchModel
+from ..settings import setting_indexing_chunk_size
 
 from .mixins.search_task_mixins import SearchTaskTestMixin
 
@@ -57,6 +59,178 @@ class SearchTaskTestCase(SearchTaskTestMixin, BaseTestCase):
         )
         self.assertTrue(self._test_object_list[0] in queryset)
 
+    def test_task_reindex_backend_checkpoint(self):
+        with mock.patch(
+            'mayan.apps.dynamic_search.tasks.task_index_instances.apply_async'
+        ) as mock_apply_async:
+            self._execute_task_reindex_backend()
+
+        self.assertTrue(mock_apply_async.called)
+        self.assertEqual(
+            ReindexCheckpoint.objects.count(), 0
+        )
+
+    def test_task_reindex_backend_checkpoint_chord(self):
+        with mock.patch(
+            'mayan.apps.dynamic_search.tasks.app'
+        ) as mock_app:
+            mock_app.conf.result_backend = 'redis://'
+
+            with mock.patch(
+                'mayan.apps.dynamic_search.tasks.task_reindex_backend_chunk.apply_async'
+            ) as mock_task_reindex_backend_chunk_apply_async:
+                with mock.patch(
+                    'mayan.apps.dynamic_search.tasks.task_index_instances.apply_async'
+                ) as mock_task_index_instances_apply_async:
+                    self._execute_task_reindex_backend()
+
+        # The instances are queued in chunks, starting from the
+        # checkpoints.
+        self.assertFalse(mock_task_index_instances_apply_async.called)
+        self.assertEqual(
+            mock_task_reindex_backend_chunk_apply_async.call_count, 1
+        )
+        self.assertEqual(
+            ReindexCheckpoint.objects.count(), len(SearchModel.all())
+        )
+
+    def test_task_reindex_backend_chunk(self):
+        self._create_test_object(
+            instance_kwargs={'test_field': 'def'}
+        )
+
+        # Test object IDs are not sequential.
+        test_object_id_list = sorted(
+            test_object.pk for test_object in self._test_object_list
+        )
+
+        ReindexCheckpoint.objects.create(
+            search_model_name=self._test_model_search.full_name
+        )
+
+        self._set_environment_variable(
+            name='MAYAN_{}'.format(setting_indexing_chunk_size.global_name),
+            value='1'
+        )
+        setting_indexing_chunk_size.do_cache_invalidate()
+        self.addCleanup(setting_indexing_chunk_size.do_cache_invalidate)
+
+        with mock.patch(
+            'mayan.apps.dynamic_search.tasks.TASK_REINDEX_BACKEND_CHUNK_SIZE',
+            1
+        ):
+            with mock.patch(
+                'mayan.apps.dynamic_search.tasks.chord'
+            ) as mock_chord:
+                with mock.patch(
+                    'mayan.apps.dynamic_search.tasks.task_bulk_indexing_end.apply_async'
+                ) as mock_task_bulk_indexing_end_apply_async:
+                    self._execute_task_reindex_backend_chunk()
+
+        # The backend is restored after the last chunk.
+        self.assertFalse(mock_task_bulk_indexing_end_apply_async.called)
+        self.assertEqual(mock_chord.call_count, 1)
+
+        chord_kwargs = mock_chord.call_args.kwargs
+
+        self.assertEqual(
+            chord_kwargs['body'].task,
+            'mayan.apps.dynamic_search.tasks.task_reindex_backend_chunk'
+        )
+        self.assertEqual(
+            [signature.kwargs for signature in chord_kwargs['header']], [
+                {
+                    'id_list': (test_object_id_list[0],),
+                    'search_model_full_name': self._test_model_search.full_name
+                }
+            ]
+        )
+        self.assertTrue(mock_chord.return_value.apply_async.called)
+
+        # The checkpoint advances after the chunk is queued.
+        self.assertEqual(
+            ReindexCheckpoint.objects.get().last_object_id,
+            test_object_id_list[0]
+        )
+
+    def test_task_reindex_backend_chunk_last(self):
+        ReindexCheckpoint.objects.create(
+            last_object_id=self._test_object.pk,
+            search_model_name=self._test_model_search.full_name
+        )
+
+        test_index_settings = {'test_index': {'refresh_interval': '5s'}}
+
+        with mock.patch(
+            'mayan.apps.dynamic_search.tasks.chord'
+        ) as mock_chord:
+            with mock.patch(
+                'mayan.apps.dynamic_search.tasks.task_bulk_indexing_end.apply_async'
+            ) as mock_task_bulk_indexing_end_apply_async:
+                self._execute_task_reindex_backend_chunk(
+                    index_settings=test_index_settings
+                )
+
+        self.assertFalse(mock_chord.called)
+        mock_task_bulk_indexing_end_apply_async.assert_called_once_with(
+            kwargs={'index_settings': test_index_settings}
+        )
+        self.assertEqual(
+            ReindexCheckpoint.objects.count(), 0
+        )
+
+    def test_task_reindex_backend_checkpoint_resume(self):
+        self._create_test_object(
+            instance_kwargs={'test_field': 'def'}
+        )
+
+        # Test object IDs are not sequential.
+        test_object_id_list = sorted(
+            test_object.pk for test_object in self._test_object_list
+        )
+
+        ReindexCheckpoint.objects.create(
+            last_object_id=test_object_id_list[0],
+            search_model_name=self._test_model_search.full_name
+        )
+
+        with mock.patch(
+            'mayan.apps.dynamic_search.tasks.task_index_instances.apply_async'
+        ) as mock_apply_async:
+            with mock.patch(
+                'mayan.apps.dynamic_search.tasks.SearchBackend.get_instance'
+            ) as mock_get_instance:
+                mock_get_instance.return_value.bulk_indexing_start.return_value = None
+                self._execute_task_reindex_backend(resume=True)
+
+        # The search backend is not reset when resuming.
+        self.assertFalse(mock_get_instance.return_value.reset.called)
+        mock_apply_async.assert_called_once_with(
+            kwargs={
+                'id_list': (test_object_id_list[1],),
+                'search_model_full_name': self._test_model_search.full_name
+            }
+        )
+        self.assertEqual(
+            ReindexCheckpoint.objects.count(), 0
+        )
+
+    def test_task_reindex_backend_checkpoint_resume_no_checkpoints(self):
+        with mock.patch(
+            'mayan.apps.dynamic_search.tasks.task_index_instances.apply_async'
+        ) as mock_apply_async:
+            with mock.patch(
+                'mayan.apps.dynamic_search.tasks.SearchBackend.get_instance'
+            ) as mock_get_instance:
+                self._execute_task_reindex_backend(resume=True)
+
+        # Nothing to resume; the search backend is left untouched.
+        self.assertFalse(mock_get_instance.return_value.reset.called)
+        self.assertFalse(mock_apply_async.called)
+        self.assertEqual(
+            ReindexCheckpoint.objects.count(), 0
+        )
+
     @skip(reason='Test with a backend that supports reindexing.')
     def test_task_reindex_backend(self):
         queryset = self._do_search(
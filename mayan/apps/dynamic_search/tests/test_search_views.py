@@ -1,4 +1,4 @@
-from unittest import skip
+from unittest import mock, skip
 
 from django.urls import reverse
 
@@ -14,7 +14,9 @@ from ..literals import (
     MATCH_ALL_FIELD_CHOICES, MATCH_ALL_FIELD_NAME, QUERY_PARAMETER_ANY_FIELD,
     SEARCH_MODEL_NAME_KWARG
 )
+from ..models import CachedResultset
 from ..permissions import permission_search_tools
+from ..search_interpreters import SearchInterpreter
 
 from .literals import TEST_SEARCH_OBJECT_TERM
 from .mixins.base import TestSearchObjectSimpleTestMixin
@@ -407,6 +409,42 @@ class SearchResultViewTestCase(
         events = self._get_test_events()
         self.assertEqual(events.count(), 0)
 
+    def test_result_view_cached_results(self):
+        test_query = {
+            'uuid': self._test_object.uuid,
+            '_{}'.format(
+                SEARCH_MODEL_NAME_KWARG
+            ): self._test_search_model.full_name
+        }
+
+        response = self._request_search_results_view(data=test_query)
+        self.assertContains(
+            response=response, status_code=200,
+            text='Total: 1'
+        )
+
+        self.assertEqual(
+            CachedResultset.objects.count(), 1
+        )
+
+        self._clear_events()
+
+        test_query['page'] = 1
+
+        with mock.patch.object(
+            SearchInterpreter, 'do_resolve'
+        ) as mock_do_resolve:
+            response = self._request_search_results_view(data=test_query)
+
+        self.assertFalse(mock_do_resolve.called)
+        self.assertContains(
+            response=response, status_code=200,
+            text='Total: 1'
+        )
+
+        events = self._get_test_events()
+        self.assertEqual(events.count(), 0)
+
     def test_result_scoped_search_view(self):
         self._clear_events()
 
@@ -4,12 +4,17 @@ from django.conf import settings
 from django.contrib import messages
 from django.http import Http404
 
+from mayan.apps.rest_api.pagination import MayanPageNumberPagination
+from mayan.apps.views.settings import setting_paging_argument
 from mayan.apps.views.utils import get_request_data
 
 from ..exceptions import (
     DynamicSearchException, DynamicSearchInterpreterUnknownSearchType
 )
-from ..literals import FILTER_PREFIX, SEARCH_MODEL_NAME_KWARG
+from ..literals import (
+    FILTER_PREFIX, SEARCH_MODEL_NAME_KWARG,
+    SEARCH_RESULTS_CACHE_QUERY_PARAMETERS
+)
 from ..mixins import QuerysetSearchModelMixin
 from ..search_backends import SearchBackend
 from ..search_interpreters import SearchInterpreter
@@ -173,6 +178,7 @@ class SearchResultViewMixin(SearchQueryViewMixin):
                 saved_resultset, queryset = search_backend.search(
                     search_model=self.search_model,
                     store_resultset=store_resultset, query=query_clean,
+                    use_cached_results=self.get_search_use_cached_results(),
                     user=self.request.user
                 )
             except DynamicSearchException as exception:
@@ -192,3 +198,21 @@ class SearchResultViewMixin(SearchQueryViewMixin):
         saved_resultset, queryset = self.do_search_execute()
 
         return queryset
+
+    def get_search_use_cached_results(self):
+        """
+        Changing the page or the sorting of the results of a search reuses
+        the result IDs of the first execution of the query.
+        """
+        query_dict = self.get_search_query()
+
+        query_parameters = SEARCH_RESULTS_CACHE_QUERY_PARAMETERS + (
+            MayanPageNumberPagination.page_query_param,
+            setting_paging_argument.value
+        )
+
+        for query_parameter in query_parameters:
+            if query_parameter in query_dict:
+                return True
+
+        return False
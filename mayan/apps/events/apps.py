@@ -1,3 +1,5 @@
+from celery.signals import task_postrun, task_prerun
+
 from django.apps import apps
 from django.contrib.auth import get_user_model
 from django.db import models
@@ -13,6 +15,9 @@ from mayan.apps.forms import column_widgets
 from mayan.apps.navigation.source_columns import SourceColumn
 
 from .classes import EventTypeNamespace
+from .handlers import (
+    handler_event_commit_buffer_start, handler_event_commit_buffer_stop
+)
 from .html_widgets import widget_event_actor_link, widget_event_type_link
 from .links import (
     link_event_list, link_event_list_clear, link_event_list_export,
@@ -235,3 +240,12 @@ class EventsApp(MayanAppConfig):
         menu_tools.bind_links(
             links=(link_event_list,)
         )
+
+        task_postrun.connect(
+            handler_event_commit_buffer_stop,
+            dispatch_uid='events_handler_event_commit_buffer_stop'
+        )
+        task_prerun.connect(
+            handler_event_commit_buffer_start,
+            dispatch_uid='events_handler_event_commit_buffer_start'
+        )
@@ -1,12 +1,17 @@
 import csv
 import logging
+import threading
 
 from furl import furl
 
 from django.apps import apps
 from django.contrib.auth import get_user_model
+from django.db import connections, transaction
+from django.db.models.signals import post_save
 from django.db.utils import OperationalError, ProgrammingError
 from django.urls import reverse
+from django.utils.dateparse import parse_datetime
+from django.utils.timezone import now
 from django.utils.translation import gettext_lazy as _
 
 from actstream import action
@@ -20,9 +25,9 @@ from .links import (
     link_object_event_list, link_object_event_type_user_subscription_list
 )
 from .literals import (
-    DEFAULT_EVENT_LIST_EXPORT_FILENAME, EVENT_EVENTS_CLEARED_NAME,
-    EVENT_EVENTS_EXPORTED_NAME, EVENT_TYPE_NAMESPACE_NAME,
-    TEXT_UNKNOWN_EVENT_ID
+    DEFAULT_EVENT_LIST_EXPORT_FILENAME, EVENT_COMMIT_BUFFER_SIZE,
+    EVENT_EVENTS_CLEARED_NAME, EVENT_EVENTS_EXPORTED_NAME,
+    EVENT_OBJECT_NAMES, EVENT_TYPE_NAMESPACE_NAME, TEXT_UNKNOWN_EVENT_ID
 )
 from .permissions import (
     permission_events_clear, permission_events_export, permission_events_view
@@ -131,6 +136,63 @@ class ActionExporter:
             )
 
 
+class EventCommitBuffer:
+    """
+    Per thread buffer of the events committed while a task is executing.
+    The events are queued for commit in batches when the outermost task
+    finishes or when the buffer is full, instead of queuing a task for
+    each event.
+    """
+    _local = threading.local()
+
+    @classmethod
+    def _get_entry_list(cls):
+        try:
+            return cls._local.entry_list
+        except AttributeError:
+            cls._local.entry_list = []
+            return cls._local.entry_list
+
+    @classmethod
+    def append(cls, entry):
+        entry_list = cls._get_entry_list()
+        entry_list.append(entry)
+
+        if len(entry_list) >= EVENT_COMMIT_BUFFER_SIZE:
+            cls.flush()
+
+    @classmethod
+    def flush(cls):
+        # Hidden import.
+        # This circular import is necessary.
+        from .tasks import task_event_commit_many
+
+        entry_list = cls._get_entry_list()
+        cls._local.entry_list = []
+
+        if entry_list:
+            task_event_commit_many.apply_async(
+                kwargs={'entry_list': entry_list}
+            )
+
+    @classmethod
+    def is_active(cls):
+        return getattr(cls._local, 'depth', 0) > 0
+
+    @classmethod
+    def start(cls):
+        cls._local.depth = getattr(cls._local, 'depth', 0) + 1
+
+    @classmethod
+    def stop(cls):
+        cls._local.depth = max(
+            getattr(cls._local, 'depth', 0) - 1, 0
+        )
+
+        if not cls._local.depth:
+            cls.flush()
+
+
 class EventModelRegistry:
     _registry = set()
 
@@ -330,6 +392,210 @@ class EventType:
     def __str__(self):
         return '{}: {}'.format(self.namespace.label, self.label)
 
+    @classmethod
+    def _commit_many(cls, entry_list):
+        """
+        Create the actions and notifications of a list of buffered events
+        using bulk queries. The objects of the events are fetched with a
+        single query per model and the subscriptions of all the events
+        are resolved together.
+        """
+        Action = apps.get_model(app_label='actstream', model_name='Action')
+        ContentType = apps.get_model(
+            app_label='contenttypes', model_name='ContentType'
+        )
+        EventSubscription = apps.get_model(
+            app_label='events', model_name='EventSubscription'
+        )
+        Notification = apps.get_model(
+            app_label='events', model_name='Notification'
+        )
+        ObjectEventSubscription = apps.get_model(
+            app_label='events', model_name='ObjectEventSubscription'
+        )
+
+        object_id_dictionary = {}
+
+        for entry in entry_list:
+            for name in EVENT_OBJECT_NAMES:
+                object_id = entry.get('{}_id'.format(name))
+
+                if object_id:
+                    object_id_dictionary.setdefault(
+                        (
+                            entry['{}_app_label'.format(name)],
+                            entry['{}_model_name'.format(name)]
+                        ), set()
+                    ).add(object_id)
+
+        object_dictionary = {}
+
+        for (app_label, model_name), id_set in object_id_dictionary.items():
+            Model = apps.get_model(
+                app_label=app_label, model_name=model_name
+            )
+
+            for pk, instance in Model.objects.in_bulk(id_list=id_set).items():
+                object_dictionary[(app_label, model_name, pk)] = instance
+
+        event_list = []
+
+        for entry in entry_list:
+            event_objects = {}
+
+            for name in EVENT_OBJECT_NAMES:
+                object_id = entry.get('{}_id'.format(name))
+
+                if object_id:
+                    event_objects[name] = object_dictionary.get(
+                        (
+                            entry['{}_app_label'.format(name)],
+                            entry['{}_model_name'.format(name)], object_id
+                        )
+                    )
+
+                    if event_objects[name] is None:
+                        logger.warning(
+                            'Unable to find the %s of event "%s". The '
+                            'object was deleted before the event was '
+                            'committed.', name, entry['event_id']
+                        )
+                        break
+                else:
+                    event_objects[name] = None
+            else:
+                actor = event_objects['actor']
+                target = event_objects['target']
+
+                if actor is None and target is None:
+                    logger.warning(
+                        'Attempting to commit event "%s" without an actor '
+                        'or a target. This is not supported.',
+                        entry['event_id']
+                    )
+                    continue
+
+                sender = actor or target
+
+                action = Action(
+                    actor_content_type=ContentType.objects.get_for_model(
+                        model=sender
+                    ), actor_object_id=sender.pk, public=True,
+                    timestamp=parse_datetime(value=entry['timestamp']),
+                    verb=entry['event_id']
+                )
+
+                for name in ('action_object', 'target'):
+                    instance = event_objects[name]
+
+                    if instance is not None:
+                        setattr(
+                            action, '{}_content_type'.format(name),
+                            ContentType.objects.get_for_model(model=instance)
+                        )
+                        setattr(
+                            action, '{}_object_id'.format(name), instance.pk
+                        )
+
+                event_list.append(
+                    (action, event_objects['action_object'], target)
+                )
+
+        if not event_list:
+            return
+
+        action_list = [entry[0] for entry in event_list]
+        verb_set = {action.verb for action in action_list}
+
+        # Gather the users subscribed globally to the events.
+        subscription_dictionary = {}
+
+        queryset_event_subscriptions = EventSubscription.objects.filter(
+            stored_event_type__name__in=verb_set
+        ).values_list('stored_event_type__name', 'user_id')
+
+        for verb, user_id in queryset_event_subscriptions:
+            subscription_dictionary.setdefault(verb, set()).add(user_id)
+
+        # Gather the users subscribed to the target and action objects of
+        # the events.
+        content_type_id_set = set()
+        object_id_set = set()
+
+        for action, action_object, target in event_list:
+            for instance in (action_object, target):
+                if instance is not None:
+                    content_type_id_set.add(
+                        ContentType.objects.get_for_model(model=instance).pk
+                    )
+                    object_id_set.add(instance.pk)
+
+        queryset_object_event_subscriptions = ObjectEventSubscription.objects.filter(
+            content_type_id__in=content_type_id_set,
+            object_id__in=object_id_set,
+            stored_event_type__name__in=verb_set
+        ).values_list(
+            'content_type_id', 'object_id', 'stored_event_type__name',
+            'user_id'
+        )
+
+        for content_type_id, object_id, verb, user_id in queryset_object_event_subscriptions:
+            subscription_dictionary.setdefault(
+                (content_type_id, object_id, verb), set()
+            ).add(user_id)
+
+        connection = connections[Action.objects.db]
+
+        is_bulk_create = connection.features.can_return_rows_from_bulk_insert
+
+        with transaction.atomic(using=Action.objects.db):
+            if is_bulk_create:
+                Action.objects.bulk_create(objs=action_list)
+            else:
+                # The primary keys of the actions are needed to create
+                # the notifications. Saving each action sends its
+                # `post_save` signal.
+                for action in action_list:
+                    action.save()
+
+            notification_list = []
+
+            for action, action_object, target in event_list:
+                if action_object is None and target is None:
+                    continue
+
+                user_id_set = set(
+                    subscription_dictionary.get(action.verb, ())
+                )
+
+                for instance in (action_object, target):
+                    if instance is not None:
+                        user_id_set.update(
+                            subscription_dictionary.get(
+                                (
+                                    ContentType.objects.get_for_model(
+                                        model=instance
+                                    ).pk, instance.pk, action.verb
+                                ), ()
+                            )
+                        )
+
+                for user_id in user_id_set:
+                    notification_list.append(
+                        Notification(action=action, user_id=user_id)
+                    )
+
+            Notification.objects.bulk_create(objs=notification_list)
+
+        if is_bulk_create:
+            # `bulk_create` does not send the signal of each action, send
+            # it to keep the receivers, like the event triggers, working.
+            for action in action_list:
+                post_save.send(
+                    created=True, instance=action, raw=False, sender=Action,
+                    update_fields=None, using=Action.objects.db
+                )
+
     def _commit(self, action_object=None, actor=None, target=None):
         EventSubscription = apps.get_model(
             app_label='events', model_name='EventSubscription'
@@ -439,7 +705,12 @@ class EventType:
                     }
                 )
 
-            task_event_commit.apply_async(kwargs=task_kwargs)
+            if EventCommitBuffer.is_active():
+                task_kwargs['timestamp'] = now().isoformat()
+
+                EventCommitBuffer.append(entry=task_kwargs)
+            else:
+                task_event_commit.apply_async(kwargs=task_kwargs)
 
     def do_delete(self):
         self.__class__._registry.pop(self.id)
@@ -0,0 +1,9 @@
+from .classes import EventCommitBuffer
+
+
+def handler_event_commit_buffer_start(sender, **kwargs):
+    EventCommitBuffer.start()
+
+
+def handler_event_commit_buffer_stop(sender, **kwargs):
+    EventCommitBuffer.stop()
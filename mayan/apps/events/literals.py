@@ -8,9 +8,12 @@ DEFAULT_EVENTS_PRUNE_BACKEND = None
 DEFAULT_EVENTS_PRUNE_BACKEND_ARGUMENTS = {}
 DEFAULT_EVENTS_PRUNE_TASK_INTERVAL = 60 * 60 * 24 * 30  # 30 days
 
+EVENT_COMMIT_BUFFER_SIZE = 500
+
 EVENT_MANAGER_ORDER_AFTER = 1
 EVENT_MANAGER_ORDER_BEFORE = 2
 
+EVENT_OBJECT_NAMES = ('action_object', 'actor', 'target')
 EVENT_TYPE_NAMESPACE_NAME = 'events'
 EVENT_EVENTS_CLEARED_NAME = 'event_cleared'
 EVENT_EVENTS_EXPORTED_NAME = 'event_exported'
@@ -19,6 +19,11 @@ queue_events_fast.add_task_type(
     dotted_path='mayan.apps.events.tasks.task_event_commit',
     label=_(message='Commit an event'), name='task_event_commit'
 )
+queue_events_fast.add_task_type(
+    dotted_path='mayan.apps.events.tasks.task_event_commit_many',
+    label=_(message='Commit a batch of events'),
+    name='task_event_commit_many'
+)
 
 queue_events_slow.add_task_type(
     dotted_path='mayan.apps.events.tasks.task_event_prune',
@@ -58,6 +58,14 @@ def task_event_commit(
         raise self.retry(exc=exception)
 
 
+@app.task(bind=True, ignore_result=True, retry_backoff=True)
+def task_event_commit_many(self, entry_list):
+    try:
+        EventType._commit_many(entry_list=entry_list)
+    except OperationalError as exception:
+        raise self.retry(exc=exception)
+
+
 @app.task(ignore_result=True)
 def task_event_prune():
     if setting_event_prune_backend.value:
@@ -1,10 +1,134 @@
+from unittest import mock
+
+from actstream.models import Action
+
+from django.db import connections
+from django.db.models.signals import post_save
+
 from mayan.apps.testing.tests.base import BaseTestCase
 
-from ..classes import EventModelRegistry, ModelEventType
+from ..classes import EventCommitBuffer, EventModelRegistry, ModelEventType
 from ..decorators import method_event
 from ..event_managers import EventManagerMethodAfter
 
+from ..models import Notification
+
 from .mixins.event_type_mixins import EventTypeTestMixin
+from .mixins.subscription_mixins import ObjectEventSubscriptionTestMixin
+
+
+class EventCommitBufferTestCase(
+    EventTypeTestMixin, ObjectEventSubscriptionTestMixin, BaseTestCase
+):
+    def setUp(self):
+        super().setUp()
+        self._create_test_event_type()
+        self._create_test_user()
+        self._create_test_object()
+
+        self._clear_events()
+
+    def _commit_test_events(self, count):
+        EventCommitBuffer.start()
+
+        try:
+            for index in range(count):
+                self._test_event_type.commit(
+                    actor=self._test_case_user, target=self._test_object
+                )
+
+            self.assertEqual(self._get_test_events().count(), 0)
+        finally:
+            EventCommitBuffer.stop()
+
+    def test_event_commit_buffer(self):
+        self._commit_test_events(count=3)
+
+        events = self._get_test_events()
+        self.assertEqual(events.count(), 3)
+
+        for event in events:
+            self.assertEqual(event.actor, self._test_case_user)
+            self.assertEqual(event.target, self._test_object)
+            self.assertEqual(event.verb, self._test_event_type.id)
+
+    def test_event_commit_buffer_deleted_object(self):
+        EventCommitBuffer.start()
+
+        try:
+            self._test_event_type.commit(
+                actor=self._test_case_user, target=self._test_object
+            )
+            self._test_object.delete()
+        finally:
+            EventCommitBuffer.stop()
+
+        self.assertEqual(self._get_test_events().count(), 0)
+
+    def _get_test_post_save_count(self, count):
+        receiver = mock.Mock()
+
+        post_save.connect(
+            dispatch_uid='test_event_commit_buffer_post_save',
+            receiver=receiver, sender=Action
+        )
+
+        try:
+            self._commit_test_events(count=count)
+        finally:
+            post_save.disconnect(
+                dispatch_uid='test_event_commit_buffer_post_save',
+                sender=Action
+            )
+
+        return receiver.call_count
+
+    def test_event_commit_buffer_post_save(self):
+        self.assertEqual(
+            self._get_test_post_save_count(count=3), 3
+        )
+
+    def test_event_commit_buffer_post_save_no_bulk_insert_rows(self):
+        connection = connections[Action.objects.db]
+
+        with mock.patch.object(
+            type(connection.features), 'can_return_rows_from_bulk_insert',
+            new_callable=mock.PropertyMock, return_value=False
+        ):
+            self.assertEqual(
+                self._get_test_post_save_count(count=3), 3
+            )
+
+        self.assertEqual(self._get_test_events().count(), 3)
+
+    def test_event_commit_buffer_nested(self):
+        EventCommitBuffer.start()
+
+        try:
+            self._commit_test_events(count=1)
+
+            self.assertEqual(self._get_test_events().count(), 0)
+        finally:
+            EventCommitBuffer.stop()
+
+        self.assertEqual(self._get_test_events().count(), 1)
+
+    def test_event_commit_buffer_notifications(self):
+        self._create_test_object_event_subscription()
+
+        self._commit_test_events(count=2)
+
+        events = self._get_test_events()
+        self.assertEqual(events.count(), 2)
+
+        notifications = Notification.objects.filter(
+            user=self._test_case_user
+        )
+        self.assertEqual(notifications.count(), 2)
+        self.assertEqual(
+            set(notifications.values_list('action_id', flat=True)),
+            set(events.values_list('pk', flat=True))
+        )
 
 
 class EventManagerTestCase(EventTypeTestMixin, BaseTestCase):
@@ -1,3 +1,5 @@
+from celery.signals import task_postrun
+
 from django.utils.translation import gettext_lazy as _
 
 from mayan.apps.acls.classes import ModelPermission
@@ -18,6 +20,7 @@ from .dashboard_widgets import (
 from .events import (
     event_cache_edited, event_cache_partition_purged, event_cache_purged
 )
+from .handlers import handler_cache_partition_file_access_flush
 from .links import (
     link_cache_list, link_cache_purge_multiple,
     link_cache_purge_single, link_cache_tool
@@ -103,3 +106,8 @@ class FileCachingAppConfig(MayanAppConfig):
         menu_tools.bind_links(
             links=(link_cache_tool,)
         )
+
+        task_postrun.connect(
+            handler_cache_partition_file_access_flush,
+            dispatch_uid='file_caching_handler_cache_partition_file_access_flush'
+        )
@@ -0,0 +1,283 @@
+import atexit
+from collections import OrderedDict
+import logging
+import threading
+import time
+
+from django.apps import apps
+from django.db.models import F, FloatField
+from django.db.models.functions import Cast, Greatest
+from django.utils import timezone
+from django.utils.translation import gettext_lazy as _
+
+from .literals import (
+    CACHE_EVICTION_POLICY_GDSF, CACHE_EVICTION_POLICY_LFU,
+    CACHE_EVICTION_POLICY_LFU_AGING, CACHE_EVICTION_POLICY_LRU
+)
+from .settings import (
+    setting_access_flush_interval, setting_access_flush_size,
+    setting_memory_cache_maximum_file_size, setting_memory_cache_maximum_size
+)
+
+logger = logging.getLogger(name=__name__)
+
+
+class CacheEvictionPolicy:
+    """
+    Base class for the cache eviction policies. Subclasses define the
+    order in which the files of a cache are deleted when the cache is full.
+    """
+    _registry = {}
+
+    is_aging = False
+    label = None
+    name = None
+
+    @classmethod
+    def all(cls):
+        return sorted(
+            cls._registry.values(), key=lambda policy: policy.name
+        )
+
+    @classmethod
+    def get(cls, name):
+        return cls._registry[name]
+
+    @classmethod
+    def get_queryset_ordered(cls, queryset):
+        raise NotImplementedError(
+            'Subclass must implement the `get_queryset_ordered` method.'
+        )
+
+    @classmethod
+    def register(cls, policy):
+        cls._registry[policy.name] = policy
+
+
+class CacheEvictionPolicyGDSF(CacheEvictionPolicy):
+    """
+    Greedy dual size frequency. Evicts first the files with the lowest
+    hits to size ratio. Large files need more hits to be kept. Hits are
+    periodically halved to age out files that are no longer requested.
+    """
+    is_aging = True
+    label = _(message='Greedy dual size frequency')
+    name = CACHE_EVICTION_POLICY_GDSF
+
+    @classmethod
+    def get_queryset_ordered(cls, queryset):
+        queryset = queryset.annotate(
+            eviction_priority=Cast(
+                'hits', output_field=FloatField()
+            ) / Cast(
+                Greatest('file_size', 1), output_field=FloatField()
+            )
+        )
+        return queryset.order_by(
+            'eviction_priority', 'datetime_accessed', 'pk'
+        )
+
+
+class CacheEvictionPolicyLFU(CacheEvictionPolicy):
+    label = _(message='Least frequently used')
+    name = CACHE_EVICTION_POLICY_LFU
+
+    @classmethod
+    def get_queryset_ordered(cls, queryset):
+        return queryset.order_by('hits', 'datetime', 'pk')
+
+
+class CacheEvictionPolicyLFUAging(CacheEvictionPolicy):
+    """
+    Least frequently used with the hits being periodically halved to
+    allow files that were popular in the past to be evicted.
+    """
+    is_aging = True
+    label = _(message='Least frequently used with aging')
+    name = CACHE_EVICTION_POLICY_LFU_AGING
+
+    @classmethod
+    def get_queryset_ordered(cls, queryset):
+        return queryset.order_by('hits', 'datetime_accessed', 'pk')
+
+
+class CacheEvictionPolicyLRU(CacheEvictionPolicy):
+    label = _(message='Least recently used')
+    name = CACHE_EVICTION_POLICY_LRU
+
+    @classmethod
+    def get_queryset_ordered(cls, queryset):
+        return queryset.order_by('datetime_accessed', 'pk')
+
+
+class CachePartitionFileAccessTracker:
+    """
+    Per process buffer of the cache partition file accesses. Accesses are
+    accumulated in memory and written to the database in a single bulk
+    update when enough files were accessed or when the flush interval
+    elapses, instead of updating the database on every read.
+    Celery prefork worker processes do not run the exit handlers, the
+    accesses are also written after each task.
+    """
+    _accesses = {}
+    _last_flush_monotonic = time.monotonic()
+    _lock = threading.Lock()
+
+    @classmethod
+    def flush(cls):
+        with cls._lock:
+            accesses = cls._accesses
+            cls._accesses = {}
+            cls._last_flush_monotonic = time.monotonic()
+
+        if accesses:
+            CachePartitionFile = apps.get_model(
+                app_label='file_caching', model_name='CachePartitionFile'
+            )
+
+            logger.debug('Flushing %d cache file accesses.', len(accesses))
+
+            # Write all the accesses with a single CASE statement per
+            # batch instead of one statement per file.
+            cache_partition_files = [
+                CachePartitionFile(
+                    datetime_accessed=datetime_accessed,
+                    hits=F('hits') + hits, pk=pk
+                ) for pk, (hits, datetime_accessed) in accesses.items()
+            ]
+            CachePartitionFile.objects.bulk_update(
+                fields=('datetime_accessed', 'hits'),
+                objs=cache_partition_files
+            )
+
+    @classmethod
+    def record(cls, cache_partition_file_id):
+        with cls._lock:
+            hits = cls._accesses.get(
+                cache_partition_file_id, (0, None)
+            )[0]
+            cls._accesses[cache_partition_file_id] = (
+                hits + 1, timezone.now()
+            )
+
+            is_flush_required = (
+                len(cls._accesses) >= setting_access_flush_size.value
+            ) or (
+                time.monotonic() - cls._last_flush_monotonic >= setting_access_flush_interval.value
+            )
+
+        if is_flush_required:
+            cls.flush()
+
+
+class CachePartitionFileMemoryCache:
+    """
+    Per process, size bounded, least recently used memory cache of the
+    content of small cache partition files. Entries are keyed by partition
+    and filename and store the primary key and creation date time of the
+    file. Files can be deleted and created again under the same name by
+    other processes, entries are only returned for the database row they
+    were read from.
+    """
+    _entries = OrderedDict()
+    _lock = threading.Lock()
+    _size = 0
+
+    @classmethod
+    def _entry_remove(cls, key):
+        entry = cls._entries.pop(key, None)
+        if entry:
+            cls._size -= len(entry[1])
+
+    @classmethod
+    def clear(cls):
+        with cls._lock:
+            cls._entries.clear()
+            cls._size = 0
+
+    @classmethod
+    def get(cls, cache_partition_file):
+        """
+        Return the content of the cache partition file or None if the file
+        is not cached. Entries of a previous file with the same name are
+        discarded.
+        """
+        key = (cache_partition_file.partition_id, cache_partition_file.filename)
+        version = (cache_partition_file.pk, cache_partition_file.datetime)
+
+        with cls._lock:
+            entry = cls._entries.get(key)
+            if entry:
+                if entry[0] == version:
+                    cls._entries.move_to_end(key=key)
+                    return entry[1]
+                else:
+                    cls._entry_remove(key=key)
+
+    @classmethod
+    def get_is_enabled(cls):
+        return cls.get_maximum_size() > 0
+
+    @classmethod
+    def get_maximum_file_size(cls):
+        return min(
+            setting_memory_cache_maximum_file_size.value,
+            cls.get_maximum_size()
+        )
+
+    @classmethod
+    def get_maximum_size(cls):
+        return setting_memory_cache_maximum_size.value
+
+    @classmethod
+    def invalidate(cls, cache_partition_id, filename):
+        with cls._lock:
+            cls._entry_remove(
+                key=(cache_partition_id, filename)
+            )
+
+    @classmethod
+    def invalidate_partition(cls, cache_partition_id):
+        with cls._lock:
+            for key in list(cls._entries):
+                if key[0] == cache_partition_id:
+                    cls._entry_remove(key=key)
+
+    @classmethod
+    def set(cls, cache_partition_file, content):
+        if len(content) > cls.get_maximum_file_size():
+            return
+
+        key = (cache_partition_file.partition_id, cache_partition_file.filename)
+        version = (cache_partition_file.pk, cache_partition_file.datetime)
+        maximum_size = cls.get_maximum_size()
+
+        with cls._lock:
+            cls._entry_remove(key=key)
+            cls._entries[key] = (version, content)
+            cls._size += len(content)
+
+            while cls._size > maximum_size:
+                cls._entry_remove(
+                    key=next(
+                        iter(cls._entries)
+                    )
+                )
+
+
+def _flush_access_tracker():
+    try:
+        CachePartitionFileAccessTracker.flush()
+    except Exception as exception:
+        logger.warning(
+            'Unable to flush the cache file accesses on exit; %s',
+            exception
+        )
+
+
+atexit.register(_flush_access_tracker)
+
+CacheEvictionPolicy.register(policy=CacheEvictionPolicyGDSF)
+CacheEvictionPolicy.register(policy=CacheEvictionPolicyLFU)
+CacheEvictionPolicy.register(policy=CacheEvictionPolicyLFUAging)
+CacheEvictionPolicy.register(policy=CacheEvictionPolicyLRU)
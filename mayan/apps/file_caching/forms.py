@@ -18,7 +18,8 @@ class CacheDetailForm(forms.DetailForm):
         ), (
             _(message='Configuration'), {
                 'fields': (
-                    'get_maximum_size_display', 'get_total_size_display'
+                    'get_maximum_size_display', 'get_total_size_display',
+                    'get_eviction_policy_label'
                 )
             }
         ), (
@@ -33,6 +34,7 @@ class CacheDetailForm(forms.DetailForm):
             {'field': 'label'},
             {'field': 'get_maximum_size_display'},
             {'field': 'get_total_size_display'},
+            {'field': 'get_eviction_policy_label'},
             {'field': 'get_partition_count'},
             {'field': 'get_partition_file_count'}
         )
@@ -0,0 +1,5 @@
+from .classes import CachePartitionFileAccessTracker
+
+
+def handler_cache_partition_file_access_flush(sender, **kwargs):
+    CachePartitionFileAccessTracker.flush()
@@ -1,2 +1,20 @@
+CACHE_EVICTION_POLICY_GDSF = 'gdsf'
+CACHE_EVICTION_POLICY_LFU = 'lfu'
+CACHE_EVICTION_POLICY_LFU_AGING = 'lfu_aging'
+CACHE_EVICTION_POLICY_LRU = 'lru'
+
+# Reader counts not updated for this long are left by processes that
+# stopped while reading and no longer keep the file from being evicted.
+CACHE_PARTITION_FILE_READER_TIMEOUT = 30 * 60  # 30 minutes.
+CACHE_PARTITION_FILE_TEMPORARY_FILENAME_TEMPLATE = '{filename}.partial-{uuid}'
+CACHE_PRUNE_BATCH_SIZE = 100
+
+DEFAULT_ACCESS_FLUSH_INTERVAL = 60  # seconds
+DEFAULT_ACCESS_FLUSH_SIZE = 100
+DEFAULT_EVICTION_POLICIES = {}
+DEFAULT_EVICTION_POLICY = CACHE_EVICTION_POLICY_LFU
 DEFAULT_MAXIMUM_FAILED_PRUNE_ATTEMPTS = 100
 DEFAULT_MAXIMUM_NORMAL_PRUNE_ATTEMPTS = 100
+DEFAULT_MEMORY_CACHE_MAXIMUM_FILE_SIZE = 512 * 1024  # 512 KB
+DEFAULT_MEMORY_CACHE_MAXIMUM_SIZE = 0
+DEFAULT_TASK_HITS_DECAY_INTERVAL = 60 * 60 * 24  # 24 hours
@@ -0,0 +1,36 @@
+from django.db import migrations, models
+from django.db.models import F
+import django.utils.timezone
+
+
+def code_copy_datetime_accessed(apps, schema_editor):
+    CachePartitionFile = apps.get_model(
+        app_label='file_caching', model_name='CachePartitionFile'
+    )
+
+    CachePartitionFile.objects.using(
+        alias=schema_editor.connection.alias
+    ).update(
+        datetime_accessed=F('datetime')
+    )
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ('file_caching', '0011_alter_cache_maximum_size')
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='cachepartitionfile', name='datetime_accessed',
+            field=models.DateTimeField(
+                db_index=True, default=django.utils.timezone.now,
+                help_text='Date and time this cache partition file was '
+                'last accessed.', verbose_name='Date time accessed'
+            )
+        ),
+        migrations.RunPython(
+            code=code_copy_datetime_accessed,
+            reverse_code=migrations.RunPython.noop
+        )
+    ]
@@ -0,0 +1,26 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ('file_caching', '0012_cachepartitionfile_datetime_accessed')
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='cachepartitionfile', name='datetime_read',
+            field=models.DateTimeField(
+                blank=True, help_text='Date and time this cache partition '
+                'file was last opened from the storage.', null=True,
+                verbose_name='Date time read'
+            )
+        ),
+        migrations.AddField(
+            model_name='cachepartitionfile', name='reader_count',
+            field=models.PositiveIntegerField(
+                default=0, help_text='Number of readers of this cache '
+                'partition file. Files being read are not evicted.',
+                verbose_name='Reader count'
+            )
+        )
+    ]
@@ -1,10 +1,15 @@
 from contextlib import contextmanager
+from datetime import timedelta
+from io import BytesIO
 import logging
+import os
+import uuid
 
 from django.apps import apps
 from django.core.files.base import ContentFile
-from django.db.models import F, Sum
+from django.db.models import F, Q, Sum
 from django.template.defaultfilters import filesizeformat
+from django.utils import timezone
 from django.utils.functional import cached_property
 from django.utils.text import format_lazy
 from django.utils.translation import gettext_lazy as _
@@ -12,15 +17,21 @@ from django.utils.translation import gettext_lazy as _
 from mayan.apps.events.decorators import method_event
 from mayan.apps.events.event_managers import EventManagerMethodAfter
 from mayan.apps.lock_manager.backends.base import LockingBackend
-from mayan.apps.lock_manager.decorators import (
-    acquire_lock_class_method, locked_class_method, release_lock_class_method
-)
 from mayan.apps.lock_manager.exceptions import LockError
 from mayan.apps.storage.classes import DefinedStorage
 
+from .classes import (
+    CacheEvictionPolicy, CachePartitionFileAccessTracker,
+    CachePartitionFileMemoryCache
+)
 from .events import event_cache_partition_purged, event_cache_purged
 from .exceptions import FileCachingException
+from .literals import (
+    CACHE_PARTITION_FILE_READER_TIMEOUT,
+    CACHE_PARTITION_FILE_TEMPORARY_FILENAME_TEMPLATE, CACHE_PRUNE_BATCH_SIZE
+)
 from .settings import (
+    setting_eviction_policies, setting_eviction_policy,
     setting_maximum_failed_prune_attempts,
     setting_maximum_normal_prune_attempts
 )
@@ -29,6 +40,93 @@ logger = logging.getLogger(name=__name__)
 
 
 class CacheBusinessLogicMixin:
+    def evict(self, cache_partition_files):
+        """
+        Delete the cache partition files in batches. The lock of each file
+        is acquired without waiting, files being created or read by any
+        process are skipped.
+        Returns a dictionary with the size freed and the list of primary
+        keys of the files that could not be deleted.
+        """
+        CachePartitionFile = apps.get_model(
+            app_label='file_caching', model_name='CachePartitionFile'
+        )
+
+        failed_pk_list = []
+        size = 0
+
+        locking_backend_class = LockingBackend.get_backend()
+
+        for index in range(0, len(cache_partition_files), CACHE_PRUNE_BATCH_SIZE):
+            batch = cache_partition_files[
+                index:index + CACHE_PRUNE_BATCH_SIZE
+            ]
+            locks = {}
+
+            try:
+                for cache_partition_file in batch:
+                    lock_name = cache_partition_file._lock_manager_get_lock_name()
+                    try:
+                        locks[cache_partition_file.pk] = locking_backend_class.acquire_lock(
+                            name=lock_name
+                        )
+                    except LockError:
+                        logger.debug(
+                            'Lock error trying to delete file "%s" for '
+                            'prune. Skipping and attempting next file.',
+                            cache_partition_file
+                        )
+                        failed_pk_list.append(cache_partition_file.pk)
+
+                # Readers do not acquire the lock, files opened after the
+                # eviction plan was obtained are skipped.
+                reader_pk_list = list(
+                    CachePartitionFile.objects.filter(
+                        pk__in=locks.keys()
+                    ).filter(
+                        self.get_reader_query()
+                    ).values_list('pk', flat=True)
+                )
+
+                if reader_pk_list:
+                    logger.debug(
+                        'Files "%s" are being read. Skipping and attempting '
+                        'next files.', reader_pk_list
+                    )
+                    failed_pk_list.extend(reader_pk_list)
+
+                # Files deleted by another process before the lock was
+                # acquired are not counted.
+                queryset_cache_partition_files = CachePartitionFile.objects.filter(
+                    pk__in=locks.keys()
+                ).exclude(pk__in=reader_pk_list)
+                existing_file_sizes = dict(
+                    queryset_cache_partition_files.values_list(
+                        'pk', 'file_size'
+                    )
+                )
+
+                storage_instance = self.storage
+                for cache_partition_file in batch:
+                    if cache_partition_file.pk in existing_file_sizes:
+                        CachePartitionFileMemoryCache.invalidate(
+                            cache_partition_id=cache_partition_file.partition_id,
+                            filename=cache_partition_file.filename
+                        )
+                        storage_instance.delete(
+                            name=cache_partition_file.full_filename
+                        )
+
+                queryset_cache_partition_files.delete()
+                size += sum(
+                    existing_file_sizes.values()
+                )
+            finally:
+                for lock in locks.values():
+                    lock.release()
+
+        return {'failed_pk_list': failed_pk_list, 'size': size}
+
     def get_defined_storage(self):
         try:
             defined_storage_class = DefinedStorage.get(
@@ -41,6 +139,61 @@ class CacheBusinessLogicMixin:
 
         return defined_storage_class
 
+    def get_eviction_plan(self, size, exclude_pk_list=None):
+        """
+        Return the list of cache partition files to delete, in eviction
+        order, to free at least `size` bytes. The list is obtained from a
+        single query that stops being read once the size is reached.
+        """
+        queryset_cache_partition_files = self.get_queryset_files_for_eviction().exclude(
+            self.get_reader_query()
+        )
+
+        if exclude_pk_list:
+            queryset_cache_partition_files = queryset_cache_partition_files.exclude(
+                pk__in=exclude_pk_list
+            )
+
+        queryset_cache_partition_files = queryset_cache_partition_files.select_related(
+            'partition'
+        )
+
+        result = []
+        cumulative_size = 0
+
+        iterator = queryset_cache_partition_files.iterator(
+            chunk_size=CACHE_PRUNE_BATCH_SIZE
+        )
+
+        for cache_partition_file in iterator:
+            if cumulative_size >= size:
+                break
+
+            # Avoid a query per file to obtain the lock name and storage.
+            cache_partition_file.partition.cache = self
+            result.append(cache_partition_file)
+            cumulative_size += cache_partition_file.file_size
+
+        return result
+
+    def get_eviction_policy(self):
+        policy_name = setting_eviction_policies.value.get(
+            self.defined_storage_name, setting_eviction_policy.value
+        )
+
+        return CacheEvictionPolicy.get(name=policy_name)
+
+    def get_eviction_policy_label(self):
+        return self.get_eviction_policy().label
+
+    get_eviction_policy_label.short_description = _(
+        message='Eviction policy'
+    )
+    get_eviction_policy_label.help_text = _(
+        message='Order in which the files are deleted when the cache is '
+        'full.'
+    )
+
     def get_files(self):
         CachePartitionFile = apps.get_model(
             app_label='file_caching', model_name='CachePartitionFile'
@@ -80,11 +233,23 @@ class CacheBusinessLogicMixin:
     get_partition_file_count.help_text = _(message='Total cached files.')
 
     def get_queryset_files_for_eviction(self):
-        queryset_cache_partition_files_sorted = self.get_files().order_by(
-            'hits', 'datetime'
+        eviction_policy = self.get_eviction_policy()
+
+        return eviction_policy.get_queryset_ordered(
+            queryset=self.get_files()
         )
 
-        return queryset_cache_partition_files_sorted
+    @staticmethod
+    def get_reader_query():
+        """
+        Return the filter of the files being read. Reader counts not
+        updated within the reader timeout are ignored.
+        """
+        return Q(
+            datetime_read__gt=timezone.now() - timedelta(
+                seconds=CACHE_PARTITION_FILE_READER_TIMEOUT
+            ), reader_count__gt=0
+        )
 
     def get_total_size(self):
         """
@@ -113,6 +278,17 @@ class CacheBusinessLogicMixin:
         message='Current size of the cache.'
     )
 
+    def hits_decay(self):
+        """
+        Halve the hits of the files of the cache when using an aging
+        eviction policy.
+        """
+        if self.get_eviction_policy().is_aging:
+            queryset_files = self.get_files().filter(hits__gt=0)
+            queryset_files.update(
+                hits=F('hits') / 2
+            )
+
     @cached_property
     def label(self):
         defined_storage_class = self.get_defined_storage()
@@ -123,56 +299,48 @@ class CacheBusinessLogicMixin:
     def prune(self):
         """
         Deletes files until the total size of the cache is below the allowed
-        maximum size of the cache.
+        maximum size of the cache. The total size is calculated once and
+        the files to delete are selected in eviction order with a single
+        query per attempt.
         """
         failed_attempts = 0
         normal_attempts = 0
-        file_index = 0
+        exclude_pk_list = []
 
-        CachePartitionFile = apps.get_model(
-            app_label='file_caching', model_name='CachePartitionFile'
-        )
+        # Include the accesses recorded by this process in the eviction
+        # order.
+        CachePartitionFileAccessTracker.flush()
 
-        get_queryset_eviction = self.get_queryset_files_for_eviction()
+        total_size = self.get_total_size()
 
-        while self.get_total_size() >= self.maximum_size:
-            try:
-                cache_partition_file = get_queryset_eviction[
-                    file_index
-                ]
-            except IndexError:
-                # Attempted to get a file beyond what the queryset provided.
-                file_index = 0
-                get_queryset_eviction = self.get_queryset_files_for_eviction()
-            else:
-                try:
-                    cache_partition_file.delete()
-                except CachePartitionFile.DoesNotExist:
-                    # The file selected from deletion was deleted by another
-                    # process before the lock was acquired.
-                    file_index += 1
-                except LockError:
-                    logger.debug(
-                        'Lock error trying to delete file "%s" for '
-                        'prune. Skipping and attempting next file.',
-                        cache_partition_file
-                    )
-                    failed_attempts += 1
-                    file_index += 1
+        while total_size >= self.maximum_size:
+            eviction_plan = self.get_eviction_plan(
+                exclude_pk_list=exclude_pk_list,
+                size=total_size - self.maximum_size + 1
+            )
 
-                    if failed_attempts > setting_maximum_failed_prune_attempts.value:
-                        raise FileCachingException(
-                            'Too many cache prune attempts failed.'
-                        )
-                else:
-                    file_index = 0
-                    normal_attempts += 1
+            if not eviction_plan:
+                raise FileCachingException(
+                    'Unable to find cache files to prune.'
+                )
 
-                    if normal_attempts > setting_maximum_normal_prune_attempts.value:
-                        raise FileCachingException(
-                            'Too many cache prunes trying to create a '
-                            'single new file.'
-                        )
+            result = self.evict(cache_partition_files=eviction_plan)
+
+            total_size -= result['size']
+            exclude_pk_list.extend(result['failed_pk_list'])
+            failed_attempts += len(result['failed_pk_list'])
+            normal_attempts += 1
+
+            if failed_attempts > setting_maximum_failed_prune_attempts.value:
+                raise FileCachingException(
+                    'Too many cache prune attempts failed.'
+                )
+
+            if normal_attempts > setting_maximum_normal_prune_attempts.value:
+                raise FileCachingException(
+                    'Too many cache prunes trying to create a '
+                    'single new file.'
+                )
 
     @method_event(
         event=event_cache_purged,
@@ -224,8 +392,66 @@ class CachePartitionBusinessLogicMixin:
     def _lock_manager_get_lock_name(self, filename):
         return self.get_file_lock_name(filename=filename)
 
+    def _publish_file(self, filename, file_size, temporary_filename):
+        """
+        Move the completed temporary file to its final name and create the
+        database entry. Local storages use an atomic rename, other storages
+        fall back to a copy.
+        """
+        full_filename = self.get_full_filename(filename=filename)
+        storage_instance = self.cache.storage
+
+        try:
+            path = storage_instance.path(name=full_filename)
+            temporary_path = storage_instance.path(name=temporary_filename)
+        except NotImplementedError:
+            try:
+                storage_instance.delete(name=full_filename)
+            except Exception as exception:
+                """
+                Some S3 implementations like Google Cloud Storage throw
+                an error when attempting to delete a not existent file
+                key. Ignore this exception, any storage error of concern
+                will be triggered by the ``storage.save`` call below.
+                """
+                logger.debug(
+                    'cache.storage.delete exception: %s', exception
+                )
+
+            with storage_instance.open(mode='rb', name=temporary_filename) as file_object:
+                storage_instance.save(
+                    name=full_filename, content=file_object
+                )
+
+            storage_instance.delete(name=temporary_filename)
+        else:
+            os.makedirs(
+                os.path.dirname(path), exist_ok=True
+            )
+            os.replace(temporary_path, path)
+
+        CachePartitionFileMemoryCache.invalidate(
+            cache_partition_id=self.pk, filename=filename
+        )
+
+        try:
+            return self.files.create(file_size=file_size, filename=filename)
+        except Exception as exception:
+            logger.error(
+                'Unexpected exception while trying to save new '
+                'cache file; %s', exception, exc_info=True
+            )
+            storage_instance.delete(name=full_filename)
+            raise
+
     @contextmanager
     def create_file(self, filename):
+        """
+        Create a new cache partition file. The content is written to a
+        temporary name and the file is published by renaming it and
+        creating its database entry only when complete. Readers never see
+        partial files and do not need to acquire the lock.
+        """
         lock_name = self.get_file_lock_name(filename=filename)
         try:
             logger.debug('trying to acquire lock: %s', lock_name)
@@ -235,53 +461,48 @@ class CachePartitionBusinessLogicMixin:
             try:
                 self.cache.prune()
 
+                storage_instance = self.cache.storage
+
                 # Since open "wb+" doesn't create files, force the creation
                 # of an empty file.
-                try:
-                    self.cache.storage.delete(
-                        name=self.get_full_filename(filename=filename)
-                    )
-                except Exception as exception:
-                    """
-                    Some S3 implementations like Google Cloud Storage throw
-                    an error when attempting to delete a not existent file
-                    key. Ignore this exception, any storage error of concern
-                    will be triggered by the ``storage.save`` call below.
-                    """
-                    logger.debug(
-                        'cache.storage.delete exception: %s', exception
-                    )
-
-                self.cache.storage.save(
-                    name=self.get_full_filename(filename=filename),
-                    content=ContentFile(content=b'')
+                temporary_filename = storage_instance.save(
+                    name=CACHE_PARTITION_FILE_TEMPORARY_FILENAME_TEMPLATE.format(
+                        filename=self.get_full_filename(filename=filename),
+                        uuid=uuid.uuid4().hex
+                    ), content=ContentFile(content=b'')
                 )
 
-                partition_file = None
-
                 try:
-                    partition_file = self.files.create(filename=filename)
-                    yield partition_file._open_for_writing(
-                        _acquire_lock=False
+                    file_object = storage_instance.open(
+                        mode='wb', name=temporary_filename
+                    )
+                    try:
+                        yield file_object
+                    finally:
+                        file_object.close()
+
+                    file_size = storage_instance.size(
+                        name=temporary_filename
                     )
                 except Exception as exception:
                     logger.error(
                         'Unexpected exception while trying to save new '
                         'cache file; %s', exception, exc_info=True
                     )
-                    if partition_file:
-                        partition_file.delete(_acquire_lock=False)
-                    else:
-                        # If the CachePartitionFile entry was not created
-                        # do manual clean up of the empty storage file
-                        # created with the previous`self.cache.storage.save`.
-                        self.cache.storage.delete(
-                            name=self.get_full_filename(filename=filename)
-                        )
+                    storage_instance.delete(name=temporary_filename)
                     raise
                 else:
-                    partition_file.close(_acquire_lock=False)
-                    partition_file._update_size(_acquire_lock=False)
+                    if file_size > self.cache.maximum_size:
+                        storage_instance.delete(name=temporary_filename)
+                        raise FileCachingException(
+                            'Cache partition file {} is bigger than the '
+                            'maximum cache size.'.format(filename)
+                        )
+
+                    self._publish_file(
+                        filename=filename, file_size=file_size,
+                        temporary_filename=temporary_filename
+                    )
             finally:
                 lock.release()
         except LockError:
@@ -333,6 +554,11 @@ class CachePartitionBusinessLogicMixin:
     )
     def purge(self, user):
         self._event_actor = user
+
+        CachePartitionFileMemoryCache.invalidate_partition(
+            cache_partition_id=self.pk
+        )
+
         queryset_files = self.files.all()
 
         for parition_file in queryset_files:
@@ -351,43 +577,17 @@ class CachePartitionFileBusinessLogicMixin:
     def _lock_manager_get_lock_name(self, *args, **kwargs):
         return self.partition.get_file_lock_name(filename=self.filename)
 
-    @acquire_lock_class_method
-    def _open_for_writing(self):
-        """
-        Open the file for writing only. If the file is written to, the
-        .update_size() must be called.
-        """
-        try:
-            storage_instance = self.partition.cache.storage
-
-            self._storage_object = storage_instance.open(
-                mode='wb', name=self.full_filename
-            )
-            return self._storage_object
-        except Exception as exception:
-            logger.error(
-                'Unexpected exception opening the cache file; %s', exception,
-                exc_info=True
-            )
-            raise
+    def _reader_add(self):
+        self.__class__.objects.filter(pk=self.pk).update(
+            datetime_read=timezone.now(),
+            reader_count=F('reader_count') + 1
+        )
 
-    @locked_class_method
-    def _update_size(self):
-        """
-        Called after creation and initial write only.
-        """
-        storage_instance = self.partition.cache.storage
-        self.file_size = storage_instance.size(name=self.full_filename)
-        self.save(
-            update_fields=('file_size',)
+    def _reader_remove(self):
+        self.__class__.objects.filter(pk=self.pk, reader_count__gt=0).update(
+            reader_count=F('reader_count') - 1
         )
-        if self.file_size > self.partition.cache.maximum_size:
-            raise FileCachingException(
-                'Cache partition file %s is bigger than the maximum cache '
-                'size.'
-            )
 
-    @release_lock_class_method
     def close(self):
         if self._storage_object is not None:
             self._storage_object.close()
@@ -406,33 +606,44 @@ class CachePartitionFileBusinessLogicMixin:
     @contextmanager
     def open(self):
         """
-        Open the file for reading only.
+        Open the file for reading only. Files are immutable once published
+        and are read without acquiring the lock. The reader count of the
+        database row keeps any process from evicting the file while it is
+        read from the storage. Small files are served from the memory cache
+        when enabled and the cached content belongs to this database row.
         """
-        CachePartitionFile = apps.get_model(
-            app_label='file_caching', model_name='CachePartitionFile'
+        CachePartitionFileAccessTracker.record(
+            cache_partition_file_id=self.pk
         )
 
-        lock_name = self._lock_manager_get_lock_name()
-        try:
-            logger.debug('trying to acquire lock: %s', lock_name)
-            locking_backend_class = LockingBackend.get_backend()
-
-            self._lock = locking_backend_class.acquire_lock(name=lock_name)
+        content = CachePartitionFileMemoryCache.get(
+            cache_partition_file=self
+        )
 
-            queryset_partition_files = CachePartitionFile.objects.filter(
-                pk=self.pk
-            )
+        if content is not None:
+            yield BytesIO(content)
+            return
 
-            queryset_partition_files.update(
-                hits=F('hits') + 1
-            )
-            logger.debug('acquired lock: %s', lock_name)
-            self._storage_object = None
+        self._reader_add()
+        self._storage_object = None
+        try:
             try:
                 storage_instance = self.partition.cache.storage
                 self._storage_object = storage_instance.open(
                     mode='rb', name=self.full_filename
                 )
+
+                is_memory_cacheable = (
+                    CachePartitionFileMemoryCache.get_is_enabled()
+                ) and (
+                    self.file_size <= CachePartitionFileMemoryCache.get_maximum_file_size()
+                )
+
+                if is_memory_cacheable:
+                    content = self._storage_object.read()
+                    CachePartitionFileMemoryCache.set(
+                        cache_partition_file=self, content=content
+                    )
             except Exception as exception:
                 logger.error(
                     'Unexpected exception opening the cache file; %s',
@@ -440,10 +651,11 @@ class CachePartitionFileBusinessLogicMixin:
                 )
                 raise
             else:
-                yield self._storage_object
+                if is_memory_cacheable:
+                    yield BytesIO(content)
+                else:
+                    yield self._storage_object
             finally:
-                self.close(_acquire_lock=False)
-                self._lock.release()
-        except LockError:
-            logger.debug('unable to obtain lock: %s', lock_name)
-            raise
+                self.close()
+        finally:
+            self._reader_remove()
@@ -1,6 +1,7 @@
 from django.core import validators
 from django.db import models
 from django.urls import reverse
+from django.utils.timezone import now
 from django.utils.translation import gettext_lazy as _
 
 from mayan.apps.databases.model_mixins import ValueChangeModelMixin
@@ -8,6 +9,7 @@ from mayan.apps.events.decorators import method_event
 from mayan.apps.events.event_managers import EventManagerSave
 from mayan.apps.lock_manager.decorators import locked_class_method
 
+from .classes import CachePartitionFileMemoryCache
 from .events import event_cache_created, event_cache_edited
 from .model_mixins import (
     CacheBusinessLogicMixin, CachePartitionBusinessLogicMixin,
@@ -107,6 +109,12 @@ class CachePartitionFile(CachePartitionFileBusinessLogicMixin, models.Model):
     datetime = models.DateTimeField(
         auto_now_add=True, db_index=True, verbose_name=_(message='Date time')
     )
+    datetime_accessed = models.DateTimeField(
+        db_index=True, default=now, help_text=_(
+            message='Date and time this cache partition file was last '
+            'accessed.'
+        ), verbose_name=_(message='Date time accessed')
+    )
     filename = models.CharField(
         max_length=255, verbose_name=_(message='Filename')
     )
@@ -118,6 +126,18 @@ class CachePartitionFile(CachePartitionFileBusinessLogicMixin, models.Model):
             message='Times this cache partition file has been accessed.'
         ), verbose_name='Hits'
     )
+    datetime_read = models.DateTimeField(
+        blank=True, help_text=_(
+            message='Date and time this cache partition file was last '
+            'opened from the storage.'
+        ), null=True, verbose_name=_(message='Date time read')
+    )
+    reader_count = models.PositiveIntegerField(
+        default=0, help_text=_(
+            message='Number of readers of this cache partition file. Files '
+            'being read are not evicted.'
+        ), verbose_name=_(message='Reader count')
+    )
 
     class Meta:
         get_latest_by = 'datetime'
@@ -127,6 +147,9 @@ class CachePartitionFile(CachePartitionFileBusinessLogicMixin, models.Model):
 
     @locked_class_method
     def delete(self, *args, **kwargs):
+        CachePartitionFileMemoryCache.invalidate(
+            cache_partition_id=self.partition_id, filename=self.filename
+        )
         storage_instance = self.partition.cache.storage
         storage_instance.delete(name=self.full_filename)
         return super().delete(*args, **kwargs)
@@ -1,11 +1,19 @@
+from datetime import timedelta
+
 from django.utils.translation import gettext_lazy as _
 
 from mayan.apps.task_manager.classes import CeleryQueue
 from mayan.apps.task_manager.workers import worker_b, worker_c
 
+from .settings import setting_task_hits_decay_interval
+
 queue_file_caching = CeleryQueue(
     name='file_caching', label=_(message='File caching'), worker=worker_b
 )
+queue_file_caching_periodic = CeleryQueue(
+    name='file_caching_periodic', label=_(message='File caching periodic'),
+    transient=True, worker=worker_c
+)
 queue_file_caching_slow = CeleryQueue(
     name='file_caching_slow', label=_(message='File caching slow'), worker=worker_c
 )
@@ -15,6 +23,14 @@ queue_file_caching.add_task_type(
     label=_(message='Purge a file cache partition')
 )
 
+queue_file_caching_periodic.add_task_type(
+    dotted_path='mayan.apps.file_caching.tasks.task_cache_hits_decay',
+    label=_(message='Decay the hits of the cache files'),
+    name='task_cache_hits_decay', schedule=timedelta(
+        seconds=setting_task_hits_decay_interval.value
+    )
+)
+
 queue_file_caching_slow.add_task_type(
     dotted_path='mayan.apps.file_caching.tasks.task_cache_purge',
     label=_(message='Purge a file cache')
@@ -3,14 +3,51 @@ from django.utils.translation import gettext_lazy as _
 from mayan.apps.smart_settings.settings import setting_cluster
 
 from .literals import (
+    DEFAULT_ACCESS_FLUSH_INTERVAL, DEFAULT_ACCESS_FLUSH_SIZE,
+    DEFAULT_EVICTION_POLICIES, DEFAULT_EVICTION_POLICY,
     DEFAULT_MAXIMUM_FAILED_PRUNE_ATTEMPTS,
-    DEFAULT_MAXIMUM_NORMAL_PRUNE_ATTEMPTS
+    DEFAULT_MAXIMUM_NORMAL_PRUNE_ATTEMPTS,
+    DEFAULT_MEMORY_CACHE_MAXIMUM_FILE_SIZE,
+    DEFAULT_MEMORY_CACHE_MAXIMUM_SIZE, DEFAULT_TASK_HITS_DECAY_INTERVAL
 )
 
 setting_namespace = setting_cluster.do_namespace_add(
     label=_(message='File caching'), name='file_caching'
 )
 
+setting_access_flush_interval = setting_namespace.do_setting_add(
+    default=DEFAULT_ACCESS_FLUSH_INTERVAL,
+    global_name='FILE_CACHING_ACCESS_FLUSH_INTERVAL', help_text=_(
+        message='Time in seconds after which the cache file accesses '
+        'recorded by a process are written to the database.'
+    )
+)
+setting_access_flush_size = setting_namespace.do_setting_add(
+    default=DEFAULT_ACCESS_FLUSH_SIZE,
+    global_name='FILE_CACHING_ACCESS_FLUSH_SIZE', help_text=_(
+        message='Number of distinct cache files accessed by a process '
+        'after which the recorded accesses are written to the database.'
+    )
+)
+setting_eviction_policies = setting_namespace.do_setting_add(
+    default=DEFAULT_EVICTION_POLICIES,
+    global_name='FILE_CACHING_EVICTION_POLICIES', help_text=_(
+        message='Dictionary of defined storage names and the eviction '
+        'policy to use for their cache. Caches not listed use the '
+        'FILE_CACHING_EVICTION_POLICY. Available policies: "gdsf", "lfu", '
+        '"lfu_aging", "lru".'
+    )
+)
+setting_eviction_policy = setting_namespace.do_setting_add(
+    default=DEFAULT_EVICTION_POLICY,
+    global_name='FILE_CACHING_EVICTION_POLICY', help_text=_(
+        message='Default policy used to select the cache files to delete '
+        'when a cache is full. Available policies: "gdsf" (greedy dual '
+        'size frequency), "lfu" (least frequently used), "lfu_aging" '
+        '(least frequently used with periodic decay), "lru" (least '
+        'recently used).'
+    )
+)
 setting_maximum_failed_prune_attempts = setting_namespace.do_setting_add(
     default=DEFAULT_MAXIMUM_FAILED_PRUNE_ATTEMPTS,
     global_name='FILE_CACHING_MAXIMUM_FAILED_PRUNE_ATTEMPTS', help_text=_(
@@ -26,3 +63,26 @@ setting_maximum_normal_prune_attempts = setting_namespace.do_setting_add(
         'space for new a file being requested, before giving up.'
     )
 )
+setting_memory_cache_maximum_file_size = setting_namespace.do_setting_add(
+    default=DEFAULT_MEMORY_CACHE_MAXIMUM_FILE_SIZE,
+    global_name='FILE_CACHING_MEMORY_CACHE_MAXIMUM_FILE_SIZE', help_text=_(
+        message='Size in bytes of the largest cache file that will be kept '
+        'in the memory cache of each process.'
+    )
+)
+setting_memory_cache_maximum_size = setting_namespace.do_setting_add(
+    default=DEFAULT_MEMORY_CACHE_MAXIMUM_SIZE,
+    global_name='FILE_CACHING_MEMORY_CACHE_MAXIMUM_SIZE', help_text=_(
+        message='Size in bytes of the memory cache of each process. '
+        'Frequently read cache files are served from memory without '
+        'accessing the database or the storage. Use 0 to disable the '
+        'memory cache.'
+    )
+)
+setting_task_hits_decay_interval = setting_namespace.do_setting_add(
+    default=DEFAULT_TASK_HITS_DECAY_INTERVAL,
+    global_name='FILE_CACHING_TASK_HITS_DECAY_INTERVAL', help_text=_(
+        message='Interval in seconds at which the hit count of the files '
+        'of caches using an aging eviction policy is halved.'
+    )
+)
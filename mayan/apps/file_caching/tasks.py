@@ -9,6 +9,20 @@ from mayan.celery import app
 logger = logging.getLogger(name=__name__)
 
 
+@app.task(ignore_result=True)
+def task_cache_hits_decay():
+    Cache = apps.get_model(
+        app_label='file_caching', model_name='Cache'
+    )
+
+    logger.info('Starting cache hits decay')
+
+    for cache in Cache.objects.all():
+        cache.hits_decay()
+
+    logger.info('Finished cache hits decay')
+
+
 @app.task(bind=True, ignore_result=True)
 def task_cache_partition_purge(
     self, cache_partition_id, content_type_id=None, object_id=None,
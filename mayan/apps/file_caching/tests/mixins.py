@@ -3,6 +3,7 @@ from django.utils.encoding import force_bytes
 from mayan.apps.storage.classes import DefinedStorage
 from mayan.apps.storage.utils import fs_cleanup, mkdtemp
 
+from ..classes import CachePartitionFileMemoryCache
 from ..models import Cache
 from ..tasks import task_cache_partition_purge, task_cache_purge
 
@@ -47,6 +48,7 @@ class CacheTestMixin:
                     self._create_test_cache_partition_file()
 
     def tearDown(self):
+        CachePartitionFileMemoryCache.clear()
         fs_cleanup(filename=self.temporary_directory)
         super().tearDown()
 
@@ -1,13 +1,27 @@
+from datetime import timedelta
 from unittest import mock
 
+from celery.signals import task_postrun
+
+from django.core.files.base import ContentFile
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
 from mayan.apps.lock_manager.exceptions import LockError
 from mayan.apps.testing.tests.base import BaseTestCase
 
+from ..classes import (
+    CacheEvictionPolicyGDSF, CacheEvictionPolicyLFUAging,
+    CacheEvictionPolicyLRU, CachePartitionFileAccessTracker,
+    CachePartitionFileMemoryCache
+)
 from ..events import (
     event_cache_created, event_cache_edited, event_cache_partition_purged,
     event_cache_purged
 )
 from ..exceptions import FileCachingException
+from ..literals import CACHE_PARTITION_FILE_READER_TIMEOUT
 from ..models import CachePartitionFile
 
 from .literals import TEST_CACHE_PARTITION_FILE_FILENAME
@@ -147,6 +161,44 @@ class CacheModelTestCase(CacheTestMixin, BaseTestCase):
         events = self._get_test_events()
         self.assertEqual(events.count(), 0)
 
+    @mock.patch(
+        'mayan.apps.file_caching.models.Cache.get_eviction_policy',
+        return_value=CacheEvictionPolicyGDSF
+    )
+    def test_cache_partition_file_gdsf_eviction(
+        self, mock_get_eviction_policy_method
+    ):
+        self._create_test_cache(
+            extra_data={
+                'maximum_size': 4
+            }
+        )
+
+        self._create_test_cache_partition()
+        self._create_test_cache_partition_file(file_size=3)
+        self._create_test_cache_partition_file(file_size=1)
+
+        self._clear_events()
+
+        with self._test_cache_partition_file_list[0].open():
+            """Do nothing"""
+
+        with self._test_cache_partition_file_list[1].open():
+            """Do nothing"""
+
+        self._create_test_cache_partition_file(file_size=1)
+
+        # Same hits but larger was purged.
+        self.assertTrue(
+            self._test_cache_partition_file_list[0] not in CachePartitionFile.objects.all()
+        )
+        self.assertTrue(
+            self._test_cache_partition_file_list[1] in CachePartitionFile.objects.all()
+        )
+
+        events = self._get_test_events()
+        self.assertEqual(events.count(), 0)
+
     def test_cache_partition_file_hits(self):
         self._create_test_cache()
         self._create_test_cache_partition()
@@ -159,6 +211,74 @@ class CacheModelTestCase(CacheTestMixin, BaseTestCase):
         with self._test_cache_partition_file.open():
             """Do nothing"""
 
+        CachePartitionFileAccessTracker.flush()
+        self._test_cache_partition_file.refresh_from_db()
+
+        self.assertEqual(
+            self._test_cache_partition_file.hits,
+            cache_partition_file_hits + 1
+        )
+
+        events = self._get_test_events()
+        self.assertEqual(events.count(), 0)
+
+    def test_cache_partition_file_hits_flush_multiple(self):
+        self._create_test_cache()
+        self._create_test_cache_partition()
+        self._create_test_cache_partition_file()
+        self._create_test_cache_partition_file()
+
+        CachePartitionFileAccessTracker.flush()
+
+        self._clear_events()
+
+        for test_cache_partition_file in self._test_cache_partition_file_list:
+            test_cache_partition_file.refresh_from_db()
+
+        test_cache_partition_file_hits_list = [
+            test_cache_partition_file.hits for test_cache_partition_file in self._test_cache_partition_file_list
+        ]
+
+        with self._test_cache_partition_file_list[0].open():
+            """Do nothing"""
+
+        for count in range(2):
+            with self._test_cache_partition_file_list[1].open():
+                """Do nothing"""
+
+        with CaptureQueriesContext(connection=connection) as queries:
+            CachePartitionFileAccessTracker.flush()
+
+        update_queries = [
+            query for query in queries.captured_queries if query[
+                'sql'
+            ].startswith('UPDATE')
+        ]
+        self.assertEqual(len(update_queries), 1)
+
+        for index, test_cache_partition_file in enumerate(self._test_cache_partition_file_list):
+            test_cache_partition_file.refresh_from_db()
+            self.assertEqual(
+                test_cache_partition_file.hits,
+                test_cache_partition_file_hits_list[index] + index + 1
+            )
+
+        events = self._get_test_events()
+        self.assertEqual(events.count(), 0)
+
+    def test_cache_partition_file_hits_flush_on_task_postrun(self):
+        self._create_test_cache()
+        self._create_test_cache_partition()
+        self._create_test_cache_partition_file()
+
+        cache_partition_file_hits = self._test_cache_partition_file.hits
+
+        self._clear_events()
+
+        with self._test_cache_partition_file.open():
+            """Do nothing"""
+
+        task_postrun.send(sender=None)
         self._test_cache_partition_file.refresh_from_db()
 
         self.assertEqual(
@@ -169,6 +289,60 @@ class CacheModelTestCase(CacheTestMixin, BaseTestCase):
         events = self._get_test_events()
         self.assertEqual(events.count(), 0)
 
+    def test_cache_partition_file_hits_flush_empty(self):
+        self._clear_events()
+
+        with mock.patch(
+            'mayan.apps.file_caching.classes.apps.get_model'
+        ) as mock_get_model:
+            CachePartitionFileAccessTracker.flush()
+
+        self.assertFalse(mock_get_model.called)
+
+        events = self._get_test_events()
+        self.assertEqual(events.count(), 0)
+
+    @mock.patch(
+        'mayan.apps.file_caching.models.Cache.get_eviction_policy',
+        return_value=CacheEvictionPolicyLRU
+    )
+    def test_cache_partition_file_lru_access_eviction(
+        self, mock_get_eviction_policy_method
+    ):
+        self._create_test_cache(
+            extra_data={
+                'maximum_size': 2
+            }
+        )
+
+        self._create_test_cache_partition()
+        self._create_test_cache_partition_file(file_size=1)
+        self._create_test_cache_partition_file(file_size=1)
+
+        self._clear_events()
+
+        with self._test_cache_partition_file_list[1].open():
+            """Do nothing"""
+
+        with self._test_cache_partition_file_list[1].open():
+            """Do nothing"""
+
+        with self._test_cache_partition_file_list[0].open():
+            """Do nothing"""
+
+        self._create_test_cache_partition_file(file_size=1)
+
+        # Fewer hits but most recently accessed was kept.
+        self.assertTrue(
+            self._test_cache_partition_file_list[0] in CachePartitionFile.objects.all()
+        )
+        self.assertTrue(
+            self._test_cache_partition_file_list[1] not in CachePartitionFile.objects.all()
+        )
+
+        events = self._get_test_events()
+        self.assertEqual(events.count(), 0)
+
     def test_cache_partition_file_lru_eviction(self):
         self._create_test_cache(
             extra_data={
@@ -247,21 +421,139 @@ class CacheModelTestCase(CacheTestMixin, BaseTestCase):
         self.assertEqual(events[1].target, self._test_cache)
         self.assertEqual(events[1].verb, event_cache_edited.id)
 
-    def test_cache_partition_file_context_manager_locking(self):
+    def test_cache_partition_file_context_manager_no_locking(self):
         self._create_test_cache()
         self._create_test_cache_partition()
         self._create_test_cache_partition_file()
 
         self._clear_events()
 
+        with self._test_cache_partition_file.open() as file_object_1:
+            with self._test_cache_partition_file.open() as file_object_2:
+                self.assertEqual(file_object_1.read(), file_object_2.read())
+
+        events = self._get_test_events()
+        self.assertEqual(events.count(), 0)
+
+    def test_cache_partition_file_context_manager_reader_count(self):
+        self._create_test_cache()
+        self._create_test_cache_partition()
+        self._create_test_cache_partition_file()
+
         with self._test_cache_partition_file.open():
+            with self._test_cache_partition_file.open():
+                self._test_cache_partition_file.refresh_from_db()
+                self.assertEqual(
+                    self._test_cache_partition_file.reader_count, 2
+                )
+
+        self._test_cache_partition_file.refresh_from_db()
+        self.assertEqual(self._test_cache_partition_file.reader_count, 0)
+        self.assertNotEqual(self._test_cache_partition_file.datetime_read, None)
+
+    def test_cache_partition_file_evict_reader(self):
+        self._create_test_cache()
+        self._create_test_cache_partition()
+        self._create_test_cache_partition_file()
+
+        # Opened by another process.
+        CachePartitionFile.objects.filter(
+            pk=self._test_cache_partition_file.pk
+        ).update(datetime_read=timezone.now(), reader_count=1)
+
+        result = self._test_cache.evict(
+            cache_partition_files=(self._test_cache_partition_file,)
+        )
+
+        self.assertEqual(
+            result['failed_pk_list'], [self._test_cache_partition_file.pk]
+        )
+        self.assertEqual(result['size'], 0)
+        self.assertTrue(
+            self._test_cache.storage.exists(
+                name=self._test_cache_partition_file.full_filename
+            )
+        )
+        self.assertEqual(
+            self._test_cache.get_eviction_plan(size=1), []
+        )
+
+    def test_cache_partition_file_evict_reader_timeout(self):
+        self._create_test_cache()
+        self._create_test_cache_partition()
+        self._create_test_cache_partition_file()
+
+        # Left by a process that stopped while reading.
+        CachePartitionFile.objects.filter(
+            pk=self._test_cache_partition_file.pk
+        ).update(
+            datetime_read=timezone.now() - timedelta(
+                seconds=CACHE_PARTITION_FILE_READER_TIMEOUT + 1
+            ), reader_count=1
+        )
+
+        result = self._test_cache.evict(
+            cache_partition_files=(self._test_cache_partition_file,)
+        )
+
+        self.assertEqual(result['failed_pk_list'], [])
+        self.assertFalse(
+            CachePartitionFile.objects.filter(
+                pk=self._test_cache_partition_file.pk
+            ).exists()
+        )
+
+    def test_cache_partition_file_create_locking(self):
+        self._create_test_cache()
+        self._create_test_cache_partition()
+
+        self._clear_events()
+
+        with self._test_cache_partition.create_file(filename=TEST_CACHE_PARTITION_FILE_FILENAME):
             with self.assertRaises(expected_exception=LockError):
-                with self._test_cache_partition_file.open():
+                with self._test_cache_partition.create_file(filename=TEST_CACHE_PARTITION_FILE_FILENAME):
                     """Trigger LockError."""
 
         events = self._get_test_events()
         self.assertEqual(events.count(), 0)
 
+    def test_cache_partition_file_create_publication(self):
+        self._create_test_cache()
+        self._create_test_cache_partition()
+
+        self._clear_events()
+
+        full_filename = self._test_cache_partition.get_full_filename(
+            filename=TEST_CACHE_PARTITION_FILE_FILENAME
+        )
+
+        with self._test_cache_partition.create_file(filename=TEST_CACHE_PARTITION_FILE_FILENAME) as file_object:
+            file_object.write(b'test')
+
+            self.assertFalse(
+                self._test_cache_partition.files.filter(
+                    filename=TEST_CACHE_PARTITION_FILE_FILENAME
+                ).exists()
+            )
+            self.assertFalse(
+                self._test_cache.storage.exists(name=full_filename)
+            )
+
+        cache_partition_file = self._test_cache_partition.get_file(
+            filename=TEST_CACHE_PARTITION_FILE_FILENAME
+        )
+        self.assertEqual(cache_partition_file.file_size, 4)
+
+        with cache_partition_file.open() as file_object:
+            self.assertEqual(file_object.read(), b'test')
+
+        self.assertEqual(
+            self._test_cache.storage.listdir(path='')[1], [full_filename]
+        )
+
+        events = self._get_test_events()
+        self.assertEqual(events.count(), 0)
+
     def test_incremental_file_index_cache_prune(self):
         self._create_test_cache(
             extra_data={
@@ -279,7 +571,7 @@ class CacheModelTestCase(CacheTestMixin, BaseTestCase):
             """Increase hits of file #1"""
 
         with self._test_cache_partition_file_list[0].open():
-            """Lock and increase hits of file #0"""
+            """Read and increase hits of file #0"""
             self._create_test_cache_partition_file(file_size=1)
 
         self.assertTrue(
@@ -295,6 +587,113 @@ class CacheModelTestCase(CacheTestMixin, BaseTestCase):
         events = self._get_test_events()
         self.assertEqual(events.count(), 0)
 
+    def test_method_get_eviction_plan(self):
+        self._create_test_cache(
+            extra_data={
+                'maximum_size': 4
+            }
+        )
+
+        self._create_test_cache_partition()
+        self._create_test_cache_partition_file(file_size=1)
+        self._create_test_cache_partition_file(file_size=1)
+        self._create_test_cache_partition_file(file_size=1)
+
+        self._clear_events()
+
+        eviction_plan = self._test_cache.get_eviction_plan(size=2)
+
+        self.assertEqual(
+            eviction_plan, self._test_cache_partition_file_list[0:2]
+        )
+
+        eviction_plan = self._test_cache.get_eviction_plan(
+            exclude_pk_list=(self._test_cache_partition_file_list[0].pk,),
+            size=2
+        )
+
+        self.assertEqual(
+            eviction_plan, self._test_cache_partition_file_list[1:3]
+        )
+
+        events = self._get_test_events()
+        self.assertEqual(events.count(), 0)
+
+    @mock.patch(
+        'mayan.apps.file_caching.models.Cache.get_eviction_policy',
+        return_value=CacheEvictionPolicyLFUAging
+    )
+    def test_method_hits_decay(self, mock_get_eviction_policy_method):
+        self._create_test_cache()
+        self._create_test_cache_partition()
+        self._create_test_cache_partition_file()
+
+        for index in range(4):
+            with self._test_cache_partition_file.open():
+                """Do nothing"""
+
+        CachePartitionFileAccessTracker.flush()
+
+        self._clear_events()
+
+        self._test_cache.hits_decay()
+
+        self._test_cache_partition_file.refresh_from_db()
+        self.assertEqual(self._test_cache_partition_file.hits, 2)
+
+        events = self._get_test_events()
+        self.assertEqual(events.count(), 0)
+
+    def test_method_hits_decay_no_aging(self):
+        self._create_test_cache()
+        self._create_test_cache_partition()
+        self._create_test_cache_partition_file()
+
+        for index in range(4):
+            with self._test_cache_partition_file.open():
+                """Do nothing"""
+
+        CachePartitionFileAccessTracker.flush()
+
+        self._clear_events()
+
+        self._test_cache.hits_decay()
+
+        self._test_cache_partition_file.refresh_from_db()
+        self.assertEqual(self._test_cache_partition_file.hits, 4)
+
+        events = self._get_test_events()
+        self.assertEqual(events.count(), 0)
+
+    def test_prune_multiple_files(self):
+        self._create_test_cache(
+            extra_data={
+                'maximum_size': 5
+            }
+        )
+
+        self._create_test_cache_partition()
+        self._create_test_cache_partition_file(file_size=1)
+        self._create_test_cache_partition_file(file_size=1)
+        self._create_test_cache_partition_file(file_size=1)
+        self._create_test_cache_partition_file(file_size=1)
+
+        self._test_cache.maximum_size = 2
+        self._test_cache.save()
+
+        self.assertEqual(self._test_cache.get_total_size(), 1)
+        self.assertEqual(
+            list(CachePartitionFile.objects.all()),
+            self._test_cache_partition_file_list[3:]
+        )
+
+        for cache_partition_file in self._test_cache_partition_file_list[0:3]:
+            self.assertFalse(
+                self._test_cache.storage.exists(
+                    name=cache_partition_file.full_filename
+                )
+            )
+
     def test_purge_on_error(self):
         self._silence_logger(name='mayan.apps.file_caching.model_mixins')
 
@@ -337,6 +736,153 @@ class CacheModelTestCase(CacheTestMixin, BaseTestCase):
         self.assertEqual(events[1].verb, event_cache_purged.id)
 
 
+@mock.patch(
+    'mayan.apps.file_caching.classes.CachePartitionFileMemoryCache.get_maximum_size',
+    return_value=1024
+)
+class CachePartitionFileMemoryCacheTestCase(CacheTestMixin, BaseTestCase):
+    auto_create_test_cache = True
+    auto_create_test_cache_partition = True
+
+    def setUp(self):
+        super().setUp()
+        self._create_test_cache_partition_file(file_size=16)
+
+    def _read_test_cache_partition_file(self):
+        cache_partition_file = self._test_cache_partition.get_file(
+            filename=self._test_cache_partition_file.filename
+        )
+
+        with cache_partition_file.open() as file_object:
+            return file_object.read()
+
+    def test_memory_cache_hit(self, mock_get_maximum_size):
+        content = self._read_test_cache_partition_file()
+        CachePartitionFileAccessTracker.flush()
+
+        self._clear_events()
+
+        # Only the query validating the file row.
+        with self.assertNumQueries(num=1):
+            self.assertEqual(
+                self._read_test_cache_partition_file(), content
+            )
+
+        events = self._get_test_events()
+        self.assertEqual(events.count(), 0)
+
+    def test_memory_cache_invalidation_on_delete(
+        self, mock_get_maximum_size
+    ):
+        self._read_test_cache_partition_file()
+
+        self._clear_events()
+
+        self._test_cache_partition_file.delete()
+
+        with self.assertRaises(expected_exception=CachePartitionFile.DoesNotExist):
+            self._read_test_cache_partition_file()
+
+        events = self._get_test_events()
+        self.assertEqual(events.count(), 0)
+
+    def test_memory_cache_invalidation_on_external_delete(
+        self, mock_get_maximum_size
+    ):
+        self._read_test_cache_partition_file()
+
+        self._clear_events()
+
+        # Deleted by another process, the local memory cache is not
+        # invalidated.
+        CachePartitionFile.objects.filter(
+            pk=self._test_cache_partition_file.pk
+        ).delete()
+
+        with self.assertRaises(expected_exception=CachePartitionFile.DoesNotExist):
+            self._read_test_cache_partition_file()
+
+        events = self._get_test_events()
+        self.assertEqual(events.count(), 0)
+
+    def test_memory_cache_invalidation_on_external_regenerate(
+        self, mock_get_maximum_size
+    ):
+        self._read_test_cache_partition_file()
+
+        self._clear_events()
+
+        # Deleted and created again by another process, the local memory
+        # cache is not invalidated.
+        test_content = b'0123456789'
+        CachePartitionFile.objects.filter(
+            pk=self._test_cache_partition_file.pk
+        ).delete()
+        storage_instance = self._test_cache.storage
+        storage_instance.delete(
+            name=self._test_cache_partition_file.full_filename
+        )
+        storage_instance.save(
+            content=ContentFile(content=test_content),
+            name=self._test_cache_partition_file.full_filename
+        )
+        self._test_cache_partition.files.create(
+            file_size=len(test_content),
+            filename=self._test_cache_partition_file.filename
+        )
+
+        self.assertEqual(
+            self._read_test_cache_partition_file(), test_content
+        )
+
+        events = self._get_test_events()
+        self.assertEqual(events.count(), 0)
+
+    def test_memory_cache_invalidation_on_purge(
+        self, mock_get_maximum_size
+    ):
+        self._read_test_cache_partition_file()
+
+        self._clear_events()
+
+        self._test_cache_partition.purge(user=self._test_case_user)
+
+        self.assertEqual(
+            CachePartitionFileMemoryCache.get(
+                cache_partition_file=self._test_cache_partition_file
+            ), None
+        )
+
+        events = self._get_test_events()
+        self.assertEqual(events.count(), 1)
+
+    def test_memory_cache_size_limit(self, mock_get_maximum_size):
+        mock_get_maximum_size.return_value = self._test_cache_partition_file.file_size
+
+        self._create_test_cache_partition_file(file_size=16)
+        test_cache_partition_files = self._test_cache_partition_file_list
+
+        for cache_partition_file in test_cache_partition_files:
+            with cache_partition_file.open():
+                """Do nothing"""
+
+        self._clear_events()
+
+        self.assertEqual(
+            CachePartitionFileMemoryCache.get(
+                cache_partition_file=test_cache_partition_files[0]
+            ), None
+        )
+        self.assertNotEqual(
+            CachePartitionFileMemoryCache.get(
+                cache_partition_file=test_cache_partition_files[1]
+            ), None
+        )
+
+        events = self._get_test_events()
+        self.assertEqual(events.count(), 0)
+
+
 class CachePartitionModelTestCase(CacheTestMixin, BaseTestCase):
     def test_cache_create(self):
         self._create_test_cache()
@@ -5,7 +5,7 @@ from django.core.exceptions import ImproperlyConfigured
 from django.template import RequestContext, Variable, VariableDoesNotExist
 
 from .class_mixins import TemplateObjectMixin
-from .links import ResolvedLink
+from .links import Link, ResolvedLink
 from .utils import get_current_view_name
 
 logger = logging.getLogger(name=__name__)
@@ -132,6 +132,39 @@ class Menu(TemplateObjectMixin):
 
         return matched_links
 
+    def get_link_permissions(self, source):
+        """
+        Return the permissions of the links of the menu that are checked
+        against the source object itself. Used to check the access to the
+        objects of a list in bulk before resolving the menu for each one.
+        """
+        result = set()
+
+        navigation_object_class = self.get_navigation_object_class(
+            resolved_navigation_object=source
+        )
+
+        if self.cache_class_associations:
+            matched_links = self.get_links_for_class_cached(
+                resolved_navigation_object_class=navigation_object_class
+            )
+        else:
+            matched_links = self.get_links_for_class_non_cached(
+                resolved_navigation_object_class=navigation_object_class
+            )
+
+        for link in matched_links:
+            is_permission_object_source = isinstance(link, Link) and (
+                type(link).get_permission is Link.get_permission
+            ) and (
+                type(link).get_permission_object is Link.get_permission_object
+            )
+
+            if is_permission_object_source and link._permission:
+                result.add(link._permission)
+
+        return result
+
     @cache
     def get_links_for_class_cached(self, resolved_navigation_object_class):
         return self.get_links_for_class_non_cached(
@@ -1,19 +1,30 @@
 import logging
 import os
+import shutil
+import threading
 
 import sh
 
+from django.utils.encoding import force_str
 from django.utils.translation import gettext_lazy as _
 
+from mayan.apps.storage.utils import TemporaryDirectory
+
 from ..classes import OCRBackendBase
 from ..exceptions import OCRError
 
-from .literals import DEFAULT_TESSERACT_BINARY_PATH, DEFAULT_TESSERACT_TIMEOUT
+from .literals import (
+    DEFAULT_TESSERACT_BINARY_PATH, DEFAULT_TESSERACT_TIMEOUT,
+    TESSERACT_FILE_LIST_FILENAME, TESSERACT_PAGE_SEPARATOR
+)
 
 logger = logging.getLogger(name=__name__)
 
 
 class Tesseract(OCRBackendBase):
+    _initialize_cache = {}
+    _initialize_cache_lock = threading.Lock()
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.read_settings()
@@ -21,62 +32,127 @@ class Tesseract(OCRBackendBase):
         if kwargs.get('auto_initialize', True):
             self.initialize()
 
-    def _execute(self, image_file_object):
-        """
-        Execute the command line binary of tesseract.
-        """
-        if self.command_tesseract:
-            arguments = ['-', '-']
+    def _call_tesseract(self, arguments, language=None, **kwargs):
+        keyword_arguments = {
+            '_timeout': self.command_timeout
+        }
+        keyword_arguments.update(kwargs)
 
-            keyword_arguments = {
-                '_in': image_file_object,
-                '_timeout': self.command_timeout
-            }
+        if language:
+            keyword_arguments['l'] = language
 
-            if self.language:
-                keyword_arguments['l'] = self.language
+        environment = os.environ.copy()
+        environment.update(self.command_environment)
+        keyword_arguments['_env'] = environment
 
-            environment = os.environ.copy()
-            environment.update(self.command_environment)
-            keyword_arguments['_env'] = environment
+        arguments = list(arguments)
+        arguments.extend(self.tesseract_arguments_extra)
 
-            arguments.extend(self.tesseract_arguments_extra)
+        logger.debug(
+            'Calling Tesseract with arguments %s, %s', arguments,
+            keyword_arguments
+        )
 
-            logger.debug(
-                'Calling Tesseract with arguments %s, %s', arguments,
-                keyword_arguments
+        try:
+            return self.command_tesseract(*arguments, **keyword_arguments)
+        except Exception as exception:
+            error_message_list = []
+            error_message_list.append(
+                'Exception calling Tesseract with language option: {}; {}'.format(
+                    language, exception
+                )
             )
 
-            try:
-                output = self.command_tesseract(
-                    *arguments, **keyword_arguments
-                )
-            except Exception as exception:
-                error_message_list = []
+            if language not in self.languages:
                 error_message_list.append(
-                    'Exception calling Tesseract with language option: {}; {}'.format(
-                        self.language, exception
+                    'The requested OCR language "{}" is not '
+                    'available and needs to be installed.'.format(
+                        language
                     )
                 )
 
-                if self.language not in self.languages:
-                    error_message_list.append(
-                        'The requested OCR language "{}" is not '
-                        'available and needs to be installed.'.format(
-                            self.language
-                        )
-                    )
+            error_message = '/n'.join(error_message_list)
 
-                error_message = '/n'.join(error_message_list)
+            logger.error(error_message, exc_info=True)
+            raise OCRError(error_message)
 
-                logger.error(error_message, exc_info=True)
-                raise OCRError(error_message)
-            else:
-                return output
+    def _execute(self, image_file_object, language=None):
+        """
+        Execute the command line binary of tesseract.
+        """
+        if self.command_tesseract:
+            return self._call_tesseract(
+                arguments=('-', '-'), language=language,
+                _in=image_file_object
+            )
         else:
             return ''
 
+    def _execute_many(self, image_file_objects, language=None):
+        """
+        Pass all the images to a single Tesseract execution using a file
+        list. Tesseract terminates the text of each image with a form feed
+        which is used to split the output.
+        """
+        if len(image_file_objects) < 2:
+            return super()._execute_many(
+                image_file_objects=image_file_objects, language=language
+            )
+
+        if not self.command_tesseract:
+            return [''] * len(image_file_objects)
+
+        with TemporaryDirectory() as temporary_directory:
+            image_path_list = []
+            for index, image_file_object in enumerate(image_file_objects):
+                image_path = os.path.join(
+                    temporary_directory, '{}.png'.format(index)
+                )
+                with open(file=image_path, mode='wb') as file_object:
+                    shutil.copyfileobj(
+                        fsrc=image_file_object, fdst=file_object
+                    )
+                image_path_list.append(image_path)
+
+            file_list_path = os.path.join(
+                temporary_directory, TESSERACT_FILE_LIST_FILENAME
+            )
+            with open(file=file_list_path, mode='w') as file_object:
+                file_object.write(
+                    '\n'.join(image_path_list)
+                )
+
+            output = force_str(
+                s=self._call_tesseract(
+                    arguments=(file_list_path, '-'), language=language
+                )
+            )
+
+        result = output.split(TESSERACT_PAGE_SEPARATOR)
+
+        # The text of the last image is also terminated by a separator.
+        if len(result) == len(image_file_objects) + 1:
+            return result[:-1]
+        else:
+            logger.warning(
+                'Tesseract returned %d pages for %d images. Processing '
+                'images individually.', len(result) - 1,
+                len(image_file_objects)
+            )
+
+            for image_file_object in image_file_objects:
+                image_file_object.seek(0)
+
+            return super()._execute_many(
+                image_file_objects=image_file_objects, language=language
+            )
+
     def initialize(self):
+        """
+        Locate the binary and get the list of available languages. The
+        results are cached per binary path to avoid executing the binary
+        again when another instance is created.
+        """
         self.languages = ()
 
         try:
@@ -89,26 +165,42 @@ class Tesseract(OCRBackendBase):
                 _(message='Tesseract OCR not found.')
             )
         else:
-            # Get version.
-            output = self.command_tesseract(v=True)
-            logger.debug('Tesseract version: %s', output)
-
-            # Get languages.
-            output = self.command_tesseract(list_langs=True)
-            # Sample output format.
-            # List of available languages (3):
-            # deu
-            # eng
-            # osd
-            # <- empty line
-
-            # Extraction: strip last line, split by newline, discard the
-            # first line.
-            self.languages = output.strip().split('\n')[1:]
-
-            logger.debug(
-                'Available languages: %s', ', '.join(self.languages)
-            )
+            with self._initialize_cache_lock:
+                try:
+                    self.languages = self._initialize_cache[
+                        self.tesseract_binary_path
+                    ]
+                except KeyError:
+                    self.languages = self.get_languages()
+                    self._initialize_cache[
+                        self.tesseract_binary_path
+                    ] = self.languages
+
+    def get_languages(self):
+        # Get version.
+        output = self.command_tesseract(v=True)
+        logger.debug('Tesseract version: %s', output)
+
+        # Get languages.
+        output = self.command_tesseract(list_langs=True)
+        # Sample output format.
+        # List of available languages (3):
+        # deu
+        # eng
+        # osd
+        # <- empty line
+
+        # Extraction: strip last line, split by newline, discard the
+        # first line.
+        languages = tuple(
+            output.strip().split('\n')[1:]
+        )
+
+        logger.debug(
+            'Available languages: %s', ', '.join(languages)
+        )
+
+        return languages
 
     def read_settings(self):
         self.command_timeout = self.kwargs.get(
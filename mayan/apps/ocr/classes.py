@@ -1,44 +1,130 @@
-import shutil
+from contextlib import ExitStack, contextmanager
+import json
+import logging
 
 from django.utils.encoding import force_str
 from django.utils.module_loading import import_string
 
+from mayan.apps.common.utils import ProcessInstanceCache
 from mayan.apps.converter.classes import ConverterBase
 from mayan.apps.storage.utils import TemporaryFile
 
-from .settings import setting_ocr_backend, setting_ocr_backend_arguments
+from .literals import OCR_IMAGE_FORMAT, OCR_IMAGE_MODE
+from .settings import (
+    setting_ocr_backend, setting_ocr_backend_arguments,
+    setting_ocr_image_dpi
+)
+
+logger = logging.getLogger(name=__name__)
 
 
 class OCRBackendBase:
-    @staticmethod
-    def get_instance():
-        return import_string(
-            dotted_path=setting_ocr_backend.value
-        )(**setting_ocr_backend_arguments.value)
+    """
+    Base class for the OCR backends. Backend instances are initialized
+    once per process and reused for every page by `get_instance`. Backends
+    must not store per call state in the instance.
+    """
+    _instance_cache = ProcessInstanceCache()
+
+    @classmethod
+    def get_instance(cls):
+        """
+        Return the OCR backend instance of the process. A new instance is
+        created only when the backend setting values change or after a
+        fork.
+        """
+        dotted_path = setting_ocr_backend.value
+        kwargs = setting_ocr_backend_arguments.value or {}
+
+        def factory():
+            logger.debug(
+                'Initializing OCR backend: %s', dotted_path
+            )
+            return import_string(dotted_path=dotted_path)(**kwargs)
+
+        return cls._instance_cache.get(
+            arguments=(
+                dotted_path,
+                json.dumps(obj=kwargs, default=str, sort_keys=True)
+            ), factory=factory
+        )
+
+    @classmethod
+    def instance_cache_clear(cls):
+        cls._instance_cache.clear()
 
     def __init__(self, *args, **kwargs):
         self.args = args
         self.kwargs = kwargs
 
-    def execute(self, file_object, language=None, transformations=None):
-        self.language = language
+    def _execute_many(self, image_file_objects, language=None):
+        """
+        Backends able to process several images in a single call override
+        this method.
+        """
+        return [
+            self._execute(
+                image_file_object=image_file_object, language=language
+            ) for image_file_object in image_file_objects
+        ]
 
+    @contextmanager
+    def _get_image_file(self, file_object, transformations=None):
+        """
+        Yield the image to pass to the backend. Page images are already
+        rendered and cached, and are used as they are unless
+        transformations are requested. Transformed images are saved once
+        in a lossless grayscale format.
+        """
         if not transformations:
-            transformations = []
-
-        self.converter = ConverterBase.get_converter_class()(
-            file_object=file_object
-        )
+            file_object.seek(0)
+            yield file_object
+        else:
+            converter = ConverterBase.get_converter_class()(
+                file_object=file_object
+            )
+            converter.transform_many(transformations=transformations)
 
-        for transformation in transformations:
-            self.converter.transform(transformation=transformation)
+            dpi = converter.image.info.get(
+                'dpi', (setting_ocr_image_dpi.value,) * 2
+            )
 
-        image = self.converter.get_page()
+            with TemporaryFile() as temporary_image_file:
+                converter.image.convert(mode=OCR_IMAGE_MODE).save(
+                    dpi=dpi, fp=temporary_image_file, format=OCR_IMAGE_FORMAT
+                )
+                temporary_image_file.seek(0)
 
-        with TemporaryFile() as temporary_image_file:
-            shutil.copyfileobj(fsrc=image, fdst=temporary_image_file)
-            temporary_image_file.seek(0)
+                yield temporary_image_file
 
+    def execute(self, file_object, language=None, transformations=None):
+        with self._get_image_file(file_object=file_object, transformations=transformations) as image_file_object:
             return force_str(
-                s=self._execute(image_file_object=temporary_image_file)
+                s=self._execute(
+                    image_file_object=image_file_object, language=language
+                )
             )
+
+    def execute_many(
+        self, file_objects, language=None, transformations=None
+    ):
+        """
+        OCR a list of images in the same language. Returns a list with the
+        text of each image in the same order.
+        """
+        with ExitStack() as stack:
+            image_file_objects = [
+                stack.enter_context(
+                    self._get_image_file(
+                        file_object=file_object,
+                        transformations=transformations
+                    )
+                ) for file_object in file_objects
+            ]
+
+            return [
+                force_str(s=result) for result in self._execute_many(
+                    image_file_objects=image_file_objects,
+                    language=language
+                )
+            ]
@@ -3,7 +3,15 @@ DEFAULT_OCR_BACKEND = 'mayan.apps.ocr.backends.tesseract.Tesseract'
 DEFAULT_OCR_BACKEND_ARGUMENTS = {
     'environment': {'OMP_THREAD_LIMIT': '1'}
 }
+DEFAULT_OCR_IMAGE_DPI = 300
+
+# Pages of a document version passed to a single OCR backend call.
+DOCUMENT_VERSION_PAGE_OCR_BATCH_SIZE = 10
 
 ERROR_LOG_DOMAIN_NAME = 'ocr'
 
+# Lossless grayscale format for the images transformed before the OCR.
+OCR_IMAGE_FORMAT = 'PNG'
+OCR_IMAGE_MODE = 'L'
+
 TASK_DOCUMENT_VERSION_PAGE_OCR_TIMEOUT = 10 * 60  # 10 Minutes per page
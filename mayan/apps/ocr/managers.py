@@ -1,3 +1,4 @@
+from contextlib import ExitStack
 import logging
 
 from django.apps import apps
@@ -35,51 +36,105 @@ class DocumentVersionPageOCRContentManager(models.Manager):
     def process_document_version_page(
         self, document_version_page, user=None
     ):
-        logger.info(
-            'Processing page: %d of document version: %s',
-            document_version_page.page_number,
-            document_version_page.document_version
+        self.process_document_version_pages(
+            document_version_pages=(document_version_page,), user=user
         )
 
+    def process_document_version_pages(
+        self, document_version_pages, user=None
+    ):
+        """
+        OCR pages of the same document version with a single backend
+        call. When the call fails, the pages are processed one by one to
+        record the error of each page.
+        """
         DocumentVersionPageOCRContent = apps.get_model(
             app_label='ocr', model_name='DocumentVersionPageOCRContent'
         )
 
-        lock_name = document_version_page.get_lock_name(user=user)
+        for document_version_page in document_version_pages:
+            logger.info(
+                'Processing page: %d of document version: %s',
+                document_version_page.page_number,
+                document_version_page.document_version
+            )
+
+        locking_backend = LockingBackend.get_backend()
+        document_version_page_locks = []
 
         try:
-            document_version_page_lock = LockingBackend.get_backend().acquire_lock(
-                name=lock_name,
-                timeout=setting_image_generation_timeout.value * 2
-            )
-        except Exception as exception:
-            logger.error(
-                'Error attempting to lock document version page: %d; %s',
-                document_version_page.pk, exception, exc_info=True
-            )
-            raise
-        else:
+            for document_version_page in document_version_pages:
+                lock_name = document_version_page.get_lock_name(user=user)
+
+                try:
+                    document_version_page_locks.append(
+                        locking_backend.acquire_lock(
+                            name=lock_name,
+                            timeout=setting_image_generation_timeout.value * 2 * len(document_version_pages)
+                        )
+                    )
+                except Exception as exception:
+                    logger.error(
+                        'Error attempting to lock document version page: '
+                        '%d; %s', document_version_page.pk, exception,
+                        exc_info=True
+                    )
+                    raise
+
             try:
-                cache_filename = document_version_page.generate_image(
-                    _acquire_lock=False, user=user
-                )
+                with ExitStack() as stack:
+                    file_objects = []
+
+                    for document_version_page in document_version_pages:
+                        cache_filename = document_version_page.generate_image(
+                            _acquire_lock=False, user=user
+                        )
+                        file_objects.append(
+                            stack.enter_context(
+                                document_version_page.cache_partition.get_file(
+                                    filename=cache_filename
+                                ).open()
+                            )
+                        )
+
+                    language = document_version_pages[0].document_version.document.language
+                    ocr_backend = None
 
-                with document_version_page.cache_partition.get_file(filename=cache_filename).open() as file_object:
                     try:
-                        ocr_content = OCRBackendBase.get_instance().execute(
-                            file_object=file_object,
-                            language=document_version_page.document_version.document.language
+                        ocr_backend = OCRBackendBase.get_instance()
+                        results = ocr_backend.execute_many(
+                            file_objects=file_objects, language=language
                         )
                     except OCRError as exception:
+                        if ocr_backend is None or len(file_objects) == 1:
+                            results = [exception] * len(file_objects)
+                        else:
+                            results = []
+
+                            for file_object in file_objects:
+                                file_object.seek(0)
+
+                                try:
+                                    results.append(
+                                        ocr_backend.execute(
+                                            file_object=file_object,
+                                            language=language
+                                        )
+                                    )
+                                except OCRError as page_exception:
+                                    results.append(page_exception)
+
+                for document_version_page, result in zip(document_version_pages, results):
+                    if isinstance(result, OCRError):
                         document_version_page.error_log.create(
                             domain_name=ERROR_LOG_DOMAIN_NAME,
-                            text=str(exception)
+                            text=str(result)
                         )
                     else:
                         DocumentVersionPageOCRContent.objects.update_or_create(
                             document_version_page=document_version_page,
                             defaults={
-                                'content': ocr_content
+                                'content': result
                             }
                         )
                         queryset_error_logs = document_version_page.error_log.filter(
@@ -88,17 +143,20 @@ class DocumentVersionPageOCRContentManager(models.Manager):
                         queryset_error_logs.delete()
             except Exception as exception:
                 logger.error(
-                    'OCR error for document version page: %d; %s',
-                    document_version_page.pk, exception, exc_info=True
+                    'OCR error for document version pages: %s; %s', [
+                        document_version_page.pk for document_version_page in document_version_pages
+                    ], exception, exc_info=True
                 )
                 raise
             else:
-                logger.info(
-                    'Finished processing page: %d of document version: %s',
-                    document_version_page.page_number,
-                    document_version_page.document_version
-                )
-            finally:
+                for document_version_page in document_version_pages:
+                    logger.info(
+                        'Finished processing page: %d of document version: '
+                        '%s', document_version_page.page_number,
+                        document_version_page.document_version
+                    )
+        finally:
+            for document_version_page_lock in document_version_page_locks:
                 document_version_page_lock.release()
 
 
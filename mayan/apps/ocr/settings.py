@@ -3,7 +3,8 @@ from django.utils.translation import gettext_lazy as _
 from mayan.apps.smart_settings.settings import setting_cluster
 
 from .literals import (
-    DEFAULT_OCR_AUTO_OCR, DEFAULT_OCR_BACKEND, DEFAULT_OCR_BACKEND_ARGUMENTS
+    DEFAULT_OCR_AUTO_OCR, DEFAULT_OCR_BACKEND, DEFAULT_OCR_BACKEND_ARGUMENTS,
+    DEFAULT_OCR_IMAGE_DPI
 )
 from .setting_migrations import OCRSettingMigration
 
@@ -27,3 +28,10 @@ setting_ocr_backend_arguments = setting_namespace.do_setting_add(
     default=DEFAULT_OCR_BACKEND_ARGUMENTS,
     global_name='OCR_BACKEND_ARGUMENTS'
 )
+setting_ocr_image_dpi = setting_namespace.do_setting_add(
+    default=DEFAULT_OCR_IMAGE_DPI, global_name='OCR_IMAGE_DPI', help_text=_(
+        message='Resolution in dots per inch to record in the images that '
+        'are transformed before being passed to the OCR backend, when the '
+        'image does not specify one.'
+    )
+)
@@ -0,0 +1,13 @@
+from ..classes import OCRBackendBase
+
+
+class TestOCRBackend(OCRBackendBase):
+    """
+    OCR backend that returns the size of the image instead of the text.
+    """
+    def _execute(self, image_file_object, language=None):
+        return str(
+            len(
+                image_file_object.read()
+            )
+        )
@@ -10,3 +10,7 @@ TEST_DOCUMENT_VERSION_PAGE_OCR_CONTENT = 'test content'
 TEST_DOCUMENT_VERSION_PAGE_OCR_CONTENT_UPDATED = 'updated content'
 
 TEST_UPDATE_DOCUMENT_PAGE_OCR_ACTION_DOTTED_PATH = 'mayan.apps.ocr.workflow_actions.UpdateDocumentPageOCRAction'
+
+TEST_OCR_BACKEND_DOTTED_PATH = 'mayan.apps.ocr.tests.backends.TestOCRBackend'
+TEST_TESSERACT_LANGUAGES_OUTPUT = 'List of available languages (2):\ndeu\neng\n'
+TEST_TESSERACT_MULTIPLE_OUTPUT = 'test content 1\ftest content 2\f'
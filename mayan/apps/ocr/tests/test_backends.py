@@ -0,0 +1,113 @@
+import io
+from unittest import mock
+
+from PIL import Image
+
+from mayan.apps.converter.transformations import TransformationRotate90
+from mayan.apps.documents.tests.literals import TEST_FILE_SMALL_PATH
+from mayan.apps.testing.tests.base import BaseTestCase
+
+from ..backends.tesseract import Tesseract
+from ..classes import OCRBackendBase
+from ..literals import OCR_IMAGE_FORMAT, OCR_IMAGE_MODE
+from ..settings import setting_ocr_backend
+
+from .backends import TestOCRBackend
+from .literals import (
+    TEST_OCR_BACKEND_DOTTED_PATH, TEST_TESSERACT_LANGUAGES_OUTPUT,
+    TEST_TESSERACT_MULTIPLE_OUTPUT
+)
+
+
+class OCRBackendInstanceTestCase(BaseTestCase):
+    def setUp(self):
+        super().setUp()
+        OCRBackendBase.instance_cache_clear()
+
+        self._set_environment_variable(
+            name='MAYAN_{}'.format(setting_ocr_backend.global_name),
+            value=TEST_OCR_BACKEND_DOTTED_PATH
+        )
+
+    def tearDown(self):
+        OCRBackendBase.instance_cache_clear()
+        super().tearDown()
+
+    def test_get_instance_reuse(self):
+        instance = OCRBackendBase.get_instance()
+
+        self.assertTrue(
+            isinstance(instance, TestOCRBackend)
+        )
+        self.assertEqual(
+            OCRBackendBase.get_instance(), instance
+        )
+
+    @mock.patch('mayan.apps.ocr.classes.ConverterBase.get_converter_class')
+    def test_execute_cached_image(self, mock_get_converter_class):
+        result = OCRBackendBase.get_instance().execute(
+            file_object=io.BytesIO(initial_bytes=b'123')
+        )
+
+        self.assertEqual(result, '3')
+        self.assertFalse(mock_get_converter_class.called)
+
+    @mock.patch('mayan.apps.ocr.classes.ConverterBase.get_converter_class')
+    def test_execute_many(self, mock_get_converter_class):
+        result = OCRBackendBase.get_instance().execute_many(
+            file_objects=(
+                io.BytesIO(initial_bytes=b'1'),
+                io.BytesIO(initial_bytes=b'12')
+            )
+        )
+
+        self.assertEqual(result, ['1', '2'])
+        self.assertFalse(mock_get_converter_class.called)
+
+    def test_execute_transformations(self):
+        with open(file=TEST_FILE_SMALL_PATH, mode='rb') as file_object:
+            with OCRBackendBase.get_instance()._get_image_file(file_object=file_object, transformations=(TransformationRotate90(),)) as image_file_object:
+                image = Image.open(fp=image_file_object)
+
+                self.assertEqual(image.format, OCR_IMAGE_FORMAT)
+                self.assertEqual(image.mode, OCR_IMAGE_MODE)
+
+
+class TesseractBackendTestCase(BaseTestCase):
+    def setUp(self):
+        super().setUp()
+        Tesseract._initialize_cache.clear()
+
+    def tearDown(self):
+        Tesseract._initialize_cache.clear()
+        super().tearDown()
+
+    @mock.patch('mayan.apps.ocr.backends.tesseract.sh.Command')
+    def test_initialize_languages_cache(self, mock_command):
+        mock_command.return_value.return_value = TEST_TESSERACT_LANGUAGES_OUTPUT
+
+        backend_1 = Tesseract()
+        backend_2 = Tesseract()
+
+        self.assertEqual(backend_1.languages, ('deu', 'eng'))
+        self.assertEqual(backend_2.languages, ('deu', 'eng'))
+        # Version and language list, only for the first instance.
+        self.assertEqual(mock_command.return_value.call_count, 2)
+
+    @mock.patch('mayan.apps.ocr.backends.tesseract.sh.Command')
+    def test_execute_many_single_call(self, mock_command):
+        mock_command.return_value.return_value = TEST_TESSERACT_LANGUAGES_OUTPUT
+        backend = Tesseract()
+
+        mock_command.return_value.reset_mock()
+        mock_command.return_value.return_value = TEST_TESSERACT_MULTIPLE_OUTPUT
+
+        result = backend._execute_many(
+            image_file_objects=(
+                io.BytesIO(initial_bytes=b'1'),
+                io.BytesIO(initial_bytes=b'2')
+            ), language='eng'
+        )
+
+        self.assertEqual(result, ['test content 1', 'test content 2'])
+        self.assertEqual(mock_command.return_value.call_count, 1)
@@ -1,10 +1,15 @@
 from unittest import mock
 
 from mayan.apps.documents.tests.base import GenericDocumentTestCase
+from mayan.apps.documents.tests.literals import (
+    TEST_FILE_MULTI_PAGE_TIFF_FILENAME
+)
 
+from ..classes import OCRBackendBase
 from ..events import event_ocr_document_version_finished
 from ..exceptions import OCRError
 
+from .backends import TestOCRBackend
 from .mixins import DocumentVersionOCRTaskTestMixin
 
 
@@ -73,3 +78,36 @@ class OCRTaskTestCase(
 
         events = self._get_test_events()
         self.assertEqual(events.count(), 0)
+
+
+class OCRTaskMultiplePageTestCase(
+    DocumentVersionOCRTaskTestMixin, GenericDocumentTestCase
+):
+    _test_document_filename = TEST_FILE_MULTI_PAGE_TIFF_FILENAME
+
+    def test_task_document_version_ocr_process_execute_many(self):
+        test_ocr_backend = TestOCRBackend()
+
+        with mock.patch.object(
+            OCRBackendBase, 'get_instance', return_value=test_ocr_backend
+        ):
+            with mock.patch.object(
+                test_ocr_backend, 'execute_many',
+                wraps=test_ocr_backend.execute_many
+            ) as method_execute_many:
+                self._execute_task_document_version_ocr_process()
+
+        page_count = self._test_document_version.pages.count()
+        self.assertTrue(page_count > 1)
+
+        self.assertEqual(method_execute_many.call_count, 1)
+        self.assertEqual(
+            len(
+                method_execute_many.call_args.kwargs['file_objects']
+            ), page_count
+        )
+
+        for document_version_page in self._test_document_version.pages.all():
+            self.assertNotEqual(
+                document_version_page.ocr_content.content, ''
+            )
@@ -19,6 +19,7 @@ from mayan.apps.converter.transformations import TransformationResize
 from mayan.apps.navigation.source_columns import SourceColumn
 from mayan.apps.sources.literals import STORAGE_NAME_SOURCE_CACHE_FOLDER
 from mayan.apps.storage.classes import DefinedStorage
+from mayan.apps.storage.utils import get_storage_local_path
 
 from .column_widgets import StoredFileThumbnailWidget
 from .links import link_storage_file_delete, link_source_file_select
@@ -229,6 +230,11 @@ class SourceStoredFile:
         else:
             return page_image
 
+    def get_local_path(self):
+        return get_storage_local_path(
+            name=self.get_full_path(), storage=self.storage_backend_instance
+        )
+
     def get_size(self):
         return self.storage_backend_instance.size(
             name=self.get_full_path()
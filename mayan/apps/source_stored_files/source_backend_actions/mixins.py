@@ -14,7 +14,10 @@ from mayan.apps.sources.source_backend_actions.interfaces import (
     SourceBackendActionInterfaceRequestViewForm,
     SourceBackendActionInterfaceTask
 )
+from mayan.apps.storage.classes import DefinedStorage
+from mayan.apps.storage.literals import STORAGE_NAME_SHARED_UPLOADED_FILE
 from mayan.apps.storage.models import SharedUploadedFile
+from mayan.apps.storage.utils import local_file_open
 
 from .arguments import (
     argument_encoded_filename, argument_file_cleanup,
@@ -223,6 +226,9 @@ class SourceBackendActionMixinFileStoredBase:
             source_backend_instance, self.stored_method_name_file_get
         )
 
+        if file_cleanup is None:
+            file_cleanup = self.default_file_cleanup
+
         result['server_upload_entry_list'] = []
 
         server_upload_entry_generator = source_stored_file_get_method(
@@ -243,6 +249,7 @@ class SourceBackendActionMixinFileStoredBase:
 
                 result['server_upload_entry_list'].append(
                     self.process_server_upload_entry(
+                        file_cleanup=file_cleanup,
                         server_upload_entry=server_upload_entry
                     )
                 )
@@ -252,9 +259,6 @@ class SourceBackendActionMixinFileStoredBase:
                 """
                 break
 
-        if file_cleanup is None:
-            file_cleanup = self.default_file_cleanup
-
         if file_cleanup:
             source_stored_file_cleanup_method = getattr(
                 source_backend_instance, self.stored_method_name_file_cleanup,
@@ -279,18 +283,41 @@ class SourceBackendActionMixinFileStoredBase:
 
         return result
 
-    def process_server_upload_entry(self, server_upload_entry):
+    def process_server_upload_entry(
+        self, server_upload_entry, file_cleanup=False
+    ):
         file_object = server_upload_entry.pop('file')
 
-        with file_object.open(mode='rb') as file_object:
-            shared_uploaded_file = SharedUploadedFile.objects.create(
-                file=File(
+        # Files removed from the source after being processed are linked
+        # into the shared storage instead of copied when they are in the
+        # local filesystem. Files that are kept are always copied to not
+        # share the content with a file that could be modified later.
+        get_local_path = getattr(file_object, 'get_local_path', None)
+
+        if file_cleanup and get_local_path:
+            path = get_local_path()
+        else:
+            path = None
+
+        if path:
+            storage = DefinedStorage.get(
+                name=STORAGE_NAME_SHARED_UPLOADED_FILE
+            ).get_storage_instance()
+
+            with local_file_open(path=path, storage=storage) as file_object:
+                shared_uploaded_file = SharedUploadedFile.objects.create(
                     file=file_object
                 )
-            )
+        else:
+            with file_object.open(mode='rb') as file_object:
+                shared_uploaded_file = SharedUploadedFile.objects.create(
+                    file=File(
+                        file=file_object
+                    )
+                )
 
-            server_upload_entry['shared_uploaded_file_id'] = shared_uploaded_file.pk
-            return server_upload_entry
+        server_upload_entry['shared_uploaded_file_id'] = shared_uploaded_file.pk
+        return server_upload_entry
 
 
 class SourceBackendActionMixinFileStoredInteractive(
@@ -378,7 +405,18 @@ class SourceBackendActionMixinFileStoredInteractiveNot(
 
                 source_backend_instance = self.action.source.get_backend_instance()
 
-                self.action_kwargs['file_identifier'] = source_backend_instance.get_file_identifier()
+                # Backends able to select several files return a batch of
+                # identifiers.
+                get_file_identifier_list = getattr(
+                    source_backend_instance, 'get_file_identifier_list', None
+                )
+
+                if get_file_identifier_list:
+                    self.action_kwargs['file_identifier_list'] = get_file_identifier_list()
+                else:
+                    self.action_kwargs['file_identifier_list'] = (
+                        source_backend_instance.get_file_identifier(),
+                    )
 
         class Task(SourceBackendActionInterfaceTask):
             class Argument:
@@ -391,6 +429,13 @@ class SourceBackendActionMixinFileStoredInteractiveNot(
                 self.action_kwargs['file_cleanup'] = self.context['file_cleanup']
                 self.action_kwargs['file_identifier'] = self.context['file_identifier']
 
+    def _execute(self, file_identifier_list, **kwargs):
+        # Queue a background task for each file to process them in
+        # parallel. An empty batch queues a single task to keep the quick
+        # exit of sources without files.
+        for file_identifier in file_identifier_list or (None,):
+            super()._execute(file_identifier=file_identifier, **kwargs)
+
     def convert_dry_run_to_file_cleanup(self, dry_run):
         if dry_run is True:
             return False
@@ -1,10 +1,12 @@
 import logging
-from pathlib import Path
+from pathlib import Path, PurePath
 
 from django.core.files.storage import FileSystemStorage
 from django.utils.translation import gettext_lazy as _
 
-from mayan.apps.sources.exceptions import SourceException
+from mayan.apps.sources.exceptions import (
+    SourceActionException, SourceException
+)
 
 from ..classes import SourceStoredFile
 
@@ -59,6 +61,24 @@ class SourceBackendMixinStoredFileLocationFilesystem:
 
         return fieldsets
 
+    def get_folder_path(self):
+        """
+        Return the folder path after checking that it exists and is a
+        directory.
+        """
+        path = Path(
+            self.kwargs['folder_path']
+        )
+
+        # Force testing the path and raise errors for the log.
+        path.lstat()
+        if not path.is_dir():
+            raise SourceException(
+                'Path {} is not a directory.'.format(path)
+            )
+
+        return path
+
     def get_storage_backend_arguments(self):
         return {
             'location': '{}'.format(
@@ -83,17 +103,52 @@ class SourceBackendMixinStoredFileLocationFilesystem:
             logger.fatal(message)
             raise TypeError(message) from exception
 
-    def get_stored_file_list(self):
+    def get_stored_file(self, encoded_filename=None, filename=None):
+        """
+        Locate the file directly instead of listing the whole folder.
+        Only files that would be part of the stored file list are
+        returned.
+        """
+        if encoded_filename:
+            stored_file = SourceStoredFile(
+                encoded_filename=encoded_filename, source=self
+            )
+        elif filename:
+            stored_file = SourceStoredFile(filename=filename, source=self)
+        else:
+            raise SourceActionException(
+                'Must provide either `encoded_filename` or `filename`.'
+            )
+
+        relative_path = PurePath(stored_file.filename)
+
+        if relative_path.is_absolute() or '..' in relative_path.parts:
+            raise SourceActionException('Requested file not found.')
+
+        include_subdirectories = self.kwargs.get(
+            'include_subdirectories', False
+        )
+
+        if len(relative_path.parts) > 1 and not include_subdirectories:
+            raise SourceActionException('Requested file not found.')
+
+        regex_exclude = self.get_regex_exclude()
+        regex_include = self.get_regex_include()
+
+        if not regex_include.match(string=relative_path.name) or regex_exclude.match(string=relative_path.name):
+            raise SourceActionException('Requested file not found.')
+
         path = Path(
             self.kwargs['folder_path']
-        )
+        ).joinpath(relative_path)
 
-        # Force testing the path and raise errors for the log.
-        path.lstat()
-        if not path.is_dir():
-            raise SourceException(
-                'Path {} is not a directory.'.format(path)
-            )
+        if not path.is_file():
+            raise SourceActionException('Requested file not found.')
+
+        return stored_file
+
+    def get_stored_file_list(self):
+        path = self.get_folder_path()
 
         regex_exclude = self.get_regex_exclude()
         regex_include = self.get_regex_include()
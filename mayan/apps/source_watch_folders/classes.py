@@ -0,0 +1,325 @@
+import ctypes
+import ctypes.util
+import functools
+import logging
+import os
+import struct
+import sys
+import threading
+import time
+
+from mayan.apps.common.utils import ProcessInstanceCache
+
+from .literals import (
+    INOTIFY_EVENT_HEADER_FORMAT, INOTIFY_IN_IGNORED, INOTIFY_READ_SIZE,
+    INOTIFY_RESCAN_MASK, INOTIFY_WATCH_MASK,
+    WATCH_FOLDER_DIRECTORY_SETTLE_TIME
+)
+
+logger = logging.getLogger(name=__name__)
+
+
+class InotifyWatcher:
+    """
+    Minimal interface to the Linux inotify API. Collects the directories
+    changed since the previous call to `get_changes`.
+    """
+    def __init__(self):
+        if not sys.platform.startswith('linux'):
+            raise OSError('inotify is only available on Linux.')
+
+        self.libc = ctypes.CDLL(
+            ctypes.util.find_library('c'), use_errno=True
+        )
+        self.fd = self.libc.inotify_init1(os.O_CLOEXEC | os.O_NONBLOCK)
+
+        if self.fd < 0:
+            self._raise_error()
+
+        self.relative_paths = {}
+
+    def _raise_error(self, filename=None):
+        error_number = ctypes.get_errno()
+        raise OSError(error_number, os.strerror(error_number), filename)
+
+    def close(self):
+        if self.fd >= 0:
+            os.close(self.fd)
+            self.fd = -1
+
+    def get_changes(self):
+        """
+        Return the set of relative paths of the changed directories and
+        a flag indicating if the changes were lost and a full scan is
+        required.
+        """
+        changed_relative_paths = set()
+        rescan = False
+
+        header_size = struct.calcsize(INOTIFY_EVENT_HEADER_FORMAT)
+
+        while True:
+            try:
+                data = os.read(self.fd, INOTIFY_READ_SIZE)
+            except BlockingIOError:
+                break
+
+            offset = 0
+
+            while offset < len(data):
+                watch_descriptor, mask, cookie, length = struct.unpack_from(
+                    INOTIFY_EVENT_HEADER_FORMAT, data, offset
+                )
+                offset += header_size + length
+
+                if mask & INOTIFY_RESCAN_MASK:
+                    rescan = True
+                elif mask & INOTIFY_IN_IGNORED:
+                    self.relative_paths.pop(watch_descriptor, None)
+                else:
+                    relative_path = self.relative_paths.get(watch_descriptor)
+
+                    if relative_path is not None:
+                        changed_relative_paths.add(relative_path)
+
+        return changed_relative_paths, rescan
+
+    def watch_add(self, path, relative_path):
+        watch_descriptor = self.libc.inotify_add_watch(
+            self.fd, os.fsencode(path), INOTIFY_WATCH_MASK
+        )
+
+        if watch_descriptor < 0:
+            self._raise_error(filename=path)
+
+        self.relative_paths[watch_descriptor] = relative_path
+
+
+class WatchFolderScanner:
+    """
+    Incremental scanner of the files of a watch folder. The scanner keeps
+    a manifest of the directories and files found by the previous scans.
+    Directories are read again only when their modification time changes
+    or when inotify reports a change, and only the files that are not yet
+    stable are checked again.
+    """
+    _instance_cache = ProcessInstanceCache(
+        on_discard=lambda instance: instance.close()
+    )
+
+    @classmethod
+    def get_instance(
+        cls, folder_path, source_id, file_stable_time=0,
+        include_subdirectories=False, use_inotify=False
+    ):
+        """
+        Return the scanner of the source for the process. The manifest
+        is discarded when the folder options of the source change.
+        """
+        return cls._instance_cache.get(
+            arguments=(
+                folder_path, file_stable_time, include_subdirectories,
+                use_inotify
+            ), factory=functools.partial(
+                cls, file_stable_time=file_stable_time,
+                folder_path=folder_path,
+                include_subdirectories=include_subdirectories,
+                use_inotify=use_inotify
+            ), key=source_id
+        )
+
+    @classmethod
+    def instance_cache_clear(cls):
+        cls._instance_cache.clear()
+
+    def __init__(
+        self, folder_path, file_stable_time=0, include_subdirectories=False,
+        use_inotify=False
+    ):
+        self.directories = {}
+        self.file_stable_time_ns = file_stable_time * 10 ** 9
+        self.folder_path = folder_path
+        self.include_subdirectories = include_subdirectories
+        self.lock = threading.Lock()
+        self.watcher = None
+
+        if use_inotify:
+            try:
+                self.watcher = InotifyWatcher()
+            except OSError as exception:
+                logger.warning(
+                    'Unable to use inotify for the watch folder "%s", '
+                    'using polling; %s', folder_path, exception
+                )
+
+    def _directory_read(self, relative_path, mtime_ns, entry=None):
+        # Files already known by inode that were stable keep their
+        # manifest values to avoid a `stat` call for each.
+        files_previous = entry['files'] if entry else {}
+        files = {}
+        subdirectory_list = []
+
+        with os.scandir(os.path.join(self.folder_path, relative_path)) as iterator:
+            for directory_entry in iterator:
+                entry_relative_path = os.path.join(
+                    relative_path, directory_entry.name
+                )
+
+                try:
+                    if directory_entry.is_dir(follow_symlinks=False):
+                        subdirectory_list.append(entry_relative_path)
+                    elif directory_entry.is_file():
+                        file_entry = files_previous.get(directory_entry.name)
+
+                        if file_entry and file_entry['stable'] and file_entry['inode'] == directory_entry.inode():
+                            files[directory_entry.name] = file_entry
+                        else:
+                            files[directory_entry.name] = self._file_stat(
+                                relative_path=entry_relative_path
+                            )
+                except FileNotFoundError:
+                    """
+                    The entry was removed while being read.
+                    """
+
+        return {
+            'files': files, 'mtime_ns': mtime_ns,
+            'subdirectory_list': subdirectory_list
+        }
+
+    def _directory_update(self, relative_path, changed, entry, rescan):
+        """
+        Return the updated manifest entry of a directory or None if the
+        directory no longer exists.
+        """
+        path = os.path.join(self.folder_path, relative_path)
+
+        if self.watcher and (entry is None or rescan):
+            # Watch before reading to not miss the changes made while
+            # reading.
+            try:
+                self.watcher.watch_add(
+                    path=path, relative_path=relative_path
+                )
+            except FileNotFoundError:
+                return None
+            except OSError as exception:
+                logger.warning(
+                    'Unable to watch the directory "%s", using polling; '
+                    '%s', path, exception
+                )
+                self.watcher.close()
+                self.watcher = None
+
+        try:
+            mtime_ns = os.stat(path).st_mtime_ns
+
+            directory_settled = time.time_ns() - mtime_ns >= WATCH_FOLDER_DIRECTORY_SETTLE_TIME * 10 ** 9
+
+            if changed or entry is None or entry['mtime_ns'] != mtime_ns or not directory_settled:
+                return self._directory_read(
+                    entry=entry, mtime_ns=mtime_ns,
+                    relative_path=relative_path
+                )
+        except FileNotFoundError:
+            return None
+
+        return entry
+
+    def _file_stat(self, relative_path):
+        stat_result = os.stat(
+            os.path.join(self.folder_path, relative_path)
+        )
+
+        return {
+            'inode': stat_result.st_ino, 'mtime_ns': stat_result.st_mtime_ns,
+            'size': stat_result.st_size,
+            'stable': time.time_ns() - stat_result.st_mtime_ns >= self.file_stable_time_ns
+        }
+
+    def close(self):
+        if self.watcher:
+            self.watcher.close()
+            self.watcher = None
+
+    def scan(self):
+        """
+        Update the manifest and return a list of relative filename and
+        stable flag tuples sorted by modification time. A file is stable
+        when its modification time is older than the stable time of the
+        scanner.
+        """
+        with self.lock:
+            if self.watcher:
+                changed_relative_paths, rescan = self.watcher.get_changes()
+                rescan = rescan or not self.directories
+            else:
+                changed_relative_paths = set()
+                rescan = True
+
+            directories = {}
+            relative_path_list = ['']
+
+            while relative_path_list:
+                relative_path = relative_path_list.pop()
+                entry = self.directories.get(relative_path)
+
+                changed = relative_path in changed_relative_paths
+
+                if changed or entry is None or rescan:
+                    entry_updated = self._directory_update(
+                        changed=changed, entry=entry,
+                        relative_path=relative_path, rescan=rescan
+                    )
+
+                    if entry_updated is None:
+                        if relative_path:
+                            continue
+                        else:
+                            raise FileNotFoundError(
+                                'Watch folder "{}" not found.'.format(
+                                    self.folder_path
+                                )
+                            )
+                else:
+                    entry_updated = entry
+
+                if entry_updated is entry:
+                    # Check again the files that were not stable.
+                    for name, file_entry in tuple(entry['files'].items()):
+                        if not file_entry['stable']:
+                            try:
+                                entry['files'][name] = self._file_stat(
+                                    relative_path=os.path.join(
+                                        relative_path, name
+                                    )
+                                )
+                            except FileNotFoundError:
+                                del entry['files'][name]
+
+                directories[relative_path] = entry_updated
+
+                if self.include_subdirectories:
+                    relative_path_list.extend(
+                        entry_updated['subdirectory_list']
+                    )
+
+            self.directories = directories
+
+            result = []
+
+            for relative_path, entry in directories.items():
+                for name, file_entry in entry['files'].items():
+                    result.append(
+                        (
+                            file_entry['mtime_ns'],
+                            os.path.join(relative_path, name),
+                            file_entry['stable']
+                        )
+                    )
+
+            result.sort()
+
+            return [
+                (relative_filename, stable) for mtime_ns, relative_filename, stable in result
+            ]
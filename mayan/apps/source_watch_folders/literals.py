@@ -0,0 +1,30 @@
+DEFAULT_WATCH_FOLDER_BATCH_SIZE = 50
+DEFAULT_WATCH_FOLDER_FILE_STABLE_TIME = 0
+
+# Linux inotify API values from `sys/inotify.h`.
+INOTIFY_EVENT_HEADER_FORMAT = 'iIII'
+INOTIFY_IN_ATTRIB = 0x00000004
+INOTIFY_IN_CLOSE_WRITE = 0x00000008
+INOTIFY_IN_CREATE = 0x00000100
+INOTIFY_IN_DELETE = 0x00000200
+INOTIFY_IN_DELETE_SELF = 0x00000400
+INOTIFY_IN_IGNORED = 0x00008000
+INOTIFY_IN_MODIFY = 0x00000002
+INOTIFY_IN_MOVE_SELF = 0x00000800
+INOTIFY_IN_MOVED_FROM = 0x00000040
+INOTIFY_IN_MOVED_TO = 0x00000080
+INOTIFY_IN_ONLYDIR = 0x01000000
+INOTIFY_IN_Q_OVERFLOW = 0x00004000
+INOTIFY_READ_SIZE = 65536
+
+INOTIFY_WATCH_MASK = INOTIFY_IN_ATTRIB | INOTIFY_IN_CLOSE_WRITE | INOTIFY_IN_CREATE | INOTIFY_IN_DELETE | INOTIFY_IN_DELETE_SELF | INOTIFY_IN_MODIFY | INOTIFY_IN_MOVE_SELF | INOTIFY_IN_MOVED_FROM | INOTIFY_IN_MOVED_TO | INOTIFY_IN_ONLYDIR
+INOTIFY_RESCAN_MASK = (
+    INOTIFY_IN_DELETE_SELF | INOTIFY_IN_MOVE_SELF | INOTIFY_IN_Q_OVERFLOW
+)
+
+# Directories modified this recently are read again on every scan. Some
+# filesystems store modification times with a resolution of seconds and
+# later changes during the same interval would not be detected.
+WATCH_FOLDER_DIRECTORY_SETTLE_TIME = 2
+
+WATCH_FOLDER_FILE_LOCK_NAME_TEMPLATE = 'source_watch_folder_file-{}-{}'
@@ -1,22 +1,38 @@
+import hashlib
+import logging
+import os
+
 from django.utils.translation import gettext_lazy as _
 
+from mayan.apps.lock_manager.backends.base import LockingBackend
+from mayan.apps.lock_manager.exceptions import LockError
 from mayan.apps.source_periodic.source_backend_actions.periodic_actions import (
     SourceBackendActionPeriodicDocumentUpload
 )
 from mayan.apps.source_periodic.source_backends.mixins import (
     SourceBackendMixinPeriodicCompressed
 )
+from mayan.apps.source_stored_files.classes import SourceStoredFile
 from mayan.apps.source_stored_files.source_backends.filesystem_source_mixins import (
     SourceBackendMixinStoredFileLocationFilesystem
 )
 from mayan.apps.source_stored_files.source_backends.stored_file_source_mixins import (
     SourceBackendMixinStoredFileInteractiveNot
 )
+from mayan.apps.sources.literals import DEFAULT_SOURCES_LOCK_EXPIRE
 from mayan.apps.sources.source_backends.base import SourceBackend
 from mayan.apps.sources.source_backends.mixins import (
     SourceBackendMixinRegularExpression
 )
 
+from .classes import WatchFolderScanner
+from .literals import (
+    DEFAULT_WATCH_FOLDER_BATCH_SIZE, DEFAULT_WATCH_FOLDER_FILE_STABLE_TIME,
+    WATCH_FOLDER_FILE_LOCK_NAME_TEMPLATE
+)
+
+logger = logging.getLogger(name=__name__)
+
 
 class SourceBackendWatchFolder(
     SourceBackendMixinStoredFileLocationFilesystem,
@@ -26,3 +42,148 @@ class SourceBackendWatchFolder(
 ):
     action_class_list = (SourceBackendActionPeriodicDocumentUpload,)
     label = _(message='Watch folder')
+
+    @classmethod
+    def get_form_fields(cls):
+        fields = super().get_form_fields()
+
+        fields.update(
+            {
+                'batch_size': {
+                    'class': 'django.forms.IntegerField',
+                    'default': DEFAULT_WATCH_FOLDER_BATCH_SIZE,
+                    'help_text': _(
+                        message='Maximum number of files to process in '
+                        'parallel on each check.'
+                    ),
+                    'kwargs': {
+                        'min_value': 1
+                    },
+                    'label': _(message='Batch size'),
+                    'required': False
+                },
+                'file_stable_time': {
+                    'class': 'django.forms.IntegerField',
+                    'default': DEFAULT_WATCH_FOLDER_FILE_STABLE_TIME,
+                    'help_text': _(
+                        message='Time in seconds a file must remain '
+                        'unmodified before being processed. Use it when '
+                        'files are copied slowly into the folder.'
+                    ),
+                    'kwargs': {
+                        'min_value': 0
+                    },
+                    'label': _(message='File stable time'),
+                    'required': False
+                },
+                'use_inotify': {
+                    'class': 'django.forms.BooleanField',
+                    'default': False,
+                    'help_text': _(
+                        message='Use the Linux inotify API to detect the '
+                        'folder changes instead of checking every '
+                        'directory. Only for local filesystems.'
+                    ),
+                    'label': _(message='Use inotify'),
+                    'required': False
+                }
+            }
+        )
+
+        return fields
+
+    @classmethod
+    def get_form_fieldsets(cls):
+        fieldsets = super().get_form_fieldsets()
+
+        fieldsets += (
+            (
+                _(message='Scanning'), {
+                    'fields': ('batch_size', 'file_stable_time', 'use_inotify')
+                }
+            ),
+        )
+
+        return fieldsets
+
+    def get_file_identifier_list(self):
+        """
+        Return the identifiers of the next batch of stable files. Each
+        file is reserved with a lock to avoid dispatching it again while
+        it is being processed.
+        """
+        batch_size = self.kwargs.get(
+            'batch_size'
+        ) or DEFAULT_WATCH_FOLDER_BATCH_SIZE
+
+        result = []
+
+        for filename, stable in self.get_scanner_file_list():
+            if stable:
+                lock_name = WATCH_FOLDER_FILE_LOCK_NAME_TEMPLATE.format(
+                    self.model_instance_id, hashlib.sha256(
+                        filename.encode('utf8')
+                    ).hexdigest()
+                )
+
+                try:
+                    LockingBackend.get_backend().acquire_lock(
+                        name=lock_name, timeout=DEFAULT_SOURCES_LOCK_EXPIRE
+                    )
+                except LockError:
+                    logger.debug(
+                        'File "%s" is already being processed.', filename
+                    )
+                else:
+                    result.append(
+                        SourceStoredFile(
+                            filename=filename, source=self
+                        ).encoded_filename
+                    )
+
+                    if len(result) >= batch_size:
+                        break
+
+        return result
+
+    def get_scanner(self):
+        return WatchFolderScanner.get_instance(
+            file_stable_time=self.kwargs.get(
+                'file_stable_time'
+            ) or DEFAULT_WATCH_FOLDER_FILE_STABLE_TIME,
+            folder_path=self.kwargs['folder_path'],
+            include_subdirectories=self.kwargs.get(
+                'include_subdirectories', False
+            ), source_id=self.model_instance_id,
+            use_inotify=self.kwargs.get('use_inotify', False)
+        )
+
+    def get_scanner_file_list(self):
+        """
+        Return the relative filename and stable flag of the files of the
+        folder selected by the regular expressions.
+        """
+        self.get_folder_path()
+
+        regex_exclude = self.get_regex_exclude()
+        regex_include = self.get_regex_include()
+
+        try:
+            file_list = self.get_scanner().scan()
+        except Exception as exception:
+            message = 'Unable get list of files from source: {}; {}'.format(
+                self, exception
+            )
+
+            logger.error(message)
+            raise ValueError(message) from exception
+
+        for filename, stable in file_list:
+            name = os.path.basename(filename)
+
+            if regex_include.match(string=name) and not regex_exclude.match(string=name):
+                yield filename, stable
+
+    def get_stored_file_list(self):
+        for filename, stable in self.get_scanner_file_list():
+            yield SourceStoredFile(filename=filename, source=self)
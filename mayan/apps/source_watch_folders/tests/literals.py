@@ -1,3 +1,7 @@
 TEST_SOURCE_BACKEND_PATH_WATCH_FOLDER = 'mayan.apps.source_watch_folders.source_backends.SourceBackendWatchFolder'
 
 TEST_SOURCE_BACKEND_WATCH_FOLDER_SUBFOLDER = 'test_subfolder'
+
+TEST_WATCH_FOLDER_SCANNER_FILE_STABLE_TIME = 3600
+TEST_WATCH_FOLDER_SCANNER_FILENAME = 'test_file.txt'
+TEST_WATCH_FOLDER_SCANNER_FILENAME_2 = 'test_file_2.txt'
@@ -0,0 +1,147 @@
+import os
+from pathlib import Path
+import time
+
+from mayan.apps.storage.utils import fs_cleanup, mkdtemp
+from mayan.apps.testing.tests.base import BaseTestCase
+
+from ..classes import WatchFolderScanner
+
+from .literals import (
+    TEST_SOURCE_BACKEND_WATCH_FOLDER_SUBFOLDER,
+    TEST_WATCH_FOLDER_SCANNER_FILE_STABLE_TIME,
+    TEST_WATCH_FOLDER_SCANNER_FILENAME, TEST_WATCH_FOLDER_SCANNER_FILENAME_2
+)
+
+
+class WatchFolderScannerTestCase(BaseTestCase):
+    def setUp(self):
+        super().setUp()
+        self._test_folder = mkdtemp()
+        self._test_scanner_list = []
+
+    def tearDown(self):
+        for scanner in self._test_scanner_list:
+            scanner.close()
+
+        WatchFolderScanner.instance_cache_clear()
+
+        fs_cleanup(filename=self._test_folder)
+        super().tearDown()
+
+    def _create_test_file(self, filename, age=0):
+        path = Path(self._test_folder, filename)
+        path.parent.mkdir(exist_ok=True, parents=True)
+        path.write_text(data=filename)
+
+        if age:
+            timestamp = time.time() - age
+            os.utime(path, times=(timestamp, timestamp))
+
+    def _create_test_scanner(self, **kwargs):
+        scanner = WatchFolderScanner(folder_path=self._test_folder, **kwargs)
+        self._test_scanner_list.append(scanner)
+        return scanner
+
+    def test_file_add_and_remove(self):
+        scanner = self._create_test_scanner()
+
+        self.assertEqual(scanner.scan(), [])
+
+        self._create_test_file(filename=TEST_WATCH_FOLDER_SCANNER_FILENAME)
+
+        self.assertEqual(
+            scanner.scan(), [(TEST_WATCH_FOLDER_SCANNER_FILENAME, True)]
+        )
+
+        Path(self._test_folder, TEST_WATCH_FOLDER_SCANNER_FILENAME).unlink()
+
+        self.assertEqual(scanner.scan(), [])
+
+    def test_file_stable_time(self):
+        self._create_test_file(
+            age=TEST_WATCH_FOLDER_SCANNER_FILE_STABLE_TIME * 2,
+            filename=TEST_WATCH_FOLDER_SCANNER_FILENAME
+        )
+        self._create_test_file(filename=TEST_WATCH_FOLDER_SCANNER_FILENAME_2)
+
+        scanner = self._create_test_scanner(
+            file_stable_time=TEST_WATCH_FOLDER_SCANNER_FILE_STABLE_TIME
+        )
+
+        self.assertEqual(
+            scanner.scan(), [
+                (TEST_WATCH_FOLDER_SCANNER_FILENAME, True),
+                (TEST_WATCH_FOLDER_SCANNER_FILENAME_2, False)
+            ]
+        )
+
+        # The file becomes stable once it is not modified for the stable
+        # time.
+        timestamp = time.time() - TEST_WATCH_FOLDER_SCANNER_FILE_STABLE_TIME
+        os.utime(
+            Path(self._test_folder, TEST_WATCH_FOLDER_SCANNER_FILENAME_2),
+            times=(timestamp, timestamp)
+        )
+
+        self.assertEqual(
+            scanner.scan(), [
+                (TEST_WATCH_FOLDER_SCANNER_FILENAME, True),
+                (TEST_WATCH_FOLDER_SCANNER_FILENAME_2, True)
+            ]
+        )
+
+    def test_include_subdirectories(self):
+        test_filename = os.path.join(
+            TEST_SOURCE_BACKEND_WATCH_FOLDER_SUBFOLDER,
+            TEST_WATCH_FOLDER_SCANNER_FILENAME
+        )
+        self._create_test_file(filename=test_filename)
+
+        scanner = self._create_test_scanner()
+        self.assertEqual(scanner.scan(), [])
+
+        scanner = self._create_test_scanner(include_subdirectories=True)
+        self.assertEqual(scanner.scan(), [(test_filename, True)])
+
+    def test_inotify(self):
+        scanner = self._create_test_scanner(
+            include_subdirectories=True, use_inotify=True
+        )
+
+        if not scanner.watcher:
+            self.skipTest(reason='inotify is not available.')
+
+        self.assertEqual(scanner.scan(), [])
+
+        test_filename = os.path.join(
+            TEST_SOURCE_BACKEND_WATCH_FOLDER_SUBFOLDER,
+            TEST_WATCH_FOLDER_SCANNER_FILENAME
+        )
+        self._create_test_file(filename=test_filename)
+
+        self.assertEqual(scanner.scan(), [(test_filename, True)])
+
+        Path(self._test_folder, test_filename).unlink()
+
+        self.assertEqual(scanner.scan(), [])
+
+    def test_instance_cache(self):
+        scanner = WatchFolderScanner.get_instance(
+            folder_path=self._test_folder, source_id=1
+        )
+        self._test_scanner_list.append(scanner)
+
+        self.assertTrue(
+            WatchFolderScanner.get_instance(
+                folder_path=self._test_folder, source_id=1
+            ) is scanner
+        )
+
+        scanner_subdirectories = WatchFolderScanner.get_instance(
+            folder_path=self._test_folder, include_subdirectories=True,
+            source_id=1
+        )
+        self._test_scanner_list.append(scanner_subdirectories)
+
+        self.assertFalse(scanner_subdirectories is scanner)
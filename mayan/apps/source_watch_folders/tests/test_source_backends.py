@@ -1,3 +1,4 @@
+import os
 from pathlib import Path
 import shutil
 
@@ -21,7 +22,10 @@ from mayan.apps.source_compressed.source_backends.literals import (
 )
 from mayan.apps.sources.exceptions import SourceActionException
 
-from .literals import TEST_SOURCE_BACKEND_WATCH_FOLDER_SUBFOLDER
+from .literals import (
+    TEST_SOURCE_BACKEND_WATCH_FOLDER_SUBFOLDER,
+    TEST_WATCH_FOLDER_SCANNER_FILE_STABLE_TIME
+)
 from .mixins import WatchFolderSourceTestMixin
 
 
@@ -114,6 +118,46 @@ class WatchFolderSourceBackendActionDocumentUploadTestCase(
         self.assertEqual(events[7].target, test_document_version)
         self.assertEqual(events[7].verb, event_document_version_edited.id)
 
+    def test_batch(self):
+        self._test_source_create()
+
+        self.copy_test_source_file()
+        self.copy_test_source_file(source_path=TEST_FILE_COMPRESSED_PATH)
+
+        document_count = Document.objects.count()
+
+        self._execute_test_source_action(action_name='document_upload')
+
+        self.assertEqual(
+            Document.objects.count(), document_count + 2
+        )
+
+        self.assertEqual(
+            len(
+                self.get_test_source_stored_file_list()
+            ), 0
+        )
+
+    def test_batch_size(self):
+        self._test_source_create(extra_data={'batch_size': 1})
+
+        self.copy_test_source_file()
+        self.copy_test_source_file(source_path=TEST_FILE_COMPRESSED_PATH)
+
+        document_count = Document.objects.count()
+
+        self._execute_test_source_action(action_name='document_upload')
+
+        self.assertEqual(
+            Document.objects.count(), document_count + 1
+        )
+
+        self.assertEqual(
+            len(
+                self.get_test_source_stored_file_list()
+            ), 1
+        )
+
     def test_compressed_always(self):
         self._test_source_create(
             extra_data={'uncompress': SOURCE_UNCOMPRESS_CHOICE_ALWAYS}
@@ -902,6 +946,73 @@ class WatchFolderSourceBackendActionDocumentUploadTestCase(
         self.assertEqual(events[7].target, test_document_version)
         self.assertEqual(events[7].verb, event_document_version_edited.id)
 
+    def test_file_link(self):
+        self._test_source_create()
+
+        self.copy_test_source_file()
+
+        test_source_stored_test_file_inode = self._test_source_stored_test_file.stat().st_ino
+
+        self._execute_test_source_action(action_name='document_upload')
+
+        test_document_file = Document.objects.first().file_latest
+
+        self.assertEqual(
+            os.stat(path=test_document_file.file.path).st_ino,
+            test_source_stored_test_file_inode
+        )
+        self.assertFalse(
+            self._test_source_stored_test_file.exists()
+        )
+
+    def test_file_link_dry_run(self):
+        self._test_source_create()
+
+        self.copy_test_source_file()
+
+        test_source_stored_test_file_inode = self._test_source_stored_test_file.stat().st_ino
+
+        self._execute_test_source_action(
+            action_name='document_upload', extra_data={'dry_run': True}
+        )
+
+        test_document_file = Document.objects.first().file_latest
+
+        self.assertNotEqual(
+            os.stat(path=test_document_file.file.path).st_ino,
+            test_source_stored_test_file_inode
+        )
+        self.assertEqual(
+            test_document_file.checksum, TEST_DOCUMENT_SMALL_CHECKSUM
+        )
+
+    def test_file_stable_time(self):
+        self._test_source_create(
+            extra_data={
+                'file_stable_time': TEST_WATCH_FOLDER_SCANNER_FILE_STABLE_TIME
+            }
+        )
+
+        self.copy_test_source_file()
+
+        document_count = Document.objects.count()
+
+        test_source_stored_file_count = len(
+            self.get_test_source_stored_file_list()
+        )
+
+        self._execute_test_source_action(action_name='document_upload')
+
+        self.assertEqual(
+            Document.objects.count(), document_count
+        )
+
+        self.assertEqual(
+            len(
+                self.get_test_source_stored_file_list()
+            ), test_source_stored_file_count
+        )
+
     def test_subfolder_disabled(self):
         self._test_source_create()
 
@@ -17,9 +17,9 @@ class SourceBackendActionMixinSourceMetadata(
 
         return result
 
-    def process_server_upload_entry(self, server_upload_entry):
+    def process_server_upload_entry(self, server_upload_entry, **kwargs):
         result = super().process_server_upload_entry(
-            server_upload_entry=server_upload_entry
+            server_upload_entry=server_upload_entry, **kwargs
         )
 
         source_metadata = server_upload_entry.get(
@@ -1,6 +1,8 @@
 from django.contrib import admin
 
-from .models import DownloadFile, SharedUploadedFile
+from .models import (
+    DownloadFile, SharedUploadedFile, StoredBlob, StoredBlobReference
+)
 
 
 @admin.register(DownloadFile)
@@ -15,3 +17,19 @@ class SharedUploadedFileAdmin(admin.ModelAdmin):
     date_hierarchy = 'datetime'
     list_display = ('file', 'filename', 'datetime',)
     readonly_fields = list_display
+
+
+@admin.register(StoredBlob)
+class StoredBlobAdmin(admin.ModelAdmin):
+    list_display = (
+        'checksum', 'namespace', 'name', 'reference_count', 'size'
+    )
+    list_filter = ('namespace',)
+    readonly_fields = list_display
+
+
+@admin.register(StoredBlobReference)
+class StoredBlobReferenceAdmin(admin.ModelAdmin):
+    list_display = ('name', 'namespace', 'blob')
+    list_filter = ('namespace',)
+    readonly_fields = list_display
@@ -0,0 +1,183 @@
+from functools import partial
+import hashlib
+
+from django.apps import apps
+from django.db import transaction
+
+from ..classes import PassthroughStorage
+
+from .literals import (
+    CONTENT_ADDRESSED_BLOB_NAME_TEMPLATE,
+    DEFAULT_CONTENT_ADDRESSED_NAMESPACE
+)
+
+
+class ContentAddressedPassthroughStorage(PassthroughStorage):
+    """
+    Save each distinct content only once to the next storage. Files with
+    the same content reference the same blob, which is deleted when the
+    last file referencing it is deleted. Storages sharing the same next
+    storage location must use the same namespace and storages with
+    different locations must use different namespaces.
+    """
+    def __init__(self, *args, **kwargs):
+        self.namespace = kwargs.pop(
+            'namespace', DEFAULT_CONTENT_ADDRESSED_NAMESPACE
+        )
+        super().__init__(*args, **kwargs)
+
+    def _get_checksum_and_size(self, content):
+        hash_object = hashlib.sha256()
+        size = 0
+
+        for chunk in content.chunks():
+            hash_object.update(chunk)
+            size += len(chunk)
+
+        content.seek(0)
+
+        return hash_object.hexdigest(), size
+
+    def _get_reference(self, name):
+        StoredBlobReference = apps.get_model(
+            app_label='storage', model_name='StoredBlobReference'
+        )
+
+        try:
+            return StoredBlobReference.objects.select_related('blob').get(
+                name=name, namespace=self.namespace
+            )
+        except StoredBlobReference.DoesNotExist:
+            # Files saved to the next storage before enabling this
+            # storage are accessed directly.
+            return None
+
+    def delete(self, name):
+        StoredBlob = apps.get_model(
+            app_label='storage', model_name='StoredBlob'
+        )
+        StoredBlobReference = apps.get_model(
+            app_label='storage', model_name='StoredBlobReference'
+        )
+
+        with transaction.atomic():
+            try:
+                reference = StoredBlobReference.objects.select_for_update().get(
+                    name=name, namespace=self.namespace
+                )
+            except StoredBlobReference.DoesNotExist:
+                return super().delete(name=name)
+
+            blob = StoredBlob.objects.select_for_update().get(
+                pk=reference.blob_id
+            )
+
+            reference.delete()
+
+            blob.reference_count -= 1
+
+            if blob.reference_count > 0:
+                blob.save(update_fields=('reference_count',))
+            else:
+                blob.delete()
+
+                # Delete the content only after the blob removal is
+                # committed to not lose it if the transaction fails.
+                transaction.on_commit(
+                    partial(self.next_storage_backend.delete, blob.name)
+                )
+
+    def exists(self, name):
+        if self._get_reference(name=name):
+            return True
+        else:
+            return super().exists(name=name)
+
+    def open(self, name, mode='rb', _direct=False):
+        next_kwargs = {'mode': mode, 'name': name}
+
+        if _direct:
+            if issubclass(self.next_storage_class, PassthroughStorage):
+                next_kwargs.update(
+                    {'_direct': _direct}
+                )
+        else:
+            reference = self._get_reference(name=name)
+
+            if reference:
+                # The blob content is shared with other files.
+                if set(mode) & set('+awx'):
+                    raise IOError(
+                        'Files of a content addressed storage are read '
+                        'only.'
+                    )
+
+                next_kwargs['name'] = reference.blob.name
+
+        return self._call_backend_method(
+            method_name='open', kwargs=next_kwargs
+        )
+
+    def path(self, name):
+        reference = self._get_reference(name=name)
+
+        if reference:
+            name = reference.blob.name
+
+        return super().path(name=name)
+
+    def save(self, name, content, max_length=None, _direct=False):
+        if _direct:
+            next_kwargs = {
+                'content': content, 'max_length': max_length, 'name': name
+            }
+
+            if issubclass(self.next_storage_class, PassthroughStorage):
+                next_kwargs.update(
+                    {'_direct': _direct}
+                )
+
+            return self._call_backend_method(
+                method_name='save', kwargs=next_kwargs
+            )
+        else:
+            StoredBlob = apps.get_model(
+                app_label='storage', model_name='StoredBlob'
+            )
+            StoredBlobReference = apps.get_model(
+                app_label='storage', model_name='StoredBlobReference'
+            )
+
+            name = self.get_available_name(name=name, max_length=max_length)
+            checksum, size = self._get_checksum_and_size(content=content)
+
+            with transaction.atomic():
+                blob, created = StoredBlob.objects.select_for_update().get_or_create(
+                    checksum=checksum, namespace=self.namespace,
+                    defaults={'size': size}
+                )
+
+                if created:
+                    blob.name = self.next_storage_backend.save(
+                        content=content,
+                        name=CONTENT_ADDRESSED_BLOB_NAME_TEMPLATE.format(
+                            checksum[:2], checksum[2:4], checksum
+                        )
+                    )
+
+                blob.reference_count += 1
+                blob.save(update_fields=('name', 'reference_count'))
+
+                StoredBlobReference.objects.create(
+                    blob=blob, name=name, namespace=self.namespace
+                )
+
+            return name
+
+    def size(self, name):
+        reference = self._get_reference(name=name)
+
+        if reference:
+            return reference.blob.size
+        else:
+            return super().size(name=name)
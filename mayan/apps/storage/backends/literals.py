@@ -1,3 +1,6 @@
+CONTENT_ADDRESSED_BLOB_NAME_TEMPLATE = 'blobs/{}/{}/{}'
+DEFAULT_CONTENT_ADDRESSED_NAMESPACE = 'default'
+
 ENCRYPTION_FILE_CHUNK_SIZE = 64 * 1024  # 64K
 ENCRYPTION_KEY_DERIVATION_ITERATIONS = 100000
 ENCRYPTION_KEY_SIZE = 32
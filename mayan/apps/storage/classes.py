@@ -166,6 +166,20 @@ class FakeStorageSubclass:
         return True
 
 
+class LinkedFile(File):
+    """
+    File opened from a hard link created in the folder of a filesystem
+    storage. The storage moves the link into place when saving the file
+    instead of copying the content.
+    """
+    def __init__(self, file, link_path, name=None):
+        self.link_path = link_path
+        super().__init__(file=file, name=name)
+
+    def temporary_file_path(self):
+        return self.link_path
+
+
 class PassthroughStorage(Storage):
     def __init__(self, *args, **kwargs):
         logger.debug(
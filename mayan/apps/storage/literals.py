@@ -23,6 +23,9 @@ MSG_MIME_TYPES = (
     'application/vnd.ms-outlook', 'application/vnd.ms-office',
     'application/x-ole-storage'
 )
+# Name of the temporary hard links created in the folder of filesystem
+# storages to save local files without copying them.
+STORAGE_LINK_NAME_TEMPLATE = '.link-{}'
 STORAGE_NAME_DOWNLOAD_FILE = 'storage__downloadfile'
 STORAGE_NAME_SHARED_UPLOADED_FILE = 'storage__shareduploadedfile'
 TASK_DOWNLOAD_FILE_STALE_INTERVAL = 60 * 10  # 10 minutes
@@ -0,0 +1,89 @@
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ('storage', '0008_auto_20221024_0555')
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='StoredBlob',
+            fields=[
+                (
+                    'id', models.AutoField(
+                        auto_created=True, primary_key=True, serialize=False,
+                        verbose_name='ID'
+                    )
+                ),
+                (
+                    'checksum', models.CharField(
+                        max_length=64, verbose_name='Checksum'
+                    )
+                ),
+                (
+                    'name', models.CharField(
+                        blank=True, max_length=255, verbose_name='Name'
+                    )
+                ),
+                (
+                    'namespace', models.CharField(
+                        max_length=255, verbose_name='Namespace'
+                    )
+                ),
+                (
+                    'reference_count', models.PositiveIntegerField(
+                        default=0, verbose_name='Reference count'
+                    )
+                ),
+                (
+                    'size', models.PositiveBigIntegerField(
+                        verbose_name='Size'
+                    )
+                )
+            ],
+            options={
+                'verbose_name': 'Stored blob',
+                'verbose_name_plural': 'Stored blobs',
+                'unique_together': {
+                    ('namespace', 'checksum')
+                }
+            }
+        ),
+        migrations.CreateModel(
+            name='StoredBlobReference',
+            fields=[
+                (
+                    'id', models.AutoField(
+                        auto_created=True, primary_key=True, serialize=False,
+                        verbose_name='ID'
+                    )
+                ),
+                (
+                    'name', models.CharField(
+                        max_length=255, verbose_name='Name'
+                    )
+                ),
+                (
+                    'namespace', models.CharField(
+                        max_length=255, verbose_name='Namespace'
+                    )
+                ),
+                (
+                    'blob', models.ForeignKey(
+                        on_delete=django.db.models.deletion.PROTECT,
+                        related_name='references', to='storage.storedblob',
+                        verbose_name='Blob'
+                    )
+                )
+            ],
+            options={
+                'verbose_name': 'Stored blob reference',
+                'verbose_name_plural': 'Stored blob references',
+                'unique_together': {
+                    ('namespace', 'name')
+                }
+            }
+        )
+    ]
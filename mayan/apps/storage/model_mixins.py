@@ -1,10 +1,12 @@
 import logging
 
-from django.core.files.base import ContentFile
+from django.core.files.base import ContentFile, File
 from django.db import models
 from django.template.defaultfilters import filesizeformat
 from django.utils.translation import gettext_lazy as _, gettext
 
+from .utils import get_storage_local_path, local_file_open
+
 logger = logging.getLogger(name=__name__)
 
 
@@ -84,6 +86,27 @@ class DatabaseFileModelMixin(ModelMixinFileFieldOpen, models.Model):
             self.file.storage.delete(name=name)
         return super().delete(*args, **kwargs)
 
+    def get_local_path(self):
+        return get_storage_local_path(
+            name=self.file.name, storage=self.file.storage
+        )
+
+    def open_for_storage(self, storage):
+        """
+        Return a `File` context manager to save the content to another
+        storage. Files in the local filesystem are linked into filesystem
+        storages instead of copied. The file of the instance is not
+        modified.
+        """
+        path = self.get_local_path()
+
+        if path:
+            return local_file_open(path=path, storage=storage)
+        else:
+            return File(
+                file=self.open()
+            )
+
     def save(self, *args, **kwargs):
         if not self.file:
             self.file = ContentFile(
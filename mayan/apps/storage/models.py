@@ -109,3 +109,55 @@ class SharedUploadedFile(DatabaseFileModelMixin, models.Model):
         self.filename = self.filename or Path(path=self.file.name).name
         super().save(*args, **kwargs)
         self.file.close()
+
+
+class StoredBlob(models.Model):
+    """
+    Content saved once by the content addressed storage and shared by all
+    the files with the same content. Blobs are identified by the
+    checksum of the content.
+    """
+    checksum = models.CharField(
+        max_length=64, verbose_name=_(message='Checksum')
+    )
+    name = models.CharField(
+        blank=True, max_length=255, verbose_name=_(message='Name')
+    )
+    namespace = models.CharField(
+        max_length=255, verbose_name=_(message='Namespace')
+    )
+    reference_count = models.PositiveIntegerField(
+        default=0, verbose_name=_(message='Reference count')
+    )
+    size = models.PositiveBigIntegerField(verbose_name=_(message='Size'))
+
+    class Meta:
+        unique_together = ('namespace', 'checksum')
+        verbose_name = _(message='Stored blob')
+        verbose_name_plural = _(message='Stored blobs')
+
+    def __str__(self):
+        return self.checksum
+
+
+class StoredBlobReference(models.Model):
+    """
+    Name of a file saved to the content addressed storage and the blob
+    with its content.
+    """
+    blob = models.ForeignKey(
+        on_delete=models.PROTECT, related_name='references',
+        to=StoredBlob, verbose_name=_(message='Blob')
+    )
+    name = models.CharField(max_length=255, verbose_name=_(message='Name'))
+    namespace = models.CharField(
+        max_length=255, verbose_name=_(message='Namespace')
+    )
+
+    class Meta:
+        unique_together = ('namespace', 'name')
+        verbose_name = _(message='Stored blob reference')
+        verbose_name_plural = _(message='Stored blob references')
+
+    def __str__(self):
+        return self.name
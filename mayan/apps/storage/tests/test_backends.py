@@ -6,12 +6,172 @@ from django.core.files.base import ContentFile
 from mayan.apps.common.tests.literals import (
     TEST_BINARY_CONTENT, TEST_FILE_NAME
 )
+from mayan.apps.documents.tests.base import GenericDocumentTestCase
+from mayan.apps.documents.tests.literals import TEST_DOCUMENT_SMALL_CHECKSUM
 from mayan.apps.mime_types.tests.mixins import MIMETypeBackendMixin
 from mayan.apps.storage.utils import fs_cleanup, mkdtemp
 from mayan.apps.testing.tests.base import BaseTestCase
 
 from ..backends.compressedstorage import ZipCompressedPassthroughStorage
+from ..backends.contentaddressedstorage import (
+    ContentAddressedPassthroughStorage
+)
 from ..backends.encryptedstorage import EncryptedPassthroughStorage
+from ..models import StoredBlob, StoredBlobReference
+
+from .mixins import StorageProcessorTestMixin
+
+
+class ContentAddressedDocumentFileStorageTestCase(
+    StorageProcessorTestMixin, GenericDocumentTestCase
+):
+    auto_upload_test_document = False
+
+    def setUp(self):
+        super().setUp()
+        self.document_storage_dotted_path = self.defined_storage.dotted_path
+
+        self.defined_storage.dotted_path = 'mayan.apps.storage.backends.contentaddressedstorage.ContentAddressedPassthroughStorage'
+        self.defined_storage.kwargs = {
+            'next_storage_backend_arguments': {
+                'location': self.document_storage_kwargs['location']
+            }
+        }
+
+    def tearDown(self):
+        super().tearDown()
+        self.defined_storage.dotted_path = self.document_storage_dotted_path
+
+    def test_document_file_duplicate(self):
+        self._upload_test_document()
+        self._upload_test_document()
+
+        self.assertEqual(StoredBlob.objects.get().reference_count, 2)
+
+        for test_document in self._test_document_list:
+            self.assertEqual(
+                test_document.file_latest.checksum,
+                TEST_DOCUMENT_SMALL_CHECKSUM
+            )
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self._test_document_list[0].delete(to_trash=False)
+
+        self.assertEqual(StoredBlob.objects.get().reference_count, 1)
+
+        test_document_file = self._test_document_list[1].file_latest
+
+        self.assertEqual(
+            test_document_file.checksum_update(save=False),
+            TEST_DOCUMENT_SMALL_CHECKSUM
+        )
+
+
+class ContentAddressedPassthroughStorageTestCase(BaseTestCase):
+    def setUp(self):
+        super().setUp()
+        self.temporary_directory = mkdtemp()
+        self.storage = ContentAddressedPassthroughStorage(
+            next_storage_backend_arguments={
+                'location': self.temporary_directory
+            }
+        )
+
+    def tearDown(self):
+        fs_cleanup(filename=self.temporary_directory)
+        super().tearDown()
+
+    def _get_test_blob_path_list(self):
+        return [
+            path for path in Path(self.temporary_directory).rglob(pattern='*') if path.is_file()
+        ]
+
+    def _save_test_file(self):
+        return self.storage.save(
+            name=TEST_FILE_NAME, content=ContentFile(
+                content=TEST_BINARY_CONTENT
+            )
+        )
+
+    def test_file_delete(self):
+        test_file_name_1 = self._save_test_file()
+        test_file_name_2 = self._save_test_file()
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.storage.delete(name=test_file_name_1)
+
+        self.assertEqual(StoredBlob.objects.get().reference_count, 1)
+        self.assertEqual(
+            len(
+                self._get_test_blob_path_list()
+            ), 1
+        )
+
+        with self.storage.open(name=test_file_name_2) as file_object:
+            self.assertEqual(file_object.read(), TEST_BINARY_CONTENT)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.storage.delete(name=test_file_name_2)
+
+        self.assertEqual(StoredBlob.objects.count(), 0)
+        self.assertEqual(
+            len(
+                self._get_test_blob_path_list()
+            ), 0
+        )
+
+    def test_file_direct(self):
+        self.storage.next_storage_backend.save(
+            name=TEST_FILE_NAME, content=ContentFile(
+                content=TEST_BINARY_CONTENT
+            )
+        )
+
+        self.assertTrue(
+            self.storage.exists(name=TEST_FILE_NAME)
+        )
+
+        with self.storage.open(name=TEST_FILE_NAME) as file_object:
+            self.assertEqual(file_object.read(), TEST_BINARY_CONTENT)
+
+        self.storage.delete(name=TEST_FILE_NAME)
+
+        self.assertFalse(
+            self.storage.exists(name=TEST_FILE_NAME)
+        )
+
+    def test_file_read_only(self):
+        test_file_name = self._save_test_file()
+
+        with self.assertRaises(expected_exception=IOError):
+            self.storage.open(name=test_file_name, mode='wb')
+
+    def test_file_save_and_load(self):
+        test_file_name = self._save_test_file()
+
+        with self.storage.open(name=test_file_name, mode='rb') as file_object:
+            self.assertEqual(file_object.read(), TEST_BINARY_CONTENT)
+
+        self.assertEqual(
+            self.storage.size(name=test_file_name), len(TEST_BINARY_CONTENT)
+        )
+
+    def test_file_save_duplicate(self):
+        test_file_name_1 = self._save_test_file()
+        test_file_name_2 = self._save_test_file()
+
+        self.assertNotEqual(test_file_name_1, test_file_name_2)
+        self.assertEqual(StoredBlob.objects.get().reference_count, 2)
+        self.assertEqual(StoredBlobReference.objects.count(), 2)
+        self.assertEqual(
+            len(
+                self._get_test_blob_path_list()
+            ), 1
+        )
+
+        for test_file_name in (test_file_name_1, test_file_name_2):
+            with self.storage.open(name=test_file_name) as file_object:
+                self.assertEqual(file_object.read(), TEST_BINARY_CONTENT)
 
 
 class EncryptedPassthroughStorageTestCase(
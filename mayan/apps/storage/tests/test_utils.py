@@ -1,16 +1,73 @@
+import os
 from pathlib import Path
 import shutil
 
+from django.core.files.storage import FileSystemStorage
+
 from mayan.apps.documents.storages import storage_document_files
 from mayan.apps.documents.tests.base import GenericDocumentTestCase
 from mayan.apps.mime_types.tests.mixins import MIMETypeBackendMixin
 from mayan.apps.testing.tests.base import BaseTestCase
 
-from ..utils import PassthroughStorageProcessor, mkdtemp, patch_files
+from ..backends.compressedstorage import ZipCompressedPassthroughStorage
+from ..utils import (
+    PassthroughStorageProcessor, local_file_open, mkdtemp, patch_files
+)
 
 from .mixins import StorageProcessorTestMixin
 
 
+class LocalFileOpenTestCase(BaseTestCase):
+    def setUp(self):
+        super().setUp()
+        self.temporary_directory = mkdtemp()
+        self.path_temporary_directory = Path(self.temporary_directory)
+        self.path_test_file = self.path_temporary_directory / 'test_file.txt'
+        self.path_test_file.write_bytes(data=b'test content')
+        self.test_storage_location = str(
+            self.path_temporary_directory / 'storage'
+        )
+
+    def tearDown(self):
+        super().tearDown()
+        shutil.rmtree(path=self.temporary_directory, ignore_errors=True)
+
+    def test_filesystem_storage(self):
+        storage = FileSystemStorage(location=self.test_storage_location)
+
+        with local_file_open(path=str(self.path_test_file), storage=storage) as file_object:
+            name = storage.save(content=file_object, name='test_name')
+
+        self.assertEqual(
+            os.stat(path=storage.path(name=name)).st_ino,
+            self.path_test_file.stat().st_ino
+        )
+        self.assertEqual(self.path_test_file.read_bytes(), b'test content')
+        self.assertEqual(
+            os.listdir(path=self.test_storage_location), [name]
+        )
+
+    def test_passthrough_storage(self):
+        storage = ZipCompressedPassthroughStorage(
+            next_storage_backend_arguments={
+                'location': self.test_storage_location
+            }
+        )
+
+        with local_file_open(path=str(self.path_test_file), storage=storage) as file_object:
+            name = storage.save(content=file_object, name='test_name')
+
+        self.assertNotEqual(
+            os.stat(path=storage.path(name=name)).st_ino,
+            self.path_test_file.stat().st_ino
+        )
+
+        with storage.open(name=name) as file_object:
+            self.assertEqual(file_object.read(), b'test content')
+
+        self.assertEqual(self.path_test_file.read_bytes(), b'test content')
+
+
 class PatchFilesTestCase(BaseTestCase):
     test_replace_text = 'replaced_text'
 
@@ -1,3 +1,4 @@
+from contextlib import contextmanager
 import dbm
 import logging
 import os
@@ -7,14 +8,26 @@ import tempfile
 import uuid
 
 from django.apps import apps
+from django.core.files.base import File
+from django.core.files.storage import FileSystemStorage
 from django.utils.module_loading import import_string
 
-from .classes import DefinedStorage, PassthroughStorage
+from .classes import (
+    DefinedStorage, DefinedStorageLazy, LinkedFile, PassthroughStorage
+)
+from .literals import STORAGE_LINK_NAME_TEMPLATE
 from .settings import setting_temporary_directory
 
 logger = logging.getLogger(name=__name__)
 
 
+def _get_storage_instance(storage):
+    if isinstance(storage, DefinedStorageLazy):
+        return DefinedStorage.get(name=storage.name).get_storage_instance()
+    else:
+        return storage
+
+
 def NamedTemporaryFile(*args, **kwargs):
     kwargs.update(
         {'dir': setting_temporary_directory.value}
@@ -121,6 +134,17 @@ def fs_cleanup(filename, suppress_exceptions=True):
                 raise
 
 
+def get_storage_local_path(name, storage):
+    """
+    Return the local filesystem path of a stored file or None when the
+    storage does not keep the content as is in the local filesystem.
+    """
+    storage = _get_storage_instance(storage=storage)
+
+    if isinstance(storage, FileSystemStorage):
+        return storage.path(name=name)
+
+
 def get_storage_subclass(dotted_path):
     """
     Import a storage class and return a subclass that will always return eq
@@ -144,6 +168,52 @@ def get_storage_subclass(dotted_path):
     return StorageSubclass
 
 
+@contextmanager
+def local_file_open(path, storage):
+    """
+    Open a local file to save it to the storage. When the storage is a
+    filesystem storage in the same filesystem, a hard link of the file is
+    created in the storage folder and the storage moves the link into
+    place instead of copying the content. The original file is not
+    modified.
+    """
+    storage = _get_storage_instance(storage=storage)
+    link_path = None
+    name = os.path.basename(path)
+
+    if isinstance(storage, FileSystemStorage):
+        link_path = os.path.join(
+            storage.location, STORAGE_LINK_NAME_TEMPLATE.format(
+                uuid.uuid4().hex
+            )
+        )
+
+        try:
+            os.makedirs(storage.location, exist_ok=True)
+            os.link(src=path, dst=link_path)
+        except OSError as exception:
+            logger.debug(
+                'Unable to link file "%s" into the storage, copying it; %s',
+                path, exception
+            )
+            link_path = None
+
+    try:
+        if link_path:
+            with open(file=link_path, mode='rb') as file_object:
+                yield LinkedFile(
+                    file=file_object, link_path=link_path, name=name
+                )
+        else:
+            with open(file=path, mode='rb') as file_object:
+                yield File(file=file_object, name=name)
+    finally:
+        if link_path:
+            # The link still exists only when the storage copied the
+            # file or when the file was not saved.
+            fs_cleanup(filename=link_path)
+
+
 def mkdtemp(*args, **kwargs):
     """
     Creates a temporary directory in the most secure manner possible.
@@ -20,6 +20,7 @@ from mayan.apps.dynamic_search.views.view_mixins import (
     SearchFilterEnabledListViewMixin
 )
 from mayan.apps.forms.forms import ChoiceForm
+from mayan.apps.navigation.menus import Menu
 
 from .icons import (
     icon_add_all, icon_assign_remove_add, icon_assign_remove_remove,
@@ -866,6 +867,7 @@ class SingleObjectListView(
     """
     A view that will generate a list of instances from a queryset.
     """
+    access_check_prefetch_menu_names = ('list facet', 'object')
     template_name = 'appearance/list.html'
 
     def __init__(self, *args, **kwargs):
@@ -882,6 +884,33 @@ class SingleObjectListView(
 
         return result
 
+    def do_access_check_prefetch(self, object_list):
+        """
+        Check the access to the objects of the page for the permissions
+        of the menu links in bulk. The decisions are cached for the
+        resolution of the menus of each object.
+        """
+        object_list = list(object_list)
+
+        if object_list:
+            for menu_name in self.access_check_prefetch_menu_names:
+                menu = Menu.get(name=menu_name)
+
+                for permission in menu.get_link_permissions(source=object_list[0]):
+                    AccessControlList.objects.check_access_many(
+                        obj_list=object_list, permission=permission,
+                        user=self.request.user
+                    )
+
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+
+        self.do_access_check_prefetch(
+            object_list=context.get('object_list') or ()
+        )
+
+        return context
+
     def get_paginate_by(self, queryset):
         return setting_paginate_by.value
 
@@ -181,6 +181,7 @@ MIDDLEWARE = (
     'django.contrib.auth.middleware.AuthenticationMiddleware',
     'mayan.apps.locales.middleware.locales.UserLocaleProfileMiddleware',
     'mayan.apps.authentication.middleware.impersonate.ImpersonateMiddleware',
+    'mayan.apps.acls.middleware.access_check_cache.AccessCheckCacheMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
     'stronghold.middleware.LoginRequiredMiddleware',